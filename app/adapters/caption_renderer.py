@@ -1,25 +1,48 @@
-"""Caption renderer — Pillow text rendering + FFmpeg overlay burn-in.
+"""Caption renderer — libass single-pass burn-in with a Pillow + FFmpeg overlay fallback.
 
-Uses Pillow to render caption text as transparent PNG frames, then FFmpeg's
-overlay filter to composite them onto the video. This approach works with
-any FFmpeg build (no libass/libfreetype required).
+When the local FFmpeg build ships the ``ass`` filter, captions are written as
+one ASS script and burned in a single filter pass. Otherwise Pillow renders
+each word as a transparent PNG frame and FFmpeg's overlay filter composites
+them onto the video, which works with any FFmpeg build (no libass required).
+Both paths share the same word timing and per-word font fitting.
 """
 
 from __future__ import annotations
 
-import json
+import functools
 import os
 import subprocess
 import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 from PIL import Image, ImageDraw, ImageFont
 
 from app.adapters.deepgram_client import Word, WordLevelTranscript
+from app.adapters.media_probe import MediaProbeError, probe_media
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+CAPTION_RENDER_MODE_AUTO = "auto"
+CAPTION_RENDER_MODE_ASS = "ass"
+CAPTION_RENDER_MODE_OVERLAY = "overlay"
+CAPTION_RENDER_MODE = os.getenv("CAPTION_RENDER_MODE", CAPTION_RENDER_MODE_AUTO).strip().lower()
+
+# Hormozi palette in ASS &HAABBGGRR order (alpha 00 = opaque).
+_ASS_WHITE = "&H00FFFFFF"
+_ASS_YELLOW = "&H0000D7FF"  # #FFD700
+_ASS_BLACK = "&H00000000"
+_ASS_SHADOW = "&H4B000000"  # black at alpha 180/255, matching the PNG shadow
+
+# Word sprites are shared by every post rendered in this process. The cache is bounded
+# by decoded RGBA size: one word at 1080 px width is a few hundred KB.
+CAPTION_SPRITE_CACHE_MAX_BYTES = max(int(os.getenv("CAPTION_SPRITE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))), 1)
+_CAPTION_WHITE = (255, 255, 255, 255)
+_CAPTION_YELLOW = (255, 215, 0, 255)  # #FFD700
+
 
 class CaptionRendererError(Exception):
     def __init__(self, message: str, *, transient: bool = False):
@@ -43,8 +66,25 @@ def group_words_into_phrases(words: list[Word], *, max_words: int = 4) -> list[d
     return phrases
 
 
+_font_cache = threading.local()
+
+
 def _get_font(size: int) -> ImageFont.FreeTypeFont:
-    """Get a heavy impact-style font (TikTok/Hormozi look)."""
+    """Get a heavy impact-style font (TikTok/Hormozi look).
+
+    Loaded faces are memoized per thread; FreeType faces are not safe to share
+    across threads.
+    """
+    fonts = getattr(_font_cache, "fonts", None)
+    if fonts is None:
+        fonts = _font_cache.fonts = {}
+    font = fonts.get(size)
+    if font is None:
+        font = fonts[size] = _load_font(size)
+    return font
+
+
+def _load_font(size: int) -> ImageFont.FreeTypeFont:
     font_paths = [
         "/System/Library/Fonts/Supplemental/Impact.ttf",  # macOS — classic TikTok font
         "/System/Library/Fonts/Supplemental/Arial Black.ttf",  # macOS fallback
@@ -102,6 +142,120 @@ def _fit_caption_layout(
     return best_font, best_font_size, best_text_width, best_text_height, best_outline, best_shadow
 
 
+@dataclass(frozen=True)
+class _WordSprite:
+    """A word rasterized once, cropped to its outline and shadow."""
+
+    image: Image.Image
+    left: int  # sprite top-left relative to the text origin
+    top: int
+    text_width: int
+    text_height: int
+    outline_range: int
+    shadow_offset: int
+
+    @property
+    def nbytes(self) -> int:
+        return self.image.width * self.image.height * 4
+
+
+_word_sprite_cache: "OrderedDict[tuple[str, int, int, tuple[int, ...]], _WordSprite]" = OrderedDict()
+_word_sprite_cache_bytes = 0
+_word_sprite_lock = threading.Lock()
+
+
+def _caption_fill(word_index_global: int) -> tuple[int, int, int, int]:
+    # Color cycling: alternate white and yellow based on global word index
+    # Every other word gets yellow for visual rhythm
+    return _CAPTION_YELLOW if word_index_global % 2 == 1 else _CAPTION_WHITE
+
+
+def _rasterize_word_sprite(
+    word_text: str,
+    *,
+    video_width: int,
+    base_font_size: int,
+    fill: tuple[int, ...],
+) -> _WordSprite:
+    measure = ImageDraw.Draw(Image.new("RGBA", (1, 1), (0, 0, 0, 0)))
+    font, _, text_width, text_height, outline_range, shadow_offset = _fit_caption_layout(
+        draw=measure,
+        word_text=word_text,
+        video_width=video_width,
+        base_font_size=base_font_size,
+    )
+    # The stroke pass dilates the glyphs by outline_range in one draw call.
+    left, top, right, bottom = measure.textbbox((0, 0), word_text, font=font, stroke_width=outline_range)
+    image = Image.new(
+        "RGBA",
+        (right - left + shadow_offset, bottom - top + shadow_offset),
+        (0, 0, 0, 0),
+    )
+    draw = ImageDraw.Draw(image)
+    origin = (-left, -top)
+    draw.text(origin, word_text, font=font, fill=(0, 0, 0, 255), stroke_width=outline_range, stroke_fill=(0, 0, 0, 255))
+    draw.text((origin[0] + shadow_offset, origin[1] + shadow_offset), word_text, font=font, fill=(0, 0, 0, 180))
+    draw.text(origin, word_text, font=font, fill=fill)
+    return _WordSprite(
+        image=image,
+        left=left,
+        top=top,
+        text_width=text_width,
+        text_height=text_height,
+        outline_range=outline_range,
+        shadow_offset=shadow_offset,
+    )
+
+
+def _get_word_sprite(
+    word_text: str,
+    *,
+    video_width: int,
+    base_font_size: int,
+    fill: tuple[int, ...],
+) -> _WordSprite:
+    """Return the cached sprite for a word, rasterizing it on first use.
+
+    Rasterizing happens outside the lock so concurrent caption jobs only queue on
+    the dictionary update; when two jobs miss on the same word the first insert wins.
+    """
+    global _word_sprite_cache_bytes
+    key = (word_text, video_width, base_font_size, tuple(fill))
+    with _word_sprite_lock:
+        sprite = _word_sprite_cache.get(key)
+        if sprite is not None:
+            _word_sprite_cache.move_to_end(key)
+            return sprite
+    sprite = _rasterize_word_sprite(
+        word_text,
+        video_width=video_width,
+        base_font_size=base_font_size,
+        fill=fill,
+    )
+    with _word_sprite_lock:
+        cached = _word_sprite_cache.get(key)
+        if cached is not None:
+            _word_sprite_cache.move_to_end(key)
+            return cached
+        _word_sprite_cache[key] = sprite
+        _word_sprite_cache_bytes += sprite.nbytes
+        while _word_sprite_cache_bytes > CAPTION_SPRITE_CACHE_MAX_BYTES and len(_word_sprite_cache) > 1:
+            _, evicted = _word_sprite_cache.popitem(last=False)
+            _word_sprite_cache_bytes -= evicted.nbytes
+    return sprite
+
+
+def _word_sprite_position(sprite: _WordSprite, *, video_width: int, video_height: int) -> tuple[int, int]:
+    """Top-left frame coordinates for a sprite."""
+    # Position: lower third (75% down), standard TikTok caption zone
+    # Above the TikTok UI buttons but clearly in the subtitle area
+    padded_width = sprite.text_width + (sprite.outline_range * 2) + sprite.shadow_offset
+    padded_height = sprite.text_height + (sprite.outline_range * 2) + sprite.shadow_offset
+    x = ((video_width - padded_width) / 2) + sprite.outline_range
+    y = int(video_height * 0.75) - (padded_height / 2) + sprite.outline_range
+    return int(round(x + sprite.left)), int(round(y + sprite.top))
+
+
 def _render_caption_frame(
     text: str,
     highlight_index: int,
@@ -117,98 +271,41 @@ def _render_caption_frame(
     color cycling and thick black outline.
     """
     img = Image.new("RGBA", (video_width, video_height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
     # Hormozi style: show only the active word, ALL CAPS
-    word_text = words[highlight_index].word.upper()
-    font, resolved_font_size, text_width, text_height, outline_range, shadow_offset = _fit_caption_layout(
-        draw=draw,
-        word_text=word_text,
+    sprite = _get_word_sprite(
+        words[highlight_index].word.upper(),
         video_width=video_width,
         base_font_size=font_size,
+        fill=_caption_fill(word_index_global),
     )
-
-    # Color cycling: alternate white and yellow based on global word index
-    # Every other word gets yellow for visual rhythm
-    if word_index_global % 2 == 1:
-        fill = (255, 215, 0, 255)  # Yellow #FFD700
-    else:
-        fill = (255, 255, 255, 255)  # White
-
-    # Position: lower third (75% down), standard TikTok caption zone
-    # Above the TikTok UI buttons but clearly in the subtitle area
-    padded_width = text_width + (outline_range * 2) + shadow_offset
-    padded_height = text_height + (outline_range * 2) + shadow_offset
-    x = ((video_width - padded_width) / 2) + outline_range
-    y = int(video_height * 0.75) - (padded_height / 2) + outline_range
-
-    for dx in range(-outline_range, outline_range + 1):
-        for dy in range(-outline_range, outline_range + 1):
-            if dx * dx + dy * dy <= outline_range * outline_range:
-                draw.text((x + dx, y + dy), word_text, font=font, fill=(0, 0, 0, 255))
-
-    draw.text((x + shadow_offset, y + shadow_offset), word_text, font=font, fill=(0, 0, 0, 180))
-    draw.text((x, y), word_text, font=font, fill=fill)
-
+    img.paste(sprite.image, _word_sprite_position(sprite, video_width=video_width, video_height=video_height))
     return img
 
 
 def _get_video_fps(video_path: str) -> float:
-    """Get video FPS using ffprobe."""
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=r_frame_rate",
-        "-of", "json",
-        video_path,
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-    if result.returncode != 0:
-        return 30.0  # Default fallback
+    """Get video FPS from the shared media probe."""
     try:
-        data = json.loads(result.stdout)
-        rate_str = data["streams"][0]["r_frame_rate"]
-        num, den = rate_str.split("/")
-        return float(num) / float(den)
-    except (KeyError, IndexError, ValueError, ZeroDivisionError):
-        return 30.0
+        fps = probe_media(video_path).fps
+    except MediaProbeError:
+        return 30.0  # Default fallback
+    return fps or 30.0
 
 
 def _get_video_dimensions(video_path: str) -> tuple[int, int]:
-    """Get video width and height using ffprobe."""
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height",
-        "-of", "json",
-        video_path,
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-    if result.returncode != 0:
-        return 1080, 1920
+    """Get video width and height from the shared media probe."""
     try:
-        data = json.loads(result.stdout)
-        stream = data["streams"][0]
-        return int(stream["width"]), int(stream["height"])
-    except (KeyError, IndexError, ValueError):
+        probe = probe_media(video_path)
+        return probe.width, probe.height
+    except (MediaProbeError, ValueError):
         return 1080, 1920
 
 
 def _get_video_duration(video_path: str) -> float:
-    """Get video duration in seconds using ffprobe."""
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-show_entries", "format=duration",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        video_path,
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-    if result.returncode != 0:
-        return 0.0
+    """Get video duration in seconds from the shared media probe."""
     try:
-        duration = float(result.stdout.strip())
-    except ValueError:
+        return probe_media(video_path).duration or 0.0
+    except MediaProbeError:
         return 0.0
-    return duration if duration > 0.0 else 0.0
 
 
 def _fit_transcript_to_video_duration(
@@ -268,29 +365,189 @@ def _build_word_overlay_segments(words: list[Word], *, fps: float) -> list[tuple
     return segments
 
 
+def _format_ass_timestamp(centiseconds: int) -> str:
+    hours, remainder = divmod(max(centiseconds, 0), 360000)
+    minutes, remainder = divmod(remainder, 6000)
+    seconds, cs = divmod(remainder, 100)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{cs:02d}"
+
+
+def _escape_ass_text(text: str) -> str:
+    """Strip characters libass would treat as override blocks or escapes."""
+    return text.replace("\\", "/").replace("{", "(").replace("}", ")").replace("\n", " ")
+
+
+def _ass_font_family(font: ImageFont.FreeTypeFont) -> tuple[str, bool]:
+    try:
+        family, style = font.getname()
+    except Exception:
+        return "Impact", False
+    return family or "Impact", "bold" in (style or "").lower()
+
+
+def _ass_font_size(font: ImageFont.FreeTypeFont, pixel_size: int) -> int:
+    """Convert a Pillow em size to an ASS Fontsize.
+
+    libass sizes fonts by line height (ascent + descent) rather than em, so use
+    the Pillow metrics to land on the same visible glyph height.
+    """
+    try:
+        ascent, descent = font.getmetrics()
+    except Exception:
+        return pixel_size
+    return max(int(ascent + descent), 1)
+
+
 def generate_ass_content(
-    transcript: WordLevelTranscript, *, video_width: int = 1080, video_height: int = 1920
+    transcript: WordLevelTranscript,
+    *,
+    video_width: int = 1080,
+    video_height: int = 1920,
+    fps: float = 30.0,
 ) -> str:
-    """Generate ASS subtitle content (kept for compatibility/testing)."""
-    font_size = max(int(video_width * 0.065), 48)
-    margin_bottom = int(video_height * 0.25)
+    """Generate the Hormozi-style ASS script: one centered ALL-CAPS word per event.
+
+    Mirrors ``_render_caption_frame``: same per-word font fitting, outline and
+    shadow sizes, lower-third placement and white/yellow alternation, with the
+    same half-open timing windows as the overlay path.
+    """
+    base_font_size = max(int(video_width * 0.1), 72)
+    measure = ImageDraw.Draw(Image.new("RGBA", (1, 1), (0, 0, 0, 0)))
+    base_font = _get_font(base_font_size)
+    family, bold = _ass_font_family(base_font)
+    base_outline = max(int(base_font_size * 0.06), 4)
+    base_shadow = max(int(base_font_size * 0.04), 3)
+    center_x = video_width // 2
+    center_y = int(video_height * 0.75)
     header = f"""[Script Info]
 Title: Auto Captions
 ScriptType: v4.00+
 PlayResX: {video_width}
 PlayResY: {video_height}
-WrapStyle: 0
+WrapStyle: 2
+ScaledBorderAndShadow: yes
 
 [V4+ Styles]
 Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,Arial Bold,{font_size},&H00FFFFFF,&H000000FF,&H00000000,&H80000000,-1,0,0,0,100,100,0,0,1,3,1,2,40,40,{margin_bottom},1
+Style: Caption,{family},{_ass_font_size(base_font, base_font_size)},{_ASS_WHITE},{_ASS_WHITE},{_ASS_BLACK},{_ASS_SHADOW},{-1 if bold else 0},0,0,0,100,100,0,0,1,{base_outline},{base_shadow},5,0,0,0,1
 
 [Events]
 Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
-    if not transcript.words:
+    segments = _build_word_overlay_segments(transcript.words or [], fps=fps)
+    if not segments:
         return header
-    return header
+
+    events: list[str] = []
+    previous_end_cs = 0
+    for global_idx, (start, end, word) in enumerate(segments):
+        word_text = word.word.upper()
+        font, resolved_font_size, _, _, outline_range, shadow_offset = _fit_caption_layout(
+            draw=measure,
+            word_text=word_text,
+            video_width=video_width,
+            base_font_size=base_font_size,
+        )
+        # Round both edges on the same centisecond grid so adjacent windows stay half-open.
+        start_cs = max(int(round(start * 100)), previous_end_cs)
+        end_cs = max(int(round(end * 100)), start_cs + 1)
+        previous_end_cs = end_cs
+        colour = _ASS_YELLOW if global_idx % 2 == 1 else _ASS_WHITE
+        overrides = (
+            f"\\pos({center_x},{center_y})"
+            f"\\fs{_ass_font_size(font, resolved_font_size)}"
+            f"\\bord{outline_range}\\shad{shadow_offset}"
+            f"\\1c{colour}&"
+        )
+        events.append(
+            f"Dialogue: 0,{_format_ass_timestamp(start_cs)},{_format_ass_timestamp(end_cs)},"
+            f"Caption,,0,0,0,,{{{overrides}}}{_escape_ass_text(word_text)}"
+        )
+    return header + "\n".join(events) + "\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _libass_available() -> bool:
+    """Whether the local FFmpeg build has the libass ``ass`` filter."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-filters"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    if result.returncode != 0:
+        return False
+    return any(line.split()[1:2] == ["ass"] for line in result.stdout.splitlines() if line.strip())
+
+
+def _resolve_render_mode(render_mode: str | None) -> str:
+    mode = (render_mode or CAPTION_RENDER_MODE or CAPTION_RENDER_MODE_AUTO).strip().lower()
+    if mode == CAPTION_RENDER_MODE_OVERLAY:
+        return CAPTION_RENDER_MODE_OVERLAY
+    if mode == CAPTION_RENDER_MODE_ASS:
+        return CAPTION_RENDER_MODE_ASS
+    return CAPTION_RENDER_MODE_ASS if _libass_available() else CAPTION_RENDER_MODE_OVERLAY
+
+
+def _escape_filter_value(value: str) -> str:
+    """Escape a path for use as an unquoted FFmpeg filter option value."""
+    return value.replace("\\", "\\\\").replace(":", "\\:").replace("'", "\\'").replace(",", "\\,")
+
+
+def _build_ass_filter(ass_path: str) -> str:
+    option = f"filename={_escape_filter_value(ass_path)}"
+    font = _get_font(72)
+    font_path = getattr(font, "path", None)
+    if isinstance(font_path, str) and os.path.exists(font_path):
+        option += f":fontsdir={_escape_filter_value(os.path.dirname(font_path))}"
+    return f"[0:v]ass={option}[vout]"
+
+
+def _build_overlay_filter(
+    *,
+    video_path: str,
+    words: list[Word],
+    fps: float,
+    video_width: int,
+    video_height: int,
+    work_dir: str,
+) -> tuple[list[str], str, int]:
+    """Chain timed overlay filters over cropped word sprites.
+
+    Each distinct sprite is written once and placed at its frame offset, so
+    the temp PNGs hold only the word's bounding box rather than a full frame.
+    """
+    font_size = max(int(video_width * 0.1), 72)
+    sprite_paths: dict[tuple[str, tuple[int, ...]], str] = {}
+    segments = []
+    for global_idx, (word_start, word_end, word) in enumerate(_build_word_overlay_segments(words, fps=fps)):
+        word_text = word.word.upper()
+        fill = _caption_fill(global_idx)
+        sprite = _get_word_sprite(word_text, video_width=video_width, base_font_size=font_size, fill=fill)
+        sprite_path = sprite_paths.get((word_text, fill))
+        if sprite_path is None:
+            sprite_path = os.path.join(work_dir, f"sprite_{len(sprite_paths):04d}.png")
+            sprite.image.save(sprite_path)
+            sprite_paths[(word_text, fill)] = sprite_path
+        x, y = _word_sprite_position(sprite, video_width=video_width, video_height=video_height)
+        segments.append((word_start, word_end, sprite_path, x, y))
+
+    # Strategy: chain overlay filters, each enabled only during its time window
+    inputs = ["-i", video_path]
+    filter_parts = []
+    prev_label = "[0:v]"
+    for i, (start, end, sprite_path, x, y) in enumerate(segments):
+        inputs.extend(["-i", sprite_path])
+        input_idx = i + 1
+        out_label = f"[v{i}]" if i < len(segments) - 1 else "[vout]"
+        filter_parts.append(
+            f"{prev_label}[{input_idx}:v]overlay={x}:{y}:enable='gte(t,{start:.3f})*lt(t,{end:.3f})'{out_label}"
+        )
+        prev_label = out_label
+    return inputs, ";".join(filter_parts), len(segments)
 
 
 def burn_captions(
@@ -300,8 +557,14 @@ def burn_captions(
     correlation_id: str,
     video_width: int = 0,
     video_height: int = 0,
+    render_mode: str | None = None,
 ) -> str:
-    """Burn captions into video using Pillow + FFmpeg overlay. Returns output path."""
+    """Burn captions into video in one FFmpeg pass. Returns output path.
+
+    ``render_mode`` overrides ``CAPTION_RENDER_MODE``: ``ass`` burns a single
+    libass script, ``overlay`` chains one PNG overlay per word, and ``auto``
+    picks ``ass`` whenever the FFmpeg build supports it.
+    """
     logger.info("caption_burn_start", correlation_id=correlation_id, video_path=video_path)
 
     # Auto-detect dimensions if not provided
@@ -315,55 +578,44 @@ def burn_captions(
         video_duration_seconds=video_duration,
         fps=fps,
     )
-    font_size = max(int(video_width * 0.1), 72)
+    mode = _resolve_render_mode(render_mode)
 
-    # Create temp directory for overlay frames
-    frames_dir = tempfile.mkdtemp(prefix="caption_frames_")
+    work_dir = tempfile.mkdtemp(prefix="caption_frames_")
     output_fd, output_path = tempfile.mkstemp(suffix=".mp4")
     os.close(output_fd)
 
     try:
-        # Hormozi style: one word at a time, each as its own frame
-        segments = []
-        all_words = transcript.words
-        overlay_segments = _build_word_overlay_segments(all_words, fps=fps)
-        for global_idx, (word_start, word_end, word) in enumerate(overlay_segments):
-            frame_img = _render_caption_frame(
-                text=word.word,
-                highlight_index=0,
-                words=[word],
-                video_width=video_width,
-                video_height=video_height,
-                font_size=font_size,
-                word_index_global=global_idx,
-            )
-            frame_path = os.path.join(frames_dir, f"frame_{global_idx:04d}.png")
-            frame_img.save(frame_path)
-            segments.append((word_start, word_end, frame_path))
-
-        if not segments:
+        all_words = transcript.words or []
+        if not all_words:
             # No segments to overlay — just copy
             logger.warning("caption_burn_no_segments", correlation_id=correlation_id)
             import shutil
             shutil.copy2(video_path, output_path)
             return output_path
 
-        # Build FFmpeg filter_complex with timed overlays
-        # Strategy: chain overlay filters, each enabled only during its time window
-        inputs = ["-i", video_path]
-        filter_parts = []
-        prev_label = "[0:v]"
-
-        for i, (start, end, frame_path) in enumerate(segments):
-            inputs.extend(["-i", frame_path])
-            input_idx = i + 1
-            out_label = f"[v{i}]" if i < len(segments) - 1 else "[vout]"
-            filter_parts.append(
-                f"{prev_label}[{input_idx}:v]overlay=0:0:enable='gte(t,{start:.3f})*lt(t,{end:.3f})'{out_label}"
+        if mode == CAPTION_RENDER_MODE_ASS:
+            ass_path = os.path.join(work_dir, "captions.ass")
+            with open(ass_path, "w", encoding="utf-8") as handle:
+                handle.write(
+                    generate_ass_content(
+                        transcript,
+                        video_width=video_width,
+                        video_height=video_height,
+                        fps=fps,
+                    )
+                )
+            inputs = ["-i", video_path]
+            filter_complex = _build_ass_filter(ass_path)
+            segment_count = len(all_words)
+        else:
+            inputs, filter_complex, segment_count = _build_overlay_filter(
+                video_path=video_path,
+                words=all_words,
+                fps=fps,
+                video_width=video_width,
+                video_height=video_height,
+                work_dir=work_dir,
             )
-            prev_label = out_label
-
-        filter_complex = ";".join(filter_parts)
 
         cmd = [
             "ffmpeg", "-y",
@@ -377,13 +629,19 @@ def burn_captions(
             output_path,
         ]
 
-        logger.info("caption_burn_ffmpeg_start", correlation_id=correlation_id, segments=len(segments))
+        logger.info(
+            "caption_burn_ffmpeg_start",
+            correlation_id=correlation_id,
+            segments=segment_count,
+            render_mode=mode,
+        )
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
 
         if result.returncode != 0:
             logger.error(
                 "caption_burn_ffmpeg_failed",
                 correlation_id=correlation_id,
+                render_mode=mode,
                 stderr=result.stderr[-500:],
             )
             raise CaptionRendererError(
@@ -391,17 +649,17 @@ def burn_captions(
                 transient=False,
             )
 
-        logger.info("caption_burn_done", correlation_id=correlation_id, output_path=output_path)
+        logger.info("caption_burn_done", correlation_id=correlation_id, output_path=output_path, render_mode=mode)
         return output_path
 
     finally:
-        # Clean up frame images
-        for f in os.listdir(frames_dir):
+        # Clean up sprite images and the ASS script
+        for f in os.listdir(work_dir):
             try:
-                os.unlink(os.path.join(frames_dir, f))
+                os.unlink(os.path.join(work_dir, f))
             except OSError:
                 pass
         try:
-            os.rmdir(frames_dir)
+            os.rmdir(work_dir)
         except OSError:
             pass
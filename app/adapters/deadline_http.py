@@ -0,0 +1,190 @@
+"""
+Shared keep-alive HTTP transport for synchronous calls with an absolute deadline.
+
+Sync code used to wrap each deadline-bounded request in ``asyncio.run`` with a fresh
+``httpx.AsyncClient``, paying for a new event loop, TCP connect and TLS handshake on
+every call. Requests now run on one long-lived background event loop that keeps a
+pooled client per origin (HTTP/2 when ``h2`` is installed). The calling thread
+blocks until the response arrives or the deadline passes; on timeout the in-flight
+request is cancelled on the loop, exactly like ``asyncio.wait_for`` did before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEADLINE_HTTP_MAX_CONNECTIONS = max(int(os.getenv("DEADLINE_HTTP_MAX_CONNECTIONS", "32")), 1)
+DEADLINE_HTTP_KEEPALIVE_SECONDS = float(os.getenv("DEADLINE_HTTP_KEEPALIVE_SECONDS", "30"))
+# Extra time the caller waits for the loop to deliver its own deadline cancellation.
+_DEADLINE_CANCEL_GRACE_SECONDS = 0.25
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class DeadlineHttpTransport:
+    """Background event loop plus one pooled ``httpx.AsyncClient`` per origin."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._clients: Dict[Tuple[str, bool], httpx.AsyncClient] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked worker inherits the attribute but not the thread; start over.
+            if self._loop is None or self._pid != os.getpid() or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop, ready),
+                    name="deadline-http",
+                    daemon=True,
+                )
+                thread.start()
+                ready.wait()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+                self._clients = {}
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _client(self, origin: str, follow_redirects: bool) -> httpx.AsyncClient:
+        # Only called on the loop thread, so the dict needs no lock.
+        key = (origin, follow_redirects)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                follow_redirects=follow_redirects,
+                timeout=None,
+                limits=httpx.Limits(
+                    max_connections=DEADLINE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=DEADLINE_HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=DEADLINE_HTTP_KEEPALIVE_SECONDS,
+                ),
+            )
+            self._clients[key] = client
+        return client
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout_seconds: float,
+        follow_redirects: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        client = self._client(_origin(url), follow_redirects)
+        return await asyncio.wait_for(
+            client.request(method, url, **kwargs),
+            timeout=timeout_seconds,
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout_seconds: float,
+        follow_redirects: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send one request and return the fully read response.
+
+        Raises ``TimeoutError`` once ``timeout_seconds`` of wall-clock time have
+        passed; ``httpx`` transport errors propagate unchanged. Extra keyword
+        arguments (``params``, ``json``, ``headers``, ``timeout``...) go to
+        ``httpx.AsyncClient.request``.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Deadline HTTP requests cannot be issued from the transport loop")
+        deadline = max(0.1, float(timeout_seconds))
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._send(
+                method,
+                url,
+                timeout_seconds=deadline,
+                follow_redirects=follow_redirects,
+                **kwargs,
+            ),
+            loop,
+        )
+        try:
+            return future.result(timeout=deadline + _DEADLINE_CANCEL_GRACE_SECONDS)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        """Close pooled connections and stop the loop; the next request restarts it."""
+        with self._lock:
+            loop, thread, clients = self._loop, self._thread, list(self._clients.values())
+            self._loop, self._thread, self._pid, self._clients = None, None, None, {}
+        if loop is None or thread is None or not thread.is_alive():
+            return
+
+        async def _close_clients() -> None:
+            await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close_clients(), loop).result(timeout=5)
+        except Exception as exc:
+            logger.warning("deadline_http_close_failed", error=str(exc))
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
+
+_transport = DeadlineHttpTransport()
+
+
+def get_deadline_http_transport() -> DeadlineHttpTransport:
+    return _transport
+
+
+def request_with_deadline(
+    method: str,
+    url: str,
+    *,
+    timeout_seconds: float,
+    follow_redirects: bool = False,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Module-level shortcut for ``DeadlineHttpTransport.request`` on the shared transport."""
+    return get_deadline_http_transport().request(
+        method,
+        url,
+        timeout_seconds=timeout_seconds,
+        follow_redirects=follow_redirects,
+        **kwargs,
+    )
+
+
+def close_deadline_http_transport() -> None:
+    get_deadline_http_transport().close()
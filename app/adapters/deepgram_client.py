@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import httpx
 
@@ -13,6 +14,7 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 DEEPGRAM_API_URL = "https://api.deepgram.com/v1/listen"
+_UPLOAD_CHUNK_BYTES = 256 * 1024
 
 
 class DeepgramError(Exception):
@@ -54,10 +56,56 @@ class DeepgramClient:
 
     def transcribe(self, *, audio_bytes: bytes, correlation_id: str, language: str = "de") -> WordLevelTranscript:
         logger.info("deepgram_transcribe_start", correlation_id=correlation_id, bytes_len=len(audio_bytes), language=language)
+        return self._transcribe_content(
+            content=audio_bytes,
+            content_type="audio/mp4",
+            content_length=len(audio_bytes),
+            correlation_id=correlation_id,
+            language=language,
+        )
+
+    def transcribe_file(
+        self,
+        *,
+        path: str,
+        correlation_id: str,
+        content_type: str = "audio/mp4",
+        language: str = "de",
+    ) -> WordLevelTranscript:
+        """Transcribe a media file by streaming it from disk instead of loading it into memory."""
+        size = os.path.getsize(path)
+        logger.info(
+            "deepgram_transcribe_start",
+            correlation_id=correlation_id,
+            bytes_len=size,
+            content_type=content_type,
+            language=language,
+        )
+        return self._transcribe_content(
+            content=_iter_file_chunks(path),
+            content_type=content_type,
+            content_length=size,
+            correlation_id=correlation_id,
+            language=language,
+        )
+
+    def _transcribe_content(
+        self,
+        *,
+        content: Any,
+        content_type: str,
+        content_length: int,
+        correlation_id: str,
+        language: str,
+    ) -> WordLevelTranscript:
         params = {"model": "nova-2", "smart_format": "true", "language": language}
-        headers = {"Authorization": f"Token {self._api_key}", "Content-Type": "audio/mp4"}
+        headers = {
+            "Authorization": f"Token {self._api_key}",
+            "Content-Type": content_type,
+            "Content-Length": str(content_length),
+        }
         try:
-            response = self._client.post(DEEPGRAM_API_URL, params=params, headers=headers, content=audio_bytes)
+            response = self._client.post(DEEPGRAM_API_URL, params=params, headers=headers, content=content)
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             status = exc.response.status_code
@@ -88,5 +136,14 @@ class DeepgramClient:
         return WordLevelTranscript(words=words, full_text=full_text)
 
 
+def _iter_file_chunks(path: str) -> Iterator[bytes]:
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+
+
 def get_deepgram_client() -> DeepgramClient:
     return DeepgramClient()
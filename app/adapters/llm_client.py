@@ -5,7 +5,6 @@ Per Constitution § VI: Adapterize Specialists
 """
 
 from typing import Optional, Dict, Any, List, Iterator
-import asyncio
 import base64
 import httpx
 import json
@@ -17,6 +16,7 @@ from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.core.errors import ThirdPartyError, ValidationError
 from app.core.german import restore_german_umlauts, restore_german_umlauts_in_json
+from app.adapters.deadline_http import request_with_deadline
 from app.adapters.vertex_gemini_client import get_vertex_gemini_client
 from app.adapters.grounding_url_resolver import (
     is_grounding_redirect_url,
@@ -50,24 +50,6 @@ def _gemini_total_budget_timeout(total_seconds: float) -> httpx.Timeout:
     return httpx.Timeout(connect=connect, read=read, write=write, pool=pool)
 
 
-async def _async_gemini_api_post_with_deadline(
-    *,
-    url: str,
-    params: Dict[str, str],
-    payload: Dict[str, Any],
-    timeout_seconds: float,
-) -> httpx.Response:
-    async with httpx.AsyncClient(
-        headers={"Content-Type": "application/json", "Accept": "application/json"},
-        follow_redirects=True,
-        timeout=_gemini_total_budget_timeout(timeout_seconds),
-    ) as client:
-        return await asyncio.wait_for(
-            client.post(url, params=params, json=payload),
-            timeout=max(0.1, float(timeout_seconds)),
-        )
-
-
 def _gemini_api_post_with_deadline(
     *,
     url: str,
@@ -76,13 +58,15 @@ def _gemini_api_post_with_deadline(
     timeout_seconds: float,
 ) -> httpx.Response:
     try:
-        return asyncio.run(
-            _async_gemini_api_post_with_deadline(
-                url=url,
-                params=params,
-                payload=payload,
-                timeout_seconds=timeout_seconds,
-            )
+        return request_with_deadline(
+            "POST",
+            url,
+            timeout_seconds=timeout_seconds,
+            follow_redirects=True,
+            params=params,
+            json=payload,
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            timeout=_gemini_total_budget_timeout(timeout_seconds),
         )
     except TimeoutError as exc:
         raise httpx.TimeoutException(
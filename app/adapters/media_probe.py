@@ -0,0 +1,228 @@
+"""Media probe — one ffprobe per file, shared by every video stage.
+
+The poller, stitcher, caption renderer and shot-production runner all need the
+same stream facts (geometry, frame rate, per-stream and container durations).
+``probe_media`` runs a single ffprobe that returns all of them and memoizes the
+result in a process-wide LRU keyed by file identity (path, inode, size, mtime).
+Setting ``MEDIA_PROBE_CACHE_DIR`` adds a content-addressed on-disk store keyed
+by sha256, so the same bytes staged under a new temp path or by another worker
+process skip ffprobe entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+MEDIA_PROBE_CACHE_SIZE = int(os.getenv("MEDIA_PROBE_CACHE_SIZE", "256"))
+MEDIA_PROBE_CACHE_DIR = os.getenv("MEDIA_PROBE_CACHE_DIR", "").strip()
+_FFPROBE_TIMEOUT_SECONDS = 30
+_FFPROBE_ENTRIES = (
+    "format=duration,size,bit_rate,format_name:"
+    "stream=index,codec_type,codec_name,width,height,r_frame_rate,sample_rate,channels,duration"
+)
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+_StatKey = Tuple[str, int, int, int]
+_probe_cache: "OrderedDict[_StatKey, MediaProbe]" = OrderedDict()
+_probe_cache_lock = threading.Lock()
+
+
+class MediaProbeError(ValueError):
+    def __init__(self, message: str, *, stderr: str = ""):
+        super().__init__(message)
+        self.stderr = stderr
+
+
+@dataclass(frozen=True)
+class MediaProbe:
+    """Parsed ffprobe output for one media file."""
+
+    payload: Dict[str, Any]
+    path: str = ""
+
+    @property
+    def streams(self) -> List[Dict[str, Any]]:
+        return list(self.payload.get("streams") or [])
+
+    @property
+    def format(self) -> Dict[str, Any]:
+        return dict(self.payload.get("format") or {})
+
+    def stream(self, codec_type: str) -> Optional[Dict[str, Any]]:
+        """First stream of the given type (``video`` / ``audio``), if any."""
+        for stream in self.payload.get("streams") or []:
+            if stream.get("codec_type") == codec_type:
+                return stream
+        return None
+
+    @property
+    def width(self) -> int:
+        return int(self._require_video_stream()["width"])
+
+    @property
+    def height(self) -> int:
+        return int(self._require_video_stream()["height"])
+
+    @property
+    def fps(self) -> Optional[float]:
+        """Frame rate of the first video stream, or None when missing/unparseable."""
+        stream = self.stream("video") or {}
+        text = str(stream.get("r_frame_rate") or "").strip()
+        try:
+            if "/" in text:
+                num, _, den = text.partition("/")
+                numerator, denominator = float(num), float(den)
+                return numerator / denominator if numerator > 0 and denominator > 0 else None
+            value = float(text)
+        except ValueError:
+            return None
+        return value if value > 0 else None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Container duration in seconds."""
+        return _positive_float((self.payload.get("format") or {}).get("duration"))
+
+    def stream_duration(self, codec_type: str) -> Optional[float]:
+        stream = self.stream(codec_type)
+        if stream is None:
+            return None
+        return _positive_float(stream.get("duration"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """A detached copy of the raw ffprobe JSON."""
+        return json.loads(json.dumps(self.payload))
+
+    def _require_video_stream(self) -> Dict[str, Any]:
+        stream = self.stream("video")
+        if stream is None or "width" not in stream or "height" not in stream:
+            streams = ", ".join(
+                f"{item.get('index', '?')}:{item.get('codec_type') or 'unknown'}/{item.get('codec_name') or 'unknown'}"
+                for item in self.streams
+            ) or "none"
+            message = f"ffprobe found no video stream in {self.path or 'media file'} (streams: {streams})"
+            # Callers report ``stderr``; ffprobe's own is empty here because the probe succeeded.
+            raise MediaProbeError(message, stderr=message)
+        return stream
+
+
+def _positive_float(raw: Any) -> Optional[float]:
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def _run_ffprobe(path: str) -> Dict[str, Any]:
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        _FFPROBE_ENTRIES,
+        "-of",
+        "json",
+        path,
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, timeout=_FFPROBE_TIMEOUT_SECONDS)
+    if result.returncode != 0:
+        stderr = str(result.stderr or "")[-300:]
+        raise MediaProbeError(f"ffprobe failed: {stderr[-200:]}", stderr=stderr)
+    try:
+        payload = json.loads(result.stdout)
+    except (json.JSONDecodeError, TypeError) as exc:
+        raise MediaProbeError("ffprobe returned invalid JSON", stderr="ffprobe returned invalid JSON") from exc
+    if not isinstance(payload, dict):
+        raise MediaProbeError("ffprobe returned invalid JSON", stderr="ffprobe returned invalid JSON")
+    return payload
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _store_path(store_dir: str, content_sha256: str) -> str:
+    return os.path.join(store_dir, content_sha256[:2], f"{content_sha256}.json")
+
+
+def _read_store(store_dir: str, content_sha256: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_store_path(store_dir, content_sha256), "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_store(store_dir: str, content_sha256: str, payload: Dict[str, Any]) -> None:
+    target = _store_path(store_dir, content_sha256)
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".part")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, target)
+    except OSError as exc:
+        logger.warning("media_probe_store_write_failed", path=target, error=str(exc))
+
+
+def probe_media(path: "str | os.PathLike[str]") -> MediaProbe:
+    """Return stream and container facts for a media file, probing it at most once.
+
+    Raises:
+        MediaProbeError: the file is missing or ffprobe fails. Failures are not cached.
+    """
+    resolved = os.path.realpath(os.fspath(path))
+    try:
+        stat = os.stat(resolved)
+    except OSError as exc:
+        raise MediaProbeError(f"media file not found: {path}", stderr=str(exc)) from exc
+    stat_key: _StatKey = (resolved, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    with _probe_cache_lock:
+        cached = _probe_cache.get(stat_key)
+        if cached is not None:
+            _probe_cache.move_to_end(stat_key)
+            return cached
+
+    payload: Optional[Dict[str, Any]] = None
+    content_sha256 = ""
+    store_dir = MEDIA_PROBE_CACHE_DIR
+    if store_dir:
+        content_sha256 = _file_sha256(resolved)
+        payload = _read_store(store_dir, content_sha256)
+    if payload is None:
+        payload = _run_ffprobe(resolved)
+        if store_dir:
+            _write_store(store_dir, content_sha256, payload)
+
+    probe = MediaProbe(payload=payload, path=resolved)
+    with _probe_cache_lock:
+        _probe_cache[stat_key] = probe
+        _probe_cache.move_to_end(stat_key)
+        while len(_probe_cache) > max(MEDIA_PROBE_CACHE_SIZE, 1):
+            _probe_cache.popitem(last=False)
+    return probe
+
+
+def clear_media_probe_cache() -> None:
+    """Drop the in-process LRU (the on-disk store is left alone)."""
+    with _probe_cache_lock:
+        _probe_cache.clear()
@@ -0,0 +1,224 @@
+"""
+Cross-process rate limiting for AI provider calls.
+
+The API server and every worker (topics, audits, expansion, scene images) call
+Gemini on Vertex independently. ``_VERTEX_REQUEST_SEMAPHORE`` only bounds one
+process, so together they overshoot the project quota and each finds out from
+its own 429s, backing off on its own schedule while the others keep spending.
+This limiter keeps one token bucket per provider and model in Postgres (see the
+``acquire_provider_rate_limit`` RPC). Every process draws a token before a
+request; a 429 anywhere halves the bucket's rate and pauses it for everyone
+until the provider's Retry-After has passed, after which the rate recovers
+linearly. Grants, throttles and 429s are recorded per tenant (process role).
+
+Budgets come from ``PROVIDER_RATE_LIMITS`` as requests per minute, e.g.
+``vertex_gemini:gemini-2.5-pro=60,vertex_gemini:*=600``. Provider/model pairs
+without a budget are not limited. When the database cannot be reached the
+limiter fails open for a while rather than stopping provider traffic.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.adapters.supabase_client import get_supabase
+from app.core.errors import ThirdPartyError
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PROVIDER_RATE_LIMITS = os.getenv("PROVIDER_RATE_LIMITS", "")
+# Bucket size in seconds of budget: how large a burst may follow an idle period.
+PROVIDER_RATE_LIMIT_BURST_SECONDS = max(float(os.getenv("PROVIDER_RATE_LIMIT_BURST_SECONDS", "5")), 1.0)
+# Seconds for a fully backed-off rate to climb back to the configured budget.
+PROVIDER_RATE_LIMIT_RECOVERY_SECONDS = max(float(os.getenv("PROVIDER_RATE_LIMIT_RECOVERY_SECONDS", "60")), 1.0)
+PROVIDER_RATE_LIMIT_MIN_SCALE = min(max(float(os.getenv("PROVIDER_RATE_LIMIT_MIN_SCALE", "0.1")), 0.01), 1.0)
+# Longest a request without its own deadline waits for a token.
+PROVIDER_RATE_LIMIT_MAX_WAIT_SECONDS = float(os.getenv("PROVIDER_RATE_LIMIT_MAX_WAIT_SECONDS", "60"))
+PROVIDER_RATE_LIMIT_FAIL_OPEN_SECONDS = float(os.getenv("PROVIDER_RATE_LIMIT_FAIL_OPEN_SECONDS", "30"))
+_MIN_POLL_SECONDS = 0.05
+
+Budgets = Dict[Tuple[str, str], float]
+
+
+def parse_provider_rate_limits(raw: str) -> Budgets:
+    """``provider:model=rpm`` entries, comma separated; ``*`` as model is the provider default."""
+    budgets: Budgets = {}
+    for entry in str(raw or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        key, _, value = entry.partition("=")
+        provider, _, model = key.strip().partition(":")
+        try:
+            requests_per_minute = float(value)
+        except ValueError:
+            requests_per_minute = 0.0
+        if not provider.strip() or requests_per_minute <= 0:
+            logger.warning("provider_rate_limit_entry_invalid", entry=entry)
+            continue
+        budgets[(provider.strip(), model.strip() or "*")] = requests_per_minute
+    return budgets
+
+
+def _default_tenant() -> str:
+    configured = os.getenv("PROVIDER_RATE_LIMIT_TENANT", "").strip()
+    if configured:
+        return configured
+    return os.path.splitext(os.path.basename(sys.argv[0] or ""))[0] or "unknown"
+
+
+def _rpc(function_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    response = get_supabase().client.rpc(function_name, payload).execute()
+    data = response.data
+    if isinstance(data, list):
+        return data[0] if data else {}
+    return data or {}
+
+
+class ProviderRateLimiter:
+    """Token bucket per provider and model, shared through Postgres."""
+
+    def __init__(
+        self,
+        *,
+        budgets: Optional[Budgets] = None,
+        tenant: Optional[str] = None,
+        burst_seconds: float = PROVIDER_RATE_LIMIT_BURST_SECONDS,
+        recovery_seconds: float = PROVIDER_RATE_LIMIT_RECOVERY_SECONDS,
+        min_scale: float = PROVIDER_RATE_LIMIT_MIN_SCALE,
+        fail_open_seconds: float = PROVIDER_RATE_LIMIT_FAIL_OPEN_SECONDS,
+        rpc: Callable[[str, Dict[str, Any]], Dict[str, Any]] = _rpc,
+    ) -> None:
+        self._budgets = parse_provider_rate_limits(PROVIDER_RATE_LIMITS) if budgets is None else dict(budgets)
+        self._tenant = tenant or _default_tenant()
+        self._burst_seconds = burst_seconds
+        self._recovery_seconds = recovery_seconds
+        self._min_scale = min_scale
+        self._fail_open_seconds = fail_open_seconds
+        self._rpc = rpc
+        self._lock = threading.Lock()
+        self._bypass_until = 0.0
+
+    def budget(self, provider: str, model: str) -> Optional[float]:
+        """Requests per minute for ``provider``/``model``, or None when it is not limited."""
+        return self._budgets.get((provider, model), self._budgets.get((provider, "*")))
+
+    def _call(self, function_name: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if time.monotonic() < self._bypass_until:
+                return None
+        try:
+            return self._rpc(function_name, payload)
+        except Exception as exc:  # noqa: BLE001 - the limiter must never take provider traffic down.
+            with self._lock:
+                self._bypass_until = time.monotonic() + self._fail_open_seconds
+            logger.warning(
+                "provider_rate_limiter_unavailable",
+                function=function_name,
+                error=str(exc),
+                fail_open_seconds=self._fail_open_seconds,
+            )
+            return None
+
+    def acquire(self, provider: str, model: str, *, max_wait_seconds: Optional[float] = None) -> float:
+        """Wait for a token from the shared bucket and return the seconds spent waiting.
+
+        Raises a 429 ThirdPartyError before any request is sent when the bucket
+        cannot grant one within ``max_wait_seconds``.
+        """
+        requests_per_minute = self.budget(provider, model)
+        if requests_per_minute is None:
+            return 0.0
+        if max_wait_seconds is None:
+            max_wait_seconds = PROVIDER_RATE_LIMIT_MAX_WAIT_SECONDS
+        payload = {
+            "p_provider": provider,
+            "p_model": model,
+            "p_tenant": self._tenant,
+            "p_requests_per_minute": requests_per_minute,
+            "p_burst": max(1.0, requests_per_minute / 60.0 * self._burst_seconds),
+            "p_recovery_seconds": self._recovery_seconds,
+        }
+        started = time.monotonic()
+        deadline = started + max(0.0, float(max_wait_seconds))
+        while True:
+            result = self._call("acquire_provider_rate_limit", payload)
+            if result is None or result.get("granted"):
+                waited = time.monotonic() - started
+                if waited >= 1.0:
+                    logger.info(
+                        "provider_rate_limit_waited",
+                        provider=provider,
+                        model=model,
+                        tenant=self._tenant,
+                        waited_seconds=round(waited, 3),
+                    )
+                return waited
+            wait_seconds = max(float(result.get("wait_seconds") or 0.0), _MIN_POLL_SECONDS)
+            remaining = deadline - time.monotonic()
+            if wait_seconds > remaining:
+                raise ThirdPartyError(
+                    message=f"{provider} {model} rate limit budget exhausted; no request was sent",
+                    details={
+                        "reason_code": "provider_rate_limit_wait",
+                        "status_code": 429,
+                        "provider": provider,
+                        "model": model,
+                        "wait_seconds": round(wait_seconds, 3),
+                        "rate_scale": result.get("rate_scale"),
+                        "blocked_before_submit": True,
+                    },
+                )
+            # Jitter keeps processes that were refused together from all polling together.
+            time.sleep(min(remaining, wait_seconds * random.uniform(1.0, 1.2)))
+
+    def report_rate_limited(self, provider: str, model: str, *, retry_after_seconds: float) -> None:
+        """Shrink the shared budget after the provider answered 429."""
+        if self.budget(provider, model) is None:
+            return
+        result = self._call(
+            "report_provider_rate_limited",
+            {
+                "p_provider": provider,
+                "p_model": model,
+                "p_tenant": self._tenant,
+                "p_retry_after_seconds": max(0.0, float(retry_after_seconds)),
+                "p_min_scale": self._min_scale,
+            },
+        )
+        if result is not None:
+            logger.warning(
+                "provider_rate_limit_backoff",
+                provider=provider,
+                model=model,
+                tenant=self._tenant,
+                rate_scale=result.get("rate_scale"),
+                penalty_until=result.get("penalty_until"),
+            )
+
+    def usage(self, provider: str, model: str, *, since_minutes: int = 60) -> Dict[str, Any]:
+        """Per-tenant grants, throttles, 429s and share of the budget over the last ``since_minutes``."""
+        since = datetime.now(timezone.utc) - timedelta(minutes=max(int(since_minutes), 1))
+        return self._rpc(
+            "get_provider_rate_limit_usage",
+            {"p_provider": provider, "p_model": model, "p_since": since.isoformat()},
+        )
+
+
+_limiter: Optional[ProviderRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_provider_rate_limiter() -> ProviderRateLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = ProviderRateLimiter()
+        return _limiter
@@ -6,14 +6,16 @@ Per Constitution § VI: Adapterize specialists.
 from __future__ import annotations
 
 import asyncio
+import os
 import re
 from datetime import datetime, timezone
 from hashlib import sha256
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional
 from urllib.parse import quote
 
 import boto3
 import httpx
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from app.core.config import get_settings
@@ -21,6 +23,43 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_FILE_CHUNK_BYTES = 1024 * 1024
+# Part size for managed video uploads; R2 rejects multipart parts below 5 MiB.
+R2_UPLOAD_PART_BYTES = max(int(os.getenv("R2_UPLOAD_PART_MB", "8")), 5) * 1024 * 1024
+# Parts in flight per video upload; 1 restores the old sequential upload.
+R2_UPLOAD_MAX_CONCURRENCY = max(int(os.getenv("R2_UPLOAD_MAX_CONCURRENCY", "4")), 1)
+_VIDEO_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=R2_UPLOAD_PART_BYTES,
+    multipart_chunksize=R2_UPLOAD_PART_BYTES,
+    max_concurrency=R2_UPLOAD_MAX_CONCURRENCY,
+)
+# boto3's wrapper does not take this s3transfer knob as an argument. It caps the parts
+# read ahead of the uploaders, so one upload buffers at most this many parts.
+_VIDEO_TRANSFER_CONFIG.max_in_memory_upload_chunks = R2_UPLOAD_MAX_CONCURRENCY + 1
+
+
+class _HashingReader:
+    """Read-only stream wrapper that hashes and counts bytes as boto3 reads them.
+
+    It has no ``seek``/``tell`` on purpose: s3transfer then treats it as a
+    non-seekable stream and reads it front to back exactly once, so the digest
+    sees the bytes in order even while parts upload concurrently.
+    """
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self._digest = sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
 
 async def _async_put_presigned_image_with_deadline(
     *,
@@ -213,6 +252,110 @@ class StorageClient:
             )
             raise
 
+    def upload_video_file(
+        self,
+        *,
+        file_name: str,
+        path: Optional[str] = None,
+        fileobj: Optional[BinaryIO] = None,
+        correlation_id: Optional[str] = None,
+        content_type: str = "video/mp4",
+        object_key: Optional[str] = None,
+        expected_sha256: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Upload a video from ``path`` or a readable ``fileobj`` without buffering it whole.
+
+        Returns the same result dict as ``upload_video``. boto3's managed transfer
+        switches to multipart above ``R2_UPLOAD_PART_BYTES`` and uploads parts
+        concurrently, and the sha256 is computed from that same single read. Object
+        metadata is fixed when the upload starts, so a caller that already knows the
+        digest passes ``expected_sha256`` (checked once the read finishes); otherwise
+        the digest is stamped afterwards with a server-side metadata copy.
+        """
+        if (path is None) == (fileobj is None):
+            raise ValueError("Pass exactly one of path or fileobj.")
+        object_key = _strip_slashes(object_key) if object_key else self._build_object_key(file_name)
+        normalized_expected = str(expected_sha256 or "").strip().lower()
+        size_bytes = os.path.getsize(path) if path is not None else None
+        upload_args: Dict[str, Any] = {
+            "ContentType": content_type,
+            "CacheControl": "public, max-age=31536000, immutable",
+        }
+        if normalized_expected:
+            upload_args["Metadata"] = {"sha256": normalized_expected}
+
+        try:
+            logger.info(
+                "storage_upload_starting",
+                correlation_id=correlation_id,
+                storage_provider="cloudflare_r2",
+                file_name=file_name,
+                object_key=object_key,
+                size_bytes=size_bytes,
+            )
+
+            handle = open(path, "rb") if path is not None else fileobj
+            try:
+                reader = _HashingReader(handle)
+                self.client.upload_fileobj(
+                    reader,
+                    self.bucket_name,
+                    object_key,
+                    ExtraArgs=upload_args,
+                    Config=_VIDEO_TRANSFER_CONFIG,
+                )
+            finally:
+                if path is not None:
+                    handle.close()
+            size_bytes = reader.size
+            video_sha256 = reader.hexdigest()
+
+            if normalized_expected and video_sha256 != normalized_expected:
+                self.client.delete_object(Bucket=self.bucket_name, Key=object_key)
+                raise ValueError("Uploaded video does not match its expected SHA-256.")
+            if not normalized_expected:
+                self.client.copy_object(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    CopySource={"Bucket": self.bucket_name, "Key": object_key},
+                    MetadataDirective="REPLACE",
+                    Metadata={"sha256": video_sha256},
+                    **upload_args,
+                )
+
+            result = {
+                "storage_provider": "cloudflare_r2",
+                "storage_key": object_key,
+                "url": self._build_public_url(object_key),
+                "thumbnail_url": None,
+                "file_path": object_key,
+                "size": size_bytes,
+                "sha256": video_sha256,
+                "file_type": content_type,
+            }
+
+            logger.info(
+                "storage_video_uploaded",
+                correlation_id=correlation_id,
+                storage_provider="cloudflare_r2",
+                object_key=object_key,
+                url=result["url"],
+                size_bytes=size_bytes,
+            )
+            return result
+
+        except Exception as exc:  # noqa: BLE001
+            logger.exception(
+                "storage_upload_failed",
+                correlation_id=correlation_id,
+                storage_provider="cloudflare_r2",
+                file_name=file_name,
+                object_key=object_key,
+                size_bytes=size_bytes,
+                error=str(exc),
+            )
+            raise
+
     def prepare_video_upload(
         self,
         *,
@@ -306,6 +449,36 @@ class StorageClient:
             "content_type": content_type,
         }
 
+    def video_variant_key(self, *, source_sha256: str, profile: str) -> str:
+        """Content-addressed key for a derived video (one per source digest and profile)."""
+        normalized_sha256 = str(source_sha256 or "").strip().lower()
+        if not re.fullmatch(r"[0-9a-f]{64}", normalized_sha256):
+            raise ValueError("Source video SHA-256 must contain 64 lowercase hexadecimal characters.")
+        safe_profile = re.sub(r"[^A-Za-z0-9._-]+", "-", profile).strip("-") or "default"
+        key_prefix = f"{self.object_prefix}/" if self.object_prefix else ""
+        return f"{key_prefix}variants/{safe_profile}/{normalized_sha256}.mp4"
+
+    def find_video_variant(self, *, source_sha256: str, profile: str) -> Optional[Dict[str, Any]]:
+        """Return the stored variant of a source as an upload result dict, or None when absent."""
+        object_key = self.video_variant_key(source_sha256=source_sha256, profile=profile)
+        try:
+            head = self.client.head_object(Bucket=self.bucket_name, Key=object_key)
+        except ClientError as exc:
+            error_code = str(exc.response.get("Error", {}).get("Code") or "")
+            if error_code in {"404", "NoSuchKey", "NotFound"}:
+                return None
+            raise
+        return {
+            "storage_provider": "cloudflare_r2",
+            "storage_key": object_key,
+            "url": self._build_public_url(object_key),
+            "thumbnail_url": None,
+            "file_path": object_key,
+            "size": int(head.get("ContentLength") or 0),
+            "sha256": str((head.get("Metadata") or {}).get("sha256") or ""),
+            "file_type": str(head.get("ContentType") or "video/mp4"),
+        }
+
     def upload_image(
         self,
         *,
@@ -543,6 +716,33 @@ class StorageClient:
         )
         return content
 
+    def download_video_to_file(
+        self,
+        *,
+        video_url: str,
+        destination_path: str,
+        correlation_id: str,
+    ) -> int:
+        """Stream a video URL to ``destination_path`` and return the byte count."""
+        logger.info(
+            "storage_download_start",
+            correlation_id=correlation_id,
+            url=video_url[:80],
+        )
+        size = 0
+        with self._http_client.stream("GET", video_url) as response:
+            response.raise_for_status()
+            with open(destination_path, "wb") as handle:
+                for chunk in response.iter_bytes(_FILE_CHUNK_BYTES):
+                    handle.write(chunk)
+                    size += len(chunk)
+        logger.info(
+            "storage_download_done",
+            correlation_id=correlation_id,
+            size=size,
+        )
+        return size
+
     def _build_object_key(self, file_name: str, *, prefix: Optional[str] = None) -> str:
         safe_name = re.sub(r"[^A-Za-z0-9._-]+", "-", file_name).strip("-") or "video.mp4"
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
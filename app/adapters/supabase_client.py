@@ -4,12 +4,16 @@ Singleton client for Supabase database and storage.
 Per Constitution § VI: Vanilla-First Implementation
 """
 
+import asyncio
+import contextvars
+import functools
 import os
 import re
 import threading
 import time
 from collections.abc import Callable
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, TypeVar
 import httpx
 from supabase import create_client, Client
 from supabase.lib.client_options import SyncClientOptions
@@ -17,9 +21,13 @@ from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
+_T = TypeVar("_T")
 _SUPABASE_KEY_PROBE_TIMEOUT_SECONDS = float(os.getenv("SUPABASE_KEY_PROBE_TIMEOUT_SECONDS", "4"))
 _SUPABASE_POSTGREST_TIMEOUT_SECONDS = float(os.getenv("SUPABASE_POSTGREST_TIMEOUT_SECONDS", "30"))
 _SUPABASE_READ_RETRY_DELAYS = (0.0, 0.15, 0.35)
+# supabase-py is synchronous; async handlers hand their queries to this many
+# dedicated threads instead of blocking the event loop (see ``run_db``).
+DB_THREAD_POOL_SIZE = max(int(os.getenv("DB_THREAD_POOL_SIZE", "16")), 1)
 _TRANSIENT_DATABASE_ERROR_MARKERS = (
     "connection reset",
     "connection refused",
@@ -263,3 +271,40 @@ def execute_supabase_read(
     if last_error is not None:
         raise last_error
     raise RuntimeError(f"Supabase read {operation} failed without an error.")
+
+
+_db_executor: Optional[ThreadPoolExecutor] = None
+_db_executor_lock = threading.Lock()
+
+
+def _get_db_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        with _db_executor_lock:
+            if _db_executor is None:
+                _db_executor = ThreadPoolExecutor(
+                    max_workers=DB_THREAD_POOL_SIZE,
+                    thread_name_prefix="supabase-db",
+                )
+    return _db_executor
+
+
+async def run_db(fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+    """Run a synchronous database call from async code without blocking the loop.
+
+    The call executes on a dedicated pool of ``DB_THREAD_POOL_SIZE`` threads so a
+    slow PostgREST query only occupies one DB thread while ``/health`` and other
+    requests keep being served. Context variables (structlog bindings) carry over.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await loop.run_in_executor(_get_db_executor(), call)
+
+
+def shutdown_db_executor() -> None:
+    """Stop the DB thread pool; a later ``run_db`` call starts a fresh one."""
+    global _db_executor
+    with _db_executor_lock:
+        executor, _db_executor = _db_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,257 @@
+"""
+Shared reachability checks for source URLs.
+
+Script selectability, research source validation and the source backfill scripts
+all ask the same question ("does this page still answer?") about largely the same
+URLs. They used to open a fresh ``httpx.Client`` per URL and probe serially, with
+either no cache or an unbounded one that never expired. This service keeps one
+pooled client, probes a batch of URLs in parallel with a per-host concurrency cap,
+and remembers results in an LRU cache whose entries expire (failures sooner than
+successes, since those are often transient).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+URL_REACHABILITY_TTL_SECONDS = float(os.getenv("URL_REACHABILITY_TTL_SECONDS", "21600"))
+URL_REACHABILITY_FAILURE_TTL_SECONDS = float(os.getenv("URL_REACHABILITY_FAILURE_TTL_SECONDS", "600"))
+URL_REACHABILITY_CACHE_SIZE = max(int(os.getenv("URL_REACHABILITY_CACHE_SIZE", "4096")), 1)
+URL_REACHABILITY_MAX_WORKERS = max(int(os.getenv("URL_REACHABILITY_MAX_WORKERS", "16")), 1)
+URL_REACHABILITY_PER_HOST_LIMIT = max(int(os.getenv("URL_REACHABILITY_PER_HOST_LIMIT", "2")), 1)
+URL_REACHABILITY_TIMEOUT_SECONDS = float(os.getenv("URL_REACHABILITY_TIMEOUT_SECONDS", "8"))
+URL_REACHABILITY_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) "
+    "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15"
+)
+# Servers that refuse HEAD but may serve the page to a GET.
+_HEAD_REJECTED_STATUS_CODES = {403, 405, 501}
+
+
+@dataclass(frozen=True)
+class UrlProbeResult:
+    """Outcome of one probe; ``status_code`` is None when no response arrived."""
+
+    url: str
+    reachable: bool
+    status_code: Optional[int] = None
+    error_kind: Optional[str] = None  # invalid_url, connect, timeout, transport
+    error: Optional[str] = None
+
+
+def _cache_key(url: str) -> str:
+    return str(url or "").strip().rstrip("/")
+
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+class UrlReachabilityService:
+    """Pooled, cached, per-host-limited HEAD/GET probing."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = URL_REACHABILITY_TTL_SECONDS,
+        failure_ttl_seconds: float = URL_REACHABILITY_FAILURE_TTL_SECONDS,
+        max_entries: int = URL_REACHABILITY_CACHE_SIZE,
+        max_workers: int = URL_REACHABILITY_MAX_WORKERS,
+        per_host_limit: int = URL_REACHABILITY_PER_HOST_LIMIT,
+        timeout_seconds: float = URL_REACHABILITY_TIMEOUT_SECONDS,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._failure_ttl_seconds = failure_ttl_seconds
+        self._max_entries = max(int(max_entries), 1)
+        self._max_workers = max(int(max_workers), 1)
+        self._per_host_limit = max(int(per_host_limit), 1)
+        self._timeout_seconds = timeout_seconds
+        self._transport = transport
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, Tuple[float, UrlProbeResult]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._client: Optional[httpx.Client] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _http_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    timeout=httpx.Timeout(self._timeout_seconds, connect=min(3.0, self._timeout_seconds)),
+                    follow_redirects=True,
+                    headers={"User-Agent": URL_REACHABILITY_USER_AGENT},
+                    limits=httpx.Limits(
+                        max_connections=self._max_workers,
+                        max_keepalive_connections=self._max_workers,
+                    ),
+                    transport=self._transport,
+                )
+            return self._client
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="url-reachability",
+                )
+            return self._executor
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = _host(url)
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._per_host_limit)
+                self._host_slots[host] = slot
+            return slot
+
+    def _cached(self, key: str) -> Optional[UrlProbeResult]:
+        # Caller holds self._lock.
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _remember(self, key: str, result: UrlProbeResult) -> None:
+        ttl = self._ttl_seconds if result.reachable else self._failure_ttl_seconds
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def _probe(self, url: str) -> UrlProbeResult:
+        client = self._http_client()
+        with self._host_slot(url):
+            try:
+                response = client.head(url)
+                if response.status_code in _HEAD_REJECTED_STATUS_CODES:
+                    # Stream so a large page body is never downloaded just to read the status.
+                    with client.stream("GET", url) as streamed:
+                        response = streamed
+                status_code = response.status_code
+                return UrlProbeResult(url=url, reachable=status_code < 400, status_code=status_code)
+            except httpx.TimeoutException as exc:
+                error_kind, error = "timeout", exc
+            except httpx.ConnectError as exc:
+                error_kind, error = "connect", exc
+            except httpx.HTTPError as exc:
+                error_kind, error = "transport", exc
+            except (httpx.InvalidURL, ValueError) as exc:
+                error_kind, error = "invalid_url", exc
+        logger.debug("url_reachability_probe_failed", url=url, error_kind=error_kind, error=str(error))
+        return UrlProbeResult(url=url, reachable=False, error_kind=error_kind, error=str(error))
+
+    def _probe_and_remember(self, key: str, url: str) -> UrlProbeResult:
+        try:
+            result = self._probe(url)
+            self._remember(key, result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def probe_many(self, urls: Iterable[str]) -> Dict[str, UrlProbeResult]:
+        """Probe every distinct URL once, in parallel, and return results keyed by input URL.
+
+        Cached results are reused; a URL another caller is already probing is
+        awaited rather than probed twice.
+        """
+        requested: List[str] = [str(url or "").strip() for url in urls]
+        results: Dict[str, UrlProbeResult] = {}
+        pending: Dict[str, Future] = {}
+        for url in requested:
+            key = _cache_key(url)
+            if url in results or key in pending:
+                continue
+            if not url.lower().startswith(("http://", "https://")) or not _host(url):
+                results[url] = UrlProbeResult(url=url, reachable=False, error_kind="invalid_url")
+                continue
+            with self._lock:
+                cached = self._cached(key)
+                future = None if cached is not None else self._inflight.get(key)
+                if cached is None and future is None:
+                    future = Future()
+                    self._inflight[key] = future
+                    owned = True
+                else:
+                    owned = False
+            if cached is not None:
+                results[url] = cached
+                continue
+            if owned:
+                self._pool().submit(self._run_owned_probe, future, key, url)
+            pending[key] = future
+
+        for url in requested:
+            if url in results:
+                continue
+            results[url] = pending[_cache_key(url)].result()
+        return results
+
+    def _run_owned_probe(self, future: Future, key: str, url: str) -> None:
+        try:
+            future.set_result(self._probe_and_remember(key, url))
+        except BaseException as exc:  # noqa: BLE001 - hand the failure to every waiter.
+            future.set_exception(exc)
+
+    def check_many(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Reachability of every URL (keyed by the URL as given) after one parallel round-trip."""
+        return {url: result.reachable for url, result in self.probe_many(urls).items()}
+
+    def check(self, url: str) -> bool:
+        return self.check_many([url]).get(str(url or "").strip(), False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            client, executor = self._client, self._executor
+            self._client, self._executor = None, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if client is not None:
+            client.close()
+
+
+_service: Optional[UrlReachabilityService] = None
+_service_lock = threading.Lock()
+
+
+def get_url_reachability_service() -> UrlReachabilityService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = UrlReachabilityService()
+        return _service
+
+
+def close_url_reachability_service() -> None:
+    global _service
+    with _service_lock:
+        service, _service = _service, None
+    if service is not None:
+        service.close()
@@ -454,7 +454,53 @@ class VeoClient:
             )
             
             return video_bytes
-        
+
+        except Exception as e:
+            logger.exception(
+                "veo_download_failed",
+                correlation_id=correlation_id,
+                error=str(e)
+            )
+            raise
+
+    def download_video_to_file(
+        self,
+        video_uri: str,
+        destination_path: str,
+        correlation_id: str
+    ) -> int:
+        """
+        Stream generated video from VEO straight to ``destination_path``.
+
+        Only one response chunk is held in memory at a time. Returns the number of bytes written.
+        """
+        try:
+            logger.info(
+                "veo_download_to_file_starting",
+                correlation_id=correlation_id,
+                video_uri=video_uri
+            )
+            size_bytes = 0
+            with self._http_client.stream(
+                "GET",
+                video_uri,
+                headers=self._build_headers(),
+                follow_redirects=True,
+                timeout=60.0
+            ) as response:
+                response.raise_for_status()
+                with open(destination_path, "wb") as file_obj:
+                    for chunk in response.iter_bytes():
+                        file_obj.write(chunk)
+                        size_bytes += len(chunk)
+
+            logger.info(
+                "veo_video_downloaded_to_file",
+                correlation_id=correlation_id,
+                size_bytes=size_bytes
+            )
+            return size_bytes
+
         except Exception as e:
             logger.exception(
                 "veo_download_failed",
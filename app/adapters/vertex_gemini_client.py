@@ -18,6 +18,7 @@ import google.auth.exceptions
 import httpx
 from google.auth.transport.requests import Request
 
+from app.adapters.provider_rate_limiter import get_provider_rate_limiter
 from app.core.config import get_settings, resolve_google_application_credentials_path
 from app.core.errors import ThirdPartyError, ValidationError
 from app.core.german import restore_german_umlauts, restore_german_umlauts_in_json
@@ -37,6 +38,8 @@ _VERTEX_RETRY_BASE_SECONDS = 0.5
 _VERTEX_RETRY_MAX_SECONDS = 8.0
 _VERTEX_TRANSIENT_HTTP_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 _VERTEX_CAPACITY_WAIT_SECONDS = 15.0
+# Key for the cross-process budget in PROVIDER_RATE_LIMITS, e.g. "vertex_gemini:gemini-2.5-pro=60".
+VERTEX_GEMINI_RATE_LIMIT_PROVIDER = "vertex_gemini"
 
 
 class _DeadlineBoundAuthRequest:
@@ -492,6 +495,16 @@ class VertexGeminiClient:
                 if timeout_seconds is not None
                 else None
             )
+            # Shared with every other process; the semaphore below only bounds this one.
+            get_provider_rate_limiter().acquire(
+                VERTEX_GEMINI_RATE_LIMIT_PROVIDER,
+                model,
+                max_wait_seconds=(
+                    _vertex_capacity_budget_seconds(float(timeout_seconds))
+                    if timeout_seconds is not None
+                    else None
+                ),
+            )
             with _vertex_request_slot(timeout_seconds=timeout_seconds):
                 client = self._http_client
                 client_generation = self._http_client_generation
@@ -557,6 +570,15 @@ class VertexGeminiClient:
             is_transient = (
                 response.status_code in _VERTEX_TRANSIENT_HTTP_STATUS_CODES
             )
+            if response.status_code == 429:
+                get_provider_rate_limiter().report_rate_limited(
+                    VERTEX_GEMINI_RATE_LIMIT_PROVIDER,
+                    model,
+                    retry_after_seconds=_vertex_retry_delay_seconds(
+                        attempt=attempt,
+                        response=response,
+                    ),
+                )
             if (
                 is_transient
                 and attempt < attempt_limit - 1
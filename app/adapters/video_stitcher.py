@@ -13,13 +13,14 @@ System ffmpeg/ffprobe are assumed in PATH (already required by the trim/crop/cap
 
 from __future__ import annotations
 
-import json
 import math
 import os
+import shutil
 import subprocess
 import tempfile
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from app.adapters.media_probe import MediaProbeError, probe_media
 from app.core.logging import get_logger
 from app.features.shot_production.audio_seams import (
     MAX_EXACT_DELIVERY_RETIME_RATIO,
@@ -32,7 +33,6 @@ from app.features.shot_production.duration import (
 logger = get_logger(__name__)
 
 _FFMPEG_TIMEOUT_SECONDS = 300
-_FFPROBE_TIMEOUT_SECONDS = 30
 _DEFAULT_FPS = 24.0
 _I2V_HEAD_TRIM_SECONDS = 0.0
 _NON_FINAL_TAIL_TRIM_SECONDS = 0.0
@@ -52,89 +52,35 @@ _REFRAME_PROFILE_BY_NAME = {
 
 def _probe_video_geometry(video_path: str) -> Tuple[int, int, float]:
     """Return (width, height, fps) for the first video stream."""
-    command = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "v:0",
-        "-show_entries",
-        "stream=width,height,r_frame_rate",
-        "-of",
-        "json",
-        video_path,
-    ]
-    result = subprocess.run(command, capture_output=True, text=True, timeout=_FFPROBE_TIMEOUT_SECONDS)
-    if result.returncode != 0:
-        raise ValueError(f"ffprobe geometry failed: {result.stderr[-200:]}")
-    stream = (json.loads(result.stdout).get("streams") or [{}])[0]
-    width = int(stream["width"])
-    height = int(stream["height"])
-    fps = _parse_frame_rate(stream.get("r_frame_rate"))
-    return width, height, fps
-
-
-def _parse_frame_rate(raw: Any) -> float:
-    text = str(raw or "").strip()
-    if "/" in text:
-        num, _, den = text.partition("/")
-        try:
-            numerator = float(num)
-            denominator = float(den)
-            if denominator > 0 and numerator > 0:
-                return numerator / denominator
-        except ValueError:
-            return _DEFAULT_FPS
     try:
-        value = float(text)
-        return value if value > 0 else _DEFAULT_FPS
-    except ValueError:
-        return _DEFAULT_FPS
+        probe = probe_media(video_path)
+        width, height = probe.width, probe.height
+    except MediaProbeError as exc:
+        raise ValueError(f"ffprobe geometry failed: {exc.stderr[-200:]}") from exc
+    return width, height, probe.fps or _DEFAULT_FPS
 
 
 def _probe_duration(video_path: str) -> float:
-    command = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "default=noprint_wrappers=1:nokey=1",
-        video_path,
-    ]
-    result = subprocess.run(command, capture_output=True, text=True, timeout=_FFPROBE_TIMEOUT_SECONDS)
-    if result.returncode != 0:
-        raise ValueError(f"ffprobe duration failed: {result.stderr[-200:]}")
-    return float(result.stdout.strip())
+    try:
+        duration = probe_media(video_path).duration
+    except MediaProbeError as exc:
+        raise ValueError(f"ffprobe duration failed: {exc.stderr[-200:]}") from exc
+    if duration is None:
+        raise ValueError("ffprobe duration failed: no container duration")
+    return duration
 
 
 def _probe_av_stream_durations(video_path: str) -> Tuple[float, float]:
-    command = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-show_entries",
-        "stream=codec_type,duration:format=duration",
-        "-of",
-        "json",
-        video_path,
-    ]
-    result = subprocess.run(command, capture_output=True, text=True, timeout=_FFPROBE_TIMEOUT_SECONDS)
-    if result.returncode != 0:
-        raise ValueError(f"ffprobe stream duration failed: {result.stderr[-200:]}")
-    payload = json.loads(result.stdout)
-    fallback = float((payload.get("format") or {})["duration"])
-    durations: Dict[str, float] = {}
-    for stream in payload.get("streams") or []:
-        stream_type = str(stream.get("codec_type") or "")
-        try:
-            duration = float(stream.get("duration"))
-        except (TypeError, ValueError):
-            duration = fallback
-        if stream_type in {"video", "audio"} and duration > 0:
-            durations.setdefault(stream_type, duration)
-    return durations.get("video", fallback), durations.get("audio", fallback)
+    try:
+        probe = probe_media(video_path)
+    except MediaProbeError as exc:
+        raise ValueError(f"ffprobe stream duration failed: {exc.stderr[-200:]}") from exc
+    fallback = probe.duration
+    if fallback is None:
+        raise ValueError("ffprobe stream duration failed: no container duration")
+    video_duration = probe.stream_duration("video") or fallback
+    audio_duration = probe.stream_duration("audio") or fallback
+    return video_duration, audio_duration
 
 
 def _even_dimension(value: float) -> int:
@@ -350,7 +296,7 @@ def extract_anchor_frame(
 
 def stitch_segments(
     *,
-    segment_videos: List[bytes],
+    segment_paths: Sequence[str],
     post_id: str,
     correlation_id: str,
     trim_windows: Optional[List[Dict[str, Any]]] = None,
@@ -359,10 +305,45 @@ def stitch_segments(
     delivery_retime_ratio: Optional[float] = None,
     terminal_tail_exclusion_seconds: Optional[float] = None,
 ) -> Tuple[bytes, Dict[str, Any]]:
-    """Concatenate ordered segment videos into one mp4.
+    """Concatenate ordered segment videos into one mp4 and return its bytes.
+
+    Same arguments as ``stitch_segments_to_file``; use that when the result can stay on disk.
+    """
+    with tempfile.TemporaryDirectory(prefix="video_stitch_out_") as output_dir:
+        output_path = os.path.join(output_dir, "stitched.mp4")
+        stitch_metadata = stitch_segments_to_file(
+            segment_paths=segment_paths,
+            output_path=output_path,
+            post_id=post_id,
+            correlation_id=correlation_id,
+            trim_windows=trim_windows,
+            acoustic_plan=acoustic_plan,
+            target_duration_seconds=target_duration_seconds,
+            delivery_retime_ratio=delivery_retime_ratio,
+            terminal_tail_exclusion_seconds=terminal_tail_exclusion_seconds,
+        )
+        with open(output_path, "rb") as file_obj:
+            return file_obj.read(), stitch_metadata
+
+
+def stitch_segments_to_file(
+    *,
+    segment_paths: Sequence[str],
+    output_path: str,
+    post_id: str,
+    correlation_id: str,
+    trim_windows: Optional[List[Dict[str, Any]]] = None,
+    acoustic_plan: Optional[Dict[str, Any]] = None,
+    target_duration_seconds: Optional[float] = None,
+    delivery_retime_ratio: Optional[float] = None,
+    terminal_tail_exclusion_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Concatenate ordered segment videos into one mp4 written to ``output_path``.
 
     Args:
-        segment_videos: Ordered raw mp4 bytes, one per segment. Must be non-empty.
+        segment_paths: Ordered mp4 file paths, one per segment. Must be non-empty. ffmpeg reads
+            them in place, so callers stage segments on disk instead of holding them in memory.
+        output_path: Where the stitched mp4 is written; its directory must exist.
         post_id: Owning post id for logging.
         correlation_id: Correlation id for structured logging.
         trim_windows: Optional per-segment start/end seconds. When present, each segment is
@@ -378,17 +359,21 @@ def stitch_segments(
             pitch-preservingly retiming the retained content to the exact delivery target.
 
     Returns:
-        (final_video_bytes, stitch_metadata).
+        stitch_metadata.
 
     Raises:
         ValueError: empty input or ffmpeg/ffprobe failure.
     """
-    if not segment_videos:
+    if not segment_paths:
         raise ValueError("stitch_segments requires at least one segment")
+    input_paths = [os.fspath(path) for path in segment_paths]
+    for index, input_path in enumerate(input_paths):
+        if not os.path.isfile(input_path) or os.path.getsize(input_path) == 0:
+            raise ValueError(f"Segment {index} for post {post_id} is empty")
 
     # Preserve the historical passthrough only when no delivery processing is requested.
     if (
-        len(segment_videos) == 1
+        len(input_paths) == 1
         and not trim_windows
         and target_duration_seconds is None
         and delivery_retime_ratio is None
@@ -399,18 +384,10 @@ def stitch_segments(
             post_id=post_id,
             correlation_id=correlation_id,
         )
-        return segment_videos[0], {"stitch_segment_count": 1, "stitch_applied": False}
+        shutil.copyfile(input_paths[0], output_path)
+        return {"stitch_segment_count": 1, "stitch_applied": False}
 
     with tempfile.TemporaryDirectory(prefix="video_stitch_") as temp_dir:
-        input_paths: List[str] = []
-        for index, video_bytes in enumerate(segment_videos):
-            if not video_bytes:
-                raise ValueError(f"Segment {index} for post {post_id} is empty")
-            input_path = os.path.join(temp_dir, f"segment_{index}.mp4")
-            with open(input_path, "wb") as file_obj:
-                file_obj.write(video_bytes)
-            input_paths.append(input_path)
-
         # Normalize every segment to the first segment's geometry before concatenating so small
         # encoder differences between independent generations cannot break the concat filter.
         width, height, fps = _probe_video_geometry(input_paths[0])
@@ -756,7 +733,6 @@ def stitch_segments(
             end_pan_protection_applied = True
         filter_complex = ";".join(filter_parts)
 
-        output_path = os.path.join(temp_dir, "stitched.mp4")
         command += [
             "-filter_complex",
             filter_complex,
@@ -798,12 +774,10 @@ def stitch_segments(
             raise ValueError(
                 f"Acoustic stitch audio/video duration drift exceeded one frame: {duration_delta:.6f}s"
             )
-        with open(output_path, "rb") as file_obj:
-            final_bytes = file_obj.read()
 
     stitch_metadata = {
         "stitch_applied": True,
-        "stitch_segment_count": len(segment_videos),
+        "stitch_segment_count": len(input_paths),
         "stitch_segment_durations_s": [round(value, 3) for value in segment_durations],
         "stitch_final_duration_s": round(final_duration, 3),
         "stitch_width": width,
@@ -854,4 +828,4 @@ def stitch_segments(
         correlation_id=correlation_id,
         **stitch_metadata,
     )
-    return final_bytes, stitch_metadata
+    return stitch_metadata
@@ -0,0 +1,50 @@
+"""Process-wide pause shared by every caller of a rate-limited provider, and 429 detection."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from app.core.errors import RateLimitError
+
+
+class RateLimitCooldown:
+    """Pause every thread drawing on one provider budget once any of them is told to back off.
+
+    Without it each in-flight call would keep retrying on its own schedule and the
+    pool would go on spending quota while the provider is already rejecting us.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        """Sleep until the current pause, if any, has passed."""
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def trip(self, seconds: float) -> None:
+        """Hold every caller back for at least ``seconds`` from now."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether a provider call failed with HTTP 429.
+
+    Judged from the status the error carries, never its text, so an id, byte count
+    or script that happens to contain "429" does not pause anyone.
+    """
+    if isinstance(exc, RateLimitError):
+        return True
+    details = getattr(exc, "details", None)
+    if isinstance(details, dict) and details.get("status_code") == 429:
+        return True
+    # httpx.HTTPStatusError and friends carry the response.
+    if getattr(getattr(exc, "response", None), "status_code", None) == 429:
+        return True
+    # google.api_core.exceptions.ResourceExhausted sets code to HTTP 429.
+    return getattr(exc, "code", None) == 429
@@ -5,6 +5,7 @@ Shared duration-tier profiles for batch routing, scripts, and Veo chaining.
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 import math
 import re
 from typing import Any, Dict, Optional
@@ -59,6 +60,19 @@ VIDEO_STATUS_CAPTION_COMPLETED = "caption_completed"
 VIDEO_STATUS_CAPTION_FAILED = "caption_failed"
 # Segmented route: all segments generated, now being concatenated by the stitcher in the poller.
 VIDEO_STATUS_STITCHING = "stitching"
+# Adaptive poll schedule. A Veo operation is never done before its typical render time, so the first
+# status check waits that long after submit; afterwards checks back off exponentially up to a cap.
+VIDEO_POLL_NEXT_AT_KEY = "video_poll_next_at"
+VIDEO_POLL_ATTEMPT_KEY = "video_poll_attempt"
+VIDEO_POLL_FIRST_CHECK_SECONDS = {
+    SHORT_VIDEO_ROUTE: 45,
+    # Per hop: the base clip and every 7s extension are separate operations.
+    VEO_EXTENDED_VIDEO_ROUTE: 40,
+    # Segments render in parallel; the post is done when the slowest one is.
+    VEO_SEGMENTED_VIDEO_ROUTE: 60,
+}
+VIDEO_POLL_BACKOFF_BASE_SECONDS = 10
+VIDEO_POLL_BACKOFF_MAX_SECONDS = 30
 
 
 @dataclass(frozen=True)
@@ -480,3 +494,25 @@ def get_pollable_video_statuses() -> tuple[str, ...]:
 def get_caption_pollable_statuses() -> tuple[str, ...]:
     """Statuses the caption worker should poll for."""
     return (VIDEO_STATUS_CAPTION_PENDING,)
+
+
+def get_video_first_poll_delay_seconds(route: Optional[str]) -> int:
+    """Seconds to wait after a submit before the first provider status check is worthwhile."""
+    return VIDEO_POLL_FIRST_CHECK_SECONDS.get(route or SHORT_VIDEO_ROUTE, VIDEO_POLL_FIRST_CHECK_SECONDS[SHORT_VIDEO_ROUTE])
+
+
+def get_video_poll_backoff_seconds(attempt: int) -> int:
+    """Exponential backoff between status checks of an operation that is still rendering."""
+    exponent = min(max(int(attempt or 0), 0), 16)
+    return min(VIDEO_POLL_BACKOFF_BASE_SECONDS * (2 ** exponent), VIDEO_POLL_BACKOFF_MAX_SECONDS)
+
+
+def compute_next_video_poll_at(route: Optional[str], *, anchor: datetime, attempt: int) -> datetime:
+    """Next due time for an operation.
+
+    ``attempt`` counts status checks already made against the current operation; attempt 0 means the
+    operation was just submitted and ``anchor`` is its submit time.
+    """
+    if attempt <= 0:
+        return anchor + timedelta(seconds=get_video_first_poll_delay_seconds(route))
+    return anchor + timedelta(seconds=get_video_poll_backoff_seconds(attempt - 1))
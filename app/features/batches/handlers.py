@@ -5,6 +5,7 @@ Per Constitution § V: Locality & Vertical Slices
 """
 
 import asyncio
+import copy
 import json
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from pathlib import Path
@@ -39,7 +40,6 @@ from app.features.batches.queries import (
 )
 from app.features.topics.handlers import discover_topics_for_batch
 from app.features.topics.handlers import (
-    get_seeding_events,
     get_seeding_progress,
     has_required_family_coverage,
     is_batch_discovery_active,
@@ -81,6 +81,8 @@ from app.core.errors import (
     StateTransitionError,
     ValidationError as FlowForgeValidationError,
 )
+from app.adapters.supabase_client import run_db
+from app.features.batches.progress_hub import get_batch_progress_hub
 from app.core.logging import get_logger
 from app.core.states import BatchState
 
@@ -268,7 +270,8 @@ async def create_batch_endpoint(request: Request):
                 details,
             ) from exc
 
-        batch = create_batch(
+        batch = await run_db(
+            create_batch,
             brand=payload.brand,
             post_type_counts=payload.post_type_counts.model_dump() if payload.post_type_counts else {},
             target_length_tier=None,
@@ -279,14 +282,16 @@ async def create_batch_endpoint(request: Request):
         expected_posts = payload.manual_post_count if is_manual_creation_mode(payload.creation_mode) else payload.post_type_counts.total
 
         if is_manual_creation_mode(payload.creation_mode):
-            create_manual_draft_posts(
+            await run_db(
+                create_manual_draft_posts,
                 batch_id=batch["id"],
                 manual_post_count=payload.manual_post_count or 0,
                 target_length_tier=8,
             )
-            batch = update_batch_state(batch["id"], BatchState.S2_SEEDED)
+            batch = await run_db(update_batch_state, batch["id"], BatchState.S2_SEEDED)
         else:
-            start_seeding_interaction(
+            await run_db(
+                start_seeding_interaction,
                 batch_id=batch["id"],
                 brand=batch["brand"],
                 expected_posts=payload.post_type_counts.total,
@@ -299,7 +304,7 @@ async def create_batch_endpoint(request: Request):
                 response.headers["HX-Redirect"] = f"/batches/{batch['id']}"
                 return response
 
-            batches, total = list_batches()
+            batches, total = await run_db(list_batches)
             batch_responses = [BatchResponse(**b).model_dump(mode="json") for b in batches]
             context = {
                 "request": request,
@@ -1339,12 +1344,33 @@ def _build_batch_detail_view(batch_detail: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _schedule_recovery_discovery(
+    loop: asyncio.AbstractEventLoop,
+    batch_id: str,
+    *,
+    reason: str,
+) -> None:
+    """Hand ``schedule_batch_discovery`` back to the event loop that owns discovery tasks."""
+
+    def _schedule() -> None:
+        try:
+            schedule_batch_discovery(batch_id, reason=reason)
+        except Exception as exc:
+            logger.warning("batch_recovery_schedule_failed", batch_id=batch_id, reason=reason, error=str(exc))
+
+    loop.call_soon_threadsafe(_schedule)
+
+
 def _recover_stale_semantic_batch(
     batch: dict,
     posts_summary: dict,
     progress: dict | None,
+    loop: asyncio.AbstractEventLoop,
 ) -> dict | None:
-    """Resume an interrupted semantic seed run from any user-visible batch route."""
+    """Resume an interrupted semantic seed run from any user-visible batch route.
+
+    Blocking (run via ``run_db``); discovery is scheduled back on ``loop``.
+    """
     semantic_resume_is_safe = semantic_batch_posts_are_resumable(
         batch,
         posts_summary["posts_by_state"],
@@ -1364,7 +1390,7 @@ def _recover_stale_semantic_batch(
             brand=batch["brand"],
             expected_posts=expected_posts,
         )
-        schedule_batch_discovery(batch_id, reason="status_recovery")
+        _schedule_recovery_discovery(loop, batch_id, reason="status_recovery")
         return get_seeding_progress(batch_id)
 
     if progress.get("stage") == "coverage_pending":
@@ -1384,9 +1410,9 @@ def _recover_stale_semantic_batch(
                 retry_message=None,
             )
             _COVERAGE_RECOVERY_LAST_SCHEDULED_AT.pop(batch_id, None)
-            schedule_batch_discovery(batch_id, reason="coverage_recovery")
+            _schedule_recovery_discovery(loop, batch_id, reason="coverage_recovery")
         else:
-            now = asyncio.get_running_loop().time()
+            now = loop.time()
             last_scheduled = _COVERAGE_RECOVERY_LAST_SCHEDULED_AT.get(batch_id, 0.0)
             progress = update_seeding_progress(
                 batch_id,
@@ -1403,7 +1429,7 @@ def _recover_stale_semantic_batch(
                 retry_message="Coverage is still short; the batch will keep retrying in the background.",
             )
             if last_scheduled == 0.0 or (now - last_scheduled) >= _COVERAGE_RECOVERY_COOLDOWN_SECONDS:
-                schedule_batch_discovery(batch_id, reason="coverage_recovery")
+                _schedule_recovery_discovery(loop, batch_id, reason="coverage_recovery")
                 _COVERAGE_RECOVERY_LAST_SCHEDULED_AT[batch_id] = now
         return get_seeding_progress(batch_id) or progress
 
@@ -1421,7 +1447,7 @@ def _recover_stale_semantic_batch(
         is_retrying=True,
         retry_message="A stale generation run was detected and restarted automatically.",
     )
-    schedule_batch_discovery(batch_id, reason="status_recovery")
+    _schedule_recovery_discovery(loop, batch_id, reason="status_recovery")
     return get_seeding_progress(batch_id) or progress
 
 
@@ -1436,7 +1462,7 @@ async def list_batches_endpoint(
     List batches with optional filtering.
     """
     try:
-        batches, total = list_batches(archived=archived, limit=limit, offset=offset)
+        batches, total = await run_db(list_batches, archived=archived, limit=limit, offset=offset)
 
         batch_responses = [BatchResponse(**batch) for batch in batches]
 
@@ -1470,228 +1496,274 @@ async def list_batches_endpoint(
         )
 
 
-@router.get("/{batch_id}", response_model=SuccessResponse)
-async def get_batch_endpoint(request: Request, batch_id: str):
-    """
-    Get batch by ID with posts summary.
-    """
-    try:
-        from app.features.topics.queries import get_posts_by_batch
-        
-        batch = get_batch_by_id(batch_id)
-        posts_summary = get_batch_posts_summary(batch_id)
-        if not _batch_has_manual_drafts(batch):
-            _recover_stale_semantic_batch(
-                batch,
-                posts_summary,
-                get_seeding_progress(batch_id),
-            )
-        posts_data = get_posts_by_batch(batch_id)
-        raw_scene_references_by_post = character_queries.list_scene_references_for_posts(
-            [str(p.get("id")) for p in posts_data if p.get("id")]
+def _read_batch_recovery_inputs(batch_id: str) -> tuple[dict, dict, dict | None, bool]:
+    """Read what ``_recover_stale_semantic_batch`` needs (blocking; run via ``run_db``)."""
+    batch = get_batch_by_id(batch_id)
+    posts_summary = get_batch_posts_summary(batch_id)
+    progress = get_seeding_progress(batch_id)
+    return batch, posts_summary, progress, _batch_has_manual_drafts(batch)
+
+
+def _load_batch_detail(batch: Dict[str, Any], posts_summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Read the batch's posts and their scene references (blocking; run via ``run_db``)."""
+    from app.features.topics.queries import get_posts_by_batch
+
+    batch_id = batch["id"]
+    posts_data = get_posts_by_batch(batch_id)
+    raw_scene_references_by_post = character_queries.list_scene_references_for_posts(
+        [str(p.get("id")) for p in posts_data if p.get("id")]
+    )
+    scene_references_by_post = {}
+    batch_actor_identity_id = str(batch.get("actor_identity_id") or "").strip()
+    for post_id, references in raw_scene_references_by_post.items():
+        actor_scoped_references = (
+            [
+                row
+                for row in references
+                if str(row.get("actor_identity_id") or "").strip() == batch_actor_identity_id
+            ]
+            if batch_actor_identity_id
+            else references
         )
-        scene_references_by_post = {}
-        batch_actor_identity_id = str(batch.get("actor_identity_id") or "").strip()
-        for post_id, references in raw_scene_references_by_post.items():
-            actor_scoped_references = (
-                [
-                    row
-                    for row in references
-                    if str(row.get("actor_identity_id") or "").strip() == batch_actor_identity_id
-                ]
-                if batch_actor_identity_id
-                else references
+        latest_reference_set_id = character_queries.select_latest_reference_set_id(actor_scoped_references)
+        if latest_reference_set_id:
+            scene_references_by_post[post_id] = character_queries.filter_reference_rows_for_set(
+                actor_scoped_references,
+                latest_reference_set_id,
             )
-            latest_reference_set_id = character_queries.select_latest_reference_set_id(actor_scoped_references)
-            if latest_reference_set_id:
-                scene_references_by_post[post_id] = character_queries.filter_reference_rows_for_set(
-                    actor_scoped_references,
-                    latest_reference_set_id,
+        else:
+            scene_references_by_post[post_id] = actor_scoped_references
+    batch_creation_mode = str(batch.get("creation_mode") or "").strip()
+    
+    posts_list = []
+    for p in posts_data:
+        normalized_seed = _normalize_seed_data(p.get("seed_data"))
+        manual_post_type = str(normalized_seed.get("manual_post_type") or "").strip()
+        display_post_type = manual_post_type or str(p.get("post_type") or "").strip()
+        if is_manual_creation_mode(batch_creation_mode) and not manual_post_type and display_post_type == "value":
+            display_post_type = ""
+
+        video_prompt = p.get("video_prompt_json")
+        if isinstance(video_prompt, str):
+            try:
+                video_prompt = json.loads(video_prompt)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "video_prompt_json_decode_failed",
+                    post_id=p.get("id")
                 )
-            else:
-                scene_references_by_post[post_id] = actor_scoped_references
-        batch_creation_mode = str(batch.get("creation_mode") or "").strip()
-        
-        posts_list = []
-        for p in posts_data:
-            normalized_seed = _normalize_seed_data(p.get("seed_data"))
-            manual_post_type = str(normalized_seed.get("manual_post_type") or "").strip()
-            display_post_type = manual_post_type or str(p.get("post_type") or "").strip()
-            if is_manual_creation_mode(batch_creation_mode) and not manual_post_type and display_post_type == "value":
-                display_post_type = ""
-
-            video_prompt = p.get("video_prompt_json")
-            if isinstance(video_prompt, str):
-                try:
-                    video_prompt = json.loads(video_prompt)
-                except json.JSONDecodeError:
-                    logger.warning(
-                        "video_prompt_json_decode_failed",
-                        post_id=p.get("id")
-                    )
-                    video_prompt = None
-            legacy_32_visuals = bool(
-                p.get("target_length_tier") == 32
-                or normalized_seed.get("target_length_tier") == 32
-            )
-            video_metadata = p.get("video_metadata")
-            if isinstance(video_metadata, str):
-                try:
-                    video_metadata = json.loads(video_metadata)
-                except json.JSONDecodeError:
-                    video_metadata = {}
-            if isinstance(video_metadata, dict) and video_metadata.get("target_length_tier") == 32:
-                legacy_32_visuals = True
-
-            video_prompt = sync_video_prompt_with_seed_data(
-                video_prompt,
-                normalized_seed,
-                legacy_32_visuals=legacy_32_visuals,
-            )
-            video_prompt = _refresh_prompt_scene_for_display(video_prompt)
+                video_prompt = None
+        legacy_32_visuals = bool(
+            p.get("target_length_tier") == 32
+            or normalized_seed.get("target_length_tier") == 32
+        )
+        video_metadata = p.get("video_metadata")
+        if isinstance(video_metadata, str):
+            try:
+                video_metadata = json.loads(video_metadata)
+            except json.JSONDecodeError:
+                video_metadata = {}
+        if isinstance(video_metadata, dict) and video_metadata.get("target_length_tier") == 32:
+            legacy_32_visuals = True
+
+        video_prompt = sync_video_prompt_with_seed_data(
+            video_prompt,
+            normalized_seed,
+            legacy_32_visuals=legacy_32_visuals,
+        )
+        video_prompt = _refresh_prompt_scene_for_display(video_prompt)
 
-            if not video_prompt and normalized_seed:
-                try:
-                    video_prompt = build_video_prompt_from_seed(
-                        normalized_seed,
-                        legacy_32_visuals=legacy_32_visuals,
-                    )
-                except Exception as exc:
-                    logger.warning(
-                        "video_prompt_preview_rebuild_failed",
-                        post_id=p.get("id"),
-                        error=str(exc),
-                    )
-
-            video_metadata = p.get("video_metadata")
-            if isinstance(video_metadata, str):
-                try:
-                    video_metadata = json.loads(video_metadata)
-                except json.JSONDecodeError:
-                    logger.warning(
-                        "video_metadata_json_decode_failed",
-                        post_id=p.get("id"),
-                        value=video_metadata
-                    )
-                    video_metadata = None
-
-            qa_auto_checks = p.get("qa_auto_checks")
-            if isinstance(qa_auto_checks, str):
-                try:
-                    qa_auto_checks = json.loads(qa_auto_checks)
-                except json.JSONDecodeError:
-                    logger.warning(
-                        "qa_auto_checks_json_decode_failed",
-                        post_id=p.get("id")
-                    )
-                    qa_auto_checks = None
+        if not video_prompt and normalized_seed:
+            try:
+                video_prompt = build_video_prompt_from_seed(
+                    normalized_seed,
+                    legacy_32_visuals=legacy_32_visuals,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "video_prompt_preview_rebuild_failed",
+                    post_id=p.get("id"),
+                    error=str(exc),
+                )
 
-            spoken_duration = p.get("spoken_duration")
+        video_metadata = p.get("video_metadata")
+        if isinstance(video_metadata, str):
             try:
-                spoken_duration_value = float(spoken_duration) if spoken_duration is not None else 0.0
-            except (TypeError, ValueError):
+                video_metadata = json.loads(video_metadata)
+            except json.JSONDecodeError:
                 logger.warning(
-                    "post_spoken_duration_parse_failed",
+                    "video_metadata_json_decode_failed",
                     post_id=p.get("id"),
-                    value=spoken_duration
+                    value=video_metadata
                 )
-                spoken_duration_value = 0.0
+                video_metadata = None
 
-            platform_ids = _normalize_json_object(
-                p.get("platform_ids"),
-                field_name="platform_ids",
+        qa_auto_checks = p.get("qa_auto_checks")
+        if isinstance(qa_auto_checks, str):
+            try:
+                qa_auto_checks = json.loads(qa_auto_checks)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "qa_auto_checks_json_decode_failed",
+                    post_id=p.get("id")
+                )
+                qa_auto_checks = None
+
+        spoken_duration = p.get("spoken_duration")
+        try:
+            spoken_duration_value = float(spoken_duration) if spoken_duration is not None else 0.0
+        except (TypeError, ValueError):
+            logger.warning(
+                "post_spoken_duration_parse_failed",
                 post_id=p.get("id"),
+                value=spoken_duration
             )
-            publish_results = _normalize_json_object(
-                p.get("publish_results"),
-                field_name="publish_results",
-                post_id=p.get("id"),
+            spoken_duration_value = 0.0
+
+        platform_ids = _normalize_json_object(
+            p.get("platform_ids"),
+            field_name="platform_ids",
+            post_id=p.get("id"),
+        )
+        publish_results = _normalize_json_object(
+            p.get("publish_results"),
+            field_name="publish_results",
+            post_id=p.get("id"),
+        )
+        social_networks = _normalize_string_list(p.get("social_networks"))
+
+        posts_list.append(
+            PostDetail(
+                id=p["id"],
+                post_type=display_post_type or p["post_type"],
+                topic_title=p["topic_title"],
+                topic_rotation=p["topic_rotation"],
+                topic_cta=p["topic_cta"],
+                spoken_duration=spoken_duration_value,
+                state=p.get("state"),
+                seed_data=normalized_seed,
+                video_prompt_json=video_prompt,
+                video_status=p.get("video_status"),
+                video_url=p.get("video_url"),
+                video_metadata=video_metadata,
+                video_operation_id=p.get("video_operation_id"),
+                video_provider=p.get("video_provider"),
+                scene_reference_image_id=p.get("scene_reference_image_id"),
+                scene_reference_candidates=scene_references_by_post.get(str(p.get("id")), []),
+                identity_gate_result=_normalize_json_object(
+                    p.get("identity_gate_result"),
+                    field_name="identity_gate_result",
+                    post_id=p.get("id"),
+                ),
+                qa_pass=p.get("qa_pass"),
+                qa_notes=p.get("qa_notes"),
+                qa_auto_checks=qa_auto_checks,
+                scheduled_at=p.get("scheduled_at"),
+                social_networks=social_networks,
+                publish_caption=p.get("publish_caption") or normalized_seed.get("caption") or normalized_seed.get("description"),
+                publish_status=p.get("publish_status"),
+                platform_ids=platform_ids,
+                publish_results=publish_results,
+                blog_enabled=p.get("blog_enabled", False),
+                blog_status=p.get("blog_status", "disabled"),
+                blog_content=normalize_blog_content(
+                    p.get("blog_content") or {},
+                    fallback_name=p.get("topic_title") or normalized_seed.get("canonical_topic", ""),
+                    scheduled_at=str(p.get("blog_scheduled_at") or "") or None,
+                    published_at=str(p.get("blog_published_at") or "") or None,
+                ),
+                blog_webflow_item_id=p.get("blog_webflow_item_id"),
+                blog_scheduled_at=p.get("blog_scheduled_at"),
+                blog_published_at=p.get("blog_published_at"),
+                created_at=p.get("created_at"),
+                updated_at=p.get("updated_at"),
             )
-            social_networks = _normalize_string_list(p.get("social_networks"))
-
-            posts_list.append(
-                PostDetail(
-                    id=p["id"],
-                    post_type=display_post_type or p["post_type"],
-                    topic_title=p["topic_title"],
-                    topic_rotation=p["topic_rotation"],
-                    topic_cta=p["topic_cta"],
-                    spoken_duration=spoken_duration_value,
-                    state=p.get("state"),
-                    seed_data=normalized_seed,
-                    video_prompt_json=video_prompt,
-                    video_status=p.get("video_status"),
-                    video_url=p.get("video_url"),
-                    video_metadata=video_metadata,
-                    video_operation_id=p.get("video_operation_id"),
-                    video_provider=p.get("video_provider"),
-                    scene_reference_image_id=p.get("scene_reference_image_id"),
-                    scene_reference_candidates=scene_references_by_post.get(str(p.get("id")), []),
-                    identity_gate_result=_normalize_json_object(
-                        p.get("identity_gate_result"),
-                        field_name="identity_gate_result",
-                        post_id=p.get("id"),
-                    ),
-                    qa_pass=p.get("qa_pass"),
-                    qa_notes=p.get("qa_notes"),
-                    qa_auto_checks=qa_auto_checks,
-                    scheduled_at=p.get("scheduled_at"),
-                    social_networks=social_networks,
-                    publish_caption=p.get("publish_caption") or normalized_seed.get("caption") or normalized_seed.get("description"),
-                    publish_status=p.get("publish_status"),
-                    platform_ids=platform_ids,
-                    publish_results=publish_results,
-                    blog_enabled=p.get("blog_enabled", False),
-                    blog_status=p.get("blog_status", "disabled"),
-                    blog_content=normalize_blog_content(
-                        p.get("blog_content") or {},
-                        fallback_name=p.get("topic_title") or normalized_seed.get("canonical_topic", ""),
-                        scheduled_at=str(p.get("blog_scheduled_at") or "") or None,
-                        published_at=str(p.get("blog_published_at") or "") or None,
-                    ),
-                    blog_webflow_item_id=p.get("blog_webflow_item_id"),
-                    blog_scheduled_at=p.get("blog_scheduled_at"),
-                    blog_published_at=p.get("blog_published_at"),
-                    created_at=p.get("created_at"),
-                    updated_at=p.get("updated_at"),
-                )
+        )
+
+    derived_creation_mode = str(batch.get("creation_mode") or "").strip()
+    if not derived_creation_mode:
+        has_manual_drafts = any(bool((p.seed_data or {}).get("manual_draft")) for p in posts_list)
+        derived_creation_mode = "manual" if has_manual_drafts else "automated"
+
+    return {
+        **batch,
+        "creation_mode": derived_creation_mode,
+        **posts_summary,
+        "meta_connection": _sanitize_meta_connection(
+            _effective_meta_connection(batch_id, batch.get("meta_connection"))
+        ),
+        "posts": posts_list,
+    }
+
+
+async def _batch_detail_payload(batch_detail: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize a loaded batch detail into the payload the HTML page renders."""
+    batch_payload = BatchDetailResponse(**batch_detail).model_dump(mode="json")
+    if is_semantic_ugc_mode(batch_payload.get("creation_mode")):
+        batch_payload["_semantic_scene_image_jobs"] = await run_db(
+            semantic_video_queries.list_scene_image_jobs_for_posts,
+            [str(post.get("id") or "") for post in batch_payload["posts"]],
+        )
+    return batch_payload
+
+
+async def _load_progress_detail_payload(batch_id: str) -> Dict[str, Any]:
+    """Load the page payload the progress hub shares across one change's refreshes."""
+    batch, posts_summary, _progress, _has_manual_drafts = await run_db(_read_batch_recovery_inputs, batch_id)
+    batch_detail = await run_db(_load_batch_detail, batch, posts_summary)
+    batch_detail["tiktok_connection"] = await get_tiktok_publish_state()
+    return await _batch_detail_payload(batch_detail)
+
+
+def _render_batch_detail(request: Request, batch_payload: Dict[str, Any], progress_event_id: str):
+    context = {
+        "request": request,
+        "batch": batch_payload,
+        "batch_view": _build_batch_detail_view(batch_payload),
+        "progress_event_id": progress_event_id,
+        "static_version": DETAIL_JS_VERSION,
+    }
+    template_name = "batches/detail.html"
+    if request.headers.get("HX-Request") == "true" and not _is_hx_history_restore_request(request):
+        template_name = "batches/detail.html"
+    return templates.TemplateResponse(template_name, context)
+
+
+@router.get("/{batch_id}", response_model=SuccessResponse)
+async def get_batch_endpoint(request: Request, batch_id: str, progress_event: Optional[str] = None):
+    """
+    Get batch by ID with posts summary.
+
+    ``progress_event`` marks a page refresh triggered by that progress stream event;
+    those are rendered from the detail the progress hub shares across subscribers.
+    """
+    try:
+        # Read before the detail load so the page's progress stream resumes no later than this render.
+        hub = get_batch_progress_hub()
+        progress_event_id = hub.latest_event_id(batch_id)
+        if progress_event and _wants_html(request):
+            shared_payload = await hub.shared_detail(
+                batch_id,
+                progress_event,
+                lambda: _load_progress_detail_payload(batch_id),
             )
+            if shared_payload is not None:
+                return _render_batch_detail(request, copy.deepcopy(shared_payload), progress_event_id)
 
-        derived_creation_mode = str(batch.get("creation_mode") or "").strip()
-        if not derived_creation_mode:
-            has_manual_drafts = any(bool((p.seed_data or {}).get("manual_draft")) for p in posts_list)
-            derived_creation_mode = "manual" if has_manual_drafts else "automated"
-
-        batch_detail = {
-            **batch,
-            "creation_mode": derived_creation_mode,
-            **posts_summary,
-            "meta_connection": _sanitize_meta_connection(
-                _effective_meta_connection(batch_id, batch.get("meta_connection"))
-            ),
-            "tiktok_connection": await get_tiktok_publish_state(),
-            "posts": posts_list,
-        }
+        batch, posts_summary, progress, has_manual_drafts = await run_db(_read_batch_recovery_inputs, batch_id)
+        if not has_manual_drafts:
+            await run_db(
+                _recover_stale_semantic_batch,
+                batch,
+                posts_summary,
+                progress,
+                asyncio.get_running_loop(),
+            )
+        batch_detail = await run_db(_load_batch_detail, batch, posts_summary)
+        batch_detail["tiktok_connection"] = await get_tiktok_publish_state()
 
         if _wants_html(request):
-            batch_model = BatchDetailResponse(**batch_detail)
-            batch_payload = batch_model.model_dump(mode="json")
-            if is_semantic_ugc_mode(batch_payload.get("creation_mode")):
-                batch_payload["_semantic_scene_image_jobs"] = (
-                    semantic_video_queries.list_scene_image_jobs_for_posts(
-                        [str(post.get("id") or "") for post in batch_payload["posts"]]
-                    )
-                )
-            context = {
-                "request": request,
-                "batch": batch_payload,
-                "batch_view": _build_batch_detail_view(batch_payload),
-                "static_version": DETAIL_JS_VERSION,
-            }
-            template_name = "batches/detail.html"
-            if request.headers.get("HX-Request") == "true" and not _is_hx_history_restore_request(request):
-                template_name = "batches/detail.html"
-            return templates.TemplateResponse(template_name, context)
+            return _render_batch_detail(request, await _batch_detail_payload(batch_detail), progress_event_id)
 
         return SuccessResponse(data=BatchDetailResponse(**batch_detail))
     
@@ -1705,50 +1777,47 @@ async def get_batch_endpoint(request: Request, batch_id: str):
         )
 
 
+def _read_batch_status(batch_id: str) -> tuple[dict, dict, dict | None, bool]:
+    """Read the inputs of the polling payload for one batch (blocking; run via ``run_db``)."""
+    batch = get_batch_by_id(batch_id)
+    posts_summary = get_batch_posts_summary(batch_id)
+    progress = get_seeding_progress(batch_id)
+    is_manual_batch = _batch_has_manual_drafts(batch) or (
+        batch.get("state") == BatchState.S2_SEEDED.value
+        and not batch.get("post_type_counts")
+    )
+    return batch, posts_summary, progress, is_manual_batch
+
+
+def _batch_status_payload(batch: dict, posts_summary: dict, progress: dict | None) -> Dict[str, Any]:
+    return {
+        "id": batch["id"],
+        "state": batch["state"],
+        "creation_mode": batch.get("creation_mode"),
+        "target_length_tier": batch.get("target_length_tier"),
+        "target_duration_seconds": batch.get("target_duration_seconds"),
+        "video_pipeline_route": batch.get("video_pipeline_route"),
+        "posts_count": posts_summary["posts_count"],
+        "posts_by_state": posts_summary["posts_by_state"],
+        "updated_at": batch["updated_at"],
+        "progress": progress,
+    }
+
+
 @router.get("/{batch_id}/status", response_model=SuccessResponse)
 async def get_batch_status(batch_id: str):
     """Return lightweight status payload for polling newly created batches."""
     try:
-        batch = get_batch_by_id(batch_id)
-        posts_summary = get_batch_posts_summary(batch_id)
-        progress = get_seeding_progress(batch_id)
-
-        is_manual_batch = _batch_has_manual_drafts(batch) or (
-            batch.get("state") == BatchState.S2_SEEDED.value
-            and not batch.get("post_type_counts")
-        )
-
-        if is_manual_batch:
-            payload = {
-                "id": batch["id"],
-                "state": batch["state"],
-                "creation_mode": batch.get("creation_mode"),
-                "target_length_tier": batch.get("target_length_tier"),
-                "target_duration_seconds": batch.get("target_duration_seconds"),
-                "video_pipeline_route": batch.get("video_pipeline_route"),
-                "posts_count": posts_summary["posts_count"],
-                "posts_by_state": posts_summary["posts_by_state"],
-                "updated_at": batch["updated_at"],
-                "progress": progress,
-            }
-            return SuccessResponse(data=payload)
-
-        progress = _recover_stale_semantic_batch(batch, posts_summary, progress)
-
-        payload = {
-            "id": batch["id"],
-            "state": batch["state"],
-            "creation_mode": batch.get("creation_mode"),
-            "target_length_tier": batch.get("target_length_tier"),
-            "target_duration_seconds": batch.get("target_duration_seconds"),
-            "video_pipeline_route": batch.get("video_pipeline_route"),
-            "posts_count": posts_summary["posts_count"],
-            "posts_by_state": posts_summary["posts_by_state"],
-            "updated_at": batch["updated_at"],
-            "progress": progress,
-        }
-
-        return SuccessResponse(data=payload)
+        batch, posts_summary, progress, is_manual_batch = await run_db(_read_batch_status, batch_id)
+        if not is_manual_batch:
+            progress = await run_db(
+                _recover_stale_semantic_batch,
+                batch,
+                posts_summary,
+                progress,
+                asyncio.get_running_loop(),
+            )
+        return SuccessResponse(data=_batch_status_payload(batch, posts_summary, progress))
 
     except FlowForgeException:
         raise
@@ -1762,32 +1831,23 @@ async def get_batch_status(batch_id: str):
 
 @router.get("/{batch_id}/progress/stream")
 async def stream_batch_progress(request: Request, batch_id: str, last_event_id: Optional[str] = None):
-    """Stream live seeding progress events with resumable replay."""
+    """Stream live batch progress (seeding, video, caption, semantic runs) with resumable replay."""
 
     async def event_stream():
-        last_seen = last_event_id or request.headers.get("last-event-id")
-
-        while True:
-            if await request.is_disconnected():
-                break
-
-            events = get_seeding_events(batch_id, last_seen)
-            if events:
-                for event in events:
-                    payload = json.dumps(event)
-                    yield f"id: {event['event_id']}\ndata: {payload}\n\n"
-                    last_seen = event["event_id"]
-
-                terminal = events[-1]["event_type"]
-                if terminal in {"interaction.complete", "interaction.failed"}:
-                    break
-            else:
-                progress = get_seeding_progress(batch_id)
-                if progress and progress.get("stage") in {"completed", "failed"}:
+        subscription = get_batch_progress_hub().subscribe(
+            batch_id,
+            last_event_id or request.headers.get("last-event-id"),
+        )
+        try:
+            async for event in subscription:
+                if await request.is_disconnected():
                     break
-
-            yield ": keep-alive\n\n"
-            await asyncio.sleep(1)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"id: {event['event_id']}\ndata: {json.dumps(event, default=str)}\n\n"
+        finally:
+            await subscription.aclose()
 
     return StreamingResponse(
         event_stream(),
@@ -1807,7 +1867,7 @@ async def advance_batch_state_endpoint(batch_id: str, request: AdvanceStateReque
     Per Constitution § VII: Validates state transitions.
     """
     try:
-        batch = update_batch_state(batch_id, request.target_state)
+        batch = await run_db(update_batch_state, batch_id, request.target_state)
         
         return SuccessResponse(data=BatchResponse(**batch))
     
@@ -1827,7 +1887,7 @@ async def duplicate_batch_endpoint(batch_id: str, request: DuplicateBatchRequest
     Duplicate a batch.
     """
     try:
-        new_batch = duplicate_batch(batch_id, request.new_brand)
+        new_batch = await run_db(duplicate_batch, batch_id, request.new_brand)
         
         return SuccessResponse(data=BatchResponse(**new_batch))
     
@@ -1847,7 +1907,7 @@ async def archive_batch_endpoint(batch_id: str, request: ArchiveBatchRequest):
     Archive or unarchive a batch.
     """
     try:
-        batch = archive_batch(batch_id, request.archived)
+        batch = await run_db(archive_batch, batch_id, request.archived)
         
         return SuccessResponse(data=BatchResponse(**batch))
     
@@ -1861,6 +1921,79 @@ async def archive_batch_endpoint(batch_id: str, request: ArchiveBatchRequest):
         )
 
 
+def _approve_batch_scripts(batch_id: str) -> tuple[BatchState, Dict[str, Any]]:
+    """Check script review state and move the batch to S4 (blocking; run via ``run_db``)."""
+    batch = get_batch_by_id(batch_id)
+    
+    try:
+        current_state = BatchState(batch["state"])
+    except ValueError:
+        raise FlowForgeException(
+            code="state_transition_error",
+            message=f"Unknown batch state {batch['state']}",
+            details={"current_state": batch["state"], "required_state": BatchState.S2_SEEDED.value}
+        )
+
+    if current_state == BatchState.S4_SCRIPTED:
+        logger.info(
+            "scripts_already_approved",
+            batch_id=batch_id,
+            current_state=current_state.value
+        )
+        updated_batch = batch
+    elif current_state != BatchState.S2_SEEDED:
+        raise FlowForgeException(
+            code="state_transition_error",
+            message=f"Cannot approve scripts from state {batch['state']}",
+            details={"current_state": batch["state"], "required_state": BatchState.S2_SEEDED.value}
+        )
+    else:
+        from app.adapters.supabase_client import get_supabase
+
+        supabase = get_supabase().client
+        posts_response = supabase.table("posts").select("id", "seed_data").eq("batch_id", batch_id).execute()
+        posts = posts_response.data or []
+        if not posts:
+            raise StateTransitionError("Cannot approve scripts without posts", {"batch_id": batch_id})
+
+        approved_count = 0
+        pending_post_ids = []
+        for post in posts:
+            seed_data = post.get("seed_data") or {}
+            if isinstance(seed_data, str):
+                try:
+                    seed_data = json.loads(seed_data)
+                except json.JSONDecodeError:
+                    seed_data = {}
+            review_status = seed_data.get("script_review_status") or "pending"
+            if review_status == "approved":
+                approved_count += 1
+            elif review_status != "removed":
+                pending_post_ids.append(post["id"])
+
+        if pending_post_ids:
+            raise StateTransitionError(
+                "Every post must be approved or removed before advancing.",
+                {"pending_post_ids": pending_post_ids}
+            )
+
+        if approved_count == 0:
+            raise StateTransitionError(
+                "At least one approved script is required before advancing.",
+                {"batch_id": batch_id}
+            )
+
+        updated_batch = update_batch_state(batch_id, BatchState.S4_SCRIPTED)
+        reconciled_state = reconcile_batch_video_pipeline_state(
+            batch_id=batch_id,
+            correlation_id=f"approve_scripts_{batch_id}",
+        )
+        if reconciled_state:
+            updated_batch = {**updated_batch, "state": reconciled_state}
+
+    return current_state, updated_batch
+
+
 @router.put("/{batch_id}/approve-scripts", response_model=SuccessResponse)
 async def approve_scripts_endpoint(batch_id: str, request: Request):
     """
@@ -1868,73 +2001,7 @@ async def approve_scripts_endpoint(batch_id: str, request: Request):
     Per Canon § 3.2: Manual script approval (optional override).
     """
     try:
-        batch = get_batch_by_id(batch_id)
-        
-        try:
-            current_state = BatchState(batch["state"])
-        except ValueError:
-            raise FlowForgeException(
-                code="state_transition_error",
-                message=f"Unknown batch state {batch['state']}",
-                details={"current_state": batch["state"], "required_state": BatchState.S2_SEEDED.value}
-            )
-
-        if current_state == BatchState.S4_SCRIPTED:
-            logger.info(
-                "scripts_already_approved",
-                batch_id=batch_id,
-                current_state=current_state.value
-            )
-            updated_batch = batch
-        elif current_state != BatchState.S2_SEEDED:
-            raise FlowForgeException(
-                code="state_transition_error",
-                message=f"Cannot approve scripts from state {batch['state']}",
-                details={"current_state": batch["state"], "required_state": BatchState.S2_SEEDED.value}
-            )
-        else:
-            from app.adapters.supabase_client import get_supabase
-
-            supabase = get_supabase().client
-            posts_response = supabase.table("posts").select("id", "seed_data").eq("batch_id", batch_id).execute()
-            posts = posts_response.data or []
-            if not posts:
-                raise StateTransitionError("Cannot approve scripts without posts", {"batch_id": batch_id})
-
-            approved_count = 0
-            pending_post_ids = []
-            for post in posts:
-                seed_data = post.get("seed_data") or {}
-                if isinstance(seed_data, str):
-                    try:
-                        seed_data = json.loads(seed_data)
-                    except json.JSONDecodeError:
-                        seed_data = {}
-                review_status = seed_data.get("script_review_status") or "pending"
-                if review_status == "approved":
-                    approved_count += 1
-                elif review_status != "removed":
-                    pending_post_ids.append(post["id"])
-
-            if pending_post_ids:
-                raise StateTransitionError(
-                    "Every post must be approved or removed before advancing.",
-                    {"pending_post_ids": pending_post_ids}
-                )
-
-            if approved_count == 0:
-                raise StateTransitionError(
-                    "At least one approved script is required before advancing.",
-                    {"batch_id": batch_id}
-                )
-
-            updated_batch = update_batch_state(batch_id, BatchState.S4_SCRIPTED)
-            reconciled_state = reconcile_batch_video_pipeline_state(
-                batch_id=batch_id,
-                correlation_id=f"approve_scripts_{batch_id}",
-            )
-            if reconciled_state:
-                updated_batch = {**updated_batch, "state": reconciled_state}
+        current_state, updated_batch = await run_db(_approve_batch_scripts, batch_id)
 
         logger.info(
             "scripts_approved",
@@ -1960,6 +2027,79 @@ async def approve_scripts_endpoint(batch_id: str, request: Request):
         )
 
 
+def _advance_batch_to_publish(batch_id: str) -> tuple[BatchState, Dict[str, Any], int]:
+    """Guard QA approval and move the batch to S7 (blocking; run via ``run_db``)."""
+    from app.adapters.supabase_client import get_supabase
+    
+    batch = get_batch_by_id(batch_id)
+    
+    try:
+        current_state = BatchState(batch["state"])
+    except ValueError:
+        raise FlowForgeException(
+            code="state_transition_error",
+            message=f"Unknown batch state {batch['state']}",
+            details={"current_state": batch["state"], "required_state": BatchState.S6_QA.value}
+        )
+    
+    if current_state != BatchState.S6_QA:
+        raise FlowForgeException(
+            code="state_transition_error",
+            message=f"Cannot advance to publish from state {batch['state']}",
+            details={"current_state": batch["state"], "required_state": BatchState.S6_QA.value}
+        )
+    
+    # Guard: Verify all active posts have qa_pass=true
+    supabase = get_supabase().client
+    posts_response = supabase.table("posts").select("id, qa_pass, seed_data").eq("batch_id", batch_id).execute()
+    posts = posts_response.data
+    
+    if not posts:
+        raise FlowForgeException(
+            code="state_transition_error",
+            message="Cannot advance batch with no posts",
+            details={"batch_id": batch_id}
+        )
+
+    active_posts = []
+    for post in posts:
+        seed_data = post.get("seed_data") or {}
+        if isinstance(seed_data, str):
+            try:
+                seed_data = json.loads(seed_data)
+            except json.JSONDecodeError:
+                seed_data = {}
+        if seed_data.get("script_review_status") == "removed" or seed_data.get("video_excluded") is True:
+            continue
+        active_posts.append(post)
+
+    if not active_posts:
+        raise FlowForgeException(
+            code="state_transition_error",
+            message="Cannot advance batch with no active posts",
+            details={"batch_id": batch_id}
+        )
+
+    posts_not_approved = [p["id"] for p in active_posts if p.get("qa_pass") is not True]
+    
+    if posts_not_approved:
+        raise FlowForgeException(
+            code="state_transition_error",
+            message=f"Cannot advance to publish. {len(posts_not_approved)} post(s) not approved.",
+            details={
+                "batch_id": batch_id,
+                "total_posts": len(active_posts),
+                "approved_posts": len(active_posts) - len(posts_not_approved),
+                "pending_posts": posts_not_approved[:5]  # Show first 5
+            }
+        )
+    
+    # All guards passed - advance state
+    updated_batch = update_batch_state(batch_id, BatchState.S7_PUBLISH_PLAN)
+
+    return current_state, updated_batch, len(active_posts)
+
+
 @router.put("/{batch_id}/advance-to-publish", response_model=SuccessResponse)
 async def advance_to_publish_endpoint(batch_id: str, request: Request):
     """
@@ -1968,80 +2108,17 @@ async def advance_to_publish_endpoint(batch_id: str, request: Request):
     Per Constitution § VII: State Machine Discipline - explicit guards.
     """
     try:
-        from app.adapters.supabase_client import get_supabase
-        
-        batch = get_batch_by_id(batch_id)
-        
-        try:
-            current_state = BatchState(batch["state"])
-        except ValueError:
-            raise FlowForgeException(
-                code="state_transition_error",
-                message=f"Unknown batch state {batch['state']}",
-                details={"current_state": batch["state"], "required_state": BatchState.S6_QA.value}
-            )
-        
-        if current_state != BatchState.S6_QA:
-            raise FlowForgeException(
-                code="state_transition_error",
-                message=f"Cannot advance to publish from state {batch['state']}",
-                details={"current_state": batch["state"], "required_state": BatchState.S6_QA.value}
-            )
-        
-        # Guard: Verify all active posts have qa_pass=true
-        supabase = get_supabase().client
-        posts_response = supabase.table("posts").select("id, qa_pass, seed_data").eq("batch_id", batch_id).execute()
-        posts = posts_response.data
-        
-        if not posts:
-            raise FlowForgeException(
-                code="state_transition_error",
-                message="Cannot advance batch with no posts",
-                details={"batch_id": batch_id}
-            )
-
-        active_posts = []
-        for post in posts:
-            seed_data = post.get("seed_data") or {}
-            if isinstance(seed_data, str):
-                try:
-                    seed_data = json.loads(seed_data)
-                except json.JSONDecodeError:
-                    seed_data = {}
-            if seed_data.get("script_review_status") == "removed" or seed_data.get("video_excluded") is True:
-                continue
-            active_posts.append(post)
-
-        if not active_posts:
-            raise FlowForgeException(
-                code="state_transition_error",
-                message="Cannot advance batch with no active posts",
-                details={"batch_id": batch_id}
-            )
+        current_state, updated_batch, active_post_count = await run_db(
+            _advance_batch_to_publish,
+            batch_id,
+        )
 
-        posts_not_approved = [p["id"] for p in active_posts if p.get("qa_pass") is not True]
-        
-        if posts_not_approved:
-            raise FlowForgeException(
-                code="state_transition_error",
-                message=f"Cannot advance to publish. {len(posts_not_approved)} post(s) not approved.",
-                details={
-                    "batch_id": batch_id,
-                    "total_posts": len(active_posts),
-                    "approved_posts": len(active_posts) - len(posts_not_approved),
-                    "pending_posts": posts_not_approved[:5]  # Show first 5
-                }
-            )
-        
-        # All guards passed - advance state
-        updated_batch = update_batch_state(batch_id, BatchState.S7_PUBLISH_PLAN)
-        
         logger.info(
             "batch_advanced_to_publish",
             batch_id=batch_id,
             previous_state=current_state.value,
             new_state=BatchState.S7_PUBLISH_PLAN.value,
-            total_posts=len(active_posts)
+            total_posts=active_post_count
         )
         
         if _wants_html(request):
@@ -0,0 +1,339 @@
+"""Batch progress hub — one publisher per batch, fanned out to every SSE subscriber.
+
+Each batch with at least one open progress stream gets a single publisher task. It
+forwards in-process seeding events as soon as ``notify_batch_progress`` wakes it
+and runs one narrow database poll (batch state, post video/caption/publish status,
+semantic run stage) every ``BATCH_PROGRESS_POLL_SECONDS``. Changes become numbered
+events in a bounded replay log; a poll that changed anything ends with one
+``progress.changed`` event naming what moved, so pages that re-render on progress
+refresh once per poll rather than once per post. Subscribers only read that log, and
+the page re-render that follows a change is served from one detail payload per batch
+(``shared_detail``), so database load per batch stays constant no matter how many
+browser tabs are watching. A reconnecting ``EventSource`` resumes from its
+``Last-Event-ID``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+from app.adapters.supabase_client import run_db
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_PROGRESS_POLL_SECONDS = float(os.getenv("BATCH_PROGRESS_POLL_SECONDS", "3"))
+BATCH_PROGRESS_KEEPALIVE_SECONDS = float(os.getenv("BATCH_PROGRESS_KEEPALIVE_SECONDS", "15"))
+BATCH_PROGRESS_REPLAY_EVENTS = int(os.getenv("BATCH_PROGRESS_REPLAY_EVENTS", "200"))
+# How long a batch keeps its publisher and replay log after the last subscriber leaves,
+# so a page reload or EventSource reconnect can still replay from Last-Event-ID.
+BATCH_PROGRESS_LINGER_SECONDS = float(os.getenv("BATCH_PROGRESS_LINGER_SECONDS", "30"))
+# How long one loaded batch detail is shared by the page refreshes that follow a change.
+# Subscribers refresh within the client's debounce window, so this only has to cover
+# one burst; a later refresh reloads so edits made outside the progress fields show up.
+BATCH_PROGRESS_DETAIL_TTL_SECONDS = float(os.getenv("BATCH_PROGRESS_DETAIL_TTL_SECONDS", "5"))
+
+_POST_PROGRESS_FIELDS = ("state", "video_status", "publish_status")
+_RUN_PROGRESS_FIELDS = ("post_id", "stage")
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+class _BatchChannel:
+    """Replay log, publisher task and wake-ups for one batch."""
+
+    def __init__(self, batch_id: str, loop: asyncio.AbstractEventLoop):
+        self.batch_id = batch_id
+        self.loop = loop
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max(BATCH_PROGRESS_REPLAY_EVENTS, 1))
+        self.last_event_id = 0
+        self.subscribers = 0
+        self.idle_since: Optional[float] = None
+        self.publisher: Optional[asyncio.Task] = None
+        self.wake = asyncio.Event()
+        self._changed = asyncio.Event()
+        self.seeding_cursor: Optional[str] = None
+        self.batch: Optional[Dict[str, Any]] = None
+        self.posts: Dict[str, Dict[str, Any]] = {}
+        self.runs: Dict[str, Dict[str, Any]] = {}
+        self.snapshot_loaded = False
+        self.changed_event_id = 0
+        self.detail: Optional[Dict[str, Any]] = None
+        self.detail_event_id = 0
+        self.detail_loaded_at = 0.0
+        self.detail_lock = asyncio.Lock()
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self.last_event_id += 1
+        event = {
+            "event_id": str(self.last_event_id),
+            "event_type": event_type,
+            "created_at": _utc_now_iso(),
+            **payload,
+        }
+        self.events.append(event)
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return event
+
+    def snapshot_payload(self) -> Dict[str, Any]:
+        return {
+            "batch": dict(self.batch or {}),
+            "posts": [dict(row) for row in self.posts.values()],
+            "runs": [dict(row) for row in self.runs.values()],
+        }
+
+    def snapshot_event(self) -> Dict[str, Any]:
+        """Current state as one event, stamped with the newest log id."""
+        return {
+            "event_id": str(self.last_event_id),
+            "event_type": "progress.snapshot",
+            "created_at": _utc_now_iso(),
+            **self.snapshot_payload(),
+        }
+
+    def events_after(self, cursor: Optional[int]) -> List[Dict[str, Any]]:
+        if cursor is None or cursor > self.last_event_id:
+            # New subscriber, or an id from before a restart: replay from the start.
+            cursor = 0
+        oldest = int(self.events[0]["event_id"]) if self.events else self.last_event_id + 1
+        if cursor < oldest - 1:
+            # The client missed events that already fell out of the replay window.
+            return [self.snapshot_event()]
+        return [event for event in self.events if int(event["event_id"]) > cursor]
+
+    async def wait_for_change(self, timeout: float) -> None:
+        changed = self._changed
+        try:
+            await asyncio.wait_for(changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+def _row_progress(row: Dict[str, Any], fields: tuple[str, ...]) -> Dict[str, Any]:
+    return {"id": str(row.get("id") or ""), **{field: row.get(field) for field in fields}}
+
+
+def _load_progress_snapshot(batch_id: str) -> Dict[str, Any]:
+    from app.features.batches.queries import get_batch_progress_snapshot
+
+    return get_batch_progress_snapshot(batch_id)
+
+
+def _read_seeding_events(batch_id: str, cursor: Optional[str]) -> List[Dict[str, Any]]:
+    from app.features.topics.handlers import get_seeding_events
+
+    return get_seeding_events(batch_id, cursor)
+
+
+class BatchProgressHub:
+    """Process-wide registry of batch channels."""
+
+    def __init__(self) -> None:
+        self._channels: Dict[str, _BatchChannel] = {}
+        self._lock = threading.Lock()
+
+    def _channel(self, batch_id: str) -> _BatchChannel:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            channel = self._channels.get(batch_id)
+            if channel is None or channel.loop is not loop:
+                channel = _BatchChannel(batch_id, loop)
+                self._channels[batch_id] = channel
+        if channel.publisher is None or channel.publisher.done():
+            channel.publisher = loop.create_task(self._run_publisher(channel))
+        return channel
+
+    def latest_event_id(self, batch_id: str) -> str:
+        """Newest event id for the batch, or ``"0"`` when nobody is streaming it."""
+        with self._lock:
+            channel = self._channels.get(batch_id)
+        return str(channel.last_event_id if channel is not None else 0)
+
+    def notify(self, batch_id: str) -> None:
+        """Wake the batch's publisher now; safe to call from worker threads."""
+        with self._lock:
+            channel = self._channels.get(batch_id)
+        if channel is None:
+            return
+        try:
+            channel.loop.call_soon_threadsafe(channel.wake.set)
+        except RuntimeError:
+            # The loop that owned the channel is closed; the next subscriber recreates it.
+            pass
+
+    async def subscribe(self, batch_id: str, last_event_id: Optional[str] = None) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield events after ``last_event_id``, then live ones; ``None`` means send a keep-alive."""
+        channel = self._channel(batch_id)
+        channel.subscribers += 1
+        channel.idle_since = None
+        cursor = _parse_event_id(last_event_id)
+        try:
+            while True:
+                events = channel.events_after(cursor)
+                for event in events:
+                    yield event
+                    cursor = int(event["event_id"])
+                if not events:
+                    await channel.wait_for_change(BATCH_PROGRESS_KEEPALIVE_SECONDS)
+                    if not channel.events_after(cursor):
+                        yield None
+        finally:
+            channel.subscribers -= 1
+            if channel.subscribers <= 0:
+                channel.idle_since = time.monotonic()
+
+    async def shared_detail(
+        self,
+        batch_id: str,
+        event_id: Optional[str],
+        load: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Batch detail for a refresh triggered by progress event ``event_id``.
+
+        Every subscriber refreshing for the same change gets one shared payload,
+        loaded by whichever request arrives first. Returns ``None`` when nobody is
+        streaming the batch or the event is unknown; the caller then loads the detail
+        itself.
+        """
+        cursor = _parse_event_id(event_id)
+        with self._lock:
+            channel = self._channels.get(batch_id)
+        if channel is None or cursor is None or cursor <= 0 or cursor > channel.last_event_id:
+            return None
+        if channel.loop is not asyncio.get_running_loop():
+            return None
+        async with channel.detail_lock:
+            fresh = time.monotonic() - channel.detail_loaded_at < BATCH_PROGRESS_DETAIL_TTL_SECONDS
+            if channel.detail is None or channel.detail_event_id < channel.changed_event_id or not fresh:
+                changed_event_id = channel.changed_event_id
+                channel.detail = await load()
+                channel.detail_event_id = changed_event_id
+                channel.detail_loaded_at = time.monotonic()
+            return channel.detail
+
+    async def _run_publisher(self, channel: _BatchChannel) -> None:
+        next_poll_at = 0.0
+        try:
+            while True:
+                channel.wake.clear()
+                self._pump_seeding(channel)
+                now = time.monotonic()
+                if now >= next_poll_at:
+                    await self._poll_database(channel)
+                    next_poll_at = time.monotonic() + BATCH_PROGRESS_POLL_SECONDS
+                if (
+                    channel.subscribers <= 0
+                    and channel.idle_since is not None
+                    and time.monotonic() - channel.idle_since >= BATCH_PROGRESS_LINGER_SECONDS
+                ):
+                    break
+                try:
+                    await asyncio.wait_for(
+                        channel.wake.wait(),
+                        timeout=max(next_poll_at - time.monotonic(), 0.05),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                if self._channels.get(channel.batch_id) is channel and channel.subscribers <= 0:
+                    self._channels.pop(channel.batch_id, None)
+
+    def _pump_seeding(self, channel: _BatchChannel) -> None:
+        for event in _read_seeding_events(channel.batch_id, channel.seeding_cursor):
+            channel.seeding_cursor = str(event["event_id"])
+            payload = {key: value for key, value in event.items() if key not in {"event_id", "event_type", "created_at"}}
+            payload["seeding_event_id"] = event["event_id"]
+            channel.publish(str(event["event_type"]), payload)
+
+    async def _poll_database(self, channel: _BatchChannel) -> None:
+        try:
+            snapshot = await run_db(_load_progress_snapshot, channel.batch_id)
+        except Exception as exc:
+            logger.warning("batch_progress_poll_failed", batch_id=channel.batch_id, error=str(exc))
+            return
+
+        batch = snapshot.get("batch") or {}
+        batch_progress = {"id": channel.batch_id, "state": batch.get("state")}
+        posts = {
+            str(row.get("id")): _row_progress(row, _POST_PROGRESS_FIELDS)
+            for row in snapshot.get("posts") or []
+            if row.get("id")
+        }
+        runs = {
+            str(row.get("id")): _row_progress(row, _RUN_PROGRESS_FIELDS)
+            for row in snapshot.get("runs") or []
+            if row.get("id")
+        }
+
+        if not channel.snapshot_loaded:
+            channel.batch, channel.posts, channel.runs = batch_progress, posts, runs
+            channel.snapshot_loaded = True
+            channel.changed_event_id = int(channel.publish("progress.snapshot", channel.snapshot_payload())["event_id"])
+            return
+
+        batch_changed = batch_progress != channel.batch
+        if batch_changed:
+            channel.publish("batch.state", {"batch": batch_progress, "previous_state": (channel.batch or {}).get("state")})
+            channel.batch = batch_progress
+        changed_posts = [post_id for post_id, post in posts.items() if channel.posts.get(post_id) != post]
+        for post_id in changed_posts:
+            channel.publish("post.progress", {"post": posts[post_id]})
+        changed_runs = [run_id for run_id, run in runs.items() if channel.runs.get(run_id) != run]
+        for run_id in changed_runs:
+            channel.publish("semantic_run.progress", {"run": runs[run_id]})
+        removed_posts = sorted(channel.posts.keys() - posts.keys())
+        for post_id in removed_posts:
+            channel.publish("post.removed", {"post": {"id": post_id}})
+        channel.posts, channel.runs = posts, runs
+        if batch_changed or changed_posts or changed_runs or removed_posts:
+            changed = channel.publish(
+                "progress.changed",
+                {
+                    "batch": batch_progress,
+                    "post_ids": changed_posts,
+                    "run_ids": changed_runs,
+                    "removed_post_ids": removed_posts,
+                },
+            )
+            channel.changed_event_id = int(changed["event_id"])
+
+    def reset(self) -> None:
+        """Drop every channel and cancel its publisher."""
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+        for channel in channels:
+            if channel.publisher is not None and not channel.publisher.done():
+                try:
+                    channel.loop.call_soon_threadsafe(channel.publisher.cancel)
+                except RuntimeError:
+                    pass
+
+
+_hub = BatchProgressHub()
+
+
+def get_batch_progress_hub() -> BatchProgressHub:
+    return _hub
+
+
+def notify_batch_progress(batch_id: str) -> None:
+    """Tell the hub a batch has new progress (no-op when nobody is watching it)."""
+    _hub.notify(batch_id)
@@ -68,6 +68,8 @@ BATCH_LIST_SCHEMA_LAG_FIELDS = (
     "target_length_tier,video_pipeline_route,created_at,updated_at,archived"
 )
 POSTS_SUMMARY_FIELDS = "id,post_type"
+PROGRESS_POST_FIELDS = "id,state,video_status,publish_status"
+PROGRESS_RUN_FIELDS = "id,post_id,stage"
 VIDEO_SUBMISSION_STARTED_STATUSES = {
     "submitted",
     "processing",
@@ -803,3 +805,36 @@ def get_batch_posts_summary(batch_id: str) -> Dict[str, Any]:
         "posts_count": posts_count,
         "posts_by_state": posts_by_type
     }
+
+
+def get_batch_progress_snapshot(batch_id: str) -> Dict[str, Any]:
+    """Read the status columns every pipeline stage writes for one batch.
+
+    Three narrow reads (batch state, post video/caption/publish status, semantic
+    run stage) shared by all progress-stream subscribers of the batch.
+    """
+    supabase = get_supabase()
+    batch_response = _execute_with_retry(
+        "get_batch_progress_snapshot.batch",
+        lambda: supabase.client.table("batches").select("id,state").eq("id", batch_id).execute(),
+    )
+    posts_response = _execute_with_retry(
+        "get_batch_progress_snapshot.posts",
+        lambda: supabase.client.table("posts").select(PROGRESS_POST_FIELDS).eq("batch_id", batch_id).execute(),
+    )
+    runs_response = _execute_with_retry(
+        "get_batch_progress_snapshot.runs",
+        lambda: (
+            supabase.client.table("semantic_video_runs")
+            .select(PROGRESS_RUN_FIELDS)
+            .eq("batch_id", batch_id)
+            .order("created_at")
+            .execute()
+        ),
+    )
+    batch_rows = batch_response.data or []
+    return {
+        "batch": batch_rows[0] if batch_rows else {},
+        "posts": posts_response.data or [],
+        "runs": runs_response.data or [],
+    }
@@ -7,17 +7,19 @@ Per Constitution § V: Locality & Vertical Slices
 
 from __future__ import annotations
 
+import asyncio
+import os
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from PIL import Image, ImageOps, UnidentifiedImageError
 from pydantic import ValidationError as PydanticValidationError
 
 from app.adapters.llm_client import get_llm_client
 from app.adapters.storage_client import get_storage_client
-from app.adapters.supabase_client import get_supabase
+from app.adapters.supabase_client import get_supabase, run_db
 from app.core.errors import ErrorCode, ThirdPartyError  # noqa: F401
 from app.core.config import get_settings
 from app.core.image_generation_prompt import write_raw_camera_image_prompt
@@ -40,6 +42,9 @@ logger = get_logger(__name__)
 _PROMPT_PATH = Path(__file__).resolve().parent.parent / "topics" / "prompt_data" / "blog_post.txt"
 BLOG_IMAGE_WIDTH = 1150
 BLOG_IMAGE_HEIGHT = 850
+# Due blog posts published to Webflow at once; the Webflow client paces requests
+# by the rate-limit headers on top of this. 1 restores the old one-by-one dispatch.
+BLOG_PUBLISH_MAX_CONCURRENCY = max(int(os.getenv("BLOG_PUBLISH_MAX_CONCURRENCY", "3")), 1)
 
 
 def _convert_generated_image_to_webp(image_bytes: bytes, *, correlation_id: str) -> bytes:
@@ -385,8 +390,7 @@ def _lookup_dossier(post: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return dossiers[0]
 
 
-def generate_blog_draft(post_id: str) -> Dict[str, Any]:
-    """Generate a blog draft for a post from its research dossier."""
+def _claim_blog_draft(post_id: str) -> Dict[str, Any]:
     post = _load_post_for_blog(post_id)
     seed_data = post.get("seed_data") or {}
 
@@ -397,83 +401,181 @@ def generate_blog_draft(post_id: str) -> Dict[str, Any]:
         raise ValueError(f"Script not approved for post {post_id}")
 
     update_blog_status(post_id, status="generating")
+    return post
+
+
+def _fail_blog_draft(post_id: str, post: Dict[str, Any], error: str) -> Dict[str, Any]:
+    error_content = _build_error_content(post, error)
+    update_blog_status(post_id, status="failed", blog_content=error_content)
+    return error_content
+
+
+def _store_blog_draft(post_id: str, post: Dict[str, Any], blog_content: Dict[str, Any]) -> Dict[str, Any]:
+    next_status = "scheduled" if post.get("blog_scheduled_at") else "draft"
+    update_blog_status(post_id, status=next_status, blog_content=blog_content)
+    return blog_content
+
+
+def _write_blog_draft(post_id: str, post: Dict[str, Any], dossier: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the LLM draft loop against a dossier; raises ValueError when no valid draft results."""
+    dossier_payload = dossier.get("normalized_payload") or {}
+    dossier_id = dossier.get("id", "")
+
+    llm = get_llm_client()
+    dossier_sources = dossier_payload.get("sources") or []
+    prompt = _build_blog_prompt(dossier_payload)
+    sources = [
+        {"title": s.get("title", ""), "url": str(s.get("url", ""))}
+        for s in dossier_sources
+        if s.get("title") and s.get("url")
+    ]
+
+    current_prompt = prompt
+    for attempt in range(1, 4):
+        raw_text = llm.generate_gemini_text(
+            prompt=current_prompt,
+            temperature=0.7 if attempt == 1 else 0.35,
+            max_tokens=8192,
+        )
+        parsed = _parse_labeled_blog_text(raw_text, dossier_payload)
+        parsed["image_prompt"] = parsed.get("image_prompt") or _build_blog_image_prompt(parsed, dossier_payload)
+
+        contract_issues = _collect_blog_contract_issues(parsed)
+        if contract_issues:
+            logger.warning(
+                "blog_generation_contract_retry",
+                post_id=post_id,
+                attempt=attempt,
+                issues=contract_issues,
+            )
+            if attempt < 3:
+                current_prompt = _build_blog_retry_prompt(prompt, contract_issues, attempt + 1)
+                continue
+            raise ValueError("; ".join(contract_issues))
+
+        try:
+            return build_blog_content_from_llm(
+                parsed,
+                dossier_id=dossier_id,
+                sources=sources,
+                scheduled_at=_isoformat_optional(post.get("blog_scheduled_at")),
+            )
+        except PydanticValidationError as exc:
+            validation_issues = _format_blog_validation_issues(exc)
+            logger.warning(
+                "blog_generation_validation_retry",
+                post_id=post_id,
+                attempt=attempt,
+                issues=validation_issues,
+            )
+            if attempt < 3:
+                current_prompt = _build_blog_retry_prompt(prompt, validation_issues, attempt + 1)
+                continue
+            raise ValueError("; ".join(validation_issues)) from exc
+
+    raise ValueError("Blog draft could not be generated with the required structure.")
+
+
+def generate_blog_draft(post_id: str) -> Dict[str, Any]:
+    """Generate a blog draft for a post from its research dossier."""
+    post = _claim_blog_draft(post_id)
 
     try:
         dossier = _lookup_dossier(post)
         if not dossier:
-            error_content = _build_error_content(post, "No research dossier found for this topic.")
-            update_blog_status(post_id, status="failed", blog_content=error_content)
-            return error_content
+            return _fail_blog_draft(post_id, post, "No research dossier found for this topic.")
+        return _store_blog_draft(post_id, post, _write_blog_draft(post_id, post, dossier))
 
-        dossier_payload = dossier.get("normalized_payload") or {}
-        dossier_id = dossier.get("id", "")
-
-        llm = get_llm_client()
-        dossier_sources = dossier_payload.get("sources") or []
-        prompt = _build_blog_prompt(dossier_payload)
-        sources = [
-            {"title": s.get("title", ""), "url": str(s.get("url", ""))}
-            for s in dossier_sources
-            if s.get("title") and s.get("url")
-        ]
+    except Exception as exc:
+        logger.error("blog_generation_failed", post_id=post_id, error=str(exc))
+        return _fail_blog_draft(post_id, post, str(exc))
 
-        blog_content: Optional[Dict[str, Any]] = None
-        current_prompt = prompt
-        for attempt in range(1, 4):
-            raw_text = llm.generate_gemini_text(
-                prompt=current_prompt,
-                temperature=0.7 if attempt == 1 else 0.35,
-                max_tokens=8192,
-            )
-            parsed = _parse_labeled_blog_text(raw_text, dossier_payload)
-            parsed["image_prompt"] = parsed.get("image_prompt") or _build_blog_image_prompt(parsed, dossier_payload)
-
-            contract_issues = _collect_blog_contract_issues(parsed)
-            if contract_issues:
-                logger.warning(
-                    "blog_generation_contract_retry",
-                    post_id=post_id,
-                    attempt=attempt,
-                    issues=contract_issues,
-                )
-                if attempt < 3:
-                    current_prompt = _build_blog_retry_prompt(prompt, contract_issues, attempt + 1)
-                    continue
-                raise ValueError("; ".join(contract_issues))
 
-            try:
-                blog_content = build_blog_content_from_llm(
-                    parsed,
-                    dossier_id=dossier_id,
-                    sources=sources,
-                    scheduled_at=_isoformat_optional(post.get("blog_scheduled_at")),
-                )
-                break
-            except PydanticValidationError as exc:
-                validation_issues = _format_blog_validation_issues(exc)
-                logger.warning(
-                    "blog_generation_validation_retry",
-                    post_id=post_id,
-                    attempt=attempt,
-                    issues=validation_issues,
-                )
-                if attempt < 3:
-                    current_prompt = _build_blog_retry_prompt(prompt, validation_issues, attempt + 1)
-                    continue
-                raise ValueError("; ".join(validation_issues)) from exc
+def _render_blog_image(image_prompt: str, *, correlation_id: str) -> Tuple[bytes, Optional[str]]:
+    """Generate the hero image for a brief and return it as Webflow-sized WebP bytes plus the model."""
+    llm = get_llm_client()
+    renderer_prompt = write_raw_camera_image_prompt(client=llm, brief=image_prompt)
+    image_result = llm.generate_gemini_image(
+        prompt=renderer_prompt,
+        model=None,
+        temperature=0.8,
+        max_tokens=2048,
+    )
+    webp_bytes = _convert_generated_image_to_webp(image_result["image_bytes"], correlation_id=correlation_id)
+    return webp_bytes, image_result.get("model")
+
+
+def _attach_blog_image(
+    post_id: str,
+    blog_content: Dict[str, Any],
+    *,
+    image_prompt: str,
+    webp_bytes: bytes,
+    image_model: Optional[str],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Upload a rendered image to R2; returns the upload result and the updated blog content."""
+    storage = get_storage_client()
+    uploaded = storage.upload_image(
+        image_bytes=webp_bytes,
+        file_name=f"{blog_content.get('slug') or post_id}.webp",
+        correlation_id=post_id,
+        content_type="image/webp",
+    )
+    updated_content = merge_blog_content_updates(
+        blog_content,
+        updates={
+            "image_prompt": image_prompt,
+            "preview_image_url": uploaded["url"],
+            "image_model": image_model,
+            "image_generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        },
+    )
+    return uploaded, updated_content
 
-        if blog_content is None:
-            raise ValueError("Blog draft could not be generated with the required structure.")
 
-        next_status = "scheduled" if post.get("blog_scheduled_at") else "draft"
-        update_blog_status(post_id, status=next_status, blog_content=blog_content)
-        return blog_content
+async def generate_blog_draft_with_image(post_id: str) -> Dict[str, Any]:
+    """Generate a post's draft and hero image concurrently from its research dossier.
+
+    The image brief is built from the dossier instead of the finished draft, so the
+    text and image model calls overlap; WebP encoding runs off the event loop with
+    the image call. When only the image fails the draft is kept with its own image
+    prompt, and the image can be generated again on its own.
+    """
+    post = await run_db(_claim_blog_draft, post_id)
+
+    try:
+        dossier = await run_db(_lookup_dossier, post)
+        if not dossier:
+            return await run_db(_fail_blog_draft, post_id, post, "No research dossier found for this topic.")
+
+        dossier_payload = dossier.get("normalized_payload") or {}
+        image_prompt = _build_blog_image_prompt({"name": post.get("topic_title")}, dossier_payload)
+        draft_result, image_result = await asyncio.gather(
+            asyncio.to_thread(_write_blog_draft, post_id, post, dossier),
+            asyncio.to_thread(_render_blog_image, image_prompt, correlation_id=post_id),
+            return_exceptions=True,
+        )
+        if isinstance(draft_result, BaseException):
+            raise draft_result
+
+        blog_content = draft_result
+        if isinstance(image_result, BaseException):
+            logger.warning("blog_image_generation_failed", post_id=post_id, error=str(image_result))
+        else:
+            webp_bytes, image_model = image_result
+            _, blog_content = await asyncio.to_thread(
+                _attach_blog_image,
+                post_id,
+                blog_content,
+                image_prompt=image_prompt,
+                webp_bytes=webp_bytes,
+                image_model=image_model,
+            )
+        return await run_db(_store_blog_draft, post_id, post, blog_content)
 
     except Exception as exc:
         logger.error("blog_generation_failed", post_id=post_id, error=str(exc))
-        error_content = _build_error_content(post, str(exc))
-        update_blog_status(post_id, status="failed", blog_content=error_content)
-        return error_content
+        return await run_db(_fail_blog_draft, post_id, post, str(exc))
 
 
 def generate_blog_image(post_id: str, *, image_prompt: Optional[str] = None) -> Dict[str, Any]:
@@ -495,30 +597,13 @@ def generate_blog_image(post_id: str, *, image_prompt: Optional[str] = None) ->
     if not effective_prompt:
         effective_prompt = _build_blog_image_prompt(blog_content, dossier_payload)
 
-    llm = get_llm_client()
-    renderer_prompt = write_raw_camera_image_prompt(client=llm, brief=effective_prompt)
-    image_result = llm.generate_gemini_image(
-        prompt=renderer_prompt,
-        model=None,
-        temperature=0.8,
-        max_tokens=2048,
-    )
-    webp_bytes = _convert_generated_image_to_webp(image_result["image_bytes"], correlation_id=post_id)
-    storage = get_storage_client()
-    uploaded = storage.upload_image(
-        image_bytes=webp_bytes,
-        file_name=f"{blog_content.get('slug') or post_id}.webp",
-        correlation_id=post_id,
-        content_type="image/webp",
-    )
-    updated_content = merge_blog_content_updates(
+    webp_bytes, image_model = _render_blog_image(effective_prompt, correlation_id=post_id)
+    uploaded, updated_content = _attach_blog_image(
+        post_id,
         blog_content,
-        updates={
-            "image_prompt": effective_prompt,
-            "preview_image_url": uploaded["url"],
-            "image_model": image_result.get("model"),
-            "image_generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
-        },
+        image_prompt=effective_prompt,
+        webp_bytes=webp_bytes,
+        image_model=image_model,
     )
     update_blog_status(post_id, status=post.get("blog_status") or "draft", blog_content=updated_content)
     return {
@@ -526,7 +611,7 @@ def generate_blog_image(post_id: str, *, image_prompt: Optional[str] = None) ->
         "image_prompt": effective_prompt,
         "preview_image_url": uploaded["url"],
         "storage_key": uploaded.get("storage_key"),
-        "image_model": image_result.get("model"),
+        "image_model": image_model,
     }
 
 
@@ -638,37 +723,44 @@ def delete_blog_post(post_id: str, *, delete_webflow_item: bool = True) -> Dict[
     }
 
 
+def _claim_due_blog_post(post_id: str) -> bool:
+    claim = get_supabase().client.table("posts").update({"blog_status": "publishing"}).eq(
+        "id", post_id
+    ).eq("blog_status", "scheduled").execute()
+    return bool(claim.data)
+
+
 async def dispatch_due_blog_posts(limit: int = 10, *, trigger: str = "scheduler") -> Dict[str, Any]:
-    """Publish due scheduled blog posts to Webflow."""
-    due_posts = get_due_scheduled_blog_posts(limit=limit)
-    supabase = get_supabase().client
-    processed = 0
-    published = 0
-    failed = 0
-
-    for row in due_posts:
+    """Publish due scheduled blog posts to Webflow, up to BLOG_PUBLISH_MAX_CONCURRENCY at a time."""
+    due_posts = await run_db(get_due_scheduled_blog_posts, limit=limit)
+    slots = asyncio.Semaphore(BLOG_PUBLISH_MAX_CONCURRENCY)
+
+    async def publish_due(row: Dict[str, Any]) -> Optional[bool]:
         post_id = str(row.get("id") or "")
         if not post_id:
-            continue
+            return None
+        async with slots:
+            try:
+                if not await run_db(_claim_due_blog_post, post_id):
+                    return None
+                await asyncio.to_thread(
+                    publish_blog_post,
+                    post_id,
+                    publication_date=_isoformat_optional(row.get("blog_scheduled_at")),
+                )
+                logger.info("blog_due_post_published", trigger=trigger, post_id=post_id)
+                return True
+            except Exception as exc:
+                logger.error("blog_due_post_publish_failed", trigger=trigger, post_id=post_id, error=str(exc))
+                await run_db(update_blog_status, post_id, status="failed")
+                return False
 
-        try:
-            claim = supabase.table("posts").update({"blog_status": "publishing"}).eq(
-                "id", post_id
-            ).eq("blog_status", "scheduled").execute()
-            if not claim.data:
-                continue
-            publish_blog_post(post_id, publication_date=_isoformat_optional(row.get("blog_scheduled_at")))
-            processed += 1
-            published += 1
-            logger.info("blog_due_post_published", trigger=trigger, post_id=post_id)
-        except Exception as exc:
-            processed += 1
-            failed += 1
-            logger.error("blog_due_post_publish_failed", trigger=trigger, post_id=post_id, error=str(exc))
-            update_blog_status(post_id, status="failed")
+    outcomes = await asyncio.gather(*(publish_due(row) for row in due_posts))
+    published = sum(1 for outcome in outcomes if outcome is True)
+    failed = sum(1 for outcome in outcomes if outcome is False)
 
     return {
-        "processed": processed,
+        "processed": published + failed,
         "published": published,
         "failed": failed,
         "trigger": trigger,
@@ -106,27 +106,16 @@ async def toggle_blog(post_id: str, request: Request):
 
 @router.post("/posts/{post_id}/blog/generate", response_model=SuccessResponse)
 async def generate_blog_draft(post_id: str):
-    """Generate a blog draft from the research dossier."""
+    """Generate a blog draft and its preview image from the research dossier."""
     try:
-        from app.features.blog.blog_runtime import (
-            generate_blog_draft as run_generate,
-            generate_blog_image as run_generate_image,
-        )
+        from app.features.blog.blog_runtime import generate_blog_draft_with_image
 
-        result = run_generate(post_id)
+        result = await generate_blog_draft_with_image(post_id)
         if result.get("error"):
             return SuccessResponse(
                 ok=False,
                 data=result,
             )
-        if result.get("image_prompt") and not result.get("preview_image_url"):
-            image_result = run_generate_image(post_id, image_prompt=result.get("image_prompt"))
-            result = {
-                **result,
-                "image_prompt": image_result.get("image_prompt") or result.get("image_prompt"),
-                "preview_image_url": image_result.get("preview_image_url"),
-                "image_model": image_result.get("image_model"),
-            }
         return SuccessResponse(
             data=result,
         )
@@ -154,7 +143,7 @@ async def generate_blog_image(post_id: str, request: Request):
             form = await request.form()
             image_prompt = form.get("image_prompt")
 
-        result = run_generate_image(post_id, image_prompt=image_prompt)
+        result = await asyncio.to_thread(run_generate_image, post_id, image_prompt=image_prompt)
         return SuccessResponse(data=result)
     except FlowForgeException:
         raise
@@ -170,7 +159,7 @@ async def generate_all_blog_drafts(batch_id: str):
     """Generate blog drafts for all blog-enabled posts in a batch."""
     try:
         from app.features.blog.blog_runtime import (
-            generate_blog_draft as run_generate,
+            generate_blog_draft_with_image,
             generate_blog_image as run_generate_image,
         )
 
@@ -189,14 +178,22 @@ async def generate_all_blog_drafts(batch_id: str):
             if post.get("blog_status") == "scheduled" and blog_content.get("preview_image_url"):
                 continue
 
-            result = blog_content if blog_has_draft_content(blog_content) else run_generate(post["id"])
             item_status = "draft"
             image_generated = False
+            if blog_has_draft_content(blog_content):
+                result = blog_content
+            else:
+                result = await generate_blog_draft_with_image(post["id"])
+                image_generated = bool(result.get("preview_image_url"))
 
             if result.get("error"):
                 item_status = "failed"
             elif result.get("image_prompt") and not result.get("preview_image_url"):
-                image_result = run_generate_image(post["id"], image_prompt=result.get("image_prompt"))
+                image_result = await asyncio.to_thread(
+                    run_generate_image,
+                    post["id"],
+                    image_prompt=result.get("image_prompt"),
+                )
                 result = {
                     **result,
                     "image_prompt": image_result.get("image_prompt") or result.get("image_prompt"),
@@ -301,7 +298,7 @@ async def publish_blog_to_webflow(post_id: str):
     try:
         from app.features.blog.blog_runtime import publish_blog_post
 
-        result = publish_blog_post(post_id)
+        result = await asyncio.to_thread(publish_blog_post, post_id)
         return SuccessResponse(
             data=BlogPublishResponse(
                 post_id=post_id,
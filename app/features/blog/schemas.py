@@ -536,6 +536,8 @@ def merge_blog_content_updates(current_content: Any, *, updates: Dict[str, Any])
             "tipp",
             "preview_text",
             "image_prompt",
+            "image_model",
+            "image_generated_at",
             "preview_image_url",
             "author_name",
             "meta_title",
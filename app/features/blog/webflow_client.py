@@ -6,6 +6,8 @@ Per Constitution § VI: Adapterize Specialists
 
 from __future__ import annotations
 
+import math
+import os
 import re
 import unicodedata
 from html import escape
@@ -16,10 +18,18 @@ import httpx
 
 from app.core.errors import ThirdPartyError, ValidationError
 from app.core.logging import get_logger
+from app.core.rate_limit import RateLimitCooldown
 
 logger = get_logger(__name__)
 
 WEBFLOW_API_BASE = "https://api.webflow.com/v2"
+# Webflow counts requests per token per minute and reports the remainder in
+# X-RateLimit-Remaining. Once it drops to the reserve, requests are spaced out over
+# the rest of the window; a 429 pauses every client until Retry-After has passed.
+WEBFLOW_RATE_LIMIT_RESERVE = max(int(os.getenv("WEBFLOW_RATE_LIMIT_RESERVE", "2")), 0)
+WEBFLOW_RATE_LIMIT_MAX_RETRIES = max(int(os.getenv("WEBFLOW_RATE_LIMIT_MAX_RETRIES", "3")), 0)
+_WEBFLOW_RATE_LIMIT_WINDOW_SECONDS = 60.0
+_WEBFLOW_RETRY_AFTER_MAX_SECONDS = 60.0
 
 _FIELD_CANDIDATES = {
     "merksatz": ("merksatz",),
@@ -38,6 +48,18 @@ _FIELD_CANDIDATES = {
 }
 
 
+def _header_number(headers: Any, name: str) -> Optional[float]:
+    try:
+        value = float(str(headers.get(name)).strip())
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) and value >= 0 else None
+
+
+# Shared by every Webflow client in the process, since they spend one token's budget.
+_RATE_GATE = RateLimitCooldown()
+
+
 class WebflowClient:
     """Webflow CMS API client for creating/updating blog post items."""
 
@@ -61,7 +83,17 @@ class WebflowClient:
         self._collection_cache: Optional[Dict[str, Any]] = None
 
     def _request(self, method: str, path: str, *, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        response = self.http_client.request(method, path, json=json)
+        for attempt in range(WEBFLOW_RATE_LIMIT_MAX_RETRIES + 1):
+            _RATE_GATE.wait()
+            response = self.http_client.request(method, path, json=json)
+            if response.status_code == 429 and attempt < WEBFLOW_RATE_LIMIT_MAX_RETRIES:
+                retry_after = _header_number(response.headers, "Retry-After")
+                delay = min(retry_after if retry_after is not None else 2.0 ** attempt, _WEBFLOW_RETRY_AFTER_MAX_SECONDS)
+                logger.warning("webflow_rate_limited", method=method, path=path, attempt=attempt + 1, delay_seconds=delay)
+                _RATE_GATE.trip(delay)
+                continue
+            self._pace(response)
+            break
         if response.status_code >= 400:
             logger.error(
                 "webflow_request_error",
@@ -78,6 +110,14 @@ class WebflowClient:
             return {}
         return response.json()
 
+    @staticmethod
+    def _pace(response: httpx.Response) -> None:
+        remaining = _header_number(response.headers, "X-RateLimit-Remaining")
+        if remaining is None or remaining > WEBFLOW_RATE_LIMIT_RESERVE:
+            return
+        limit = _header_number(response.headers, "X-RateLimit-Limit") or _WEBFLOW_RATE_LIMIT_WINDOW_SECONDS
+        _RATE_GATE.trip(_WEBFLOW_RATE_LIMIT_WINDOW_SECONDS / max(limit, 1.0))
+
     def get_collection_details(self) -> Dict[str, Any]:
         """Fetch the configured collection schema once per client instance."""
         if self._collection_cache is None:
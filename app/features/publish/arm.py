@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, Request
 from zoneinfo import ZoneInfo
 
-from app.adapters.supabase_client import get_supabase
+from app.adapters.supabase_client import get_supabase, run_db
 from app.core.errors import ValidationError
 from app.core.logging import get_logger
 from app.features.publish.schemas import BatchArmRequest, TikTokPostSettings
@@ -57,6 +57,10 @@ async def arm_batch_dispatch(
     db: Any = None,
 ) -> Dict[str, Any]:
     """Validate and arm all posts in a batch for scheduled dispatch."""
+    return await run_db(_arm_batch_dispatch, batch_id, request, db)
+
+
+def _arm_batch_dispatch(batch_id: str, request: BatchArmRequest, db: Any) -> Dict[str, Any]:
     if db is None:
         db = get_supabase().client
 
@@ -13,10 +13,9 @@ import hashlib
 import hmac
 import json
 import os
-import subprocess
-import tempfile
+import time
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 from zoneinfo import ZoneInfo
@@ -26,8 +25,7 @@ import structlog
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import RedirectResponse
 
-from app.adapters.supabase_client import get_supabase
-from app.adapters.storage_client import get_storage_client
+from app.adapters.supabase_client import get_supabase, run_db
 from app.core.config import get_settings
 from app.core.errors import (
     ErrorCode,
@@ -39,6 +37,7 @@ from app.core.errors import (
     ValidationError,
 )
 from app.core.states import BatchState
+from app.core.video_profiles import VIDEO_STATUS_CAPTION_PENDING, VIDEO_STATUS_CAPTION_PROCESSING
 from app.features.publish.schemas import (
     BatchPublishPlanRequest,
     BatchPublishPlanResponse,
@@ -57,6 +56,12 @@ from app.features.publish.schemas import (
     TikTokPostSettings,
     UpdatePostScheduleRequest,
 )
+from app.features.publish.variants import (
+    INSTAGRAM_REELS_PROFILE,
+    INSTAGRAM_VARIANT_FAILURE_KEYS,
+    build_video_variant,
+    instagram_variant_metadata,
+)
 from app.features.topics.captions import resolve_display_caption
 try:
     from app.features.publish.tiktok import (
@@ -103,6 +108,22 @@ META_OAUTH_URL = "https://www.facebook.com/v25.0/dialog/oauth"
 META_TIMEOUT_SECONDS = 30.0
 INSTAGRAM_POLL_ATTEMPTS = 45
 INSTAGRAM_POLL_SECONDS = 2
+# Due posts dispatched at once per cycle; 1 restores the old one-by-one dispatch.
+PUBLISH_DISPATCH_MAX_CONCURRENCY = max(int(os.getenv("PUBLISH_DISPATCH_MAX_CONCURRENCY", "4")), 1)
+# Uploads in flight per network across those posts, to stay inside each platform's rate limits.
+PUBLISH_NETWORK_MAX_CONCURRENCY = {
+    "facebook": max(int(os.getenv("PUBLISH_FACEBOOK_MAX_CONCURRENCY", "2")), 1),
+    "instagram": max(int(os.getenv("PUBLISH_INSTAGRAM_MAX_CONCURRENCY", "2")), 1),
+    "tiktok": max(int(os.getenv("PUBLISH_TIKTOK_MAX_CONCURRENCY", "1")), 1),
+}
+# Planned Instagram posts due within this window get their variant made before dispatch.
+PUBLISH_VARIANT_LOOKAHEAD_HOURS = float(os.getenv("PUBLISH_VARIANT_LOOKAHEAD_HOURS", "72"))
+# Variants prepared per cycle; each one can be a full transcode.
+PUBLISH_VARIANT_MAX_PER_CYCLE = max(int(os.getenv("PUBLISH_VARIANT_MAX_PER_CYCLE", "3")), 1)
+# A failed variant is retried after this delay, doubling per attempt; past the attempt cap it is
+# left to dispatch, which builds it on demand and reports the error on the post.
+PUBLISH_VARIANT_RETRY_BASE_MINUTES = float(os.getenv("PUBLISH_VARIANT_RETRY_BASE_MINUTES", "15"))
+PUBLISH_VARIANT_MAX_ATTEMPTS = max(int(os.getenv("PUBLISH_VARIANT_MAX_ATTEMPTS", "4")), 1)
 META_LOGIN_SCOPES = [
     "pages_show_list",
     "pages_read_engagement",
@@ -560,6 +581,14 @@ def _resolve_meta_connect_batch_id(batch_id: Optional[str]) -> str:
     return str(viable_rows[0]["id"])
 
 
+def _load_meta_connection(batch_id: Optional[str]) -> Dict[str, Any]:
+    """Resolve the Meta connection shown for a batch, or the workspace one without a batch."""
+    if not batch_id:
+        return _get_workspace_meta_connection()
+    batch = _load_batch(batch_id)
+    return _effective_meta_connection(batch_id, batch.get("meta_connection"))
+
+
 def _set_workspace_meta_connection(meta_connection: Dict[str, Any], *, source_batch_id: Optional[str] = None) -> None:
     """Propagate one Meta connection across all existing batches."""
     rows = _list_batch_rows("id")
@@ -634,59 +663,53 @@ def _resolve_instagram_video_url(post: Dict[str, Any]) -> str:
     return str(video_url)
 
 
+def _read_post_video_metadata(post_id: str) -> Dict[str, Any]:
+    response = get_supabase().client.table("posts").select("video_metadata").eq("id", post_id).limit(1).execute()
+    rows = response.data or []
+    return _load_json_object(rows[0].get("video_metadata")) if rows else {}
+
+
+def _update_post_video_metadata(
+    post_id: str,
+    updates: Dict[str, Any],
+    *,
+    drop_keys: tuple[str, ...] = (),
+) -> Dict[str, Any]:
+    """Merge ``updates`` into the post's current video_metadata.
+
+    Re-reads the row first so keys other workers wrote while a transcode ran are kept.
+    """
+    metadata = _read_post_video_metadata(post_id)
+    for key in drop_keys:
+        metadata.pop(key, None)
+    metadata.update(updates)
+    get_supabase().client.table("posts").update({"video_metadata": metadata}).eq("id", post_id).execute()
+    return metadata
+
+
 def _create_instagram_safe_video(post: Dict[str, Any], source_url: str) -> str:
-    """Transcode and persist an Instagram Graph compatible video variant."""
+    """Build (or reuse) the Instagram Graph compatible variant of a post's video and persist it."""
     post_id = str(post.get("id") or "post")
-    with tempfile.TemporaryDirectory(prefix="instagram_video_") as tmpdir:
-        input_path = os.path.join(tmpdir, "input.mp4")
-        output_path = os.path.join(tmpdir, "instagram.mp4")
-        with httpx.stream("GET", source_url, follow_redirects=True, timeout=120.0) as response:
-            if response.is_error:
-                raise ThirdPartyError(
-                    "Unable to download source video for Instagram publishing.",
-                    details={"status_code": response.status_code, "source_url": source_url},
-                )
-            with open(input_path, "wb") as handle:
-                for chunk in response.iter_bytes():
-                    handle.write(chunk)
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", input_path,
-            "-vf", "scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920,fps=30,format=yuv420p",
-            "-c:v", "libx264",
-            "-profile:v", "high",
-            "-level:v", "4.0",
-            "-preset", "medium",
-            "-crf", "22",
-            "-x264-params", "keyint=60:min-keyint=60:scenecut=0",
-            "-c:a", "aac",
-            "-b:a", "128k",
-            "-ar", "48000",
-            "-ac", "2",
-            "-movflags", "+faststart",
-            output_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=240)
-        if result.returncode != 0:
-            raise ThirdPartyError(
-                "Instagram video transcode failed.",
-                details={"post_id": post_id, "stderr": result.stderr[-500:]},
-            )
-
-        with open(output_path, "rb") as handle:
-            uploaded = get_storage_client().upload_video(
-                video_bytes=handle.read(),
-                file_name=f"instagram_{post_id}.mp4",
-                correlation_id=f"instagram_transcode_{post_id}",
-                content_type="video/mp4",
-            )
-    instagram_url = str(uploaded["url"])
     metadata = _load_json_object(post.get("video_metadata"))
-    metadata["instagram_video_url"] = instagram_url
-    metadata["instagram_video_storage_key"] = uploaded.get("storage_key")
-    get_supabase().client.table("posts").update({"video_metadata": metadata}).eq("id", post_id).execute()
-    logger.info("instagram_safe_video_created", post_id=post_id, instagram_video_url=instagram_url)
+    known_sha256 = metadata.get("caption_video_sha256") if source_url == metadata.get("caption_video_url") else None
+    variant = build_video_variant(
+        source_url=source_url,
+        profile=INSTAGRAM_REELS_PROFILE,
+        correlation_id=f"instagram_transcode_{post_id}",
+        source_sha256=known_sha256,
+    )
+    instagram_url = str(variant["url"])
+    _update_post_video_metadata(
+        post_id,
+        instagram_variant_metadata(variant),
+        drop_keys=INSTAGRAM_VARIANT_FAILURE_KEYS,
+    )
+    logger.info(
+        "instagram_safe_video_created",
+        post_id=post_id,
+        instagram_video_url=instagram_url,
+        reused=variant.get("reused"),
+    )
     return instagram_url
 
 
@@ -790,7 +813,7 @@ def update_post_schedule(
 @router.get("/meta/connect")
 async def connect_meta_account(batch_id: Optional[str] = None, post_id: Optional[str] = None):
     """Start Instagram Login and remember batch/post return context."""
-    batch_id = _resolve_meta_connect_batch_id(batch_id)
+    batch_id = await run_db(_resolve_meta_connect_batch_id, batch_id)
     settings = _require_meta_settings()
     state = _build_meta_state(batch_id, settings.meta_app_secret, post_id=post_id)
     query = urlencode(
@@ -808,11 +831,7 @@ async def connect_meta_account(batch_id: Optional[str] = None, post_id: Optional
 @router.get("/meta/status", response_model=SuccessResponse)
 async def get_meta_status(batch_id: Optional[str] = None):
     """Return the current workspace Meta connection state for shared UI surfaces."""
-    if batch_id:
-        batch = _load_batch(batch_id)
-        meta_connection = _effective_meta_connection(batch_id, batch.get("meta_connection"))
-    else:
-        meta_connection = _get_workspace_meta_connection()
+    meta_connection = await run_db(_load_meta_connection, batch_id)
 
     sanitized = _sanitize_meta_connection(meta_connection)
     return SuccessResponse(
@@ -827,11 +846,7 @@ async def get_meta_status(batch_id: Optional[str] = None):
 @router.get("/accounts/status", response_model=SuccessResponse)
 async def get_accounts_status(batch_id: Optional[str] = None):
     """Return the shared account hub status for all publish providers."""
-    if batch_id:
-        batch = _load_batch(batch_id)
-        meta_connection = _effective_meta_connection(batch_id, batch.get("meta_connection"))
-    else:
-        meta_connection = _get_workspace_meta_connection()
+    meta_connection = await run_db(_load_meta_connection, batch_id)
 
     sanitized_meta = _sanitize_meta_connection(meta_connection)
     tiktok_connection = await get_tiktok_publish_state()
@@ -882,7 +897,8 @@ async def meta_oauth_callback(code: Optional[str] = None, state: Optional[str] =
         redirect_target = f"{redirect_target}#post-{post_id}"
 
     if error:
-        _set_workspace_meta_connection(
+        await run_db(
+            _set_workspace_meta_connection,
             {
                 "status": "error",
                 "error": error,
@@ -920,7 +936,7 @@ async def meta_oauth_callback(code: Optional[str] = None, state: Optional[str] =
                 "expires_in": token_payload.get("expires_in"),
             },
         }
-        _set_workspace_meta_connection(connection, source_batch_id=batch_id)
+        await run_db(_set_workspace_meta_connection, connection, source_batch_id=batch_id)
         logger.info(
             "meta_connection_created",
             batch_id=batch_id,
@@ -928,7 +944,8 @@ async def meta_oauth_callback(code: Optional[str] = None, state: Optional[str] =
             available_pages=len(available_pages),
         )
     except FlowForgeException as exc:
-        _set_workspace_meta_connection(
+        await run_db(
+            _set_workspace_meta_connection,
             {
                 "status": "error",
                 "error": exc.message,
@@ -951,8 +968,7 @@ async def select_meta_target(batch_id: str, request: Request):
         form = await request.form()
         payload = MetaTargetSelectionRequest(page_id=str(form.get("page_id", "")).strip())
 
-    batch = _load_batch(batch_id)
-    meta_connection = _effective_meta_connection(batch_id, batch.get("meta_connection"))
+    meta_connection = await run_db(_load_meta_connection, batch_id)
     available_pages = meta_connection.get("available_pages") or []
 
     selected_page = None
@@ -971,7 +987,7 @@ async def select_meta_target(batch_id: str, request: Request):
     meta_connection["selected_page"] = selected_page
     meta_connection["selected_instagram"] = instagram_account
     meta_connection["updated_at"] = datetime.utcnow().isoformat()
-    _set_workspace_meta_connection(meta_connection, source_batch_id=batch_id)
+    await run_db(_set_workspace_meta_connection, meta_connection, source_batch_id=batch_id)
 
     logger.info(
         "meta_targets_selected",
@@ -985,7 +1001,7 @@ async def select_meta_target(batch_id: str, request: Request):
 @router.post("/batches/{batch_id}/meta/disconnect", response_model=SuccessResponse)
 async def disconnect_meta_account(batch_id: str):
     """Clear the stored Meta connection for the whole workspace."""
-    _load_batch(batch_id)
+    await run_db(_load_batch, batch_id)
     connection = {
         "status": "disconnected",
         "updated_at": datetime.utcnow().isoformat(),
@@ -993,7 +1009,7 @@ async def disconnect_meta_account(batch_id: str):
         "selected_page": {},
         "selected_instagram": {},
     }
-    _set_workspace_meta_connection(connection, source_batch_id=batch_id)
+    await run_db(_set_workspace_meta_connection, connection, source_batch_id=batch_id)
     logger.info("meta_connection_cleared", batch_id=batch_id)
     return SuccessResponse(data={"batch_id": batch_id, "meta_connection": connection})
 
@@ -1013,15 +1029,15 @@ async def schedule_post(post_id: str, request: PostScheduleRequest):
     if post_id != request.post_id:
         raise HTTPException(status_code=409, detail="Post id mismatch between route and body")
 
-    post = _load_post(post_id)
+    post = await run_db(_load_post, post_id)
     if not post.get("video_url"):
         raise HTTPException(status_code=422, detail="Generate the video before saving a publish schedule.")
 
-    batch = _load_batch(post["batch_id"])
-    meta_connection = _effective_meta_connection(post["batch_id"], batch.get("meta_connection"))
+    meta_connection = await run_db(_load_meta_connection, post["batch_id"])
     _ensure_meta_targets_for_networks([n.value for n in request.social_networks], meta_connection)
 
-    updated_post = update_post_schedule(
+    updated_post = await run_db(
+        update_post_schedule,
         post_id=post_id,
         scheduled_at=request.scheduled_at,
         social_networks=[n.value for n in request.social_networks],
@@ -1052,16 +1068,16 @@ async def update_schedule(post_id: str, request: UpdatePostScheduleRequest):
     if request.social_networks is not None:
         social_networks = [n.value for n in request.social_networks]
 
-    post = _load_post(post_id, fields="id,batch_id,video_url,social_networks")
+    post = await run_db(_load_post, post_id, fields="id,batch_id,video_url,social_networks")
     networks_to_validate = social_networks or _load_string_list(post.get("social_networks"))
     if networks_to_validate:
         if not post.get("video_url"):
             raise HTTPException(status_code=422, detail="Generate the video before saving a publish schedule.")
-        batch = _load_batch(post["batch_id"])
-        meta_connection = _effective_meta_connection(post["batch_id"], batch.get("meta_connection"))
+        meta_connection = await run_db(_load_meta_connection, post["batch_id"])
         _ensure_meta_targets_for_networks(networks_to_validate, meta_connection)
 
-    updated_post = update_post_schedule(
+    updated_post = await run_db(
+        update_post_schedule,
         post_id=post_id,
         scheduled_at=request.scheduled_at,
         social_networks=social_networks,
@@ -1087,7 +1103,8 @@ def _update_post_tiktok_settings_row(post_id: str, payload: Dict[str, Any]) -> D
 @router.put("/posts/{post_id}/tiktok-settings", response_model=SuccessResponse)
 async def save_post_tiktok_settings(post_id: str, settings: TikTokPostSettings):
     """Persist TikTok required-field settings for one post."""
-    row = _update_post_tiktok_settings_row(
+    row = await run_db(
+        _update_post_tiktok_settings_row,
         post_id,
         {"tiktok_settings": settings.model_dump()},
     )
@@ -1111,7 +1128,8 @@ def _update_batch_tiktok_defaults_row(batch_id: str, payload: Dict[str, Any]) ->
 @router.put("/batches/{batch_id}/tiktok-defaults", response_model=SuccessResponse)
 async def save_batch_tiktok_defaults(batch_id: str, defaults: TikTokBatchDefaults):
     """Persist batch-level TikTok defaults used as starting state for each post."""
-    row = _update_batch_tiktok_defaults_row(
+    row = await run_db(
+        _update_batch_tiktok_defaults_row,
         batch_id,
         {"tiktok_defaults": defaults.model_dump()},
     )
@@ -1121,7 +1139,7 @@ async def save_batch_tiktok_defaults(batch_id: str, defaults: TikTokBatchDefault
 @router.post("/batches/{batch_id}/plan", response_model=SuccessResponse)
 async def set_batch_publish_plan(batch_id: str, request: BatchPublishPlanRequest):
     """Set publish plan for every active post in the batch."""
-    batch = _load_batch(batch_id)
+    batch = await run_db(_load_batch, batch_id)
     if batch.get("state") != BatchState.S7_PUBLISH_PLAN.value:
         raise HTTPException(
             status_code=409,
@@ -1130,7 +1148,8 @@ async def set_batch_publish_plan(batch_id: str, request: BatchPublishPlanRequest
 
     updated_count = 0
     for schedule in request.schedules:
-        update_post_schedule(
+        await run_db(
+            update_post_schedule,
             post_id=schedule.post_id,
             scheduled_at=schedule.scheduled_at,
             social_networks=[n.value for n in schedule.social_networks],
@@ -1152,7 +1171,7 @@ async def set_batch_publish_plan(batch_id: str, request: BatchPublishPlanRequest
 async def get_batch_publish_plan(batch_id: str):
     """Return the current publish planning state for the batch."""
     try:
-        schedules = get_post_schedules(batch_id)
+        schedules = await run_db(get_post_schedules, batch_id)
         scheduled_count = sum(1 for schedule in schedules if schedule.get("scheduled_at"))
         pending_count = len(schedules) - scheduled_count
         return BatchPublishPlanResponse(
@@ -1183,7 +1202,7 @@ async def get_batch_publish_plan(batch_id: str):
 async def suggest_publish_times(batch_id: str, request: SuggestTimesRequest):
     """Suggest peak times with the existing deterministic heuristic."""
     try:
-        schedules = get_post_schedules(batch_id)
+        schedules = await run_db(get_post_schedules, batch_id)
         num_posts = len(schedules)
         peak_hours = [12, 15, 18, 20]
 
@@ -1222,15 +1241,15 @@ async def confirm_publish(
     if batch_id != request.batch_id:
         raise HTTPException(status_code=409, detail="Batch id mismatch between route and body")
 
-    batch = _load_batch(batch_id)
+    batch = await run_db(_load_batch, batch_id)
     if batch.get("state") != BatchState.S7_PUBLISH_PLAN.value:
         raise HTTPException(
             status_code=409,
             detail=f"Batch must be in S7_PUBLISH_PLAN state (current: {batch.get('state')})",
         )
 
-    meta_connection = _effective_meta_connection(batch_id, batch.get("meta_connection"))
-    schedules = get_post_schedules(batch_id)
+    meta_connection = await run_db(_effective_meta_connection, batch_id, batch.get("meta_connection"))
+    schedules = await run_db(get_post_schedules, batch_id)
     if not schedules:
         raise HTTPException(status_code=400, detail="No active posts are available for publish scheduling")
 
@@ -1252,9 +1271,11 @@ async def confirm_publish(
     supabase = get_supabase().client
     results: List[PublishResult] = []
     for schedule in schedules:
-        supabase.table("posts").update(
-            {"publish_status": "scheduled", "publish_results": {}, "platform_ids": {}}
-        ).eq("id", schedule["id"]).execute()
+        await run_db(
+            supabase.table("posts").update(
+                {"publish_status": "scheduled", "publish_results": {}, "platform_ids": {}}
+            ).eq("id", schedule["id"]).execute
+        )
         results.append(PublishResult(post_id=schedule["id"], success=True))
 
     logger.info(
@@ -1342,7 +1363,7 @@ async def _publish_instagram_reel(post: Dict[str, Any], meta_connection: Dict[st
     selected_page, selected_instagram = _get_selected_meta_targets(meta_connection)
     ig_id = selected_instagram.get("id")
     page_token = selected_page.get("access_token")
-    video_url = _ensure_instagram_video_url(post)
+    video_url = await asyncio.to_thread(_ensure_instagram_video_url, post)
     if not ig_id or not page_token:
         raise ValidationError("Instagram target is unavailable for this batch.")
     if not video_url:
@@ -1487,9 +1508,11 @@ async def _resolve_confirm_publish_request(
 
 async def _reconcile_inflight_tiktok_posts(limit: int = 20) -> List[str]:
     supabase = get_supabase().client
-    response = supabase.table("posts").select(
-        "id,batch_id,publish_status,publish_results,seed_data"
-    ).eq("publish_status", "publishing").limit(limit).execute()
+    response = await run_db(
+        supabase.table("posts").select(
+            "id,batch_id,publish_status,publish_results,seed_data"
+        ).eq("publish_status", "publishing").limit(limit).execute
+    )
     touched_batches: List[str] = []
     for row in response.data or []:
         if _is_removed_post(row):
@@ -1544,26 +1567,149 @@ def _reconcile_completed_batches(batch_ids: List[str]) -> None:
             logger.info("batch_meta_publish_completed", batch_id=batch_id, posts=len(active_posts))
 
 
-async def dispatch_due_posts(limit: int = 10, *, trigger: str = "scheduler") -> Dict[str, Any]:
-    """Dispatch due posts and persist per-network outcomes."""
-    inflight_batches = await _reconcile_inflight_tiktok_posts()
-    now = datetime.utcnow().isoformat()
-    supabase = get_supabase().client
-    due_response = supabase.table("posts").select(
-        "id, batch_id, post_type, video_url, video_metadata, seed_data, scheduled_at, publish_caption, social_networks, publish_status, publish_results, platform_ids, tiktok_settings"
-    ).eq("publish_status", "scheduled").lte("scheduled_at", now).order("scheduled_at").limit(limit).execute()
+def _dispatch_lag_seconds(scheduled_at: Any, now: datetime) -> Optional[float]:
+    """Seconds between a post's scheduled time and ``now`` (naive UTC); None when unparseable."""
+    raw = str(scheduled_at or "").strip()
+    if not raw:
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return round(max((now - parsed).total_seconds(), 0.0), 1)
 
-    due_posts = due_response.data or []
-    processed = 0
-    published = 0
-    failed = 0
-    touched_batches: List[str] = list(inflight_batches)
 
-    for due_post in due_posts:
-        if _is_removed_post(due_post):
-            continue
+class _DispatchCycle:
+    """State shared by the posts of one dispatch cycle.
+
+    Meta connections are resolved once per batch and TikTok creator info once per
+    cycle (only if a post targets TikTok), and the semaphores cap how many posts
+    and per-network uploads run at the same time.
+    """
+
+    def __init__(self) -> None:
+        self.post_slots = asyncio.Semaphore(PUBLISH_DISPATCH_MAX_CONCURRENCY)
+        self.network_slots = {
+            network: asyncio.Semaphore(limit) for network, limit in PUBLISH_NETWORK_MAX_CONCURRENCY.items()
+        }
+        self._meta_connections: Dict[str, asyncio.Task] = {}
+        self._tiktok_connection: Optional[asyncio.Task] = None
+
+    async def _resolve_meta_connection(self, batch_id: str) -> Dict[str, Any]:
+        batch = await run_db(_load_batch, batch_id, fields="id,meta_connection,state")
+        return await run_db(_effective_meta_connection, batch_id, batch.get("meta_connection"))
+
+    async def meta_connection(self, batch_id: str) -> Dict[str, Any]:
+        task = self._meta_connections.get(batch_id)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve_meta_connection(batch_id))
+            self._meta_connections[batch_id] = task
+        return await asyncio.shield(task)
+
+    async def tiktok_connection(self) -> Dict[str, Any]:
+        if self._tiktok_connection is None:
+            self._tiktok_connection = asyncio.ensure_future(get_tiktok_publish_state())
+        return await asyncio.shield(self._tiktok_connection)
+
+    def network_slot(self, network: str) -> asyncio.Semaphore:
+        slot = self.network_slots.get(network)
+        if slot is None:
+            slot = asyncio.Semaphore(1)
+            self.network_slots[network] = slot
+        return slot
+
+
+async def _publish_due_post_network(
+    post: Dict[str, Any],
+    network: str,
+    *,
+    existing: Dict[str, Any],
+    meta_connection: Dict[str, Any],
+    cycle: _DispatchCycle,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Publish one network of a due post; returns its publish result and any platform id."""
+    attempt_count = _network_attempt_count(existing)
+    try:
+        async with cycle.network_slot(network):
+            if network == SocialNetwork.FACEBOOK.value:
+                remote_id = await _publish_facebook_video(post, meta_connection)
+            elif network == SocialNetwork.INSTAGRAM.value:
+                remote_id = await _publish_instagram_reel(post, meta_connection)
+            elif network == SocialNetwork.TIKTOK.value:
+                tiktok_job, post_mode = await _dispatch_tiktok_post(
+                    post,
+                    await cycle.tiktok_connection(),
+                    tiktok_settings=_load_json_object(post.get("tiktok_settings")),
+                )
+            else:
+                raise ValidationError(
+                    f"{network} publishing is not supported by this publish slice.",
+                    details={"network": network},
+                )
 
-        if _should_block_value_caption_publish(due_post):
+        if network == SocialNetwork.TIKTOK.value:
+            tiktok_payload = _load_json_object(tiktok_job.get("response_payload_json"))
+            provider_post_ids = tiktok_payload.get("publicaly_available_post_id") or []
+            remote_id = str(provider_post_ids[0]) if provider_post_ids else str(tiktok_job.get("tiktok_publish_id") or tiktok_job.get("id"))
+            provider_status = str(tiktok_payload.get("provider_status") or tiktok_job.get("status") or "").upper()
+            result_status = _tiktok_job_result_status(tiktok_job)
+            result = {
+                "status": result_status,
+                "post_mode": post_mode,
+                "provider_status": provider_status,
+                "publish_id": tiktok_job.get("tiktok_publish_id"),
+                "remote_id": remote_id,
+                "post_id": str(provider_post_ids[0]) if provider_post_ids else None,
+                "fail_reason": tiktok_payload.get("fail_reason"),
+                "error_message": tiktok_job.get("error_message") or "",
+                "published_at": datetime.utcnow().isoformat() if result_status == "published" else None,
+                "last_attempt_at": datetime.utcnow().isoformat(),
+                "attempt_count": attempt_count,
+            }
+            platform_id = str(provider_post_ids[0]) if result_status == "published" and provider_post_ids else None
+            return result, platform_id
+
+        return {
+            "status": "published",
+            "remote_id": remote_id,
+            "published_at": datetime.utcnow().isoformat(),
+            "last_attempt_at": datetime.utcnow().isoformat(),
+            "attempt_count": attempt_count,
+        }, remote_id
+    except FlowForgeException as exc:
+        return {
+            "status": "failed",
+            "error_code": exc.code.value,
+            "error_message": exc.message,
+            "details": exc.details,
+            "last_attempt_at": datetime.utcnow().isoformat(),
+            "attempt_count": attempt_count,
+        }, None
+    except Exception as exc:
+        return {
+            "status": "failed",
+            "error_code": ErrorCode.INTERNAL_ERROR.value,
+            "error_message": str(exc),
+            "last_attempt_at": datetime.utcnow().isoformat(),
+            "attempt_count": attempt_count,
+        }, None
+
+
+async def _dispatch_due_post(
+    due_post: Dict[str, Any],
+    cycle: _DispatchCycle,
+    *,
+    trigger: str,
+) -> Optional[Tuple[str, Optional[str]]]:
+    """Claim and publish one due post.
+
+    Returns (publish_status, touched batch id), or None when the post was skipped.
+    """
+    supabase = get_supabase().client
+    if _should_block_value_caption_publish(due_post):
+        await run_db(
             supabase.table("posts").update(
                 {
                     "publish_results": {
@@ -1577,121 +1723,76 @@ async def dispatch_due_posts(limit: int = 10, *, trigger: str = "scheduler") ->
                         },
                     },
                 }
-            ).eq("id", due_post["id"]).execute()
-            processed += 1
-            failed += 1
-            continue
+            ).eq("id", due_post["id"]).execute
+        )
+        return "failed", None
 
-        claim = supabase.table("posts").update({"publish_status": "publishing"}).eq(
+    claim = await run_db(
+        supabase.table("posts").update({"publish_status": "publishing"}).eq(
             "id", due_post["id"]
-        ).eq("publish_status", "scheduled").execute()
-        if not claim.data:
-            continue
-
-        post = dict(claim.data[0])
-        post["publish_caption"] = _default_publish_caption(post)
-        post["raw_video_url"] = post.get("video_url") or ""
-        post["video_url"] = _resolve_video_url(post)
-        post["social_networks"] = _load_string_list(post.get("social_networks"))
-        publish_results = _load_json_object(post.get("publish_results"))
-        platform_ids = _load_json_object(post.get("platform_ids"))
-        batch = _load_batch(post["batch_id"], fields="id,meta_connection,state")
-        meta_connection = _effective_meta_connection(post["batch_id"], batch.get("meta_connection"))
-        tiktok_connection = await get_tiktok_publish_state()
-
-        try:
-            _ensure_meta_targets_for_networks(post["social_networks"], meta_connection)
-
-            for network in post["social_networks"]:
-                existing = _load_json_object(publish_results.get(network))
-                if existing.get("status") == "published":
-                    continue
+        ).eq("publish_status", "scheduled").execute
+    )
+    if not claim.data:
+        return None
 
-                attempt_count = _network_attempt_count(existing)
-                try:
-                    if network == SocialNetwork.FACEBOOK.value:
-                        remote_id = await _publish_facebook_video(post, meta_connection)
-                    elif network == SocialNetwork.INSTAGRAM.value:
-                        remote_id = await _publish_instagram_reel(post, meta_connection)
-                    elif network == SocialNetwork.TIKTOK.value:
-                        tiktok_job, post_mode = await _dispatch_tiktok_post(
-                            post,
-                            tiktok_connection,
-                            tiktok_settings=_load_json_object(post.get("tiktok_settings")),
-                        )
-                        tiktok_payload = _load_json_object(tiktok_job.get("response_payload_json"))
-                        provider_post_ids = tiktok_payload.get("publicaly_available_post_id") or []
-                        remote_id = str(provider_post_ids[0]) if provider_post_ids else str(tiktok_job.get("tiktok_publish_id") or tiktok_job.get("id"))
-                        provider_status = str(tiktok_payload.get("provider_status") or tiktok_job.get("status") or "").upper()
-                        publish_results[network] = {
-                            "status": _tiktok_job_result_status(tiktok_job),
-                            "post_mode": post_mode,
-                            "provider_status": provider_status,
-                            "publish_id": tiktok_job.get("tiktok_publish_id"),
-                            "remote_id": remote_id,
-                            "post_id": str(provider_post_ids[0]) if provider_post_ids else None,
-                            "fail_reason": tiktok_payload.get("fail_reason"),
-                            "error_message": tiktok_job.get("error_message") or "",
-                            "published_at": datetime.utcnow().isoformat() if _tiktok_job_result_status(tiktok_job) == "published" else None,
-                            "last_attempt_at": datetime.utcnow().isoformat(),
-                            "attempt_count": attempt_count,
-                        }
-                        if _tiktok_job_result_status(tiktok_job) == "published" and provider_post_ids:
-                            platform_ids[network] = str(provider_post_ids[0])
-                        continue
-                    else:
-                        raise ValidationError(
-                            f"{network} publishing is not supported by this publish slice.",
-                            details={"network": network},
-                        )
+    post = dict(claim.data[0])
+    post["publish_caption"] = _default_publish_caption(post)
+    post["raw_video_url"] = post.get("video_url") or ""
+    post["video_url"] = _resolve_video_url(post)
+    post["social_networks"] = _load_string_list(post.get("social_networks"))
+    publish_results = _load_json_object(post.get("publish_results"))
+    platform_ids = _load_json_object(post.get("platform_ids"))
+    claim_lag_seconds = _dispatch_lag_seconds(due_post.get("scheduled_at"), datetime.utcnow())
 
-                    publish_results[network] = {
-                        "status": "published",
-                        "remote_id": remote_id,
-                        "published_at": datetime.utcnow().isoformat(),
-                        "last_attempt_at": datetime.utcnow().isoformat(),
-                        "attempt_count": attempt_count,
-                    }
-                    platform_ids[network] = remote_id
-                except FlowForgeException as exc:
-                    publish_results[network] = {
-                        "status": "failed",
-                        "error_code": exc.code.value,
-                        "error_message": exc.message,
-                        "details": exc.details,
-                        "last_attempt_at": datetime.utcnow().isoformat(),
-                        "attempt_count": attempt_count,
-                    }
-                except Exception as exc:
-                    publish_results[network] = {
-                        "status": "failed",
-                        "error_code": ErrorCode.INTERNAL_ERROR.value,
-                        "error_message": str(exc),
-                        "last_attempt_at": datetime.utcnow().isoformat(),
-                        "attempt_count": attempt_count,
-                    }
+    try:
+        meta_connection = await cycle.meta_connection(post["batch_id"])
+        _ensure_meta_targets_for_networks(post["social_networks"], meta_connection)
+
+        # Networks are independent, so a post's Facebook, Instagram and TikTok uploads run together.
+        pending_networks = [
+            network
+            for network in post["social_networks"]
+            if _load_json_object(publish_results.get(network)).get("status") != "published"
+        ]
+        outcomes = await asyncio.gather(
+            *(
+                _publish_due_post_network(
+                    post,
+                    network,
+                    existing=_load_json_object(publish_results.get(network)),
+                    meta_connection=meta_connection,
+                    cycle=cycle,
+                )
+                for network in pending_networks
+            )
+        )
+        for network, (result, platform_id) in zip(pending_networks, outcomes):
+            publish_results[network] = result
+            if platform_id:
+                platform_ids[network] = platform_id
 
-            overall_status = _derive_publish_status(post["social_networks"], publish_results)
+        overall_status = _derive_publish_status(post["social_networks"], publish_results)
+        await run_db(
             supabase.table("posts").update(
                 {
                     "publish_status": overall_status,
                     "publish_results": publish_results,
                     "platform_ids": platform_ids,
                 }
-            ).eq("id", post["id"]).execute()
-
-            processed += 1
-            published += int(overall_status == "published")
-            failed += int(overall_status == "failed")
-            touched_batches.append(post["batch_id"])
-            logger.info(
-                "meta_due_post_dispatched",
-                trigger=trigger,
-                post_id=post["id"],
-                batch_id=post["batch_id"],
-                publish_status=overall_status,
-            )
-        except FlowForgeException as exc:
+            ).eq("id", post["id"]).execute
+        )
+        logger.info(
+            "meta_due_post_dispatched",
+            trigger=trigger,
+            post_id=post["id"],
+            batch_id=post["batch_id"],
+            publish_status=overall_status,
+            claim_lag_seconds=claim_lag_seconds,
+            dispatch_lag_seconds=_dispatch_lag_seconds(due_post.get("scheduled_at"), datetime.utcnow()),
+        )
+        return overall_status, post["batch_id"]
+    except FlowForgeException as exc:
+        await run_db(
             supabase.table("posts").update(
                 {
                     "publish_status": "failed",
@@ -1706,17 +1807,69 @@ async def dispatch_due_posts(limit: int = 10, *, trigger: str = "scheduler") ->
                         },
                     },
                 }
-            ).eq("id", post["id"]).execute()
-            processed += 1
-            failed += 1
-            touched_batches.append(post["batch_id"])
+            ).eq("id", post["id"]).execute
+        )
+        logger.info(
+            "meta_due_post_dispatched",
+            trigger=trigger,
+            post_id=post["id"],
+            batch_id=post["batch_id"],
+            publish_status="failed",
+            claim_lag_seconds=claim_lag_seconds,
+            dispatch_lag_seconds=_dispatch_lag_seconds(due_post.get("scheduled_at"), datetime.utcnow()),
+        )
+        return "failed", post["batch_id"]
+
+
+async def dispatch_due_posts(limit: int = 10, *, trigger: str = "scheduler") -> Dict[str, Any]:
+    """Dispatch due posts concurrently and persist per-network outcomes."""
+    started = time.monotonic()
+    inflight_batches = await _reconcile_inflight_tiktok_posts()
+    now = datetime.utcnow().isoformat()
+    supabase = get_supabase().client
+    due_response = await run_db(
+        supabase.table("posts").select(
+            "id, batch_id, post_type, video_url, video_metadata, seed_data, scheduled_at, publish_caption, social_networks, publish_status, publish_results, platform_ids, tiktok_settings"
+        ).eq("publish_status", "scheduled").lte("scheduled_at", now).order("scheduled_at").limit(limit).execute
+    )
+
+    due_posts = [post for post in due_response.data or [] if not _is_removed_post(post)]
+    cycle = _DispatchCycle()
 
-    _reconcile_completed_batches(touched_batches)
+    async def dispatch(due_post: Dict[str, Any]) -> Optional[Tuple[str, Optional[str]]]:
+        async with cycle.post_slots:
+            return await _dispatch_due_post(due_post, cycle, trigger=trigger)
+
+    # Posts run in scheduled order as slots free up; one post's failure never cancels the others.
+    outcomes = await asyncio.gather(*(dispatch(post) for post in due_posts), return_exceptions=True)
+
+    processed = 0
+    published = 0
+    failed = 0
+    touched_batches: List[str] = list(inflight_batches)
+    errors: List[BaseException] = []
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            errors.append(outcome)
+            continue
+        if outcome is None:
+            continue
+        overall_status, batch_id = outcome
+        processed += 1
+        published += int(overall_status == "published")
+        failed += int(overall_status == "failed")
+        if batch_id:
+            touched_batches.append(batch_id)
+
+    await run_db(_reconcile_completed_batches, touched_batches)
+    if errors:
+        raise errors[0]
     return {
         "processed": processed,
         "published": published,
         "failed": failed,
         "trigger": trigger,
+        "elapsed_seconds": round(time.monotonic() - started, 2),
         "checked_at": datetime.utcnow().isoformat(),
     }
 
@@ -1732,6 +1885,98 @@ async def run_scheduled_publish_job() -> Dict[str, Any]:
         return {"processed": 0, "published": 0, "failed": 0, "error": str(exc)}
 
 
+def _instagram_variant_retry_due(metadata: Dict[str, Any], now: datetime) -> bool:
+    """Whether a post whose variant build failed before may be tried again."""
+    attempts = int(metadata.get("instagram_variant_attempts") or 0)
+    if attempts <= 0:
+        return True
+    if attempts >= PUBLISH_VARIANT_MAX_ATTEMPTS:
+        return False
+    try:
+        failed_at = datetime.fromisoformat(str(metadata.get("instagram_variant_failed_at")).replace("Z", "+00:00"))
+    except ValueError:
+        return True
+    backoff = timedelta(minutes=PUBLISH_VARIANT_RETRY_BASE_MINUTES * 2 ** (attempts - 1))
+    return now >= failed_at.replace(tzinfo=None) + backoff
+
+
+def _record_instagram_variant_failure(post_id: str, error: str) -> None:
+    """Count a failed ahead-of-dispatch build on the post so later cycles back off."""
+    metadata = _read_post_video_metadata(post_id)
+    metadata.update(
+        {
+            "instagram_variant_attempts": int(metadata.get("instagram_variant_attempts") or 0) + 1,
+            "instagram_variant_failed_at": datetime.utcnow().isoformat(),
+            "instagram_variant_error": error[:500],
+        }
+    )
+    get_supabase().client.table("posts").update({"video_metadata": metadata}).eq("id", post_id).execute()
+
+
+def _posts_needing_instagram_variant(limit: int) -> List[Dict[str, Any]]:
+    """Planned Instagram posts inside the look-ahead window that have no variant yet.
+
+    Posts whose last build failed are skipped until their backoff has passed.
+    """
+    now = datetime.utcnow()
+    horizon = (now + timedelta(hours=PUBLISH_VARIANT_LOOKAHEAD_HOURS)).isoformat()
+    response = get_supabase().client.table("posts").select(
+        "id, batch_id, video_url, video_status, video_metadata, seed_data, social_networks, scheduled_at, publish_status"
+    ).in_("publish_status", ["pending", "scheduled"]).lte("scheduled_at", horizon).order("scheduled_at").limit(
+        limit * 10
+    ).execute()
+    candidates: List[Dict[str, Any]] = []
+    for row in response.data or []:
+        if _is_removed_post(row) or not row.get("video_url"):
+            continue
+        if SocialNetwork.INSTAGRAM.value not in _load_string_list(row.get("social_networks")):
+            continue
+        # The variant is made from the captioned video, so wait until it exists.
+        if row.get("video_status") in {VIDEO_STATUS_CAPTION_PENDING, VIDEO_STATUS_CAPTION_PROCESSING}:
+            continue
+        metadata = _load_json_object(row.get("video_metadata"))
+        if metadata.get("instagram_video_url") or not _instagram_variant_retry_due(metadata, now):
+            continue
+        candidates.append(row)
+        if len(candidates) >= limit:
+            break
+    return candidates
+
+
+async def prepare_publish_variants(limit: int = PUBLISH_VARIANT_MAX_PER_CYCLE) -> Dict[str, Any]:
+    """Make the Instagram variant of upcoming posts so dispatch only makes network calls."""
+    posts = await run_db(_posts_needing_instagram_variant, limit)
+    prepared = 0
+    failed = 0
+    for row in posts:
+        post = {**row, "raw_video_url": row.get("video_url") or "", "video_url": _resolve_video_url(row)}
+        try:
+            source_url = await asyncio.to_thread(_resolve_instagram_video_url, post)
+            await asyncio.to_thread(_create_instagram_safe_video, post, source_url)
+            prepared += 1
+        except Exception as exc:
+            failed += 1
+            logger.warning("instagram_variant_prepare_failed", post_id=row.get("id"), error=str(exc))
+            try:
+                await run_db(_record_instagram_variant_failure, str(row.get("id")), str(exc))
+            except Exception as record_exc:
+                logger.warning(
+                    "instagram_variant_failure_record_failed", post_id=row.get("id"), error=str(record_exc)
+                )
+    return {"candidates": len(posts), "prepared": prepared, "failed": failed}
+
+
+async def run_publish_variant_job() -> Dict[str, Any]:
+    """Entry point used by the publish scheduler worker to prepare variants between dispatches."""
+    try:
+        result = await prepare_publish_variants()
+        logger.info("publish_variant_scheduler_tick", **result)
+        return result
+    except Exception as exc:
+        logger.exception("publish_variant_scheduler_failed", error=str(exc))
+        return {"candidates": 0, "prepared": 0, "failed": 0, "error": str(exc)}
+
+
 @router.post("/cron/dispatch", response_model=SuccessResponse)
 async def cron_dispatch_publish(request: Request):
     """Cron-compatible endpoint for dispatching due Meta posts."""
@@ -1760,9 +2005,11 @@ async def publish_post_now(
     supabase = get_supabase().client
 
     # 1. Load post and validate status
-    post_resp = supabase.table("posts").select(
-        "id, batch_id, post_type, video_url, video_metadata, seed_data, scheduled_at, publish_caption, social_networks, publish_status, publish_results, platform_ids"
-    ).eq("id", post_id).execute()
+    post_resp = await run_db(
+        supabase.table("posts").select(
+            "id, batch_id, post_type, video_url, video_metadata, seed_data, scheduled_at, publish_caption, social_networks, publish_status, publish_results, platform_ids"
+        ).eq("id", post_id).execute
+    )
     if not post_resp.data:
         raise NotFoundError(f"Post {post_id} not found")
     post = post_resp.data[0]
@@ -1783,7 +2030,7 @@ async def publish_post_now(
         )
 
     # 2. Validate batch state
-    batch = _load_batch(post["batch_id"], fields="id,state,meta_connection")
+    batch = await run_db(_load_batch, post["batch_id"], fields="id,state,meta_connection")
     if batch.get("state") != BatchState.S7_PUBLISH_PLAN.value:
         raise ValidationError(
             f"Batch must be in S7_PUBLISH_PLAN state, got {batch.get('state')}",
@@ -1800,7 +2047,7 @@ async def publish_post_now(
     # 4. Validate Meta connection for Meta networks
     meta_networks = [n for n in social_networks if n in (SocialNetwork.FACEBOOK.value, SocialNetwork.INSTAGRAM.value)]
     if meta_networks:
-        meta_connection = _effective_meta_connection(post["batch_id"], batch.get("meta_connection"))
+        meta_connection = await run_db(_effective_meta_connection, post["batch_id"], batch.get("meta_connection"))
         selected_page = (meta_connection.get("selected_page") or {})
         if not selected_page.get("id") or not selected_page.get("access_token"):
             raise ValidationError(
@@ -1809,9 +2056,11 @@ async def publish_post_now(
             )
 
     # 5. Optimistic lock
-    claim = supabase.table("posts").update({"publish_status": "publishing"}).eq(
-        "id", post_id
-    ).eq("publish_status", post["publish_status"]).execute()
+    claim = await run_db(
+        supabase.table("posts").update({"publish_status": "publishing"}).eq(
+            "id", post_id
+        ).eq("publish_status", post["publish_status"]).execute
+    )
     if not claim.data:
         raise ValidationError("Post status changed concurrently, please retry")
 
@@ -1823,7 +2072,7 @@ async def publish_post_now(
     publish_results = _load_json_object(post.get("publish_results"))
     platform_ids = _load_json_object(post.get("platform_ids"))
     try:
-        meta_connection = _effective_meta_connection(post["batch_id"], batch.get("meta_connection"))
+        meta_connection = await run_db(_effective_meta_connection, post["batch_id"], batch.get("meta_connection"))
         tiktok_connection = await get_tiktok_publish_state()
 
         # 4. Dispatch to each network (reuse existing per-network functions)
@@ -1893,31 +2142,35 @@ async def publish_post_now(
                     "attempt_count": attempt_count,
                 }
     except FlowForgeException as exc:
-        supabase.table("posts").update({
-            "publish_status": "failed",
-            "publish_results": {
-                **publish_results,
-                "dispatch": {
-                    "status": "failed",
-                    "error_code": exc.code.value,
-                    "error_message": exc.message,
-                    "details": exc.details,
-                    "last_attempt_at": datetime.utcnow().isoformat(),
+        await run_db(
+            supabase.table("posts").update({
+                "publish_status": "failed",
+                "publish_results": {
+                    **publish_results,
+                    "dispatch": {
+                        "status": "failed",
+                        "error_code": exc.code.value,
+                        "error_message": exc.message,
+                        "details": exc.details,
+                        "last_attempt_at": datetime.utcnow().isoformat(),
+                    },
                 },
-            },
-        }).eq("id", post_id).execute()
-        _reconcile_completed_batches([post["batch_id"]])
+            }).eq("id", post_id).execute
+        )
+        await run_db(_reconcile_completed_batches, [post["batch_id"]])
         raise
 
     overall_status = _derive_publish_status(social_networks, publish_results)
-    supabase.table("posts").update({
-        "publish_status": overall_status,
-        "publish_results": publish_results,
-        "platform_ids": platform_ids,
-    }).eq("id", post_id).execute()
+    await run_db(
+        supabase.table("posts").update({
+            "publish_status": overall_status,
+            "publish_results": publish_results,
+            "platform_ids": platform_ids,
+        }).eq("id", post_id).execute
+    )
 
     # Check batch completion
-    _reconcile_completed_batches([post["batch_id"]])
+    await run_db(_reconcile_completed_batches, [post["batch_id"]])
 
     logger.info("post_now_dispatched", post_id=post_id, publish_status=overall_status)
     return {
@@ -17,7 +17,7 @@ import httpx
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import RedirectResponse, StreamingResponse
 
-from app.adapters.supabase_client import get_supabase
+from app.adapters.supabase_client import get_supabase, run_db
 from app.core.config import get_settings
 from app.core.errors import (
     AuthenticationError,
@@ -267,7 +267,7 @@ async def _query_creator_info(access_token: str) -> Dict[str, Any]:
 
 
 async def get_tiktok_publish_state() -> Dict[str, Any]:
-    account = get_tiktok_public_account()
+    account = await run_db(get_tiktok_public_account)
     if account.get("status") not in {"connected", "reconnect_required"}:
         return _derive_tiktok_readiness(account)
 
@@ -296,13 +296,15 @@ async def get_tiktok_publish_state() -> Dict[str, Any]:
 
 async def _load_tiktok_account_secret() -> Dict[str, Any]:
     settings = _require_tiktok_settings()
-    response = get_supabase().client.rpc(
-        "get_tiktok_connected_account_secret",
-        {
-            "p_environment": settings.tiktok_environment,
-            "p_encryption_key": settings.token_encryption_key,
-        },
-    ).execute()
+    response = await run_db(
+        get_supabase().client.rpc(
+            "get_tiktok_connected_account_secret",
+            {
+                "p_environment": settings.tiktok_environment,
+                "p_encryption_key": settings.token_encryption_key,
+            },
+        ).execute
+    )
     rows = _coerce_supabase_rows(response.data)
     if not rows:
         raise AuthenticationError("No TikTok sandbox account is connected.")
@@ -450,7 +452,8 @@ async def _refresh_tiktok_access_token(account: Dict[str, Any]) -> Dict[str, Any
         "refresh_token_expires_at": (now + timedelta(seconds=refresh_expires_in)).isoformat() if refresh_expires_in > 0 else account.get("refresh_token_expires_at"),
         "scope": str(token_payload.get("scope") or account.get("scope") or DEFAULT_SCOPE),
     }
-    persisted = _upsert_connected_account(
+    persisted = await run_db(
+        _upsert_connected_account,
         open_id=str(account.get("open_id") or token_payload.get("open_id") or ""),
         display_name=str(account.get("display_name") or "TikTok Account"),
         avatar_url=str(account.get("avatar_url") or ""),
@@ -680,16 +683,33 @@ def _update_post_tiktok_result(
     ).eq("id", post["id"]).execute()
 
 
-async def _download_video_bytes(video_url: str) -> Tuple[bytes, str]:
+def _content_range_total(value: str) -> int:
+    """Total size from a ``bytes start-end/total`` Content-Range header; 0 when absent."""
+    match = re.fullmatch(r"bytes\s+(?:\d+-\d+|\*)/(\d+)", str(value or "").strip())
+    return int(match.group(1)) if match else 0
+
+
+async def _probe_video_source(video_url: str) -> Tuple[int, str]:
+    """Size and content type of the source video, from a HEAD (or a one-byte ranged GET)."""
     async with httpx.AsyncClient(timeout=TIKTOK_TIMEOUT_SECONDS, follow_redirects=True) as client:
-        response = await client.get(video_url)
-    if response.is_error:
+        response = await client.head(video_url)
+        video_size = 0 if response.is_error else int(response.headers.get("content-length") or 0)
+        if video_size <= 0:
+            # Some origins refuse HEAD or omit Content-Length on it; a one-byte range still reports the total.
+            # Only the headers are read: an origin that ignores Range answers 200 with the whole file, and its
+            # Content-Length is the size we want, so the body is closed unread.
+            async with client.stream("GET", video_url, headers={"Range": "bytes=0-0"}) as response:
+                if response.status_code == 206:
+                    video_size = _content_range_total(response.headers.get("content-range") or "")
+                elif not response.is_error:
+                    video_size = int(response.headers.get("content-length") or 0)
+    if response.is_error or video_size <= 0:
         raise ThirdPartyError(
-            "Video download for TikTok upload failed.",
+            "Video size lookup for TikTok upload failed.",
             details={"status_code": response.status_code, "video_url": video_url},
         )
     content_type = response.headers.get("content-type", "video/mp4").split(";")[0].strip() or "video/mp4"
-    return response.content, content_type
+    return video_size, content_type
 
 
 def _calculate_upload_plan(video_size: int) -> Tuple[int, int]:
@@ -920,31 +940,80 @@ def _is_tiktok_private_post_restriction(exc: Exception) -> bool:
     )
 
 
-async def _upload_video_chunks(upload_url: str, video_bytes: bytes, content_type: str, chunk_size: int, total_chunk_count: int) -> None:
-    async with httpx.AsyncClient(timeout=TIKTOK_TIMEOUT_SECONDS) as client:
-        total_size = len(video_bytes)
-        for index in range(total_chunk_count):
-            start = index * chunk_size
-            end = min(total_size, start + chunk_size)
-            chunk = video_bytes[start:end]
-            response = await client.put(
-                upload_url,
-                headers={
-                    "Content-Type": content_type,
-                    "Content-Length": str(len(chunk)),
-                    "Content-Range": f"bytes {start}-{end - 1}/{total_size}",
-                },
-                content=chunk,
-            )
-            if response.is_error:
-                raise ThirdPartyError(
-                    "TikTok chunk upload failed.",
-                    details={
-                        "status_code": response.status_code,
-                        "chunk_index": index,
-                        "response_text": response.text[:500],
+def _chunk_byte_range(index: int, chunk_size: int, total_chunk_count: int, video_size: int) -> Tuple[int, int]:
+    """Inclusive byte range of one upload chunk; the final chunk absorbs any remainder."""
+    start = index * chunk_size
+    end = video_size - 1 if index == total_chunk_count - 1 else start + chunk_size - 1
+    return start, end
+
+
+async def _fetch_video_range(client: httpx.AsyncClient, video_url: str, start: int, end: int, video_size: int) -> bytes:
+    whole_file = start == 0 and end == video_size - 1
+    response = await client.get(video_url, headers={"Range": f"bytes={start}-{end}"})
+    # An origin may answer a range covering the whole object with a plain 200.
+    if response.status_code != 206 and not (whole_file and response.status_code == 200):
+        raise ThirdPartyError(
+            "Video range download for TikTok upload failed.",
+            details={"status_code": response.status_code, "video_url": video_url, "range": f"{start}-{end}"},
+        )
+    if len(response.content) != end - start + 1:
+        raise ThirdPartyError(
+            "Video range download for TikTok upload returned a short read.",
+            details={"video_url": video_url, "range": f"{start}-{end}", "received_bytes": len(response.content)},
+        )
+    return response.content
+
+
+async def _stream_video_chunks(
+    upload_url: str,
+    video_url: str,
+    content_type: str,
+    video_size: int,
+    chunk_size: int,
+    total_chunk_count: int,
+) -> None:
+    """Copy the source video to TikTok chunk by chunk with ranged reads.
+
+    Only the chunk being PUT and the next one (fetched while that PUT is in
+    flight) are held in memory, however long the video is.
+    """
+    async with httpx.AsyncClient(timeout=TIKTOK_TIMEOUT_SECONDS, follow_redirects=True) as source, httpx.AsyncClient(
+        timeout=TIKTOK_TIMEOUT_SECONDS
+    ) as uploader:
+
+        def fetch(index: int) -> "asyncio.Task[bytes]":
+            start, end = _chunk_byte_range(index, chunk_size, total_chunk_count, video_size)
+            return asyncio.ensure_future(_fetch_video_range(source, video_url, start, end, video_size))
+
+        next_chunk = fetch(0)
+        try:
+            for index in range(total_chunk_count):
+                chunk = await next_chunk
+                next_chunk = fetch(index + 1) if index + 1 < total_chunk_count else None
+                start, end = _chunk_byte_range(index, chunk_size, total_chunk_count, video_size)
+                response = await uploader.put(
+                    upload_url,
+                    headers={
+                        "Content-Type": content_type,
+                        "Content-Length": str(len(chunk)),
+                        "Content-Range": f"bytes {start}-{end}/{video_size}",
                     },
+                    content=chunk,
                 )
+                del chunk
+                if response.is_error:
+                    raise ThirdPartyError(
+                        "TikTok chunk upload failed.",
+                        details={
+                            "status_code": response.status_code,
+                            "chunk_index": index,
+                            "response_text": response.text[:500],
+                        },
+                    )
+        finally:
+            if next_chunk is not None and not next_chunk.done():
+                next_chunk.cancel()
+                await asyncio.gather(next_chunk, return_exceptions=True)
 
 
 def _load_post_for_tiktok(post_id: str, *, mode: str) -> Dict[str, Any]:
@@ -1051,7 +1120,8 @@ async def tiktok_oauth_callback(
         datetime.now(timezone.utc) + timedelta(seconds=refresh_expires_in)
     ).isoformat() if refresh_expires_in > 0 else None
 
-    account = _upsert_connected_account(
+    account = await run_db(
+        _upsert_connected_account,
         open_id=open_id,
         display_name=str(profile.get("display_name") or "TikTok Account"),
         avatar_url=str(profile.get("avatar_url") or ""),
@@ -1074,13 +1144,13 @@ async def tiktok_oauth_callback(
 async def disconnect_tiktok_account():
     """Remove the connected TikTok account from the workspace."""
     settings = _require_tiktok_settings()
-    response = (
+    response = await run_db(
         get_supabase()
         .client.table("connected_accounts")
         .delete()
         .eq("platform", "tiktok")
         .eq("environment", settings.tiktok_environment)
-        .execute()
+        .execute
     )
     logger.info("tiktok_account_disconnected", environment=settings.tiktok_environment)
     return SuccessResponse(data={"status": "disconnected", "deleted": len(response.data or [])})
@@ -1128,7 +1198,7 @@ async def upload_tiktok_draft_for_post(post_id: str, caption: Optional[str] = No
 @router.get("/tiktok/drafts/{post_id}/video.mp4")
 async def serve_tiktok_draft_video(post_id: str):
     """Serve a generated video from the public app domain for TikTok pull-from-URL drafts."""
-    post = _load_post_for_tiktok(post_id, mode="draft")
+    post = await run_db(_load_post_for_tiktok, post_id, mode="draft")
     source_url = str(post["video_url"])
     async with httpx.AsyncClient(timeout=TIKTOK_TIMEOUT_SECONDS, follow_redirects=True) as client:
         response = await client.get(source_url)
@@ -1186,10 +1256,9 @@ async def _publish_tiktok_post(
     brand_content_toggle: bool = False,
     brand_organic_toggle: bool = False,
 ) -> Dict[str, Any]:
-    post = _load_post_for_tiktok(post_id, mode=mode)
+    post = await run_db(_load_post_for_tiktok, post_id, mode=mode)
     account = await _load_tiktok_account_secret()
     video_url = str(post["video_url"])
-    video_bytes: Optional[bytes] = None
     content_type = "video/mp4"
     video_size = 0
 
@@ -1201,7 +1270,8 @@ async def _publish_tiktok_post(
         or video_metadata.get("size")
         or 0
     )
-    media_asset = _upsert_media_asset(
+    media_asset = await run_db(
+        _upsert_media_asset,
         source_url=str(post["video_url"]),
         storage_key=_storage_key_from_url(str(post["video_url"])),
         mime_type=content_type,
@@ -1234,7 +1304,8 @@ async def _publish_tiktok_post(
             "source": "PULL_FROM_URL",
             "video_url": draft_proxy_url,
         }
-    job = _create_publish_job(
+    job = await run_db(
+        _create_publish_job,
         connected_account_id=str(account["id"]),
         media_asset_id=str(media_asset["id"]),
         caption=resolved_caption,
@@ -1252,9 +1323,9 @@ async def _publish_tiktok_post(
                 raise ValidationError("TikTok title is required for direct post.")
             if not privacy_level:
                 raise ValidationError("TikTok privacy level is required for direct post.")
-            video_bytes, content_type = await _download_video_bytes(video_url)
-            video_size = len(video_bytes)
-            media_asset = _upsert_media_asset(
+            video_size, content_type = await _probe_video_source(video_url)
+            media_asset = await run_db(
+                _upsert_media_asset,
                 source_url=str(post["video_url"]),
                 storage_key=_storage_key_from_url(str(post["video_url"])),
                 mime_type=content_type,
@@ -1298,14 +1369,16 @@ async def _publish_tiktok_post(
                     "total_chunk_count": init_payload["total_chunk_count"],
                 },
             }
-            _update_publish_job(
+            await run_db(
+                _update_publish_job,
                 str(job["id"]),
                 {"request_payload_json": redact_secret_payload(request_payload)},
             )
-            await _upload_video_chunks(
+            await _stream_video_chunks(
                 str(init_payload["upload_url"]),
-                video_bytes,
+                video_url,
                 content_type,
+                video_size,
                 int(init_payload["chunk_size"]),
                 int(init_payload["total_chunk_count"]),
             )
@@ -1320,7 +1393,8 @@ async def _publish_tiktok_post(
         provider_post_id = str(provider_post_ids[0]) if provider_post_ids else None
         local_job_status = _map_tiktok_publish_job_status(provider_status, mode)
         local_result_status = _map_tiktok_result_status(provider_status, mode)
-        updated_job = _update_publish_job(
+        updated_job = await run_db(
+            _update_publish_job,
             str(job["id"]),
             {
                 "status": local_job_status,
@@ -1339,7 +1413,8 @@ async def _publish_tiktok_post(
                 "published_at": datetime.utcnow().isoformat() if local_result_status == "published" else None,
             },
         )
-        _update_post_tiktok_result(
+        await run_db(
+            _update_post_tiktok_result,
             post,
             updated_job,
             provider_status=provider_status,
@@ -1373,7 +1448,8 @@ async def _publish_tiktok_post(
                     "provider_error": redact_secret_payload(exc.details if isinstance(exc.details, dict) else {}),
                 },
             )
-        updated_job = _update_publish_job(
+        updated_job = await run_db(
+            _update_publish_job,
             str(job["id"]),
             {
                 "status": "failed",
@@ -1381,7 +1457,8 @@ async def _publish_tiktok_post(
                 "error_message": error_message,
             },
         )
-        _update_post_tiktok_result(
+        await run_db(
+            _update_post_tiktok_result,
             post,
             updated_job,
             provider_status="FAILED",
@@ -1392,7 +1469,8 @@ async def _publish_tiktok_post(
         raise mapped_error or exc
     except Exception as exc:
         error_message = exc.message if isinstance(exc, (ThirdPartyError, AuthenticationError, ValidationError)) else str(exc)
-        updated_job = _update_publish_job(
+        updated_job = await run_db(
+            _update_publish_job,
             str(job["id"]),
             {
                 "status": "failed",
@@ -1400,7 +1478,8 @@ async def _publish_tiktok_post(
                 "error_message": error_message,
             },
         )
-        _update_post_tiktok_result(
+        await run_db(
+            _update_post_tiktok_result,
             post,
             updated_job,
             provider_status="FAILED",
@@ -1413,14 +1492,16 @@ async def _publish_tiktok_post(
 
 async def refresh_tiktok_post_status(post_id: str) -> Optional[Dict[str, Any]]:
     """Refresh the TikTok provider status for an existing publish job."""
-    post = _load_post_for_tiktok(post_id, mode="direct")
+    post = await run_db(_load_post_for_tiktok, post_id, mode="direct")
     existing = _load_json_object((_load_json_object(post.get("publish_results"))).get("tiktok"))
     publish_id = str(existing.get("publish_id") or existing.get("remote_id") or "").strip()
     if not publish_id:
         return None
 
     account = await _load_tiktok_account_secret()
-    response = get_supabase().client.table("publish_jobs").select("*").eq("tiktok_publish_id", publish_id).limit(1).execute()
+    response = await run_db(
+        get_supabase().client.table("publish_jobs").select("*").eq("tiktok_publish_id", publish_id).limit(1).execute
+    )
     rows = response.data or []
     if not rows:
         return None
@@ -1434,7 +1515,8 @@ async def refresh_tiktok_post_status(post_id: str) -> Optional[Dict[str, Any]]:
     local_job_status = _map_tiktok_publish_job_status(provider_status, str(job.get("post_mode") or "draft"))
     local_result_status = _map_tiktok_result_status(provider_status, str(job.get("post_mode") or "draft"))
 
-    updated_job = _update_publish_job(
+    updated_job = await run_db(
+        _update_publish_job,
         str(job["id"]),
         {
             "status": local_job_status,
@@ -1443,7 +1525,8 @@ async def refresh_tiktok_post_status(post_id: str) -> Optional[Dict[str, Any]]:
             "published_at": datetime.utcnow().isoformat() if local_result_status == "published" else None,
         },
     )
-    _update_post_tiktok_result(
+    await run_db(
+        _update_post_tiktok_result,
         post,
         updated_job,
         provider_status=provider_status,
@@ -1465,7 +1548,7 @@ def _sanitize_publish_job(row: Dict[str, Any]) -> Dict[str, Any]:
 @router.get("/api/tiktok/publish-jobs/{job_id}", response_model=SuccessResponse)
 async def get_tiktok_publish_job(job_id: str):
     """Return a persisted TikTok publish job by id."""
-    response = get_supabase().client.table("publish_jobs").select("*").eq("id", job_id).execute()
+    response = await run_db(get_supabase().client.table("publish_jobs").select("*").eq("id", job_id).execute)
     rows = response.data or []
     if not rows:
         raise NotFoundError("TikTok publish job not found.", details={"job_id": job_id})
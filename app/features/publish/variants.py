@@ -0,0 +1,181 @@
+"""
+Pre-publish video variants.
+
+Instagram Graph ingestion wants a 1080x1920 H.264/AAC MP4 with the moov atom up
+front. Publishing used to build that variant during dispatch: download the
+source, run a libx264 transcode of up to four minutes, upload the result and
+patch the post. Variants are now built ahead of time, when captioning finishes
+or when a scheduled post enters the look-ahead window, so dispatch only makes
+network calls. Each variant is stored under a key derived from the source's
+sha256 and the transcode profile, so a source that was already transcoded
+reuses the stored object instead of running ffmpeg again.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+from hashlib import sha256
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.adapters.storage_client import get_storage_client
+from app.core.errors import ThirdPartyError
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+INSTAGRAM_REELS_PROFILE = "instagram-reels-v1"
+# ffmpeg output arguments per profile. The profile name is part of the storage key
+# variants are reused by, so rename the profile whenever its arguments change.
+TRANSCODE_PROFILES: Dict[str, List[str]] = {
+    INSTAGRAM_REELS_PROFILE: [
+        "-vf", "scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920,fps=30,format=yuv420p",
+        "-c:v", "libx264",
+        "-profile:v", "high",
+        "-level:v", "4.0",
+        "-preset", "medium",
+        "-crf", "22",
+        "-x264-params", "keyint=60:min-keyint=60:scenecut=0",
+        "-c:a", "aac",
+        "-b:a", "128k",
+        "-ar", "48000",
+        "-ac", "2",
+        "-movflags", "+faststart",
+    ],
+}
+VARIANT_TRANSCODE_TIMEOUT_SECONDS = 240
+VARIANT_DOWNLOAD_TIMEOUT_SECONDS = 120.0
+_FILE_CHUNK_BYTES = 1024 * 1024
+# video_metadata keys describing a post's Instagram variant; stale once the source video changes.
+# Failed ahead-of-dispatch builds, so the scheduler backs off instead of retrying every cycle.
+INSTAGRAM_VARIANT_FAILURE_KEYS = (
+    "instagram_variant_attempts",
+    "instagram_variant_failed_at",
+    "instagram_variant_error",
+)
+INSTAGRAM_VARIANT_METADATA_KEYS = (
+    "instagram_video_url",
+    "instagram_video_storage_key",
+    "instagram_video_profile",
+    "instagram_video_source_sha256",
+    *INSTAGRAM_VARIANT_FAILURE_KEYS,
+)
+
+
+def _download_source(source_url: str, destination_path: str) -> str:
+    """Stream ``source_url`` to disk and return its sha256."""
+    digest = sha256()
+    with httpx.stream("GET", source_url, follow_redirects=True, timeout=VARIANT_DOWNLOAD_TIMEOUT_SECONDS) as response:
+        if response.is_error:
+            raise ThirdPartyError(
+                "Unable to download source video for a publish variant.",
+                details={"status_code": response.status_code, "source_url": source_url},
+            )
+        with open(destination_path, "wb") as handle:
+            for chunk in response.iter_bytes(_FILE_CHUNK_BYTES):
+                digest.update(chunk)
+                handle.write(chunk)
+    return digest.hexdigest()
+
+
+def _file_sha256(path: str) -> str:
+    digest = sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_FILE_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _transcode(source_path: str, output_path: str, profile: str, *, correlation_id: str) -> None:
+    cmd = ["ffmpeg", "-y", "-i", source_path, *TRANSCODE_PROFILES[profile], output_path]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=VARIANT_TRANSCODE_TIMEOUT_SECONDS)
+    if result.returncode != 0:
+        raise ThirdPartyError(
+            "Publish variant transcode failed.",
+            details={"profile": profile, "correlation_id": correlation_id, "stderr": result.stderr[-500:]},
+        )
+
+
+def build_video_variant(
+    *,
+    source_url: str,
+    profile: str,
+    correlation_id: str,
+    source_path: Optional[str] = None,
+    source_sha256: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return the stored ``profile`` variant of a source video, transcoding only on a miss.
+
+    ``source_path`` skips the download when the caller already has the file, and a
+    known ``source_sha256`` lets a stored variant be found without touching the
+    source at all. The result is an upload result dict plus ``profile``,
+    ``source_sha256`` and ``reused``.
+    """
+    if profile not in TRANSCODE_PROFILES:
+        raise ValueError(f"Unknown publish variant profile: {profile}")
+    storage = get_storage_client()
+
+    def stored(digest: str) -> Optional[Dict[str, Any]]:
+        existing = storage.find_video_variant(source_sha256=digest, profile=profile)
+        if existing is None:
+            return None
+        logger.info(
+            "publish_variant_reused",
+            correlation_id=correlation_id,
+            profile=profile,
+            source_sha256=digest,
+            storage_key=existing["storage_key"],
+        )
+        return {**existing, "profile": profile, "source_sha256": digest, "reused": True}
+
+    if source_sha256:
+        existing = stored(source_sha256)
+        if existing is not None:
+            return existing
+
+    with tempfile.TemporaryDirectory(prefix="publish_variant_") as tmpdir:
+        if source_path is None:
+            source_path = os.path.join(tmpdir, "source.mp4")
+            downloaded_sha256 = _download_source(source_url, source_path)
+            if downloaded_sha256 != source_sha256:
+                source_sha256 = downloaded_sha256
+                existing = stored(source_sha256)
+                if existing is not None:
+                    return existing
+        elif not source_sha256:
+            source_sha256 = _file_sha256(source_path)
+            existing = stored(source_sha256)
+            if existing is not None:
+                return existing
+
+        output_path = os.path.join(tmpdir, "variant.mp4")
+        _transcode(source_path, output_path, profile, correlation_id=correlation_id)
+        uploaded = storage.upload_video_file(
+            path=output_path,
+            file_name=f"{profile}.mp4",
+            correlation_id=correlation_id,
+            content_type="video/mp4",
+            object_key=storage.video_variant_key(source_sha256=source_sha256, profile=profile),
+        )
+    logger.info(
+        "publish_variant_created",
+        correlation_id=correlation_id,
+        profile=profile,
+        source_sha256=source_sha256,
+        storage_key=uploaded["storage_key"],
+        size_bytes=uploaded.get("size"),
+    )
+    return {**uploaded, "profile": profile, "source_sha256": source_sha256, "reused": False}
+
+
+def instagram_variant_metadata(variant: Dict[str, Any]) -> Dict[str, Any]:
+    """video_metadata fields that point a post at its Instagram variant."""
+    return {
+        "instagram_video_url": str(variant["url"]),
+        "instagram_video_storage_key": variant.get("storage_key"),
+        "instagram_video_profile": variant.get("profile"),
+        "instagram_video_source_sha256": variant.get("source_sha256"),
+    }
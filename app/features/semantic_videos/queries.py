@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from copy import deepcopy
 from types import SimpleNamespace
 from typing import Any, Mapping, Optional, Sequence
@@ -10,6 +9,7 @@ from typing import Any, Mapping, Optional, Sequence
 import httpx
 from postgrest.exceptions import APIError
 
+from app.adapters.deadline_http import request_with_deadline
 from app.adapters.supabase_client import execute_supabase_read, get_supabase
 from app.core.config import get_settings
 from app.core.errors import NotFoundError, StateTransitionError, ValidationError
@@ -63,7 +63,7 @@ def _execute_transition_rpc(query, *, operation: str) -> Any:
         raise
 
 
-async def _async_transition_rpc_with_deadline(
+def _transition_rpc_with_deadline(
     *, function_name: str, payload: Mapping[str, Any], timeout_seconds: float
 ) -> Any:
     settings = get_settings()
@@ -74,15 +74,13 @@ async def _async_transition_rpc_with_deadline(
         "Accept": "application/json",
         "Prefer": "return=representation",
     }
-    async with httpx.AsyncClient(follow_redirects=False, timeout=None) as client:
-        response = await asyncio.wait_for(
-            client.post(
-                f"{settings.supabase_url}/rest/v1/rpc/{function_name}",
-                headers=headers,
-                json=dict(payload),
-            ),
-            timeout=max(0.1, float(timeout_seconds)),
-        )
+    response = request_with_deadline(
+        "POST",
+        f"{settings.supabase_url}/rest/v1/rpc/{function_name}",
+        timeout_seconds=timeout_seconds,
+        headers=headers,
+        json=dict(payload),
+    )
     if response.status_code >= 400:
         try:
             error_payload = response.json()
@@ -104,7 +102,7 @@ async def _async_transition_rpc_with_deadline(
     return SimpleNamespace(data=response.json())
 
 
-async def _async_scene_image_job_read_with_deadline(
+def _scene_image_job_read_with_deadline(
     *, post_id: str, timeout_seconds: float
 ) -> Any:
     settings = get_settings()
@@ -113,20 +111,18 @@ async def _async_scene_image_job_read_with_deadline(
         "Authorization": f"Bearer {settings.supabase_service_key}",
         "Accept": "application/json",
     }
-    async with httpx.AsyncClient(follow_redirects=False, timeout=None) as client:
-        response = await asyncio.wait_for(
-            client.get(
-                f"{settings.supabase_url}/rest/v1/semantic_scene_image_jobs",
-                headers=headers,
-                params={
-                    "select": "*",
-                    "post_id": f"eq.{post_id}",
-                    "order": "created_at.desc",
-                    "limit": "1",
-                },
-            ),
-            timeout=max(0.1, float(timeout_seconds)),
-        )
+    response = request_with_deadline(
+        "GET",
+        f"{settings.supabase_url}/rest/v1/semantic_scene_image_jobs",
+        timeout_seconds=timeout_seconds,
+        headers=headers,
+        params={
+            "select": "*",
+            "post_id": f"eq.{post_id}",
+            "order": "created_at.desc",
+            "limit": "1",
+        },
+    )
     response.raise_for_status()
     return SimpleNamespace(data=response.json())
 
@@ -145,12 +141,10 @@ class _AbsoluteDeadlineRpc:
 
     def execute(self) -> Any:
         try:
-            return asyncio.run(
-                _async_transition_rpc_with_deadline(
-                    function_name=self.function_name,
-                    payload=self.payload,
-                    timeout_seconds=self.timeout_seconds,
-                )
+            return _transition_rpc_with_deadline(
+                function_name=self.function_name,
+                payload=self.payload,
+                timeout_seconds=self.timeout_seconds,
             )
         except TimeoutError as exc:
             raise StateTransitionError(
@@ -546,11 +540,9 @@ def get_scene_image_job(
         )
     else:
         try:
-            response = asyncio.run(
-                _async_scene_image_job_read_with_deadline(
-                    post_id=post_id,
-                    timeout_seconds=timeout_seconds,
-                )
+            response = _scene_image_job_read_with_deadline(
+                post_id=post_id,
+                timeout_seconds=timeout_seconds,
             )
         except (TimeoutError, httpx.HTTPError) as exc:
             raise StateTransitionError(
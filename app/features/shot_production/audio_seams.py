@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass, replace
 from hashlib import sha256
 import json
 import math
+import os
 from pathlib import Path
 from statistics import median
+import struct
 import subprocess
+import sys
+import tempfile
+import threading
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from app.core.errors import ValidationError
@@ -34,6 +41,13 @@ _DIGITAL_SILENCE_DBFS = -120.0
 MAX_PERCEPTUAL_SEAM_ENERGY_DELTA_DB = 12.0
 MAX_MEASURED_TERMINAL_RESET_ENERGY_DELTA_DB = 18.0
 _PREFERRED_SEAM_ENERGY_DELTA_DB = 6.0
+ACOUSTIC_ANALYSIS_CACHE_DIRNAME = "acoustic-analysis"
+_ACOUSTIC_CACHE_MAGIC = b"AFM1"
+_ACOUSTIC_CACHE_HEADER = struct.Struct("<4sI")
+_ACOUSTIC_CACHE_FIELDS = 6
+_MEDIA_HASH_CHUNK_BYTES = 1024 * 1024
+_ffprobe_version_lock = threading.Lock()
+_ffprobe_version_value: Optional[str] = None
 _FRAME_TAGS = {
     "rms_dbfs": "lavfi.astats.1.RMS_level",
     "peak_dbfs": "lavfi.astats.1.Peak_level",
@@ -212,14 +226,7 @@ def _escape_lavfi_path(path: Path) -> str:
     return str(path.resolve()).replace("\\", "\\\\").replace("'", "\\'").replace(":", "\\:")
 
 
-def analyze_audio_frames(
-    media_path: Path,
-    *,
-    run_fn: Optional[Callable[..., Any]] = None,
-) -> Tuple[AudioFrameMetrics, ...]:
-    path = Path(media_path)
-    if not path.is_file():
-        raise ValidationError("Acoustic analysis requires an existing media file.")
+def _run_frame_analysis(path: Path, runner: Callable[..., Any]) -> Tuple[AudioFrameMetrics, ...]:
     filter_graph = (
         f"amovie='{_escape_lavfi_path(path)}',"
         "aformat=sample_rates=16000:channel_layouts=mono,"
@@ -240,7 +247,6 @@ def analyze_audio_frames(
         "-of",
         "json",
     ]
-    runner = run_fn or subprocess.run
     result = runner(
         command,
         capture_output=True,
@@ -259,6 +265,135 @@ def analyze_audio_frames(
     return parse_frame_metrics(payload)
 
 
+def encode_frame_metrics(frames: Sequence[AudioFrameMetrics]) -> bytes:
+    """Pack frame metrics into the compact cache layout: header + little-endian float64 rows."""
+    values = array("d")
+    for frame in frames:
+        values.extend(
+            (
+                frame.timestamp_seconds,
+                frame.rms_dbfs,
+                frame.peak_dbfs,
+                frame.zero_crossing_rate,
+                frame.spectral_centroid_hz,
+                frame.spectral_flatness,
+            )
+        )
+    if sys.byteorder != "little":
+        values.byteswap()
+    return _ACOUSTIC_CACHE_HEADER.pack(_ACOUSTIC_CACHE_MAGIC, len(frames)) + values.tobytes()
+
+
+def decode_frame_metrics(blob: bytes) -> Tuple[AudioFrameMetrics, ...]:
+    if len(blob) < _ACOUSTIC_CACHE_HEADER.size:
+        raise ValidationError("Acoustic analysis cache entry is truncated.")
+    magic, count = _ACOUSTIC_CACHE_HEADER.unpack_from(blob)
+    payload = blob[_ACOUSTIC_CACHE_HEADER.size:]
+    if magic != _ACOUSTIC_CACHE_MAGIC or len(payload) != count * _ACOUSTIC_CACHE_FIELDS * 8 or not count:
+        raise ValidationError("Acoustic analysis cache entry is malformed.")
+    values = array("d")
+    values.frombytes(payload)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return tuple(
+        AudioFrameMetrics(*values[offset:offset + _ACOUSTIC_CACHE_FIELDS])
+        for offset in range(0, len(values), _ACOUSTIC_CACHE_FIELDS)
+    )
+
+
+def _media_sha256(path: Path) -> str:
+    digest = sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_MEDIA_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _probe_ffprobe_version(runner: Callable[..., Any]) -> str:
+    try:
+        result = runner(["ffprobe", "-version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    lines = str(result.stdout or "").strip().splitlines() if result.returncode == 0 else []
+    return lines[0].strip() if lines else ""
+
+
+def _ffprobe_version(runner: Callable[..., Any]) -> str:
+    """First line of ``ffprobe -version``; empty when it cannot be determined.
+
+    Only the installed ffprobe (``subprocess.run``) is remembered for the process;
+    an injected runner may stand for a different build, so it is asked every time.
+    """
+    global _ffprobe_version_value
+    if runner is not subprocess.run:
+        return _probe_ffprobe_version(runner)
+    with _ffprobe_version_lock:
+        if _ffprobe_version_value is None:
+            version = _probe_ffprobe_version(runner)
+            if not version:
+                return ""
+            _ffprobe_version_value = version
+        return _ffprobe_version_value
+
+
+def _cache_entry_path(cache_dir: Path, cache_key: str) -> Path:
+    return cache_dir / cache_key[:2] / f"{cache_key}.afm"
+
+
+def _read_cached_frames(entry: Path) -> Optional[Tuple[AudioFrameMetrics, ...]]:
+    try:
+        return decode_frame_metrics(entry.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+
+def _write_cached_frames(entry: Path, frames: Sequence[AudioFrameMetrics]) -> None:
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".part")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(encode_frame_metrics(frames))
+        os.replace(tmp_path, entry)
+    except OSError:
+        # The cache only saves work; analysis results are still returned.
+        return
+
+
+def analyze_audio_frames(
+    media_path: Path,
+    *,
+    run_fn: Optional[Callable[..., Any]] = None,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[AudioFrameMetrics, ...]:
+    """Measure per-frame acoustic evidence for one take.
+
+    When ``cache_dir`` (or ``ACOUSTIC_ANALYSIS_CACHE_DIR``) is set, results are
+    stored under ``acoustic_analysis_cache_key`` for the media bytes, the
+    installed ffprobe build and the analyzer version, so replanning, seam repair
+    and reruns on an unchanged take skip the lavfi pass.
+    """
+    path = Path(media_path)
+    if not path.is_file():
+        raise ValidationError("Acoustic analysis requires an existing media file.")
+    runner = run_fn or subprocess.run
+    resolved_cache_dir = cache_dir or os.getenv("ACOUSTIC_ANALYSIS_CACHE_DIR", "").strip()
+    entry: Optional[Path] = None
+    if resolved_cache_dir:
+        ffprobe_version = _ffprobe_version(runner)
+        if ffprobe_version:
+            entry = _cache_entry_path(
+                Path(resolved_cache_dir),
+                acoustic_analysis_cache_key(_media_sha256(path), ffprobe_version),
+            )
+            cached = _read_cached_frames(entry)
+            if cached is not None:
+                return cached
+    frames = _run_frame_analysis(path, runner)
+    if entry is not None:
+        _write_cached_frames(entry, frames)
+    return frames
+
+
 def _validate_take_evidence(takes: Sequence[TakeAudioEvidence]) -> Tuple[TakeAudioEvidence, ...]:
     if not isinstance(takes, (list, tuple)) or len(takes) < 2:
         raise ValidationError("Acoustic seam planning requires at least two takes.")
@@ -331,11 +466,36 @@ def _plan_speech_gains(
     return gains, adjusted_range
 
 
+@dataclass(frozen=True)
+class _FrameColumns:
+    """Column view of one take's frames for windowed queries.
+
+    ``parse_frame_metrics`` emits frames in timestamp order, so a half-open
+    time window is a contiguous slice found by bisection instead of a scan.
+    """
+
+    frames: Tuple[AudioFrameMetrics, ...]
+    timestamps: array
+    ordered: bool
+
+
+def _frame_columns(take: TakeAudioEvidence) -> _FrameColumns:
+    timestamps = array("d", (frame.timestamp_seconds for frame in take.frames))
+    ordered = all(timestamps[index - 1] <= timestamps[index] for index in range(1, len(timestamps)))
+    return _FrameColumns(frames=tuple(take.frames), timestamps=timestamps, ordered=ordered)
+
+
 def _frames_between(
     take: TakeAudioEvidence,
     start_seconds: float,
     end_seconds: float,
+    *,
+    columns: Optional[_FrameColumns] = None,
 ) -> Tuple[AudioFrameMetrics, ...]:
+    if columns is not None and columns.ordered:
+        lower = bisect_left(columns.timestamps, start_seconds)
+        upper = bisect_left(columns.timestamps, end_seconds, lower)
+        return columns.frames[lower:upper]
     return tuple(
         frame
         for frame in take.frames
@@ -383,10 +543,16 @@ def _boundary_rms(
     boundary_seconds: float,
     *,
     before: bool,
+    columns: Optional[_FrameColumns] = None,
 ) -> float:
     start = boundary_seconds - 0.032 if before else boundary_seconds
     end = boundary_seconds if before else boundary_seconds + 0.032
-    frames = _frames_between(take, max(0.0, start), min(take.provider_duration_seconds, end))
+    frames = _frames_between(
+        take,
+        max(0.0, start),
+        min(take.provider_duration_seconds, end),
+        columns=columns,
+    )
     if not frames:
         raise ValidationError(
             "Acoustic seam boundary has insufficient frame evidence.",
@@ -398,11 +564,14 @@ def _boundary_rms(
 def _boundary_starts_inside_isolated_breath(
     take: TakeAudioEvidence,
     boundary_seconds: float,
+    *,
+    columns: Optional[_FrameColumns] = None,
 ) -> bool:
     frames = _frames_between(
         take,
         max(0.0, boundary_seconds - 0.128),
         min(take.first_word_start_seconds, boundary_seconds + 0.128),
+        columns=columns,
     )
     group_start: Optional[float] = None
     group_end: Optional[float] = None
@@ -488,21 +657,66 @@ def _select_seam(
         if measured_terminal_reset
         else MAX_PERCEPTUAL_SEAM_ENERGY_DELTA_DB
     )
+    # Every frame measurement below depends on the tail context or the head
+    # context alone, never on their combination or the overlap. Measure each
+    # context once, then score the full candidate grid from those results.
+    previous_columns = _frame_columns(previous)
+    next_columns = _frame_columns(next_take)
+    tail_evidence = []
     for tail_context in tail_contexts:
         previous_end = min(
             previous_audio_usable_end,
             previous.final_word_end_seconds + tail_context,
         )
-        for head_context in head_contexts:
-            next_start = max(0.0, next_take.first_word_start_seconds - head_context)
-            previous_margin = _frames_between(
-                previous, previous.final_word_end_seconds, previous_end
+        previous_margin = _frames_between(
+            previous,
+            previous.final_word_end_seconds,
+            previous_end,
+            columns=previous_columns,
+        )
+        try:
+            previous_rms: Optional[float] = _boundary_rms(
+                previous, previous_end, before=True, columns=previous_columns
             )
-            next_margin = _frames_between(next_take, next_start, next_take.first_word_start_seconds)
-            island_duration = max(
+        except ValidationError:
+            previous_rms = None
+        tail_evidence.append(
+            (
+                tail_context,
+                previous_end,
                 _maximum_breath_island_duration(previous_margin),
+                previous_rms,
+            )
+        )
+    head_evidence = []
+    for head_context in head_contexts:
+        next_start = max(0.0, next_take.first_word_start_seconds - head_context)
+        next_margin = _frames_between(
+            next_take,
+            next_start,
+            next_take.first_word_start_seconds,
+            columns=next_columns,
+        )
+        try:
+            next_rms: Optional[float] = _boundary_rms(
+                next_take, next_start, before=False, columns=next_columns
+            )
+        except ValidationError:
+            next_rms = None
+        head_evidence.append(
+            (
+                head_context,
+                next_start,
                 _maximum_breath_island_duration(next_margin),
+                _boundary_starts_inside_isolated_breath(
+                    next_take, next_start, columns=next_columns
+                ),
+                next_rms,
             )
+        )
+    for tail_context, previous_end, previous_island, previous_rms in tail_evidence:
+        for head_context, next_start, next_island, inside_breath, next_rms in head_evidence:
+            island_duration = max(previous_island, next_island)
             for overlap in overlaps:
                 word_gap = (
                     previous_end
@@ -537,18 +751,15 @@ def _select_seam(
                     reasons.append("pre_word_crossfade_guard")
                 if island_duration > 0.080 + 1e-9:
                     reasons.append("retained_breath_island")
-                if _boundary_starts_inside_isolated_breath(next_take, next_start):
+                if inside_breath:
                     reasons.append("boundary_inside_breath")
-                try:
-                    energy_delta = abs(
-                        _boundary_rms(previous, previous_end, before=True)
-                        + previous_gain_db
-                        - _boundary_rms(next_take, next_start, before=False)
-                        - next_gain_db
-                    )
-                except ValidationError:
+                if previous_rms is None or next_rms is None:
                     reasons.append("insufficient_boundary_evidence")
                     energy_delta = math.inf
+                else:
+                    energy_delta = abs(
+                        previous_rms + previous_gain_db - next_rms - next_gain_db
+                    )
                 candidate["short_window_energy_delta_db"] = (
                     round(energy_delta, 6) if math.isfinite(energy_delta) else None
                 )
@@ -1257,6 +1468,7 @@ def plan_acoustic_seams(
 
 
 __all__ = [
+    "ACOUSTIC_ANALYSIS_CACHE_DIRNAME",
     "ACOUSTIC_ANALYZER_VERSION",
     "MAX_EXACT_DELIVERY_RETIME_RATIO",
     "MAX_MEASURED_TERMINAL_RESET_ENERGY_DELTA_DB",
@@ -1270,7 +1482,9 @@ __all__ = [
     "TakeAudioEvidence",
     "acoustic_analysis_cache_key",
     "analyze_audio_frames",
+    "decode_frame_metrics",
     "delivered_seam_timing_failures",
+    "encode_frame_metrics",
     "parse_frame_metrics",
     "plan_acoustic_seams",
 ]
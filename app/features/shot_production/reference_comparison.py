@@ -10,6 +10,7 @@ from statistics import mean, pstdev
 import subprocess
 from typing import Any, Callable, Dict, Sequence
 
+from app.adapters.media_probe import MediaProbeError, probe_media
 from app.core.errors import ValidationError
 
 
@@ -108,21 +109,12 @@ def probe_edit_metrics(
     path = Path(media_path)
     if not path.is_file():
         raise ValidationError("Editorial comparison media does not exist.", {"path": str(path)})
-    duration_result = run_fn(
-        [
-            "ffprobe", "-v", "error", "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1", str(path),
-        ],
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
-    if duration_result.returncode != 0:
-        raise ValidationError("Editorial comparison could not probe media duration.")
     try:
-        duration = float(duration_result.stdout.strip())
-    except (TypeError, ValueError) as exc:
-        raise ValidationError("Editorial comparison received an invalid media duration.") from exc
+        duration = probe_media(path).duration
+    except MediaProbeError as exc:
+        raise ValidationError("Editorial comparison could not probe media duration.") from exc
+    if duration is None:
+        raise ValidationError("Editorial comparison received an invalid media duration.")
     filter_graph = f"movie='{_escape_lavfi_path(path)}',scdet=threshold={scene_threshold:g}"
     scene_result = run_fn(
         [
@@ -8,7 +8,7 @@ from contextlib import contextmanager
 from dataclasses import asdict
 from datetime import datetime, timezone
 import fcntl
-from functools import wraps
+from functools import partial, wraps
 from hashlib import sha256
 import json
 import math
@@ -30,6 +30,7 @@ from PIL import Image, ImageDraw, ImageFont, ImageOps
 from app.adapters.caption_aligner import align_transcript_to_script
 from app.adapters.caption_renderer import burn_captions
 from app.adapters.deepgram_client import Word, WordLevelTranscript
+from app.adapters.media_probe import MediaProbeError, probe_media
 from app.adapters.storage_client import get_storage_client
 from app.adapters.video_stitcher import stitch_segments
 from app.core.errors import ValidationError
@@ -41,6 +42,7 @@ from app.features.shot_production.acoustic_qa import (
     evaluate_acoustic_seam_continuity,
 )
 from app.features.shot_production.audio_seams import (
+    ACOUSTIC_ANALYSIS_CACHE_DIRNAME,
     MAX_EXACT_DELIVERY_RETIME_RATIO,
     MAX_MEASURED_TERMINAL_RESET_ENERGY_DELTA_DB,
     MAX_PERCEPTUAL_SEAM_ENERGY_DELTA_DB,
@@ -1724,23 +1726,10 @@ def run_voice_qa(
 
 
 def _probe_media(path: Path) -> Dict[str, Any]:
-    result = subprocess.run(
-        [
-            "ffprobe", "-v", "error", "-show_entries",
-            "format=duration,size,bit_rate,format_name:stream=index,codec_type,codec_name,width,height,"
-            "r_frame_rate,sample_rate,channels",
-            "-of", "json", str(path),
-        ],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    if result.returncode != 0:
-        return {"probe_error": result.stderr[-300:]}
     try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return {"probe_error": "ffprobe returned invalid JSON"}
+        return probe_media(path).to_dict()
+    except MediaProbeError as exc:
+        return {"probe_error": exc.stderr or str(exc)}
 
 
 def evaluate_final_media_probe(
@@ -2546,7 +2535,13 @@ def compose_and_caption(
         payload["acoustic_preroll_normalization"] = normalization_records
         payload.pop("acoustic_plan_failure", None)
         _atomic_write_json(manifest_path, payload)
-    segment_videos = [path.read_bytes() for path in segment_paths]
+        if analyze_audio_fn is analyze_audio_frames:
+            # Reruns after seam repair re-analyze identical normalized takes;
+            # keep their frame metrics in the run workspace.
+            analyze_audio_fn = partial(
+                analyze_audio_frames,
+                cache_dir=manifest_path.parent / ACOUSTIC_ANALYSIS_CACHE_DIRNAME,
+            )
     trim_windows = [take["trim_window"] for take in ordered]
     if single_take_terminal_protection:
         protected_source_end = (
@@ -2750,7 +2745,6 @@ def compose_and_caption(
             payload["composition_mode"] = "transcript_safe_operator_review"
             payload.pop("acoustic_seam_plan", None)
             segment_paths = tuple(Path(take["raw"]["path"]) for take in ordered)
-            segment_videos = [path.read_bytes() for path in segment_paths]
             trim_windows = []
             for position, take in enumerate(ordered):
                 window = dict(take["trim_window"])
@@ -2814,7 +2808,7 @@ def compose_and_caption(
             payload["acoustic_seam_plan"] = acoustic_plan_payload
             _atomic_write_json(manifest_path, payload)
     stitched_bytes, stitch_metadata = stitch_fn(
-        segment_videos=segment_videos,
+        segment_paths=[str(path) for path in segment_paths],
         post_id=payload["run_id"],
         correlation_id=f"semantic_ugc_{payload['run_id']}_stitch",
         trim_windows=(
@@ -3364,12 +3358,24 @@ def upload_final(manifest_path: Path, storage_client: Optional[Any] = None) -> D
             payload["status"] = "upload_ready"
             payload["updated_at"] = _utc_now()
             _atomic_write_json(manifest_path, payload)
-            result = storage.upload_video(
-                video_bytes=captioned_path.read_bytes(),
-                file_name=file_name,
-                correlation_id=f"semantic_ugc_{payload['run_id']}_upload",
-                object_key=str(intent["storage_key"]),
-            )
+            file_uploader = getattr(storage, "upload_video_file", None)
+            if callable(file_uploader):
+                # Streams the file in concurrent parts; the digest is already known, so it
+                # goes onto the object up front and is re-checked against the read.
+                result = file_uploader(
+                    path=str(captioned_path),
+                    file_name=file_name,
+                    correlation_id=f"semantic_ugc_{payload['run_id']}_upload",
+                    object_key=str(intent["storage_key"]),
+                    expected_sha256=str(caption["sha256"]),
+                )
+            else:
+                result = storage.upload_video(
+                    video_bytes=captioned_path.read_bytes(),
+                    file_name=file_name,
+                    correlation_id=f"semantic_ugc_{payload['run_id']}_upload",
+                    object_key=str(intent["storage_key"]),
+                )
             payload["upload"] = result
             intent["state"] = "receipt_recorded"
             intent["receipt_recorded_at"] = _utc_now()
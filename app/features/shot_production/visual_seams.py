@@ -10,6 +10,8 @@ import re
 import subprocess
 from typing import Any, Dict, Sequence
 
+from app.adapters.media_probe import MediaProbeError, probe_media
+
 
 DELIVERY_VISUAL_SEAM_QA_VERSION = "delivery-visual-seam-v1"
 SOURCE_TERMINAL_RESET_QA_VERSION = "source-terminal-reset-v2"
@@ -36,26 +38,11 @@ _SCENE_SCORE = re.compile(
 
 
 def _probe_duration(video_path: Path) -> float:
-    probe = subprocess.run(
-        [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(video_path),
-        ],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
     try:
-        duration = float(probe.stdout.strip())
-    except (TypeError, ValueError):
-        duration = math.nan
-    if probe.returncode != 0 or not math.isfinite(duration) or duration <= 0:
+        duration = probe_media(video_path).duration
+    except MediaProbeError:
+        duration = None
+    if duration is None or not math.isfinite(duration):
         raise ValueError("FFprobe source terminal-reset duration failed")
     return duration
 
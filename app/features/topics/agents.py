@@ -57,7 +57,6 @@ from app.features.topics.topic_validation import (
     _find_english_markers,
     _validate_dialog_script_semantics,
     _validate_dialog_script_tier,
-    _validate_url_accessible,
     compute_bigram_jaccard,
     estimate_script_duration_seconds,
     normalize_framework,
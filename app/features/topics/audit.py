@@ -7,16 +7,24 @@ prompt compliance, and virality potential using Gemini.
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from app.core.logging import get_logger
+from app.core.rate_limit import RateLimitCooldown, is_rate_limit_error
 from app.features.topics.topic_validation import detect_spoken_copy_issues
 
 logger = get_logger(__name__)
+_T = TypeVar("_T")
 
 AUDIT_PROMPT_PATH = Path(__file__).parent / "prompt_data" / "audit_prompt.txt"
+# Waits after consecutive provider 429s before a script is left pending for the next cycle.
+AUDIT_RATE_LIMIT_BACKOFF_SECONDS = (2.0, 4.0, 8.0, 16.0)
+# Output budget per script in a packed request (a single audit gets 1024).
+AUDIT_PACK_MAX_TOKENS_PER_SCRIPT = 1024
+_AUDIT_DIMENSIONS = ("german_nativeness", "hook_quality", "prompt_compliance", "virality_potential")
 
 AUDIT_SYSTEM_PROMPT = (
     "You are the Lippe Lift Studio audit agent.\n"
@@ -85,6 +93,39 @@ AUDIT_JSON_SCHEMA: Dict[str, Any] = {
 }
 
 
+AUDIT_PACK_SYSTEM_PROMPT = (
+    "You are the Lippe Lift Studio audit agent.\n"
+    "Evaluate every script independently and return ONLY valid JSON.\n"
+    "Return exactly one result per script, keyed by its script_id.\n"
+    "No markdown fences, no extra text.\n"
+    "All notes in German."
+)
+
+AUDIT_PACK_JSON_SCHEMA: Dict[str, Any] = {
+    "name": "topic_audit_pack_result",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "additionalProperties": False,
+                    "properties": {
+                        "script_id": {"type": "string"},
+                        **AUDIT_JSON_SCHEMA["schema"]["properties"],
+                    },
+                    "required": ["script_id", *AUDIT_JSON_SCHEMA["schema"]["required"]],
+                },
+            },
+        },
+        "required": ["results"],
+    },
+}
+
+
 @dataclass
 class AuditResult:
     script_id: str
@@ -97,6 +138,37 @@ class AuditResult:
     virality_potential: int = 0
 
 
+class AuditRateLimitedError(RuntimeError):
+    """The provider kept rate-limiting a script; it stays pending for the next cycle."""
+
+
+def _call_with_rate_limit_backoff(
+    callback: Callable[[], _T],
+    *,
+    script_id: str,
+    cooldown: RateLimitCooldown,
+) -> _T:
+    attempt = 0
+    while True:
+        cooldown.wait()
+        try:
+            return callback()
+        except Exception as exc:
+            if not is_rate_limit_error(exc):
+                raise
+            if attempt >= len(AUDIT_RATE_LIMIT_BACKOFF_SECONDS):
+                raise AuditRateLimitedError(str(exc)) from exc
+            delay = AUDIT_RATE_LIMIT_BACKOFF_SECONDS[attempt]
+            logger.warning(
+                "audit_rate_limited",
+                script_id=script_id,
+                attempt=attempt + 1,
+                backoff_seconds=delay,
+            )
+            cooldown.trip(delay)
+            attempt += 1
+
+
 def _load_audit_prompt() -> str:
     with AUDIT_PROMPT_PATH.open("r", encoding="utf-8") as fp:
         return fp.read().strip()
@@ -112,6 +184,40 @@ def _build_audit_prompt(row: Dict[str, Any]) -> str:
     return result
 
 
+def _build_audit_pack_prompt(rows: List[Dict[str, Any]]) -> str:
+    """Pack several scripts into one request that states the rubric only once.
+
+    The rubric and status thresholds are cut from ``audit_prompt.txt`` so the
+    packed and single-script audits always score against the same text.
+    """
+    template = _load_audit_prompt()
+    rubric = template[template.index("BEWERTUNGSDIMENSIONEN") : template.index("ANTWORTFORMAT:")].strip()
+    thresholds = template[template.index("STATUS-SCHWELLEN:") :].strip()
+    scripts = "\n\n".join(
+        (
+            f"SCRIPT_ID: {row.get('id')}\n"
+            f"TIER: {int(row.get('target_length_tier') or 8)}s\n"
+            f"TOPIC: {row.get('title') or row.get('topic') or ''}\n"
+            f"SCRIPT:\n{row.get('script') or ''}"
+        )
+        for row in rows
+    )
+    return (
+        "AUDIT_AGENT\n"
+        f"Du bewertest {len(rows)} TikTok-Scripttexte für die Zielgruppe Rollstuhlnutzer:innen "
+        "in Deutschland. Bewerte jeden Text einzeln und unabhängig von den anderen.\n\n"
+        f"SCRIPTS ZU BEWERTEN:\n\n{scripts}\n\n"
+        f"{rubric}\n\n"
+        "ANTWORTFORMAT:\n"
+        "Antworte NUR mit einem validen JSON-Objekt. Kein Zusatztext, keine Markdown-Fences.\n"
+        'Das Feld "results" enthält genau ein Objekt pro Script mit der unveränderten SCRIPT_ID '
+        'im Feld "script_id" sowie german_nativeness, hook_quality, prompt_compliance, '
+        "virality_potential (je score + notes, notes maximal 10 Wörter), total_score, status "
+        "und summary (maximal 15 Wörter).\n\n"
+        f"{thresholds}"
+    )
+
+
 def _coerce_audit_payload(data: Dict[str, Any], script_id: str) -> AuditResult:
     total = int(data.get("total_score") or 0)
     status = str(data.get("status") or "reject")
@@ -195,31 +301,99 @@ def _audit_with_text_fallback(row: Dict[str, Any], *, llm: Any, script_id: str)
     return _parse_audit_response(raw_response, script_id)
 
 
-def audit_single_script(row: Dict[str, Any], *, llm: Any) -> AuditResult:
-    """Audit a single topic_scripts row. Returns AuditResult."""
+def _packed_item_is_complete(item: Any) -> bool:
+    if not isinstance(item, dict):
+        return False
+    try:
+        for dimension in _AUDIT_DIMENSIONS:
+            int(item[dimension]["score"])
+        int(item["total_score"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return True
+
+
+def _audit_pack_with_structured_json(
+    rows: List[Dict[str, Any]],
+    *,
+    llm: Any,
+) -> Dict[str, AuditResult]:
+    """Audit several rows in one request; returns only the items that came back usable."""
+    structured = llm.generate_gemini_json(
+        prompt=_build_audit_pack_prompt(rows),
+        json_schema=AUDIT_PACK_JSON_SCHEMA,
+        system_prompt=AUDIT_PACK_SYSTEM_PROMPT,
+        max_tokens=AUDIT_PACK_MAX_TOKENS_PER_SCRIPT * len(rows),
+        temperature=0.2,
+    )
+    expected = {str(row.get("id") or "") for row in rows}
+    results: Dict[str, AuditResult] = {}
+    items = structured.get("results") if isinstance(structured, dict) else None
+    for item in items if isinstance(items, list) else []:
+        if not _packed_item_is_complete(item):
+            continue
+        script_id = str(item.get("script_id") or "").strip()
+        if script_id not in expected or script_id in results:
+            continue
+        payload = {key: value for key, value in item.items() if key != "script_id"}
+        results[script_id] = _coerce_audit_payload(payload, script_id)
+    return results
+
+
+def _deterministic_reject(row: Dict[str, Any]) -> Optional[AuditResult]:
+    script_id = str(row.get("id") or "")
+    issues = detect_spoken_copy_issues(str(row.get("script") or "").strip())
+    if not issues:
+        return None
+    issue_kinds = [issue.get("kind", "unknown") for issue in issues]
+    logger.info("audit_deterministic_reject", script_id=script_id, issues=issue_kinds)
+    return AuditResult(
+        script_id=script_id,
+        total_score=0,
+        status="reject",
+        quality_notes=json.dumps({"deterministic_reject": True, "issues": issue_kinds}, ensure_ascii=False),
+    )
+
+
+def audit_single_script(
+    row: Dict[str, Any],
+    *,
+    llm: Any,
+    cooldown: Optional[RateLimitCooldown] = None,
+) -> AuditResult:
+    """Audit a single topic_scripts row. Returns AuditResult.
+
+    Raises ``AuditRateLimitedError`` when the provider is still rate-limiting after
+    the backoff schedule, so the row is retried later instead of being rejected.
+    """
     script_id = str(row.get("id") or "")
-    script_text = str(row.get("script") or "").strip()
+    cooldown = cooldown or RateLimitCooldown()
 
     # Deterministic checks first — no LLM needed for structural failures
-    issues = detect_spoken_copy_issues(script_text)
-    if issues:
-        issue_kinds = [issue.get("kind", "unknown") for issue in issues]
-        logger.info("audit_deterministic_reject", script_id=script_id, issues=issue_kinds)
-        return AuditResult(
-            script_id=script_id,
-            total_score=0,
-            status="reject",
-            quality_notes=json.dumps({"deterministic_reject": True, "issues": issue_kinds}, ensure_ascii=False),
-        )
+    rejected = _deterministic_reject(row)
+    if rejected is not None:
+        return rejected
 
     # LLM evaluation
     try:
-        return _audit_with_structured_json(row, llm=llm)
+        return _call_with_rate_limit_backoff(
+            lambda: _audit_with_structured_json(row, llm=llm),
+            script_id=script_id,
+            cooldown=cooldown,
+        )
+    except AuditRateLimitedError:
+        raise
     except Exception as exc:
         logger.warning("audit_structured_json_failed", script_id=script_id, error=str(exc))
 
     try:
-        return _audit_with_text_fallback(row, llm=llm, script_id=script_id)
+        return _call_with_rate_limit_backoff(
+            lambda: _audit_with_text_fallback(row, llm=llm, script_id=script_id),
+            script_id=script_id,
+            cooldown=cooldown,
+        )
+    except AuditRateLimitedError:
+        raise
     except Exception as exc:
         logger.exception("audit_llm_error", script_id=script_id, error=str(exc))
         return AuditResult(
@@ -230,16 +404,110 @@ def audit_single_script(row: Dict[str, Any], *, llm: Any) -> AuditResult:
         )
 
 
-def audit_batch(rows: List[Dict[str, Any]], *, llm: Any) -> List[AuditResult]:
-    """Audit a batch of topic_scripts rows."""
-    results: List[AuditResult] = []
-    for row in rows:
-        result = audit_single_script(row, llm=llm)
-        results.append(result)
-        logger.info(
-            "audit_script_evaluated",
-            script_id=result.script_id,
-            total_score=result.total_score,
-            status=result.status,
+def _audit_pack(
+    rows: List[Dict[str, Any]],
+    *,
+    llm: Any,
+    cooldown: RateLimitCooldown,
+) -> List[Optional[AuditResult]]:
+    """Audit ``rows`` in one packed request, re-auditing missing or malformed items one by one.
+
+    ``None`` marks a row deferred by the rate limiter.
+    """
+    pack_label = f"pack:{rows[0].get('id')}+{len(rows) - 1}"
+    try:
+        packed = _call_with_rate_limit_backoff(
+            lambda: _audit_pack_with_structured_json(rows, llm=llm),
+            script_id=pack_label,
+            cooldown=cooldown,
         )
-    return results
+    except AuditRateLimitedError as exc:
+        logger.warning("audit_pack_deferred", pack=pack_label, pack_size=len(rows), error=str(exc))
+        return [None] * len(rows)
+    except Exception as exc:
+        logger.warning("audit_pack_failed", pack=pack_label, pack_size=len(rows), error=str(exc))
+        packed = {}
+
+    missing = [row for row in rows if str(row.get("id") or "") not in packed]
+    logger.info(
+        "audit_pack_evaluated",
+        pack=pack_label,
+        pack_size=len(rows),
+        resolved=len(rows) - len(missing),
+        fallback=len(missing),
+    )
+    outcomes: List[Optional[AuditResult]] = []
+    for row in rows:
+        result = packed.get(str(row.get("id") or ""))
+        if result is None:
+            result = _audit_one(row, llm=llm, cooldown=cooldown)
+        outcomes.append(result)
+    return outcomes
+
+
+def _audit_one(
+    row: Dict[str, Any],
+    *,
+    llm: Any,
+    cooldown: RateLimitCooldown,
+) -> Optional[AuditResult]:
+    try:
+        return audit_single_script(row, llm=llm, cooldown=cooldown)
+    except AuditRateLimitedError as exc:
+        logger.warning("audit_script_deferred", script_id=str(row.get("id") or ""), error=str(exc))
+        return None
+
+
+def audit_batch(
+    rows: List[Dict[str, Any]],
+    *,
+    llm: Any,
+    max_in_flight: int = 1,
+    pack_size: int = 1,
+) -> List[AuditResult]:
+    """Audit a batch of topic_scripts rows with up to ``max_in_flight`` concurrent LLM calls.
+
+    With ``pack_size`` > 1, scripts that pass the deterministic checks are sent
+    ``pack_size`` per request against ``AUDIT_PACK_JSON_SCHEMA``; only items that
+    come back missing or malformed are re-audited with single-script calls.
+
+    Results keep the input order. Rows that stayed rate-limited are left out so
+    they remain pending for the next cycle.
+    """
+    cooldown = RateLimitCooldown()
+    pack_size = max(1, int(pack_size))
+    outcomes: List[Optional[AuditResult]] = [None] * len(rows)
+    if pack_size == 1:
+        units = [[index] for index in range(len(rows))]
+    else:
+        pending: List[int] = []
+        for index, row in enumerate(rows):
+            outcomes[index] = _deterministic_reject(row)
+            if outcomes[index] is None:
+                pending.append(index)
+        units = [pending[start : start + pack_size] for start in range(0, len(pending), pack_size)]
+
+    def _run(unit: List[int]) -> List[Optional[AuditResult]]:
+        if len(unit) == 1:
+            return [_audit_one(rows[unit[0]], llm=llm, cooldown=cooldown)]
+        return _audit_pack([rows[index] for index in unit], llm=llm, cooldown=cooldown)
+
+    workers = max(1, min(int(max_in_flight), len(units)))
+    if workers == 1:
+        unit_outcomes = [_run(unit) for unit in units]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="topic-audit") as executor:
+            unit_outcomes = list(executor.map(_run, units))
+    for unit, results in zip(units, unit_outcomes):
+        for index, result in zip(unit, results):
+            outcomes[index] = result
+
+    for result in outcomes:
+        if result is not None:
+            logger.info(
+                "audit_script_evaluated",
+                script_id=result.script_id,
+                total_score=result.total_score,
+                status=result.status,
+            )
+    return [result for result in outcomes if result is not None]
@@ -9,12 +9,13 @@ from typing import Any, Dict, List, Optional
 from app.core.logging import get_logger
 from app.core.errors import ThirdPartyError
 from app.core.config import get_settings
+from app.core.rate_limit import RateLimitCooldown, is_rate_limit_error
 from app.features.topics.agents import (
     build_seed_payload,
     convert_research_item_to_topic,
     generate_topic_script_candidate,
 )
-from app.features.topics.deduplication import deduplicate_topics
+from app.features.topics.deduplication import TopicSimilarityIndex, deduplicate_topics
 from app.features.topics.prompts import build_topic_research_dossier_prompt
 from app.features.topics.response_parsers import parse_topic_research_response
 from app.features.topics.seed_builders import build_research_seed_data
@@ -28,15 +29,13 @@ logger = get_logger(__name__)
 _CANONICAL_TIERS = (8, 16, 32)
 _BACKOFF_DELAYS = (1, 2, 4)
 _DEEP_RESEARCH_TIMEOUT_SECONDS = get_settings().gemini_topic_timeout_seconds
-
-
-def _is_rate_limit_error(exc: Exception) -> bool:
-    error_text = str(exc or "").lower()
-    return "429" in error_text or "rate" in error_text
+# Shared by every warm-up in the process, so seeds researched in parallel all
+# back off once any of them is rate-limited.
+_RATE_LIMIT_COOLDOWN = RateLimitCooldown()
 
 
 def _is_retryable_deep_research_error(exc: Exception) -> bool:
-    if _is_rate_limit_error(exc):
+    if is_rate_limit_error(exc):
         return True
     error_text = str(exc or "").lower()
     if "polling failed" in error_text or "deep research failed" in error_text:
@@ -51,11 +50,13 @@ def _is_retryable_deep_research_error(exc: Exception) -> bool:
 
 def _call_with_retry(action_name: str, *, seed_topic: str, lane_title: Optional[str], callback):
     for attempt in range(len(_BACKOFF_DELAYS) + 1):
+        _RATE_LIMIT_COOLDOWN.wait()
         try:
             return callback()
         except Exception as exc:
             if _is_retryable_deep_research_error(exc) and attempt < len(_BACKOFF_DELAYS):
                 delay = _BACKOFF_DELAYS[attempt]
+                rate_limited = is_rate_limit_error(exc)
                 logger.warning(
                     "topic_warmup_rate_limit",
                     action=action_name,
@@ -63,8 +64,12 @@ def _call_with_retry(action_name: str, *, seed_topic: str, lane_title: Optional[
                     lane_title=lane_title,
                     attempt=attempt + 1,
                     backoff_seconds=delay,
+                    shared=rate_limited,
                 )
-                time.sleep(delay)
+                if rate_limited:
+                    _RATE_LIMIT_COOLDOWN.trip(delay)
+                else:
+                    time.sleep(delay)
                 continue
             raise
 
@@ -292,6 +297,7 @@ def run_single_seed_topic_warmup(
 
     existing_topics = list(existing_topics or [])
     collected_topics = list(collected_topics or [])
+    dedupe_index = TopicSimilarityIndex(existing_topics + collected_topics)
 
     try:
         raw_research = _call_with_retry(
@@ -382,7 +388,7 @@ def run_single_seed_topic_warmup(
                 "rotation": topic_data.rotation,
                 "cta": topic_data.cta,
             }
-            is_unique = deduplicate_topics([dedupe_candidate], existing_topics + collected_topics, threshold=0.35)
+            is_unique = deduplicate_topics([dedupe_candidate], dedupe_index, threshold=0.35)
             if not is_unique and not (force_fallback_lane_persistence and summary["lanes_persisted"] == 0):
                 logger.info("topic_bank_lane_deduped", seed_topic=seed_topic, lane_title=lane_title)
                 continue
@@ -493,6 +499,7 @@ def run_single_seed_topic_warmup(
             }
             existing_topics.append(dedupe_record)
             collected_topics.append(dedupe_record)
+            dedupe_index.add(dedupe_record)
             summary["lanes_persisted"] += 1
             summary["stored_rows"].append(stored_row)
             summary["stored_topic_ids"].append(str(stored_row.get("id") or "").strip())
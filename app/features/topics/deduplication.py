@@ -4,11 +4,22 @@ Jaccard similarity-based deduplication logic.
 Per Canon § 1.2: Research with De-duplication
 """
 
-from typing import Set, Tuple, Optional, List, Dict, Any
+import math
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Set, Tuple, Optional, List, Dict, Any, Iterable, Sequence, Union
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+# (field, weight) pairs of the weighted Jaccard score, see calculate_topic_similarity.
+_SIMILARITY_FIELDS = (("title", 0.5), ("rotation", 0.3), ("cta", 0.2))
+TOPIC_SIMILARITY_INDEX_TTL_SECONDS = float(os.getenv("TOPIC_SIMILARITY_INDEX_TTL_SECONDS", "300"))
+
 
 def tokenize(text: str) -> Set[str]:
     """
@@ -16,9 +27,8 @@ def tokenize(text: str) -> Set[str]:
     Remove punctuation and split on whitespace.
     """
     # Simple tokenization: lowercase, remove punctuation, split
-    import re
     text = text.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
+    text = _PUNCTUATION_RE.sub(' ', text)
     tokens = set(text.split())
     return tokens
 
@@ -90,108 +100,337 @@ def calculate_topic_similarity(
     return weighted_sim
 
 
+class TopicSimilarityIndex:
+    """
+    Pre-tokenized topics with a token -> topic inverted index per field.
+
+    Scores are the exact weighted Jaccard of calculate_topic_similarity, computed
+    on pre-tokenized rows, but only for candidates pulled from the posting lists.
+    Without a threshold every topic sharing a token with the query is a
+    candidate. With one, a topic can only reach it if some field has a Jaccard of
+    at least the threshold (the weights sum to 1), which takes an overlap of
+    ceil(threshold * |query field|) tokens; so probing all but that many minus
+    one of the query's most common tokens per field finds every such topic.
+
+    Topics keep their insertion order, which decides ties exactly like the
+    linear scans this replaces.
+    """
+
+    def __init__(self, topics: Iterable[Dict[str, Any]] = ()):
+        self._lock = threading.RLock()
+        self._topics: Dict[int, Dict[str, Any]] = {}
+        self._tokens: Dict[int, Tuple[Set[str], ...]] = {}
+        self._postings: Tuple[Dict[str, Set[int]], ...] = tuple(
+            defaultdict(set) for _ in _SIMILARITY_FIELDS
+        )
+        self._position_by_id: Dict[str, int] = {}
+        self._next_position = 0
+        for topic in topics:
+            self.add(topic)
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def add(self, topic: Dict[str, Any], *, replace: bool = False) -> bool:
+        """
+        Index a topic; returns False when it lacks a similarity field.
+        With ``replace``, an entry already indexed under the same ``id`` is dropped first.
+        """
+        if not all(key in topic for key, _ in _SIMILARITY_FIELDS):
+            logger.warning(
+                "dedupe_missing_fields",
+                missing=[key for key, _ in _SIMILARITY_FIELDS if key not in topic],
+                available=list(topic.keys()),
+            )
+            return False
+        tokens = tuple(tokenize(str(topic[key] or "")) for key, _ in _SIMILARITY_FIELDS)
+        topic_id = topic.get("id")
+        with self._lock:
+            if replace and topic_id is not None:
+                self.discard(str(topic_id))
+            position = self._next_position
+            self._next_position += 1
+            self._topics[position] = topic
+            self._tokens[position] = tokens
+            for postings, field_tokens in zip(self._postings, tokens):
+                for token in field_tokens:
+                    postings[token].add(position)
+            if topic_id is not None:
+                self._position_by_id[str(topic_id)] = position
+        return True
+
+    def discard(self, topic_id: str) -> None:
+        with self._lock:
+            position = self._position_by_id.pop(str(topic_id), None)
+            if position is None:
+                return
+            self._topics.pop(position, None)
+            for postings, field_tokens in zip(self._postings, self._tokens.pop(position)):
+                for token in field_tokens:
+                    members = postings.get(token)
+                    if members is not None:
+                        members.discard(position)
+                        if not members:
+                            del postings[token]
+
+    def _candidate_positions(
+        self,
+        query: Tuple[Set[str], ...],
+        threshold: float,
+    ) -> Set[int]:
+        # Caller holds self._lock.
+        candidates: Set[int] = set()
+        for postings, field_tokens in zip(self._postings, query):
+            if not field_tokens:
+                continue
+            probe = sorted(field_tokens, key=lambda token: len(postings.get(token, ())))
+            if threshold > 0:
+                # Slack keeps float rounding from ever dropping a topic that reaches the threshold.
+                required_overlap = max(1, math.ceil((threshold - 1e-9) * len(field_tokens) - 1e-9))
+                probe = probe[: len(field_tokens) - required_overlap + 1]
+            for token in probe:
+                candidates.update(postings.get(token, ()))
+        return candidates
+
+    def scored_candidates(
+        self,
+        title: str,
+        rotation: str,
+        cta: str,
+        threshold: float = 0.0,
+    ) -> List[Tuple[int, float, Dict[str, Any]]]:
+        """
+        (position, similarity, topic) in insertion order for candidate topics with a
+        non-zero score. With ``threshold``, every topic scoring at least that is
+        included; lower-scoring ones may be pruned.
+        """
+        query = (tokenize(title), tokenize(rotation), tokenize(cta))
+        with self._lock:
+            scored = []
+            for position in sorted(self._candidate_positions(query, threshold)):
+                sims = []
+                for query_tokens, row_tokens in zip(query, self._tokens[position]):
+                    overlap = len(query_tokens & row_tokens)
+                    sims.append(overlap / (len(query_tokens) + len(row_tokens) - overlap) if overlap else 0.0)
+                similarity = (
+                    sims[0] * _SIMILARITY_FIELDS[0][1] +
+                    sims[1] * _SIMILARITY_FIELDS[1][1] +
+                    sims[2] * _SIMILARITY_FIELDS[2][1]
+                )
+                scored.append((position, similarity, self._topics[position]))
+            return scored
+
+    def first_topic(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._topics[min(self._topics)] if self._topics else None
+
+    def best_match(
+        self,
+        title: str,
+        rotation: str,
+        cta: str,
+        threshold: float = 0.0,
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Highest-scoring topic (earliest on ties) and its score; (None, 0.0) without
+        overlap. Exact whenever the best score reaches ``threshold``.
+        """
+        best_topic: Optional[Dict[str, Any]] = None
+        best_score = 0.0
+        for _, similarity, topic in self.scored_candidates(title, rotation, cta, threshold):
+            if similarity > best_score:
+                best_score = similarity
+                best_topic = topic
+        return best_topic, best_score
+
+
+TopicCollection = Union[Sequence[Dict[str, Any]], TopicSimilarityIndex]
+
+
+def _as_index(existing_topics: TopicCollection) -> TopicSimilarityIndex:
+    if isinstance(existing_topics, TopicSimilarityIndex):
+        return existing_topics
+    return TopicSimilarityIndex(existing_topics)
+
+
+def _find_duplicate(
+    indexes: Sequence[TopicSimilarityIndex],
+    title: str,
+    rotation: str,
+    cta: str,
+    threshold: float,
+) -> Tuple[bool, Optional[str], float, Optional[Dict[str, Any]]]:
+    """Scan the indexes in order as if they were one list; the first topic at or above threshold wins."""
+    max_similarity = 0.0
+    matched_topic_id = None
+    if threshold <= 0:
+        # Every topic (even one without shared tokens) meets a non-positive threshold.
+        for index in indexes:
+            first = index.first_topic()
+            if first is not None:
+                similarity = calculate_topic_similarity(
+                    title, rotation, cta,
+                    first["title"], first["rotation"], first["cta"]
+                )
+                return True, (first.get("id") if similarity > 0 else None), similarity, first
+        return False, None, 0.0, None
+    for index in indexes:
+        for _, similarity, existing in index.scored_candidates(title, rotation, cta, threshold):
+            if similarity > max_similarity:
+                max_similarity = similarity
+                matched_topic_id = existing.get("id")
+            if similarity >= threshold:
+                return True, matched_topic_id, similarity, existing
+    return False, matched_topic_id, max_similarity, None
+
+
 def is_duplicate_topic(
     title: str,
     rotation: str,
     cta: str,
-    existing_topics: List[Dict[str, Any]],
+    existing_topics: TopicCollection,
     threshold: float = 0.7
 ) -> Tuple[bool, Optional[str], float]:
     """
     Check if a topic is a duplicate of existing topics.
-    
+
     Args:
         title: New topic title
         rotation: New topic rotation
         cta: New topic CTA
-        existing_topics: List of existing topics from database
+        existing_topics: Existing topics from database, as a list or a prebuilt
+            TopicSimilarityIndex (reuse one index across many checks)
         threshold: Similarity threshold (default 0.7)
-    
+
     Returns:
-        Tuple of (is_duplicate, matched_topic_id, max_similarity)
+        Tuple of (is_duplicate, matched_topic_id, max_similarity). For a
+        non-duplicate, max_similarity only covers topics that could have
+        reached the threshold.
     """
-    max_similarity = 0.0
-    matched_topic_id = None
-    
-    for existing in existing_topics:
-        if not all(key in existing for key in ("title", "rotation", "cta")):
-            logger.warning(
-                "dedupe_missing_fields",
-                missing=[key for key in ("title", "rotation", "cta") if key not in existing],
-                available=list(existing.keys()),
-            )
-            continue
-        similarity = calculate_topic_similarity(
-            title, rotation, cta,
-            existing["title"], existing["rotation"], existing["cta"]
+    return _is_duplicate_in([_as_index(existing_topics)], title, rotation, cta, threshold)
+
+
+def _is_duplicate_in(
+    indexes: Sequence[TopicSimilarityIndex],
+    title: str,
+    rotation: str,
+    cta: str,
+    threshold: float,
+) -> Tuple[bool, Optional[str], float]:
+    is_dup, matched_topic_id, similarity, existing = _find_duplicate(indexes, title, rotation, cta, threshold)
+    if is_dup:
+        logger.info(
+            "duplicate_topic_found",
+            similarity=similarity,
+            matched_topic_id=matched_topic_id,
+            new_title=title[:50],
+            existing_title=str(existing["title"])[:50]
         )
-        
-        if similarity > max_similarity:
-            max_similarity = similarity
-            matched_topic_id = existing.get("id")
-        
-        # Early exit if we find a clear duplicate
-        if similarity >= threshold:
-            logger.info(
-                "duplicate_topic_found",
-                similarity=similarity,
-                matched_topic_id=matched_topic_id,
-                new_title=title[:50],
-                existing_title=existing["title"][:50]
-            )
-            return True, matched_topic_id, similarity
-    
+        return True, matched_topic_id, similarity
+
     logger.info(
         "topic_uniqueness_check",
         is_duplicate=False,
-        max_similarity=max_similarity,
+        max_similarity=similarity,
         title=title[:50]
     )
-    
-    return False, matched_topic_id, max_similarity
+
+    return False, matched_topic_id, similarity
 
 
 def deduplicate_topics(
     new_topics: List[Dict[str, str]],
-    existing_topics: List[Dict[str, Any]],
+    existing_topics: TopicCollection,
     threshold: float = 0.7
 ) -> List[Dict[str, str]]:
     """
     Filter out duplicate topics from a list of new topics.
-    
+
     Args:
         new_topics: List of new topics to check
-        existing_topics: List of existing topics from database
+        existing_topics: Existing topics from database, as a list or a prebuilt
+            TopicSimilarityIndex (which is read, never modified)
         threshold: Similarity threshold
-    
+
     Returns:
         List of unique topics (non-duplicates)
     """
     unique_topics = []
-    
+    existing_index = _as_index(existing_topics)
+    unique_index = TopicSimilarityIndex()
+
     for topic in new_topics:
-        is_dup, _, similarity = is_duplicate_topic(
+        is_dup, _, similarity = _is_duplicate_in(
+            # Check against both existing and already-added unique
+            (existing_index, unique_index),
             topic["title"],
             topic["rotation"],
             topic["cta"],
-            existing_topics + unique_topics,  # Check against both existing and already-added unique
             threshold
         )
-        
+
         if not is_dup:
             unique_topics.append(topic)
+            unique_index.add(topic)
         else:
             logger.info(
                 "topic_filtered_as_duplicate",
                 title=topic["title"][:50],
                 similarity=similarity
             )
-    
+
     logger.info(
         "deduplication_complete",
         input_count=len(new_topics),
         output_count=len(unique_topics),
         filtered_count=len(new_topics) - len(unique_topics)
     )
-    
+
     return unique_topics
+
+
+_registry_index_lock = threading.Lock()
+_registry_index: Optional[TopicSimilarityIndex] = None
+_registry_index_loader: Optional[Callable[[], List[Dict[str, Any]]]] = None
+_registry_index_built_at = 0.0
+
+
+def get_registry_similarity_index(
+    load_topics: Callable[[], List[Dict[str, Any]]],
+) -> TopicSimilarityIndex:
+    """
+    Shared index over the topic registry, rebuilt from ``load_topics`` at most
+    every TOPIC_SIMILARITY_INDEX_TTL_SECONDS.
+
+    Registry writes in this process are applied immediately through
+    record_registry_topic; the TTL only bounds how long writes made by other
+    processes stay invisible. An empty registry is never cached.
+    """
+    global _registry_index, _registry_index_loader, _registry_index_built_at
+    with _registry_index_lock:
+        fresh = time.monotonic() - _registry_index_built_at < TOPIC_SIMILARITY_INDEX_TTL_SECONDS
+        if _registry_index is not None and _registry_index_loader is load_topics and fresh:
+            return _registry_index
+    index = TopicSimilarityIndex(load_topics() or [])
+    with _registry_index_lock:
+        if len(index):
+            _registry_index = index
+            _registry_index_loader = load_topics
+            _registry_index_built_at = time.monotonic()
+    return index
+
+
+def record_registry_topic(topic: Dict[str, Any]) -> None:
+    """Apply an inserted or updated registry row to the shared index, if one is built."""
+    with _registry_index_lock:
+        index = _registry_index
+    if index is not None and topic.get("id") is not None:
+        index.add(topic, replace=True)
+
+
+def reset_registry_similarity_index() -> None:
+    global _registry_index, _registry_index_loader, _registry_index_built_at
+    with _registry_index_lock:
+        _registry_index = None
+        _registry_index_loader = None
+        _registry_index_built_at = 0.0
@@ -31,7 +31,7 @@ from app.features.topics.agents import (
     build_lifestyle_seed_payload,
 )
 from app.features.topics.captions import attach_caption_bundle
-from app.features.topics.deduplication import deduplicate_topics
+from app.features.topics.deduplication import TopicSimilarityIndex, deduplicate_topics
 from app.features.topics.variant_expansion import expand_topic_variants
 from app.features.topics.seed_builders import build_research_seed_data
 from app.features.topics.seed_builders import build_product_seed_payload
@@ -58,6 +58,7 @@ from app.features.topics.queries import (
     upsert_topic_script_variants,
 )
 from app.features.batches.queries import get_batch_by_id, update_batch_state, list_batches
+from app.features.batches.progress_hub import notify_batch_progress
 from app.core.states import BatchState
 from app.core.errors import FlowForgeException, SuccessResponse, ValidationError
 from app.core.logging import get_logger
@@ -499,6 +500,8 @@ def _unique_topic_suggestions(
     seen_topic_families: set[str] = set()
     if existing_topics is None:
         existing_topics = []
+    # Index the reference topics once; accepted suggestions are added as we go.
+    dedupe_index = TopicSimilarityIndex(existing_topics)
 
     for suggestion in suggestions:
         family_signature = _topic_family_signature(suggestion)
@@ -525,8 +528,9 @@ def _unique_topic_suggestions(
             "cta": cta,
             "script": str(suggestion.get("script") or rotation or suggestion.get("title") or "").strip(),
         }
-        if deduplicate_topics([semantic_candidate], existing_topics + unique, threshold=semantic_threshold):
+        if deduplicate_topics([semantic_candidate], dedupe_index, threshold=semantic_threshold):
             unique.append(semantic_candidate)
+            dedupe_index.add(semantic_candidate)
             if len(unique) >= limit:
                 break
     return unique[:limit]
@@ -819,6 +823,7 @@ def _select_semantic_candidates(
 ) -> List[Dict[str, Any]]:
     selected: List[Dict[str, Any]] = []
     seen_identities = set(used_family_identities)
+    dedupe_index = TopicSimilarityIndex(existing_topics)
     seen_signatures = {
         signature
         for topic in existing_topics
@@ -833,11 +838,12 @@ def _select_semantic_candidates(
             continue
         if not deduplicate_topics(
             [candidate],
-            existing_topics + selected,
+            dedupe_index,
             threshold=0.35,
         ):
             continue
         selected.append(candidate)
+        dedupe_index.add(candidate)
         seen_identities.add(identity)
         if signature:
             seen_signatures.add(signature)
@@ -1370,6 +1376,7 @@ def _append_event_locked(batch_id: str, event_type: str, payload: Dict[str, Any]
     events.append(event)
     if len(events) > 80:
         del events[:-80]
+    notify_batch_progress(batch_id)
     return dict(event)
 
 
@@ -18,7 +18,7 @@ from app.core.logging import get_logger
 from app.core.video_profiles import get_duration_profile
 from app.core.errors import FlowForgeException, ThirdPartyError, ValidationError
 from app.features.topics.bank_warmup import run_single_seed_topic_warmup
-from app.features.topics.deduplication import calculate_topic_similarity
+from app.features.topics.deduplication import get_registry_similarity_index
 from app.features.topics.prompts import get_topic_bank, pick_topic_bank_topics
 from app.features.topics.queries import (
     create_topic_research_run,
@@ -26,6 +26,7 @@ from app.features.topics.queries import (
     get_topic_registry_by_id,
     get_topic_research_run,
     get_topic_scripts_for_dossier,
+    get_topic_script_count_maps,
     get_topic_scripts_for_registry,
     list_topic_research_runs,
     list_topic_suggestions,
@@ -77,12 +78,10 @@ def get_random_topic() -> Optional[Dict[str, Any]]:
     topics = get_all_topics_from_registry()
     if not topics:
         return None
+    script_counts, _ = _fetch_topic_script_count_maps()
     scored = []
     for topic in topics:
-        if str(topic.get("id") or "").startswith("topic-bank-"):
-            scripts = []
-        else:
-            scripts = get_topic_scripts_for_registry(topic["id"])
+        script_count = _count_topic_scripts(str(topic.get("id") or ""), script_counts)
         usage_count = int(topic.get("use_count") or 0)
         last_used_at = _parse_utc_timestamp(
             topic.get("last_used_at") or topic.get("last_harvested_at") or topic.get("updated_at") or topic.get("created_at")
@@ -91,7 +90,7 @@ def get_random_topic() -> Optional[Dict[str, Any]]:
             (
                 usage_count,
                 last_used_at.timestamp() if last_used_at else 0.0,
-                len(scripts),
+                script_count,
                 str(topic.get("created_at") or ""),
                 str(topic.get("title") or ""),
                 topic,
@@ -104,43 +103,22 @@ def get_random_topic() -> Optional[Dict[str, Any]]:
 
 def fuzzy_match_topic(query: str, threshold: float = 0.35) -> Optional[Dict[str, Any]]:
     """Find the most similar existing topic to a query string, if above threshold."""
-    topics = get_all_topics_from_registry()
-    if not topics:
-        return None
-    best_score = 0.0
-    best_topic = None
-    for topic in topics:
-        score = calculate_topic_similarity(
-            title1=query, rotation1=query, cta1=query,
-            title2=topic.get("title", ""),
-            rotation2=topic.get("rotation", ""),
-            cta2=topic.get("cta", ""),
-        )
-        if score > best_score:
-            best_score = score
-            best_topic = topic
+    index = get_registry_similarity_index(get_all_topics_from_registry)
+    best_topic, best_score = index.best_match(query, query, query, threshold)
     if best_score < threshold or best_topic is None:
         return None
-    scripts = get_topic_scripts_for_registry(best_topic["id"])
-    return {**best_topic, "script_count": len(scripts), "similarity_score": best_score}
+    script_counts, _ = _fetch_topic_script_count_maps()
+    script_count = _count_topic_scripts(str(best_topic["id"]), script_counts)
+    return {**best_topic, "script_count": script_count, "similarity_score": best_score}
 
 
 def _fetch_topic_script_count_maps() -> tuple[Dict[str, int], Dict[str, int]]:
-    """Fetch all resolved topic scripts once and derive total + used counts per topic."""
-    from app.features.topics.queries import _fetch_topic_script_rows
+    """Total + used script counts per topic from the shared, cached aggregate."""
     try:
-        all_scripts = _fetch_topic_script_rows()
+        return get_topic_script_count_maps()
     except Exception as exc:
         logger.warning("topic_script_counts_unavailable", error=str(exc))
         return {}, {}
-    total_counts: Dict[str, int] = {}
-    used_counts: Dict[str, int] = {}
-    for script in all_scripts:
-        rid = str(script.get("topic_registry_id") or "")
-        total_counts[rid] = total_counts.get(rid, 0) + 1
-        if int(script.get("use_count") or 0) > 0:
-            used_counts[rid] = used_counts.get(rid, 0) + 1
-    return total_counts, used_counts
 
 
 def _count_topic_scripts(topic_id: str, bulk_counts: Dict[str, int]) -> int:
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+import os
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import NAMESPACE_URL, uuid5
 
 import httpx
 
 from app.adapters.supabase_client import get_supabase, SupabaseAdapter
+from app.adapters.url_reachability import get_url_reachability_service
 
 # Module-level singleton placeholder used by patchable test seams; initialize lazily.
 supabase: Optional[SupabaseAdapter] = None
@@ -19,6 +22,7 @@ from app.core.logging import get_logger
 
 _POSTS_INSERT_RETRY_DELAYS = (0.15, 0.35, 0.75, 1.5)
 from app.features.topics.captions import resolve_selected_caption
+from app.features.topics.deduplication import record_registry_topic
 from app.features.topics.semantic_scripts import (
     semantic_recovery_title_for_script,
     semantic_script_uses_recovery_source,
@@ -41,9 +45,6 @@ from app.features.topics.topic_validation import (
 
 logger = get_logger(__name__)
 
-_VALUE_SOURCE_ACCESSIBILITY_CACHE: Dict[str, bool] = {}
-
-
 def _get_supabase_adapter() -> SupabaseAdapter:
     if supabase is None:
         return get_supabase()
@@ -130,32 +131,19 @@ def _normalize_script_row(row: Dict[str, Any]) -> Dict[str, Any]:
     return normalized
 
 
-def _is_value_source_url_accessible(url: Any, timeout: float = 6.0) -> bool:
-    normalized_url = clean_source_url(url)
-    if not normalized_url.lower().startswith(("http://", "https://")):
-        return False
-    if "example.com" in normalized_url or "vertexaisearch.cloud.google.com" in normalized_url:
-        return False
-    cache_key = normalized_url.rstrip("/")
-    if cache_key in _VALUE_SOURCE_ACCESSIBILITY_CACHE:
-        return _VALUE_SOURCE_ACCESSIBILITY_CACHE[cache_key]
-    try:
-        headers = {"User-Agent": "Mozilla/5.0"}
-        client_timeout = httpx.Timeout(connect=3.0, read=timeout, write=3.0, pool=3.0)
-        with httpx.Client(timeout=client_timeout, follow_redirects=True, headers=headers) as client:
-            response = client.head(normalized_url)
-            if response.status_code < 400:
-                _VALUE_SOURCE_ACCESSIBILITY_CACHE[cache_key] = True
-                return True
-            if response.status_code in {403, 405}:
-                response = client.get(normalized_url)
-                accessible = response.status_code < 400
-                _VALUE_SOURCE_ACCESSIBILITY_CACHE[cache_key] = accessible
-                return accessible
-    except httpx.HTTPError as exc:
-        logger.debug("value_source_url_accessibility_failed", url=normalized_url, error=str(exc))
-    _VALUE_SOURCE_ACCESSIBILITY_CACHE[cache_key] = False
-    return False
+def _check_value_source_urls(urls: List[Any]) -> Dict[str, bool]:
+    """Reachability of value-post source URLs (keyed by cleaned URL), probed in one parallel pass."""
+    candidates: List[str] = []
+    for url in urls:
+        normalized_url = clean_source_url(url)
+        if not normalized_url.lower().startswith(("http://", "https://")):
+            continue
+        if "example.com" in normalized_url or "vertexaisearch.cloud.google.com" in normalized_url:
+            continue
+        candidates.append(normalized_url)
+    if not candidates:
+        return {}
+    return get_url_reachability_service().check_many(candidates)
 
 
 def _script_is_selectable(script_row: Dict[str, Any]) -> bool:
@@ -388,7 +376,9 @@ def add_topic_to_registry(
             {key: value for key, value in update_payload.items() if value is not None}
         ).eq("id", existing_row["id"]).execute()
         if response.data:
-            return _normalize_registry_row(response.data[0])
+            updated_row = _normalize_registry_row(response.data[0])
+            record_registry_topic(updated_row)
+            return updated_row
 
     topic_payload: Dict[str, Any] = {
         "title": title,
@@ -410,6 +400,7 @@ def add_topic_to_registry(
     try:
         inserted = _insert_registry_row(topic_payload)
         logger.info("topic_added_to_registry", topic_id=inserted["id"], title=title[:50])
+        record_registry_topic(inserted)
         return inserted
     except Exception as exc:
         error_str = str(exc).lower()
@@ -444,7 +435,9 @@ def add_topic_to_registry(
                         topic_id=existing_row["id"],
                         new_count=int((updated.data[0] or {}).get("use_count") or existing_row.get("use_count") or 0),
                     )
-                    return _normalize_registry_row(updated.data[0])
+                    updated_row = _normalize_registry_row(updated.data[0])
+                    record_registry_topic(updated_row)
+                    return updated_row
             logger.error(
                 "topic_registry_unexpected_error",
                 title=title[:50],
@@ -777,6 +770,88 @@ def list_topic_scripts_for_registry(topic_registry_id: str, target_length_tier:
     return get_topic_scripts_for_registry(topic_registry_id, target_length_tier=target_length_tier)
 
 
+# Script writes in this process invalidate the cached counts immediately; the TTL
+# only bounds how long writes from other workers stay invisible.
+TOPIC_SCRIPT_COUNTS_TTL_SECONDS = float(os.getenv("TOPIC_SCRIPT_COUNTS_TTL_SECONDS", "60"))
+ScriptCountMaps = Tuple[Dict[str, int], Dict[str, int]]
+_script_counts_lock = threading.Lock()
+_script_counts: Optional[ScriptCountMaps] = None
+_script_counts_loaded_at = 0.0
+_script_counts_generation = 0
+
+
+def _scan_topic_script_counts() -> ScriptCountMaps:
+    """Aggregate counts from a narrow projection when the RPC is not deployed yet."""
+    supabase = _get_supabase_adapter()
+    total_counts: Dict[str, int] = {}
+    used_counts: Dict[str, int] = {}
+    start = 0
+    while True:
+        end = start + _TOPIC_SCRIPT_PAGE_SIZE - 1
+        response = (
+            supabase.client.table("topic_scripts")
+            .select("topic_registry_id, use_count")
+            .order("id")
+            .range(start, end)
+            .execute()
+        )
+        batch = response.data or []
+        for row in batch:
+            rid = str(row.get("topic_registry_id") or "")
+            if not rid:
+                continue
+            total_counts[rid] = total_counts.get(rid, 0) + 1
+            if int(row.get("use_count") or 0) > 0:
+                used_counts[rid] = used_counts.get(rid, 0) + 1
+        if len(batch) < _TOPIC_SCRIPT_PAGE_SIZE:
+            return total_counts, used_counts
+        start += _TOPIC_SCRIPT_PAGE_SIZE
+
+
+def _load_topic_script_counts() -> ScriptCountMaps:
+    supabase = _get_supabase_adapter()
+    try:
+        response = supabase.client.rpc("get_topic_script_counts", {}).execute()
+    except Exception as exc:
+        logger.warning("topic_script_counts_rpc_fallback", error=str(exc))
+        return _scan_topic_script_counts()
+    total_counts: Dict[str, int] = {}
+    used_counts: Dict[str, int] = {}
+    for rid, pair in dict(response.data or {}).items():
+        total, used = (list(pair or []) + [0, 0])[:2]
+        total_counts[str(rid)] = int(total or 0)
+        if int(used or 0) > 0:
+            used_counts[str(rid)] = int(used)
+    return total_counts, used_counts
+
+
+def get_topic_script_count_maps() -> ScriptCountMaps:
+    """Total and used script counts per topic_registry_id from one aggregated query.
+
+    Cached for TOPIC_SCRIPT_COUNTS_TTL_SECONDS; callers must not mutate the maps.
+    """
+    global _script_counts, _script_counts_loaded_at
+    with _script_counts_lock:
+        if _script_counts is not None and time.monotonic() - _script_counts_loaded_at < TOPIC_SCRIPT_COUNTS_TTL_SECONDS:
+            return _script_counts
+        generation = _script_counts_generation
+    counts = _load_topic_script_counts()
+    with _script_counts_lock:
+        # A write that landed while loading may be missing from these counts.
+        if generation == _script_counts_generation:
+            _script_counts = counts
+            _script_counts_loaded_at = time.monotonic()
+    return counts
+
+
+def invalidate_topic_script_counts() -> None:
+    global _script_counts, _script_counts_loaded_at, _script_counts_generation
+    with _script_counts_lock:
+        _script_counts = None
+        _script_counts_loaded_at = 0.0
+        _script_counts_generation += 1
+
+
 def list_topic_suggestions(
     target_length_tier: Optional[int] = None,
     limit: int = 50,
@@ -900,21 +975,36 @@ def list_topic_suggestions(
         )
         if post_type == "value" and check_accessibility:
             accessible_suggestions: List[Dict[str, Any]] = []
-            for suggestion in suggestions:
-                selected_sources = [
-                    source
-                    for source in list(suggestion.get("source_urls") or [])
-                    if _is_value_source_url_accessible(source.get("url") if isinstance(source, dict) else source)
-                ]
-                if not selected_sources:
-                    continue
-                suggestion = dict(suggestion)
-                suggestion["source_urls"] = selected_sources
-                suggestion["primary_source_url"] = selected_sources[0]["url"]
-                suggestion["primary_source_title"] = selected_sources[0]["title"]
-                accessible_suggestions.append(suggestion)
-                if len(accessible_suggestions) >= limit:
-                    break
+            # Probe a whole window of candidates at once; usually the first window fills the limit.
+            window_start = 0
+            while window_start < len(suggestions) and len(accessible_suggestions) < limit:
+                window = suggestions[window_start : window_start + limit]
+                window_start += len(window)
+                window_sources = {
+                    id(suggestion): [
+                        (source, clean_source_url(source.get("url") if isinstance(source, dict) else source))
+                        for source in list(suggestion.get("source_urls") or [])
+                    ]
+                    for suggestion in window
+                }
+                reachable = _check_value_source_urls(
+                    [url for sources in window_sources.values() for _, url in sources]
+                )
+                for suggestion in window:
+                    selected_sources = [
+                        source
+                        for source, url in window_sources[id(suggestion)]
+                        if reachable.get(url, False)
+                    ]
+                    if not selected_sources:
+                        continue
+                    suggestion = dict(suggestion)
+                    suggestion["source_urls"] = selected_sources
+                    suggestion["primary_source_url"] = selected_sources[0]["url"]
+                    suggestion["primary_source_title"] = selected_sources[0]["title"]
+                    accessible_suggestions.append(suggestion)
+                    if len(accessible_suggestions) >= limit:
+                        break
             return accessible_suggestions
         return suggestions[:limit]
     except Exception as exc:
@@ -1699,6 +1789,8 @@ def upsert_topic_script_variants(
                 variant_slot_key=variant_slot_key,
                 exact_key=exact_key,
             )
+    if stored_variants:
+        invalidate_topic_script_counts()
     return stored_variants
 
 
@@ -1916,8 +2008,9 @@ def get_unaudited_scripts(*, limit: int = 50) -> List[Dict[str, Any]]:
     sb = _get_supabase_adapter()
     response = (
         sb.client.table("topic_scripts")
-        .select("id, topic_registry_id, title, script, target_length_tier, post_type, bucket, lane_key, source_summary, cluster_id, origin_kind")
+        .select("id, topic_registry_id, title, script, target_length_tier, post_type, bucket, lane_key, source_summary, cluster_id, origin_kind, created_at")
         .eq("audit_status", "pending")
+        .order("created_at")
         .limit(limit)
         .execute()
     )
@@ -1934,6 +2027,17 @@ def _sync_topic_family_status(*, topic_registry_id: str) -> None:
     supabase.client.table("topic_registry").update({"status": next_status}).eq("id", topic_registry_id).execute()
 
 
+def _resolve_audit_status(quality_score: int, audit_status: Optional[str]) -> str:
+    resolved_status = str(audit_status or "").strip().lower()
+    if resolved_status in {"pass", "needs_repair", "reject"}:
+        return resolved_status
+    if int(quality_score or 0) >= 70:
+        return "pass"
+    if int(quality_score or 0) >= 40:
+        return "needs_repair"
+    return "reject"
+
+
 def update_script_quality(
     *,
     script_id: str,
@@ -1947,14 +2051,7 @@ def update_script_quality(
     if not existing.data:
         return
     row = existing.data[0]
-    resolved_status = str(audit_status or "").strip().lower()
-    if resolved_status not in {"pass", "needs_repair", "reject"}:
-        if int(quality_score or 0) >= 70:
-            resolved_status = "pass"
-        elif int(quality_score or 0) >= 40:
-            resolved_status = "needs_repair"
-        else:
-            resolved_status = "reject"
+    resolved_status = _resolve_audit_status(quality_score, audit_status)
     supabase.client.table("topic_scripts").update(
         {
             "quality_score": quality_score,
@@ -1969,6 +2066,29 @@ def update_script_quality(
         _sync_topic_family_status(topic_registry_id=topic_registry_id)
 
 
+def apply_script_audit_results(results: List[Dict[str, Any]]) -> int:
+    """Write a whole audit cycle in one RPC and re-sync the affected topic families.
+
+    Each item carries ``script_id``, ``quality_score``, ``quality_notes`` and
+    ``audit_status``. Returns the number of topic_scripts rows updated.
+    """
+    payload = [
+        {
+            "id": str(item["script_id"]),
+            "quality_score": int(item.get("quality_score") or 0),
+            "quality_notes": str(item.get("quality_notes") or ""),
+            "audit_status": _resolve_audit_status(item.get("quality_score") or 0, item.get("audit_status")),
+        }
+        for item in results
+        if str(item.get("script_id") or "").strip()
+    ]
+    if not payload:
+        return 0
+    supabase = _get_supabase_adapter()
+    response = supabase.client.rpc("apply_topic_script_audits", {"p_results": payload}).execute()
+    return int(response.data or 0)
+
+
 def mark_topic_script_used(*, script_id: Optional[str]) -> None:
     if not script_id:
         return
@@ -1984,6 +2104,7 @@ def mark_topic_script_used(*, script_id: Optional[str]) -> None:
                 "last_used_at": datetime.now(timezone.utc).isoformat(),
             }
         ).eq("id", script_id).execute()
+        invalidate_topic_script_counts()
     except Exception as exc:
         logger.warning("topic_script_usage_touch_failed", script_id=script_id, error=str(exc))
 
@@ -2002,6 +2123,7 @@ def delete_topic_script(*, script_id: Optional[str]) -> Optional[str]:
             return None
         topic_registry_id = str(row.get("topic_registry_id") or "").strip()
         supabase.client.table("topic_scripts").delete().eq("id", script_id).execute()
+        invalidate_topic_script_counts()
         if topic_registry_id:
             _sync_topic_family_status(topic_registry_id=topic_registry_id)
         return topic_registry_id or None
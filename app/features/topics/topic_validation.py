@@ -8,8 +8,7 @@ import math
 import re
 from typing import Any, Dict, List, Optional
 
-import httpx
-
+from app.adapters.url_reachability import get_url_reachability_service
 from app.core.errors import ValidationError
 from app.core.logging import get_logger
 from app.core.video_profiles import get_script_duration_bounds, script_word_count, validate_script_duration_contract
@@ -303,25 +302,6 @@ def _restore_abbreviations(text: str) -> str:
     return restored
 
 
-def _validate_url_accessible(url: str, timeout: float = 5.0) -> bool:
-    try:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            try:
-                response = client.head(url)
-                if response.status_code < 400:
-                    return True
-                if response.status_code == 405:
-                    response = client.get(url)
-                    return response.status_code < 400
-                return False
-            except httpx.HTTPStatusError:
-                response = client.get(url)
-                return response.status_code < 400
-    except Exception as exc:
-        logger.debug("url_validation_failed", url=url, error=str(exc))
-        return False
-
-
 def get_prompt1_word_bounds(tier: int | None) -> tuple[int, int]:
     return PROMPT1_WORD_BOUNDS.get(int(tier or 8), (12, 15))
 
@@ -1117,11 +1097,12 @@ def _dialog_word_bounds(profile: Any) -> tuple[int, int]:
 
 
 def validate_sources_accessible(item: ResearchAgentItem) -> None:
-    inaccessible_sources = []
-    for source in item.sources:
-        url = str(source.url)
-        if not _validate_url_accessible(url, timeout=8.0):
-            inaccessible_sources.append({"title": source.title, "url": url})
+    reachable = get_url_reachability_service().check_many(str(source.url) for source in item.sources)
+    inaccessible_sources = [
+        {"title": source.title, "url": str(source.url)}
+        for source in item.sources
+        if not reachable.get(str(source.url).strip(), False)
+    ]
     if inaccessible_sources:
         logger.warning(
             "research_source_urls_not_accessible",
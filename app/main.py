@@ -22,7 +22,9 @@ from app.core.config import get_settings, google_ai_context_fingerprint
 from app.core.video_profiles import get_duration_profile_for_creation_mode
 from app.core.logging import configure_logging, get_logger, set_correlation_id
 from app.core.errors import FlowForgeException, ErrorResponse, error_code_for_status
-from app.adapters.supabase_client import get_supabase
+from app.adapters.supabase_client import get_supabase, shutdown_db_executor
+from app.adapters.deadline_http import close_deadline_http_transport
+from app.adapters.url_reachability import close_url_reachability_service
 from app.features.batches.handlers import router as batches_router
 from app.features.topics.handlers import (
     find_recoverable_stalled_batch_ids,
@@ -160,6 +162,9 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown(wait=False)
         logger.info("publish_scheduler_stopped")
         logger.info("blog_publish_scheduler_stopped")
+    shutdown_db_executor()
+    close_deadline_http_transport()
+    close_url_reachability_service()
     logger.info("application_shutdown")
 
 
@@ -0,0 +1,111 @@
+"""Time acoustic seam selection for multi-take deliveries on synthetic frame evidence.
+
+Builds takes at the analyzer's 16 ms frame cadence (speech bed, room tone, and a breath before
+each incoming take's first word) and times ``_select_seam`` for every adjacent pair plus a full
+``plan_acoustic_seams`` run. No ffmpeg or network access.
+
+Usage:
+
+    python scripts/benchmark_acoustic_seam_planning.py
+    python scripts/benchmark_acoustic_seam_planning.py --takes 4 --take-seconds 8 --repeats 50
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.core.errors import ValidationError  # noqa: E402
+from app.features.shot_production.audio_seams import (  # noqa: E402
+    AudioFrameMetrics,
+    TakeAudioEvidence,
+    _plan_speech_gains,
+    _select_seam,
+    plan_acoustic_seams,
+)
+
+FRAME_STEP_SECONDS = 0.016
+
+
+def _take(index: int, duration: float) -> TakeAudioEvidence:
+    first_word = 0.42 if index else 0.30
+    final_word = duration - 0.62
+    frames = []
+    timestamp = 0.0
+    while timestamp <= duration:
+        rms, centroid, flatness, zcr = -60.0, 2200.0, 0.25, 0.04
+        if first_word <= timestamp <= final_word:
+            rms, centroid, flatness, zcr = -20.0, 1200.0, 0.12, 0.08
+        elif index and first_word - 0.30 <= timestamp <= first_word - 0.26:
+            rms, centroid, flatness, zcr = -42.0, 3600.0, 0.62, 0.12
+        frames.append(AudioFrameMetrics(timestamp, rms, rms + 8.0, zcr, centroid, flatness))
+        timestamp = round(timestamp + FRAME_STEP_SECONDS, 6)
+    return TakeAudioEvidence(
+        take_index=index,
+        provider_duration_seconds=duration,
+        first_word_start_seconds=first_word,
+        final_word_end_seconds=final_word,
+        frames=tuple(frames),
+    )
+
+
+def _time_ms(fn, repeats: int) -> Tuple[float, float]:
+    samples: List[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples), max(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--takes", type=int, default=4, help="Takes in the delivery (4 x 8s = 32s)")
+    parser.add_argument("--take-seconds", type=float, default=8.0, help="Provider duration per take")
+    parser.add_argument("--repeats", type=int, default=30, help="Timed runs; the median is reported")
+    args = parser.parse_args()
+
+    takes = tuple(_take(index, args.take_seconds) for index in range(args.takes))
+    gains, _ = _plan_speech_gains(takes)
+    frame_count = sum(len(take.frames) for take in takes)
+
+    def select_all() -> None:
+        for seam_index in range(len(takes) - 1):
+            _select_seam(
+                seam_index,
+                takes[seam_index],
+                takes[seam_index + 1],
+                gains[seam_index],
+                gains[seam_index + 1],
+                0.100,
+            )
+
+    seam_median, seam_max = _time_ms(select_all, args.repeats)
+    print(f"takes={len(takes)} frames={frame_count} seams={len(takes) - 1}")
+    print(f"seam selection: median {seam_median:.2f} ms, max {seam_max:.2f} ms")
+
+    content_seconds = args.takes * args.take_seconds
+    try:
+        plan_median, plan_max = _time_ms(
+            lambda: plan_acoustic_seams(
+                takes,
+                min_duration_seconds=max(content_seconds - 4.0, 0.0),
+                max_duration_seconds=content_seconds + 0.5,
+            ),
+            args.repeats,
+        )
+    except ValidationError as exc:
+        print(f"full plan: not timed ({exc.message})")
+        return
+    print(f"full plan:      median {plan_median:.2f} ms, max {plan_max:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
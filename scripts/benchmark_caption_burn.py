@@ -0,0 +1,141 @@
+"""Compare caption burn-in wall time and peak FFmpeg memory: libass single pass vs PNG overlays.
+
+Generates synthetic 9:16 clips (test pattern + tone) at each requested duration, builds a
+word-level transcript at a typical speaking rate, and runs ``burn_captions`` once per render
+mode. Each run happens in a fresh process so the reported peak RSS belongs to that run's
+FFmpeg child alone. Requires an FFmpeg build with libx264 and, for the ass mode, libass.
+
+Usage:
+
+    python scripts/benchmark_caption_burn.py
+    python scripts/benchmark_caption_burn.py --durations 16 32 --words-per-second 2.8 --repeats 3
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.adapters.caption_renderer import (  # noqa: E402
+    CAPTION_RENDER_MODE_ASS,
+    CAPTION_RENDER_MODE_OVERLAY,
+    _libass_available,
+    burn_captions,
+)
+from app.adapters.deepgram_client import Word, WordLevelTranscript  # noqa: E402
+
+_SAMPLE_WORDS = (
+    "Mach diesen Fehler nicht bei deinem Antrag weil die Frist sonst einfach verstreicht "
+    "und du am Ende ohne Unterstützung dastehst obwohl dir das Geld eigentlich zusteht"
+).split()
+
+
+def _make_clip(path: str, duration: int, width: int, height: int) -> None:
+    cmd = [
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "lavfi", "-i", f"testsrc2=size={width}x{height}:rate=30:duration={duration}",
+        "-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+        "-c:a", "aac", "-shortest",
+        path,
+    ]
+    subprocess.run(cmd, check=True)
+
+
+def _transcript(duration: int, words_per_second: float) -> WordLevelTranscript:
+    step = 1.0 / words_per_second
+    words: List[Word] = []
+    t = 0.0
+    index = 0
+    while t + step <= duration:
+        words.append(Word(_SAMPLE_WORDS[index % len(_SAMPLE_WORDS)], round(t, 3), round(t + step * 0.9, 3)))
+        t += step
+        index += 1
+    return WordLevelTranscript(words=words, full_text=" ".join(word.word for word in words))
+
+
+def _burn_once(clip_path: str, duration: int, words_per_second: float, mode: str, queue) -> None:
+    transcript = _transcript(duration, words_per_second)
+    started = time.perf_counter()
+    output_path = burn_captions(
+        video_path=clip_path,
+        transcript=transcript,
+        correlation_id=f"bench_{mode}_{duration}s",
+        render_mode=mode,
+    )
+    elapsed = time.perf_counter() - started
+    os.unlink(output_path)
+    # ru_maxrss is KiB on Linux; children here are the FFmpeg processes of this run only.
+    peak_kib = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    queue.put((elapsed, peak_kib / 1024.0, len(transcript.words)))
+
+
+def _measure(clip_path: str, duration: int, words_per_second: float, mode: str) -> Tuple[float, float, int]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_burn_once, args=(clip_path, duration, words_per_second, mode, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    if process.exitcode != 0:
+        raise RuntimeError(f"{mode} burn failed for {duration}s clip")
+    return result
+
+
+def run(durations: List[int], words_per_second: float, repeats: int, width: int, height: int) -> Dict:
+    modes = [CAPTION_RENDER_MODE_OVERLAY]
+    if _libass_available():
+        modes.append(CAPTION_RENDER_MODE_ASS)
+    else:
+        print("ffmpeg has no ass filter; only the overlay path is measured", file=sys.stderr)
+
+    results: Dict[Tuple[int, str], Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="caption_bench_") as work_dir:
+        for duration in durations:
+            clip_path = os.path.join(work_dir, f"clip_{duration}s.mp4")
+            _make_clip(clip_path, duration, width, height)
+            for mode in modes:
+                samples = [_measure(clip_path, duration, words_per_second, mode) for _ in range(repeats)]
+                results[(duration, mode)] = {
+                    "words": samples[0][2],
+                    "wall_s": statistics.median(sample[0] for sample in samples),
+                    "peak_mib": max(sample[1] for sample in samples),
+                }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--durations", type=int, nargs="+", default=[16, 32], help="Clip lengths in seconds")
+    parser.add_argument("--words-per-second", type=float, default=2.6, help="Synthetic speaking rate")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per mode; the median wall time is reported")
+    parser.add_argument("--width", type=int, default=1080)
+    parser.add_argument("--height", type=int, default=1920)
+    args = parser.parse_args()
+
+    results = run(args.durations, args.words_per_second, args.repeats, args.width, args.height)
+    print(f"{'clip':<8}{'mode':<10}{'words':>7}{'wall':>10}{'peak rss':>12}")
+    for (duration, mode), row in sorted(results.items()):
+        print(
+            f"{duration:>5}s  "
+            f"{mode:<10}"
+            f"{row['words']:>7}"
+            f"{row['wall_s']:>9.2f}s"
+            f"{row['peak_mib']:>9.0f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
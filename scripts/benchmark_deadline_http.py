@@ -0,0 +1,126 @@
+"""Compare per-call latency of deadline-bounded requests: fresh client per call vs the pooled transport.
+
+Starts a local keep-alive HTTP stub (optionally adding ``--server-delay-ms`` per request) and
+times sequential and threaded sync calls two ways:
+
+- ``per-call``: ``asyncio.run`` + a new ``httpx.AsyncClient`` per request, as the Gemini API
+  and semantic-video RPC helpers used to do.
+- ``pooled``: ``app.adapters.deadline_http.DeadlineHttpTransport`` (behind
+  ``request_with_deadline``), which reuses one background loop and pooled connections.
+
+Loopback hides TLS handshakes, so real Gemini/Supabase savings are larger than shown here.
+
+Usage:
+
+    python scripts/benchmark_deadline_http.py
+    python scripts/benchmark_deadline_http.py --requests 500 --threads 8 --server-delay-ms 2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import httpx  # noqa: E402
+
+from app.adapters.deadline_http import DeadlineHttpTransport  # noqa: E402
+
+TIMEOUT_SECONDS = 10.0
+
+
+def _start_stub_server(delay_seconds: float) -> ThreadingHTTPServer:
+    body = b'{"data": [{"id": "row-1"}]}'
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Send headers and body in one segment; split writes hit Nagle + delayed ACK stalls.
+        wbufsize = 64 * 1024
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if delay_seconds:
+                time.sleep(delay_seconds)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _per_call(url: str) -> None:
+    async def send() -> httpx.Response:
+        async with httpx.AsyncClient(follow_redirects=False, timeout=None) as client:
+            return await asyncio.wait_for(client.post(url, json={"n": 1}), timeout=TIMEOUT_SECONDS)
+
+    asyncio.run(send()).raise_for_status()
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(percentile / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _measure(call: Callable[[], None], requests: int, threads: int) -> Tuple[float, float, float]:
+    def timed(_index: int) -> float:
+        started = time.perf_counter()
+        call()
+        return (time.perf_counter() - started) * 1000.0
+
+    wall_started = time.perf_counter()
+    if threads <= 1:
+        samples = [timed(index) for index in range(requests)]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            samples = list(pool.map(timed, range(requests)))
+    wall = time.perf_counter() - wall_started
+    return statistics.median(samples), _percentile(samples, 99), requests / wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300, help="Requests per mode and thread count")
+    parser.add_argument("--threads", type=int, default=8, help="Caller threads for the concurrent run")
+    parser.add_argument("--server-delay-ms", type=float, default=0.0, help="Stub server think time")
+    args = parser.parse_args()
+
+    server = _start_stub_server(args.server_delay_ms / 1000.0)
+    url = f"http://127.0.0.1:{server.server_address[1]}/rest/v1/rpc/bench"
+    transport = DeadlineHttpTransport()
+
+    def pooled() -> None:
+        transport.request("POST", url, timeout_seconds=TIMEOUT_SECONDS, json={"n": 1}).raise_for_status()
+
+    pooled()  # start the loop and open the first connection outside the timing
+    print(f"{'mode':<10}{'threads':>8}{'p50':>10}{'p99':>10}{'req/s':>10}")
+    try:
+        for threads in (1, args.threads):
+            for mode, call in (("per-call", lambda: _per_call(url)), ("pooled", pooled)):
+                p50, p99, rate = _measure(call, args.requests, threads)
+                print(f"{mode:<10}{threads:>8}{p50:>8.2f}ms{p99:>8.2f}ms{rate:>10.0f}")
+    finally:
+        transport.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
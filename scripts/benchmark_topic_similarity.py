@@ -0,0 +1,153 @@
+"""Compare topic duplicate checks: linear weighted-Jaccard scan vs ``TopicSimilarityIndex``.
+
+Generates a synthetic registry and, for each size, times the checks below. Each phrase mixes
+frequent German function words with a Zipf-distributed content vocabulary (titles carry fewer
+function words than rotations); ``--pure-zipf`` draws every token from one Zipf vocabulary
+instead, a harsher case where even a query's rarest tokens are common.
+
+- ``linear``: the pre-index ``is_duplicate_topic`` loop, ``calculate_topic_similarity``
+  against every row (re-tokenizing both sides per pair).
+- ``index``: building the inverted index once, then querying it.
+
+Both paths must agree on every duplicate verdict (and on the matched topic and score for
+duplicates); the script exits non-zero if they do not.
+
+Usage:
+
+    python scripts/benchmark_topic_similarity.py
+    python scripts/benchmark_topic_similarity.py --sizes 1000 10000 100000 --queries 50
+    python scripts/benchmark_topic_similarity.py --pure-zipf --vocabulary 5000
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import structlog  # noqa: E402
+
+from app.features.topics.deduplication import (  # noqa: E402
+    TopicSimilarityIndex,
+    calculate_topic_similarity,
+    is_duplicate_topic,
+)
+
+THRESHOLD = 0.35
+
+
+FUNCTION_WORDS = (
+    "der die das und ist nicht mit für auf den dem ein eine du dich dir bei von zu im "
+    "es wie was wenn aber oder noch nur auch schon sich hat haben kann kein keine"
+).split()
+
+Vocabulary = Tuple[List[str], List[float]]
+
+
+def _vocabulary(size: int, rng: random.Random) -> Vocabulary:
+    letters = "abcdefghiklmnoprstuwäöüß"
+    words = ["".join(rng.choice(letters) for _ in range(rng.randint(4, 12))) for _ in range(size)]
+    weights = [1.0 / (rank + 1) for rank in range(size)]
+    return words, weights
+
+
+def _topics(
+    count: int,
+    rng: random.Random,
+    vocabulary: Vocabulary,
+    *,
+    pure_zipf: bool,
+    prefix: str = "topic",
+) -> List[Dict[str, Any]]:
+    words, weights = vocabulary
+
+    def phrase(low: int, high: int, function_word_share: float) -> str:
+        length = rng.randint(low, high)
+        if pure_zipf:
+            return " ".join(rng.choices(words, weights=weights, k=length))
+        return " ".join(
+            rng.choice(FUNCTION_WORDS) if rng.random() < function_word_share
+            else rng.choices(words, weights=weights)[0]
+            for _ in range(length)
+        )
+
+    return [
+        {
+            "id": f"{prefix}-{index}",
+            "title": phrase(3, 8, 0.2),
+            "rotation": phrase(8, 20, 0.45),
+            "cta": phrase(2, 6, 0.4),
+        }
+        for index in range(count)
+    ]
+
+
+def _linear(query: Dict[str, Any], existing: List[Dict[str, Any]]) -> Tuple[bool, Any, float]:
+    max_similarity = 0.0
+    matched = None
+    for row in existing:
+        similarity = calculate_topic_similarity(
+            query["title"], query["rotation"], query["cta"], row["title"], row["rotation"], row["cta"]
+        )
+        if similarity > max_similarity:
+            max_similarity = similarity
+            matched = row.get("id")
+        if similarity >= THRESHOLD:
+            return True, matched, similarity
+    return False, matched, max_similarity
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=30, help="Novel topics checked per size")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--vocabulary", type=int, default=30000, help="Distinct content words")
+    parser.add_argument("--pure-zipf", action="store_true", help="Draw every token from one Zipf vocabulary")
+    args = parser.parse_args()
+
+    # Per-call info/debug logs would dominate both timings.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    rng = random.Random(args.seed)
+    vocabulary = _vocabulary(args.vocabulary, rng)
+
+    print(f"{'topics':>8}{'build':>10}{'linear p50':>13}{'index p50':>12}{'speedup':>10}")
+    for size in args.sizes:
+        existing = _topics(size, rng, vocabulary, pure_zipf=args.pure_zipf)
+        queries = _topics(args.queries, rng, vocabulary, pure_zipf=args.pure_zipf, prefix="query")
+
+        started = time.perf_counter()
+        index = TopicSimilarityIndex(existing)
+        build_ms = (time.perf_counter() - started) * 1000.0
+
+        linear_ms: List[float] = []
+        index_ms: List[float] = []
+        for query in queries:
+            started = time.perf_counter()
+            expected = _linear(query, existing)
+            linear_ms.append((time.perf_counter() - started) * 1000.0)
+
+            started = time.perf_counter()
+            actual = is_duplicate_topic(query["title"], query["rotation"], query["cta"], index, THRESHOLD)
+            index_ms.append((time.perf_counter() - started) * 1000.0)
+            if actual[0] != expected[0] or (expected[0] and actual != expected):
+                sys.exit(f"mismatch at {size} topics: index={actual} linear={expected}")
+
+        linear_p50 = statistics.median(linear_ms)
+        index_p50 = statistics.median(index_ms)
+        print(
+            f"{size:>8}{build_ms:>8.0f}ms{linear_p50:>11.2f}ms{index_p50:>10.2f}ms"
+            f"{linear_p50 / max(index_p50, 1e-6):>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare provider status calls per completed video: fixed sweep vs adaptive poll schedule.
+
+Simulates a batch of Veo operations with render times drawn around each route's typical latency and
+counts how many provider status checks each strategy spends before it observes completion, plus the
+detection lag (time between the provider finishing and the poller noticing). No network access.
+
+Usage:
+
+    python scripts/benchmark_video_poll_schedule.py
+    python scripts/benchmark_video_poll_schedule.py --videos 500 --seed 7
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.core.video_profiles import (  # noqa: E402
+    SHORT_VIDEO_ROUTE,
+    VEO_EXTENDED_VIDEO_ROUTE,
+    VEO_SEGMENTED_VIDEO_ROUTE,
+    compute_next_video_poll_at,
+)
+
+FIXED_POLL_INTERVAL_SECONDS = 10
+# Observed provider render time ranges (seconds) per operation on each route.
+_RENDER_SECONDS = {
+    SHORT_VIDEO_ROUTE: (50, 180),
+    VEO_EXTENDED_VIDEO_ROUTE: (45, 150),
+    VEO_SEGMENTED_VIDEO_ROUTE: (60, 200),
+}
+
+
+def _fixed_sweep(render_seconds: float) -> Tuple[int, float]:
+    # The sweep's phase relative to submit is arbitrary; the first tick lands within one interval.
+    offset = random.uniform(0, FIXED_POLL_INTERVAL_SECONDS)
+    calls = 0
+    checked_at = offset
+    while True:
+        calls += 1
+        if checked_at >= render_seconds:
+            return calls, checked_at - render_seconds
+        checked_at += FIXED_POLL_INTERVAL_SECONDS
+
+
+def _adaptive(route: str, render_seconds: float) -> Tuple[int, float]:
+    submitted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    done_at = submitted_at + timedelta(seconds=render_seconds)
+    due_at = compute_next_video_poll_at(route, anchor=submitted_at, attempt=0)
+    attempt = 0
+    calls = 0
+    while True:
+        # The poller only notices a due operation on its next sweep tick.
+        checked_at = due_at + timedelta(seconds=random.uniform(0, FIXED_POLL_INTERVAL_SECONDS))
+        calls += 1
+        if checked_at >= done_at:
+            return calls, (checked_at - done_at).total_seconds()
+        attempt += 1
+        due_at = compute_next_video_poll_at(route, anchor=checked_at, attempt=attempt)
+
+
+def run(videos: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for route, (low, high) in _RENDER_SECONDS.items():
+        fixed_calls: List[int] = []
+        fixed_lag: List[float] = []
+        adaptive_calls: List[int] = []
+        adaptive_lag: List[float] = []
+        for _ in range(videos):
+            render_seconds = random.uniform(low, high)
+            calls, lag = _fixed_sweep(render_seconds)
+            fixed_calls.append(calls)
+            fixed_lag.append(lag)
+            calls, lag = _adaptive(route, render_seconds)
+            adaptive_calls.append(calls)
+            adaptive_lag.append(lag)
+        results[route] = {
+            "fixed_calls_per_video": statistics.mean(fixed_calls),
+            "adaptive_calls_per_video": statistics.mean(adaptive_calls),
+            "fixed_detection_lag_s": statistics.mean(fixed_lag),
+            "adaptive_detection_lag_s": statistics.mean(adaptive_lag),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--videos", type=int, default=1000, help="Simulated operations per route")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    results = run(args.videos)
+    print(f"{'route':<16}{'fixed calls':>13}{'adaptive calls':>16}{'saved':>8}{'fixed lag':>12}{'adaptive lag':>14}")
+    for route, row in results.items():
+        saved = 1 - row["adaptive_calls_per_video"] / row["fixed_calls_per_video"]
+        print(
+            f"{route:<16}"
+            f"{row['fixed_calls_per_video']:>13.1f}"
+            f"{row['adaptive_calls_per_video']:>16.1f}"
+            f"{saved:>8.0%}"
+            f"{row['fixed_detection_lag_s']:>11.1f}s"
+            f"{row['adaptive_detection_lag_s']:>13.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
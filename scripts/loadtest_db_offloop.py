@@ -0,0 +1,157 @@
+"""Measure /health and /batches/{id}/status latency while a slow database query is in flight.
+
+Drives the real FastAPI app in-process through ``httpx.ASGITransport``. Batch reads are replaced
+with stubs that sleep like PostgREST round trips (a few ms normally, ``--slow-seconds`` for one
+"slow" batch), so no Supabase project is needed. Each scenario reports p50/p99 for both routes,
+first on an idle app and then while requests for the slow batch are running:
+
+- ``offloop``: the handlers as shipped, with database calls on the ``run_db`` thread pool.
+- ``inline``: ``run_db`` swapped for a direct call, reproducing queries on the event loop.
+
+Usage:
+
+    python scripts/loadtest_db_offloop.py
+    python scripts/loadtest_db_offloop.py --requests 400 --concurrency 16 --slow-seconds 2
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+for _name, _value in {
+    "SUPABASE_URL": "https://example.supabase.co",
+    "SUPABASE_KEY": "loadtest-key",
+    "SUPABASE_SERVICE_KEY": "loadtest-service-key",
+    "GEMINI_API_KEY": "loadtest-google-key",
+    "CLOUDFLARE_R2_ACCOUNT_ID": "loadtest",
+    "CLOUDFLARE_R2_ACCESS_KEY_ID": "loadtest",
+    "CLOUDFLARE_R2_SECRET_ACCESS_KEY": "loadtest",
+    "CLOUDFLARE_R2_BUCKET_NAME": "loadtest",
+    "CLOUDFLARE_R2_PUBLIC_BASE_URL": "https://example.r2.dev",
+    "CRON_SECRET": "loadtest-cron-secret",
+    "DISABLE_STARTUP_RECOVERY_CHECKS": "1",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import httpx  # noqa: E402
+
+import app.main as app_main  # noqa: E402
+from app.features.batches import handlers as batch_handlers  # noqa: E402
+
+SLOW_BATCH_ID = "slow-batch"
+FAST_BATCH_ID = "fast-batch"
+QUERY_SECONDS = 0.004
+
+
+def _install_stubs(slow_seconds: float) -> None:
+    def get_batch_by_id(batch_id: str) -> Dict:
+        time.sleep(slow_seconds if batch_id == SLOW_BATCH_ID else QUERY_SECONDS)
+        return {
+            "id": batch_id,
+            "state": "S2_SEEDED",
+            "post_type_counts": {},
+            "creation_mode": "manual",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+        }
+
+    def get_batch_posts_summary(batch_id: str) -> Dict:
+        time.sleep(QUERY_SECONDS)
+        return {"posts_count": 0, "posts_by_state": {}}
+
+    def get_seeding_progress(batch_id: str) -> Dict:
+        time.sleep(QUERY_SECONDS)
+        return {"stage": "completed"}
+
+    batch_handlers.get_batch_by_id = get_batch_by_id
+    batch_handlers.get_batch_posts_summary = get_batch_posts_summary
+    batch_handlers.get_seeding_progress = get_seeding_progress
+    app_main._probe_database_health = lambda: True
+
+
+async def _inline_run_db(fn, /, *args, **kwargs):
+    return fn(*args, **kwargs)
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(percentile / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def _timed_get(client: httpx.AsyncClient, path: str) -> float:
+    started = time.perf_counter()
+    response = await client.get(path)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    if response.status_code != 200:
+        raise RuntimeError(f"GET {path} returned {response.status_code}: {response.text[:200]}")
+    return elapsed_ms
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    path: str,
+    requests: int,
+    concurrency: int,
+) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> float:
+        async with semaphore:
+            return await _timed_get(client, path)
+
+    return list(await asyncio.gather(*(one() for _ in range(requests))))
+
+
+async def _scenario(requests: int, concurrency: int, slow_inflight: int) -> Dict[str, Tuple[float, float]]:
+    transport = httpx.ASGITransport(app=app_main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        await _timed_get(client, "/health")
+        slow_tasks = [
+            asyncio.create_task(client.get(f"/batches/{SLOW_BATCH_ID}/status"))
+            for _ in range(slow_inflight)
+        ]
+        await asyncio.sleep(0.05)
+        health, status = await asyncio.gather(
+            _drive(client, "/health", requests, concurrency),
+            _drive(client, f"/batches/{FAST_BATCH_ID}/status", requests, concurrency),
+        )
+        await asyncio.gather(*slow_tasks)
+    return {
+        "/health": (statistics.median(health), _percentile(health, 99)),
+        "/batches/{id}/status": (statistics.median(status), _percentile(status, 99)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="In-flight requests per route")
+    parser.add_argument("--slow-seconds", type=float, default=1.0, help="Duration of the slow batch query")
+    parser.add_argument("--slow-inflight", type=int, default=2, help="Concurrent slow-batch requests")
+    args = parser.parse_args()
+
+    _install_stubs(args.slow_seconds)
+    shipped_run_db = batch_handlers.run_db
+    print(f"{'mode':<9}{'slow query':<12}{'route':<22}{'p50':>10}{'p99':>10}")
+    for mode, run_db in (("offloop", shipped_run_db), ("inline", _inline_run_db)):
+        batch_handlers.run_db = run_db
+        for slow_inflight in (0, args.slow_inflight):
+            results = asyncio.run(_scenario(args.requests, args.concurrency, slow_inflight))
+            label = f"{slow_inflight} x {args.slow_seconds:g}s" if slow_inflight else "none"
+            for route, (p50, p99) in results.items():
+                print(f"{mode:<9}{label:<12}{route:<22}{p50:>8.1f}ms{p99:>8.1f}ms")
+    batch_handlers.run_db = shipped_run_db
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Report how the shared provider rate limit budget was used, per tenant (read-only).
+
+Shows, for each process role that drew from a provider/model bucket: requests granted,
+times it was told to wait, 429s it reported, and its share of the granted requests, plus
+the bucket's current rate scale (1.0 = full budget, lower = still backing off after 429s).
+
+Usage (from the worktree, venv active so .env credentials load):
+
+    python scripts/provider_rate_limit_usage.py --model gemini-2.5-pro
+    python scripts/provider_rate_limit_usage.py --provider vertex_gemini --model gemini-2.5-flash --minutes 15 --json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.adapters.provider_rate_limiter import get_provider_rate_limiter  # noqa: E402
+from app.adapters.vertex_gemini_client import VERTEX_GEMINI_RATE_LIMIT_PROVIDER  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", default=VERTEX_GEMINI_RATE_LIMIT_PROVIDER)
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--minutes", type=int, default=60, help="Look-back window")
+    parser.add_argument("--json", action="store_true", help="Print the raw report")
+    args = parser.parse_args()
+
+    report = get_provider_rate_limiter().usage(args.provider, args.model, since_minutes=args.minutes)
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+        return 0
+
+    print(f"{args.provider} {args.model} since {report.get('since')} (rate scale {report.get('rate_scale')})")
+    tenants = report.get("tenants") or []
+    if not tenants:
+        print("  no usage recorded")
+        return 0
+    print(f"  {'tenant':<28}{'granted':>9}{'throttled':>11}{'429s':>7}{'share':>8}")
+    for row in tenants:
+        print(
+            f"  {str(row.get('tenant')):<28}{row.get('granted', 0):>9}{row.get('throttled', 0):>11}"
+            f"{row.get('rate_limited', 0):>7}{float(row.get('share') or 0):>8.1%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
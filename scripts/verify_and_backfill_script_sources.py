@@ -5,10 +5,11 @@ Workflow:
   2. Collect every distinct URL from ``primary_source_url`` and
      ``source_urls[*].url`` (and the same fields on the most-recent dossier
      per topic, used as a fallback).
-  3. HEAD/GET each URL once in parallel and classify it as alive / dead.
+  3. HEAD/GET each URL once in parallel through the shared URL reachability
+     service and classify it as alive / dead.
      - Alive: any 2xx/3xx, or 4xx that is not 404/410 (bot-blocks like 403
-       still indicate the page exists).
-     - Dead: 404, 410, DNS / connection errors, TLS errors, timeouts.
+       still indicate the page exists), 5xx, timeouts and TLS errors.
+     - Dead: 404, 410, DNS failures and refused connections.
   4. Rewrite each script:
        - Drop dead URLs from ``source_urls``.
        - If ``primary_source_url`` is dead, promote the first surviving
@@ -32,108 +33,44 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 from app.adapters.supabase_client import get_supabase
+from app.adapters.url_reachability import UrlProbeResult, get_url_reachability_service
 
-LIVENESS_TIMEOUT = 10  # seconds, per curl request
-LIVENESS_WORKERS = 24
-USER_AGENT = (
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) "
-    "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15"
-)
-# Definite-dead status codes returned by curl. 4xx that are NOT here are
-# kept (403/401/429 typically indicate the page exists but blocks scrapers).
+LIVENESS_CHUNK_SIZE = 200  # URLs per parallel round-trip (progress is printed between chunks)
+# Definite-dead status codes. 4xx that are NOT here are kept (403/401/429
+# typically indicate the page exists but blocks scrapers).
 DEAD_STATUS_CODES = {404, 410}
+# Connect errors that mean the host is gone rather than unreachable from here.
+_DEAD_CONNECT_MARKERS = (
+    "name or service not known",
+    "nodename nor servname",
+    "getaddrinfo failed",
+    "no address associated",
+    "connection refused",
+)
 
 
-def _probe_url(url: str) -> bool:
-    """Return True if URL is alive (page presumed to exist).
-
-    Uses system curl so the probe benefits from modern TLS — Python 3.9's
-    bundled OpenSSL fails handshakes with many EU government sites.
+def _is_alive(result: UrlProbeResult) -> bool:
+    """Return True if the URL is presumed to exist.
 
     Conservative classification:
-      * HTTP 2xx/3xx  → alive
-      * HTTP 4xx (except 404/410) → alive (auth wall / bot-block)
-      * HTTP 5xx     → alive (transient outage, URL still exists)
-      * 404 or 410   → DEAD
-      * curl exit 6  (DNS NXDOMAIN) → DEAD
-      * curl exit 7  (connection refused) → DEAD
-      * Any other transport / TLS error → ALIVE (page presumed real, just
-        unreachable from this host)
+      * HTTP 404 or 410                → DEAD
+      * DNS failure / connection refused → DEAD
+      * Any other HTTP status          → ALIVE (auth wall, bot-block, outage)
+      * Timeouts, TLS and other transport errors → ALIVE (page presumed real,
+        just unreachable from this host)
     """
-    try:
-        proc = subprocess.run(
-            [
-                "curl",
-                "-sI",  # silent + HEAD
-                "-L",  # follow redirects
-                "--max-time", str(LIVENESS_TIMEOUT),
-                "--connect-timeout", "6",
-                "-A", USER_AGENT,
-                "-o", "/dev/null",
-                "-w", "%{http_code}",
-                url,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=LIVENESS_TIMEOUT + 4,
-        )
-    except subprocess.TimeoutExpired:
-        return True  # timeout → presumed alive
-    except FileNotFoundError:
-        # curl not present on PATH; bail out conservatively.
-        return True
-
-    exit_code = proc.returncode
-    if exit_code in (6, 7):  # 6=DNS, 7=conn refused
-        return False
-    try:
-        status = int((proc.stdout or "0").strip())
-    except ValueError:
-        status = 0
-
-    # Some servers reject HEAD. If we got 0 or 405/501, retry with GET-discard.
-    if status in (0, 405, 501):
-        try:
-            proc = subprocess.run(
-                [
-                    "curl",
-                    "-s",
-                    "-L",
-                    "--max-time", str(LIVENESS_TIMEOUT),
-                    "--connect-timeout", "6",
-                    "-A", USER_AGENT,
-                    "-o", "/dev/null",
-                    "-w", "%{http_code}",
-                    url,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=LIVENESS_TIMEOUT + 4,
-            )
-        except subprocess.TimeoutExpired:
-            return True
-        exit_code = proc.returncode
-        if exit_code in (6, 7):
-            return False
-        try:
-            status = int((proc.stdout or "0").strip())
-        except ValueError:
-            status = 0
-
-    if status in DEAD_STATUS_CODES:
-        return False
-    if status == 0:
-        # transport-level error (TLS, reset, timeout). Presume alive.
-        return True
-    return True  # any HTTP status other than 404/410 → alive
+    if result.status_code is not None:
+        return result.status_code not in DEAD_STATUS_CODES
+    if result.error_kind == "connect":
+        message = (result.error or "").lower()
+        return not any(marker in message for marker in _DEAD_CONNECT_MARKERS)
+    return True
 
 
 def _build_liveness_map(
@@ -148,25 +85,18 @@ def _build_liveness_map(
             cache = json.loads(cache_path.read_text())
         except json.JSONDecodeError:
             cache = {}
-    to_check = [u for u in urls if u not in cache]
+    to_check = sorted(u for u in urls if u not in cache)
     print(f"[verify] {len(urls)} distinct URLs, {len(to_check)} not cached")
     if not to_check:
         return cache
 
     t0 = time.time()
-    with ThreadPoolExecutor(max_workers=LIVENESS_WORKERS) as pool:
-        futures = {pool.submit(_probe_url, u): u for u in to_check}
-        done = 0
-        for future in as_completed(futures):
-            url = futures[future]
-            try:
-                alive = future.result()
-            except Exception:  # noqa: BLE001
-                alive = True  # conservative: errors → alive
-            cache[url] = alive
-            done += 1
-            if done % 100 == 0:
-                print(f"[verify]   probed {done}/{len(to_check)}...")
+    service = get_url_reachability_service()
+    for offset in range(0, len(to_check), LIVENESS_CHUNK_SIZE):
+        chunk = to_check[offset : offset + LIVENESS_CHUNK_SIZE]
+        for url, result in service.probe_many(chunk).items():
+            cache[url] = _is_alive(result)
+        print(f"[verify]   probed {min(offset + len(chunk), len(to_check))}/{len(to_check)}...")
     print(f"[verify] probed {len(to_check)} URLs in {time.time() - t0:.1f}s")
     alive_count = sum(1 for u in to_check if cache.get(u))
     print(f"[verify]   {alive_count} alive, {len(to_check) - alive_count} dead")
@@ -204,6 +204,99 @@
         window.alert(message);
     });
 
+    // One progress stream per open batch page. It survives the outerHTML swaps it
+    // triggers; the 60s hx-trigger fallback covers a dropped connection. The hub
+    // sends one progress.changed per poll, and refreshes are throttled on top so a
+    // steady stream of events still re-renders at least every few seconds. A
+    // stream-triggered refresh names its event so the server renders it from the
+    // detail the hub shares across every open page.
+    const PROGRESS_REFRESH_EVENTS = new Set([
+        'progress.changed',
+        'interaction.complete',
+        'interaction.failed',
+    ]);
+    const PROGRESS_REFRESH_DEBOUNCE_MS = 750;
+    const PROGRESS_REFRESH_MAX_WAIT_MS = 5000;
+    let progressSource = null;
+    let progressSourceBatchId = null;
+    let progressRefreshTimer = null;
+    let progressRefreshPendingSince = null;
+    let progressRefreshEventId = null;
+
+    const closeBatchProgressStream = () => {
+        if (progressSource) {
+            progressSource.close();
+        }
+        progressSource = null;
+        progressSourceBatchId = null;
+        clearTimeout(progressRefreshTimer);
+        progressRefreshPendingSince = null;
+        progressRefreshEventId = null;
+    };
+
+    const runBatchProgressRefresh = () => {
+        progressRefreshPendingSince = null;
+        const root = document.querySelector('#batch-detail-root');
+        if (root && window.htmx) {
+            window.htmx.trigger(root, 'batch-progress');
+        }
+    };
+
+    const scheduleBatchProgressRefresh = () => {
+        const now = Date.now();
+        if (progressRefreshPendingSince === null) {
+            progressRefreshPendingSince = now;
+        }
+        const maxWaitLeft = progressRefreshPendingSince + PROGRESS_REFRESH_MAX_WAIT_MS - now;
+        clearTimeout(progressRefreshTimer);
+        progressRefreshTimer = setTimeout(
+            runBatchProgressRefresh,
+            Math.max(0, Math.min(PROGRESS_REFRESH_DEBOUNCE_MS, maxWaitLeft)),
+        );
+    };
+
+    const syncBatchProgressStream = () => {
+        const root = document.querySelector('#batch-detail-root');
+        const streamUrl = root?.dataset.progressStream;
+        if (!streamUrl || !window.EventSource) {
+            closeBatchProgressStream();
+            return;
+        }
+        if (progressSource && progressSourceBatchId === root.dataset.batchId) {
+            return;
+        }
+        closeBatchProgressStream();
+        progressSourceBatchId = root.dataset.batchId;
+        progressSource = new window.EventSource(streamUrl);
+        progressSource.onmessage = (message) => {
+            let event = null;
+            try {
+                event = JSON.parse(message.data);
+            } catch (_error) {
+                return;
+            }
+            if (PROGRESS_REFRESH_EVENTS.has(event?.event_type)) {
+                progressRefreshEventId = event.event_id || progressRefreshEventId;
+                scheduleBatchProgressRefresh();
+            }
+        };
+    };
+
+    document.body.addEventListener('htmx:configRequest', (event) => {
+        if (event.detail?.triggeringEvent?.type !== 'batch-progress' || !progressRefreshEventId) {
+            return;
+        }
+        event.detail.parameters.progress_event = progressRefreshEventId;
+    });
+
+    document.body.addEventListener('htmx:afterSettle', syncBatchProgressStream);
+    window.addEventListener('pagehide', closeBatchProgressStream);
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', syncBatchProgressStream);
+    } else {
+        syncBatchProgressStream();
+    }
+
     window.videoSettingsComponent = function (options = {}) {
         const DEFAULT_MODEL = 'veo-3.1-fast-generate-001';
         const CHARACTER_CONSISTENCY_MODEL = 'veo-3.1-generate-001';
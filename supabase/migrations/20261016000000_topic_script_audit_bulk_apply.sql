@@ -0,0 +1,84 @@
+-- Apply one audit-worker cycle in a single statement instead of a select + update
+-- + family sync round trip per script. Mirrors update_script_quality: bump
+-- audit_attempts, stamp audited_at, then mark each touched family active when any
+-- of its scripts passed (quarantined families are left alone).
+
+CREATE OR REPLACE FUNCTION public.apply_topic_script_audits(
+  p_results JSONB
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+  updated_count INTEGER;
+BEGIN
+  IF pg_catalog.jsonb_typeof(p_results) IS DISTINCT FROM 'array'
+     OR pg_catalog.jsonb_array_length(p_results) > 500 THEN
+    RAISE EXCEPTION 'topic script audit results contract is invalid';
+  END IF;
+
+  WITH item AS (
+    SELECT DISTINCT ON (result.id)
+      result.id,
+      result.quality_score,
+      COALESCE(result.quality_notes, '') AS quality_notes,
+      result.audit_status
+    FROM pg_catalog.jsonb_to_recordset(p_results)
+      AS result(id UUID, quality_score INTEGER, quality_notes TEXT, audit_status TEXT)
+    WHERE result.id IS NOT NULL
+      AND result.audit_status IN ('pass', 'needs_repair', 'reject')
+  ),
+  updated AS (
+    UPDATE public.topic_scripts AS script
+    SET quality_score = item.quality_score,
+        quality_notes = item.quality_notes,
+        audit_status = item.audit_status,
+        audit_attempts = script.audit_attempts + 1,
+        audited_at = pg_catalog.now()
+    FROM item
+    WHERE script.id = item.id
+    RETURNING script.topic_registry_id
+  ),
+  families AS (
+    SELECT DISTINCT updated.topic_registry_id
+    FROM updated
+    WHERE updated.topic_registry_id IS NOT NULL
+  ),
+  synced AS (
+    UPDATE public.topic_registry AS registry
+    SET status = CASE
+      WHEN EXISTS (
+        SELECT 1
+        FROM public.topic_scripts AS family_script
+        WHERE family_script.topic_registry_id = registry.id
+          AND (
+            family_script.audit_status = 'pass'
+            OR EXISTS (
+              SELECT 1
+              FROM item
+              WHERE item.id = family_script.id
+                AND item.audit_status = 'pass'
+            )
+          )
+      ) THEN 'active'
+      ELSE 'provisional'
+    END
+    FROM families
+    WHERE registry.id = families.topic_registry_id
+      AND registry.status IS DISTINCT FROM 'quarantined'
+    RETURNING registry.id
+  )
+  SELECT pg_catalog.count(*)::INTEGER
+  INTO updated_count
+  FROM updated;
+
+  RETURN updated_count;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.apply_topic_script_audits(JSONB)
+  FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.apply_topic_script_audits(JSONB)
+  TO service_role;
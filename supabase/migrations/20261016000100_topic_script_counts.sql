@@ -0,0 +1,34 @@
+-- Per-family script totals in one round trip. Topic selection used to fetch every
+-- resolved script (or one query per family) just to count them. The result is a
+-- single JSONB object so PostgREST's max-rows cap never truncates it:
+--   { "<topic_registry_id>": [script_count, used_script_count], ... }
+
+CREATE OR REPLACE FUNCTION public.get_topic_script_counts()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+  SELECT COALESCE(
+    pg_catalog.jsonb_object_agg(
+      counts.topic_registry_id::TEXT,
+      pg_catalog.jsonb_build_array(counts.script_count, counts.used_script_count)
+    ),
+    '{}'::JSONB
+  )
+  FROM (
+    SELECT
+      script.topic_registry_id,
+      pg_catalog.count(*)::INTEGER AS script_count,
+      (pg_catalog.count(*) FILTER (WHERE COALESCE(script.use_count, 0) > 0))::INTEGER AS used_script_count
+    FROM public.topic_scripts AS script
+    WHERE script.topic_registry_id IS NOT NULL
+    GROUP BY script.topic_registry_id
+  ) AS counts;
+$$;
+
+REVOKE ALL ON FUNCTION public.get_topic_script_counts()
+  FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_topic_script_counts()
+  TO service_role;
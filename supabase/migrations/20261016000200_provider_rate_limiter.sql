@@ -0,0 +1,215 @@
+-- Cross-process rate limiter for AI provider calls (see app/adapters/provider_rate_limiter.py).
+-- One token bucket per provider and model, shared by the API server and every worker.
+-- A 429 anywhere halves the bucket's refill rate (rate_scale) and pauses it until the
+-- provider's Retry-After has passed; the rate then recovers linearly. Usage is recorded
+-- per tenant (process role) per minute so utilization can be reported.
+
+CREATE TABLE IF NOT EXISTS public.provider_rate_limit_buckets (
+  provider TEXT NOT NULL,
+  model TEXT NOT NULL,
+  tokens DOUBLE PRECISION NOT NULL DEFAULT 0,
+  rate_scale DOUBLE PRECISION NOT NULL DEFAULT 1 CHECK (rate_scale > 0 AND rate_scale <= 1),
+  penalty_until TIMESTAMPTZ,
+  refilled_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (provider, model)
+);
+
+CREATE TABLE IF NOT EXISTS public.provider_rate_limit_usage (
+  provider TEXT NOT NULL,
+  model TEXT NOT NULL,
+  tenant TEXT NOT NULL,
+  window_start TIMESTAMPTZ NOT NULL,
+  granted_count INTEGER NOT NULL DEFAULT 0,
+  throttled_count INTEGER NOT NULL DEFAULT 0,
+  rate_limited_count INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (provider, model, tenant, window_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_provider_rate_limit_usage_window
+  ON public.provider_rate_limit_usage(provider, model, window_start DESC);
+
+CREATE OR REPLACE FUNCTION public.acquire_provider_rate_limit(
+  p_provider TEXT,
+  p_model TEXT,
+  p_tenant TEXT,
+  p_requests_per_minute DOUBLE PRECISION,
+  p_burst DOUBLE PRECISION,
+  p_recovery_seconds DOUBLE PRECISION
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+  v_now TIMESTAMPTZ := pg_catalog.clock_timestamp();
+  v_bucket public.provider_rate_limit_buckets%ROWTYPE;
+  v_elapsed DOUBLE PRECISION;
+  v_rate DOUBLE PRECISION;
+  v_granted BOOLEAN := FALSE;
+  v_wait DOUBLE PRECISION := 0;
+BEGIN
+  INSERT INTO public.provider_rate_limit_buckets (provider, model, tokens, refilled_at)
+  VALUES (p_provider, p_model, p_burst, v_now)
+  ON CONFLICT (provider, model) DO NOTHING;
+
+  SELECT * INTO v_bucket
+  FROM public.provider_rate_limit_buckets
+  WHERE provider = p_provider AND model = p_model
+  FOR UPDATE;
+
+  v_elapsed := GREATEST(EXTRACT(EPOCH FROM v_now - v_bucket.refilled_at), 0);
+  v_bucket.rate_scale := LEAST(1.0, v_bucket.rate_scale + v_elapsed / GREATEST(p_recovery_seconds, 1));
+  v_rate := GREATEST(p_requests_per_minute, 0.001) / 60.0 * v_bucket.rate_scale;
+  v_bucket.tokens := LEAST(p_burst, v_bucket.tokens + v_elapsed * v_rate);
+
+  IF v_bucket.penalty_until IS NOT NULL AND v_bucket.penalty_until > v_now THEN
+    v_bucket.tokens := 0;
+    v_wait := EXTRACT(EPOCH FROM v_bucket.penalty_until - v_now);
+  ELSIF v_bucket.tokens >= 1 THEN
+    v_bucket.tokens := v_bucket.tokens - 1;
+    v_granted := TRUE;
+  ELSE
+    v_wait := (1 - v_bucket.tokens) / v_rate;
+  END IF;
+
+  UPDATE public.provider_rate_limit_buckets
+  SET tokens = v_bucket.tokens,
+      rate_scale = v_bucket.rate_scale,
+      refilled_at = v_now
+  WHERE provider = p_provider AND model = p_model;
+
+  INSERT INTO public.provider_rate_limit_usage AS usage
+    (provider, model, tenant, window_start, granted_count, throttled_count)
+  VALUES (
+    p_provider,
+    p_model,
+    p_tenant,
+    pg_catalog.date_trunc('minute', v_now),
+    CASE WHEN v_granted THEN 1 ELSE 0 END,
+    CASE WHEN v_granted THEN 0 ELSE 1 END
+  )
+  ON CONFLICT (provider, model, tenant, window_start) DO UPDATE
+  SET granted_count = usage.granted_count + EXCLUDED.granted_count,
+      throttled_count = usage.throttled_count + EXCLUDED.throttled_count;
+
+  RETURN pg_catalog.jsonb_build_object(
+    'granted', v_granted,
+    'wait_seconds', v_wait,
+    'tokens', v_bucket.tokens,
+    'rate_scale', v_bucket.rate_scale
+  );
+END;
+$$;
+
+-- Concurrent 429s from one burst arrive while the first one's pause is still running;
+-- only the first halves the rate, so a burst does not collapse it to the floor.
+CREATE OR REPLACE FUNCTION public.report_provider_rate_limited(
+  p_provider TEXT,
+  p_model TEXT,
+  p_tenant TEXT,
+  p_retry_after_seconds DOUBLE PRECISION,
+  p_min_scale DOUBLE PRECISION
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+  v_now TIMESTAMPTZ := pg_catalog.clock_timestamp();
+  v_resume_at TIMESTAMPTZ := v_now + pg_catalog.make_interval(secs => GREATEST(p_retry_after_seconds, 0));
+  v_bucket public.provider_rate_limit_buckets%ROWTYPE;
+BEGIN
+  INSERT INTO public.provider_rate_limit_buckets (provider, model, tokens, refilled_at)
+  VALUES (p_provider, p_model, 0, v_now)
+  ON CONFLICT (provider, model) DO NOTHING;
+
+  UPDATE public.provider_rate_limit_buckets
+  SET rate_scale = CASE
+        WHEN penalty_until IS NOT NULL AND penalty_until > v_now THEN rate_scale
+        ELSE GREATEST(p_min_scale, rate_scale * 0.5)
+      END,
+      tokens = 0,
+      penalty_until = GREATEST(COALESCE(penalty_until, v_now), v_resume_at),
+      refilled_at = v_now
+  WHERE provider = p_provider AND model = p_model
+  RETURNING * INTO v_bucket;
+
+  INSERT INTO public.provider_rate_limit_usage AS usage
+    (provider, model, tenant, window_start, rate_limited_count)
+  VALUES (p_provider, p_model, p_tenant, pg_catalog.date_trunc('minute', v_now), 1)
+  ON CONFLICT (provider, model, tenant, window_start) DO UPDATE
+  SET rate_limited_count = usage.rate_limited_count + 1;
+
+  RETURN pg_catalog.jsonb_build_object(
+    'rate_scale', v_bucket.rate_scale,
+    'penalty_until', v_bucket.penalty_until
+  );
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.get_provider_rate_limit_usage(
+  p_provider TEXT,
+  p_model TEXT,
+  p_since TIMESTAMPTZ
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+  SELECT pg_catalog.jsonb_build_object(
+    'provider', p_provider,
+    'model', p_model,
+    'since', p_since,
+    'rate_scale', (
+      SELECT bucket.rate_scale
+      FROM public.provider_rate_limit_buckets AS bucket
+      WHERE bucket.provider = p_provider AND bucket.model = p_model
+    ),
+    'tenants', COALESCE(
+      pg_catalog.jsonb_agg(
+        pg_catalog.jsonb_build_object(
+          'tenant', totals.tenant,
+          'granted', totals.granted,
+          'throttled', totals.throttled,
+          'rate_limited', totals.rate_limited,
+          'share', CASE WHEN totals.all_granted > 0 THEN totals.granted::DOUBLE PRECISION / totals.all_granted ELSE 0 END
+        )
+        ORDER BY totals.granted DESC, totals.tenant
+      ),
+      '[]'::JSONB
+    )
+  )
+  FROM (
+    SELECT
+      usage.tenant,
+      pg_catalog.sum(usage.granted_count)::INTEGER AS granted,
+      pg_catalog.sum(usage.throttled_count)::INTEGER AS throttled,
+      pg_catalog.sum(usage.rate_limited_count)::INTEGER AS rate_limited,
+      pg_catalog.sum(pg_catalog.sum(usage.granted_count)) OVER ()::INTEGER AS all_granted
+    FROM public.provider_rate_limit_usage AS usage
+    WHERE usage.provider = p_provider
+      AND usage.model = p_model
+      AND usage.window_start >= pg_catalog.date_trunc('minute', p_since)
+    GROUP BY usage.tenant
+  ) AS totals;
+$$;
+
+REVOKE ALL ON TABLE public.provider_rate_limit_buckets FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON TABLE public.provider_rate_limit_usage FROM PUBLIC, anon, authenticated;
+
+REVOKE ALL ON FUNCTION public.acquire_provider_rate_limit(TEXT, TEXT, TEXT, DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION)
+  FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.acquire_provider_rate_limit(TEXT, TEXT, TEXT, DOUBLE PRECISION, DOUBLE PRECISION, DOUBLE PRECISION)
+  TO service_role;
+REVOKE ALL ON FUNCTION public.report_provider_rate_limited(TEXT, TEXT, TEXT, DOUBLE PRECISION, DOUBLE PRECISION)
+  FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.report_provider_rate_limited(TEXT, TEXT, TEXT, DOUBLE PRECISION, DOUBLE PRECISION)
+  TO service_role;
+REVOKE ALL ON FUNCTION public.get_provider_rate_limit_usage(TEXT, TEXT, TIMESTAMPTZ)
+  FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_provider_rate_limit_usage(TEXT, TEXT, TIMESTAMPTZ)
+  TO service_role;
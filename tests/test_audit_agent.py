@@ -115,7 +115,7 @@ def test_get_unaudited_scripts_returns_pending_audit_rows():
         {"id": "row-1", "script": "Test script.", "target_length_tier": 8, "title": "Test"},
     ]
     mock_table = MagicMock()
-    mock_table.select.return_value.eq.return_value.limit.return_value.execute.return_value = mock_response
+    mock_table.select.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
 
     mock_client = MagicMock()
     mock_client.client.table.return_value = mock_table
@@ -169,11 +169,12 @@ def test_audit_worker_run_audit_cycle(monkeypatch):
     def mock_get_unaudited(*, limit=50):
         return mock_rows
 
-    def mock_update(*, script_id, quality_score, quality_notes, audit_status=None):
-        updated.append({"id": script_id, "score": quality_score})
+    def mock_apply(results):
+        updated.extend({"id": item["script_id"], "score": item["quality_score"]} for item in results)
+        return len(results)
 
     monkeypatch.setattr("workers.audit_worker.get_unaudited_scripts", mock_get_unaudited)
-    monkeypatch.setattr("workers.audit_worker.update_script_quality", mock_update)
+    monkeypatch.setattr("workers.audit_worker.apply_script_audit_results", mock_apply)
 
     mock_llm = MagicMock()
     mock_llm.generate_gemini_json.return_value = json.loads(_mock_llm_response(80, "pass"))
@@ -184,3 +185,175 @@ def test_audit_worker_run_audit_cycle(monkeypatch):
 
     assert len(updated) == 2
     assert all(u["score"] == 80 for u in updated)
+
+
+def test_apply_script_audit_results_writes_cycle_in_one_rpc():
+    """Bulk write must send every result in a single RPC with resolved statuses."""
+    mock_client = MagicMock()
+    mock_client.client.rpc.return_value.execute.return_value = MagicMock(data=2)
+
+    with patch("app.features.topics.queries.supabase", mock_client):
+        from app.features.topics.queries import apply_script_audit_results
+        written = apply_script_audit_results(
+            [
+                {"script_id": "r1", "quality_score": 85, "quality_notes": "{}", "audit_status": "pass"},
+                {"script_id": "r2", "quality_score": 45, "quality_notes": "{}", "audit_status": "unknown"},
+            ]
+        )
+
+    assert written == 2
+    mock_client.client.rpc.assert_called_once()
+    function_name, params = mock_client.client.rpc.call_args[0]
+    assert function_name == "apply_topic_script_audits"
+    assert [(item["id"], item["audit_status"]) for item in params["p_results"]] == [
+        ("r1", "pass"),
+        ("r2", "needs_repair"),
+    ]
+    mock_client.client.table.assert_not_called()
+
+
+def test_audit_batch_runs_llm_calls_concurrently_and_keeps_order():
+    """Concurrent mode must overlap LLM calls up to the in-flight limit."""
+    import threading
+    import time
+
+    from app.features.topics.audit import audit_batch
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def generate(**_kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return json.loads(_mock_llm_response(80, "pass"))
+
+    llm = MagicMock()
+    llm.generate_gemini_json.side_effect = generate
+    rows = [
+        {"id": f"r{index}", "script": "Dein Recht auf Mitfahrt existiert nur auf dem Papier.", "target_length_tier": 8, "title": "OEPNV"}
+        for index in range(8)
+    ]
+
+    results = audit_batch(rows, llm=llm, max_in_flight=4)
+
+    assert [result.script_id for result in results] == [row["id"] for row in rows]
+    assert 1 < state["peak"] <= 4
+
+
+def test_audit_batch_defers_scripts_that_stay_rate_limited(monkeypatch):
+    """A persistent 429 must leave the script pending instead of rejecting it."""
+    from app.core.errors import ThirdPartyError
+    from app.features.topics import audit
+
+    monkeypatch.setattr(audit, "AUDIT_RATE_LIMIT_BACKOFF_SECONDS", (0.01, 0.01))
+    llm = MagicMock()
+    llm.generate_gemini_json.side_effect = ThirdPartyError("Gemini quota", {"status_code": 429})
+    rows = [{"id": "r1", "script": "Dein Recht auf Mitfahrt existiert nur auf dem Papier.", "target_length_tier": 8, "title": "OEPNV"}]
+
+    results = audit.audit_batch(rows, llm=llm, max_in_flight=2)
+
+    assert results == []
+    assert llm.generate_gemini_json.call_count == 3
+    llm.generate_gemini_text.assert_not_called()
+
+
+def test_audit_single_script_retries_after_rate_limit(monkeypatch):
+    from app.core.errors import ThirdPartyError
+    from app.features.topics import audit
+
+    monkeypatch.setattr(audit, "AUDIT_RATE_LIMIT_BACKOFF_SECONDS", (0.01,))
+    llm = MagicMock()
+    llm.generate_gemini_json.side_effect = [
+        ThirdPartyError("Gemini request failed", {"status_code": 429, "body": "RESOURCE_EXHAUSTED"}),
+        json.loads(_mock_llm_response(82, "pass")),
+    ]
+    row = {"id": "r1", "script": "Dein Recht auf Mitfahrt existiert nur auf dem Papier.", "target_length_tier": 8, "title": "OEPNV"}
+
+    result = audit.audit_single_script(row, llm=llm)
+
+    assert result.status == "pass"
+    assert llm.generate_gemini_json.call_count == 2
+
+
+def test_rate_limit_detection_uses_status_not_message_text():
+    import httpx
+
+    from app.core.errors import ThirdPartyError
+    from app.core.rate_limit import is_rate_limit_error
+
+    request = httpx.Request("POST", "https://example.com")
+    assert is_rate_limit_error(ThirdPartyError("quota", {"status_code": 429}))
+    assert is_rate_limit_error(
+        httpx.HTTPStatusError("slow down", request=request, response=httpx.Response(429, request=request))
+    )
+    assert not is_rate_limit_error(ThirdPartyError("bad gateway", {"status_code": 502}))
+    assert not is_rate_limit_error(RuntimeError("Script r1429 failed after 4290 ms"))
+
+
+def _packed_item(script_id: str, total_score: int, status: str) -> dict:
+    return {"script_id": script_id, **json.loads(_mock_llm_response(total_score, status))}
+
+
+def test_audit_batch_packs_scripts_into_one_request_per_pack():
+    """Packed mode sends the rubric once per pack and maps results back by script id."""
+    from app.features.topics.audit import AUDIT_PACK_JSON_SCHEMA, audit_batch
+
+    rows = [
+        {"id": f"r{index}", "script": "Dein Recht auf Mitfahrt existiert nur auf dem Papier.", "target_length_tier": 8, "title": "OEPNV"}
+        for index in range(5)
+    ]
+
+    def generate(**kwargs):
+        assert kwargs["json_schema"] is AUDIT_PACK_JSON_SCHEMA
+        assert kwargs["prompt"].count("BEWERTUNGSDIMENSIONEN") == 1
+        ids = [line.split(": ", 1)[1] for line in kwargs["prompt"].splitlines() if line.startswith("SCRIPT_ID: ")]
+        # Answer out of order to prove results are matched by id, not position.
+        return {"results": [_packed_item(script_id, 80, "pass") for script_id in reversed(ids)]}
+
+    llm = MagicMock()
+    llm.generate_gemini_json.side_effect = generate
+
+    results = audit_batch(rows, llm=llm, max_in_flight=2, pack_size=3)
+
+    assert [result.script_id for result in results] == [row["id"] for row in rows]
+    assert all(result.status == "pass" for result in results)
+    assert llm.generate_gemini_json.call_count == 2
+    llm.generate_gemini_text.assert_not_called()
+
+
+def test_audit_batch_falls_back_per_item_for_missing_or_malformed_pack_results():
+    from app.features.topics.audit import AUDIT_JSON_SCHEMA, AUDIT_PACK_JSON_SCHEMA, audit_batch
+
+    rows = [
+        {"id": "ok", "script": "Dein Recht auf Mitfahrt existiert nur auf dem Papier.", "target_length_tier": 8, "title": "OEPNV"},
+        {"id": "broken", "script": "Nur 2 Prozent aller Wohnungen sind rollstuhlgerecht.", "target_length_tier": 8, "title": "Wohnen"},
+        {"id": "missing", "script": "Dein Recht auf Mitfahrt existiert nur auf dem Papier.", "target_length_tier": 8, "title": "OEPNV"},
+        {"id": "det", "script": "Zentrale Erkenntnisse: Barrierefreiheit fehlt.", "target_length_tier": 8, "title": "Test"},
+    ]
+    single_calls = []
+
+    def generate(**kwargs):
+        if kwargs["json_schema"] is AUDIT_PACK_JSON_SCHEMA:
+            broken = _packed_item("broken", 60, "needs_repair")
+            broken["hook_quality"] = {"notes": "kein Score"}
+            return {"results": [_packed_item("ok", 85, "pass"), broken, _packed_item("unknown", 90, "pass")]}
+        assert kwargs["json_schema"] is AUDIT_JSON_SCHEMA
+        single_calls.append(kwargs["prompt"])
+        return json.loads(_mock_llm_response(50, "needs_repair"))
+
+    llm = MagicMock()
+    llm.generate_gemini_json.side_effect = generate
+
+    results = audit_batch(rows, llm=llm, pack_size=8)
+
+    by_id = {result.script_id: result for result in results}
+    assert [result.script_id for result in results] == ["ok", "broken", "missing", "det"]
+    assert by_id["ok"].total_score == 85
+    assert by_id["broken"].status == "needs_repair"
+    assert by_id["missing"].status == "needs_repair"
+    assert "deterministic_reject" in by_id["det"].quality_notes
+    assert len(single_calls) == 2
@@ -230,6 +230,40 @@ class TestBatchArmHandler:
         assert storage["posts"][0]["publish_status"] == "scheduled"
         assert storage["posts"][0]["social_networks"] == ["instagram"]
 
+    def test_arm_queries_run_off_the_event_loop(self, monkeypatch):
+        import threading
+
+        from app.features.publish import arm
+
+        storage = _make_storage(num_posts=1)
+        client = _FakeClient(storage)
+        query_threads = []
+        original_table = client.table
+
+        def _table(name):
+            query_threads.append(threading.current_thread())
+            return original_table(name)
+
+        monkeypatch.setattr(client, "table", _table)
+
+        async def _arm():
+            loop_thread = threading.current_thread()
+            await arm.arm_batch_dispatch(
+                batch_id="b1",
+                request=BatchArmRequest(
+                    week_start="2036-03-24",
+                    slots=[SlotSpec(day="mon", time="09:00")],
+                    default_networks=["instagram"],
+                    posts=[PostArmSpec(post_id="p1", caption="Caption 1")],
+                ),
+                db=client,
+            )
+            return loop_thread
+
+        loop_thread = asyncio.run(_arm())
+        assert query_threads
+        assert all(thread is not loop_thread for thread in query_threads)
+
     def test_arm_rejects_batch_not_in_s7(self):
         storage = _make_storage()
         storage["batches"][0]["state"] = "S6_QA"
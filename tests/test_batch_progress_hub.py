@@ -0,0 +1,230 @@
+"""Tests for the shared per-batch progress publisher behind the SSE stream."""
+
+import asyncio
+import os
+
+import pytest
+
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+os.environ.setdefault("GEMINI_API_KEY", "test-google-key")
+os.environ.setdefault("CLOUDFLARE_R2_ACCOUNT_ID", "test-account")
+os.environ.setdefault("CLOUDFLARE_R2_ACCESS_KEY_ID", "test-access")
+os.environ.setdefault("CLOUDFLARE_R2_SECRET_ACCESS_KEY", "test-secret")
+os.environ.setdefault("CLOUDFLARE_R2_BUCKET_NAME", "test-bucket")
+os.environ.setdefault("CLOUDFLARE_R2_PUBLIC_BASE_URL", "https://example.r2.dev")
+os.environ.setdefault("CRON_SECRET", "test-cron-secret")
+
+from app.features.batches import progress_hub
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    monkeypatch.setattr(progress_hub, "BATCH_PROGRESS_POLL_SECONDS", 0.02)
+    monkeypatch.setattr(progress_hub, "BATCH_PROGRESS_KEEPALIVE_SECONDS", 0.05)
+    monkeypatch.setattr(progress_hub, "BATCH_PROGRESS_LINGER_SECONDS", 0.0)
+    monkeypatch.setattr(progress_hub, "_read_seeding_events", lambda batch_id, cursor: [])
+    instance = progress_hub.BatchProgressHub()
+    yield instance
+    instance.reset()
+
+
+def _snapshot(state="S4_SCRIPTED", video_status="pending"):
+    return {
+        "batch": {"id": "batch-1", "state": state},
+        "posts": [{"id": "post-1", "state": "S4_SCRIPTED", "video_status": video_status, "publish_status": None}],
+        "runs": [],
+    }
+
+
+async def _collect(subscription, count):
+    events = []
+    async for event in subscription:
+        if event is not None:
+            events.append(event)
+        if len(events) >= count:
+            break
+    await subscription.aclose()
+    return events
+
+
+def test_many_subscribers_share_one_database_poll(hub, monkeypatch):
+    polls = []
+
+    def _load(batch_id):
+        polls.append(batch_id)
+        return _snapshot(video_status="submitted" if len(polls) > 1 else "pending")
+
+    monkeypatch.setattr(progress_hub, "_load_progress_snapshot", _load)
+
+    async def _run():
+        results = await asyncio.gather(*(_collect(hub.subscribe("batch-1"), 2) for _ in range(25)))
+        return results
+
+    results = asyncio.run(_run())
+
+    for events in results:
+        assert [event["event_type"] for event in events] == ["progress.snapshot", "post.progress"]
+        assert events[1]["post"]["video_status"] == "submitted"
+    # Two polls produced both events for all 25 subscribers.
+    assert len(polls) <= 3
+
+
+def test_reconnect_replays_from_last_event_id(hub, monkeypatch):
+    monkeypatch.setattr(progress_hub, "BATCH_PROGRESS_LINGER_SECONDS", 30.0)
+    states = iter(["S4_SCRIPTED", "S5_PROMPTS_BUILT", "S6_QA"])
+    current = {"state": "S4_SCRIPTED"}
+
+    def _load(batch_id):
+        current["state"] = next(states, current["state"])
+        return _snapshot(state=current["state"])
+
+    monkeypatch.setattr(progress_hub, "_load_progress_snapshot", _load)
+
+    async def _run():
+        first = await _collect(hub.subscribe("batch-1"), 5)
+        replay = await _collect(hub.subscribe("batch-1", first[0]["event_id"]), 4)
+        return first, replay
+
+    first, replay = asyncio.run(_run())
+
+    assert [event["event_type"] for event in first] == [
+        "progress.snapshot",
+        "batch.state",
+        "progress.changed",
+        "batch.state",
+        "progress.changed",
+    ]
+    assert first[1]["previous_state"] == "S4_SCRIPTED"
+    assert [event["event_id"] for event in replay] == [event["event_id"] for event in first[1:]]
+
+
+def test_poll_with_many_changes_ends_with_one_changed_event(hub, monkeypatch):
+    polls = []
+
+    def _load(batch_id):
+        polls.append(batch_id)
+        status = "submitted" if len(polls) > 1 else "pending"
+        return {
+            "batch": {"id": "batch-1", "state": "S4_SCRIPTED"},
+            "posts": [
+                {"id": f"post-{index}", "state": "S4_SCRIPTED", "video_status": status, "publish_status": None}
+                for index in range(3)
+            ],
+            "runs": [],
+        }
+
+    monkeypatch.setattr(progress_hub, "_load_progress_snapshot", _load)
+
+    events = asyncio.run(_collect(hub.subscribe("batch-1"), 5))
+
+    assert [event["event_type"] for event in events] == [
+        "progress.snapshot",
+        "post.progress",
+        "post.progress",
+        "post.progress",
+        "progress.changed",
+    ]
+    assert events[-1]["post_ids"] == ["post-0", "post-1", "post-2"]
+    assert events[-1]["removed_post_ids"] == []
+
+
+def test_client_behind_replay_window_gets_snapshot():
+    channel = progress_hub._BatchChannel("batch-1", asyncio.new_event_loop())
+    try:
+        channel.events = progress_hub.deque(maxlen=2)
+        channel.batch = {"id": "batch-1", "state": "S6_QA"}
+        for index in range(5):
+            channel.publish("post.progress", {"post": {"id": f"post-{index}"}})
+
+        behind = channel.events_after(1)
+        current = channel.events_after(4)
+
+        assert [event["event_type"] for event in behind] == ["progress.snapshot"]
+        assert behind[0]["event_id"] == "5"
+        assert behind[0]["batch"]["state"] == "S6_QA"
+        assert [event["event_id"] for event in current] == ["5"]
+    finally:
+        channel.loop.close()
+
+
+def test_seeding_events_are_pushed_on_notify(hub, monkeypatch):
+    seeding = []
+    monkeypatch.setattr(progress_hub, "BATCH_PROGRESS_POLL_SECONDS", 60.0)
+    monkeypatch.setattr(progress_hub, "_load_progress_snapshot", lambda batch_id: _snapshot())
+    monkeypatch.setattr(
+        progress_hub,
+        "_read_seeding_events",
+        lambda batch_id, cursor: [event for event in seeding if cursor is None or int(event["event_id"]) > int(cursor)],
+    )
+
+    async def _run():
+        subscription = hub.subscribe("batch-1")
+        snapshot = await subscription.__anext__()
+        seeding.append({"event_id": "1", "event_type": "interaction.complete", "created_at": "now", "message": "done"})
+        hub.notify("batch-1")
+        pushed = await asyncio.wait_for(_collect(subscription, 1), timeout=1.0)
+        return snapshot, pushed
+
+    snapshot, pushed = asyncio.run(_run())
+
+    assert snapshot["event_type"] == "progress.snapshot"
+    assert pushed[0]["event_type"] == "interaction.complete"
+    assert pushed[0]["seeding_event_id"] == "1"
+    assert pushed[0]["message"] == "done"
+
+
+def test_refreshes_for_one_change_share_one_detail_load(hub, monkeypatch):
+    monkeypatch.setattr(progress_hub, "BATCH_PROGRESS_POLL_SECONDS", 60.0)
+    monkeypatch.setattr(progress_hub, "_load_progress_snapshot", lambda batch_id: _snapshot())
+    loads = []
+
+    async def _load_detail():
+        loads.append("batch-1")
+        await asyncio.sleep(0.01)
+        return {"id": "batch-1", "posts": []}
+
+    async def _run():
+        subscription = hub.subscribe("batch-1")
+        snapshot = await subscription.__anext__()
+        details = await asyncio.gather(
+            *(hub.shared_detail("batch-1", snapshot["event_id"], _load_detail) for _ in range(25))
+        )
+        unknown = await hub.shared_detail("batch-1", "999", _load_detail)
+        missing = await hub.shared_detail("batch-2", snapshot["event_id"], _load_detail)
+        await subscription.aclose()
+        return details, unknown, missing
+
+    details, unknown, missing = asyncio.run(_run())
+
+    assert all(detail == {"id": "batch-1", "posts": []} for detail in details)
+    assert loads == ["batch-1"]
+    assert unknown is None
+    assert missing is None
+
+
+def test_shared_detail_reloads_after_a_new_change(hub, monkeypatch):
+    monkeypatch.setattr(progress_hub, "BATCH_PROGRESS_POLL_SECONDS", 60.0)
+    monkeypatch.setattr(progress_hub, "_load_progress_snapshot", lambda batch_id: _snapshot())
+    loads = []
+
+    async def _load_detail():
+        loads.append(len(loads))
+        return {"version": len(loads)}
+
+    async def _run():
+        subscription = hub.subscribe("batch-1")
+        snapshot = await subscription.__anext__()
+        first = await hub.shared_detail("batch-1", snapshot["event_id"], _load_detail)
+        channel = hub._channels["batch-1"]
+        changed = channel.publish("progress.changed", {"post_ids": ["post-1"]})
+        channel.changed_event_id = int(changed["event_id"])
+        second = await hub.shared_detail("batch-1", changed["event_id"], _load_detail)
+        await subscription.aclose()
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert first == {"version": 1}
+    assert second == {"version": 2}
@@ -389,7 +389,7 @@ def test_batch_detail_view_triggers_partial_semantic_recovery(monkeypatch):
     monkeypatch.setattr(
         batch_handlers,
         "_recover_stale_semantic_batch",
-        lambda seen_batch, seen_summary, seen_progress: recovered.append(
+        lambda seen_batch, seen_summary, seen_progress, loop: recovered.append(
             (seen_batch, seen_summary, seen_progress)
         ),
     )
@@ -587,6 +587,65 @@ def test_get_batch_status_requeues_coverage_pending_batch_when_coverage_is_still
     assert scheduled == [("batch-coverage-short", "coverage_recovery")]
 
 
+def test_get_batch_status_checks_coverage_off_the_event_loop(monkeypatch):
+    import threading
+
+    scheduled = []
+    coverage_threads = []
+    batch_handlers._COVERAGE_RECOVERY_LAST_SCHEDULED_AT.clear()
+    progress_state = {
+        "brand": "Recover",
+        "expected_posts": 3,
+        "posts_created": 0,
+        "state": "S1_SETUP",
+        "stage": "coverage_pending",
+    }
+
+    monkeypatch.setattr(
+        batch_handlers,
+        "get_batch_by_id",
+        lambda batch_id: {
+            "id": batch_id,
+            "brand": "Recover",
+            "state": "S1_SETUP",
+            "updated_at": "2026-03-19T21:00:00+00:00",
+            "post_type_counts": {"value": 3, "lifestyle": 0, "product": 0},
+            "target_length_tier": 8,
+        },
+    )
+    monkeypatch.setattr(batch_handlers, "get_batch_posts_summary", lambda batch_id: {"posts_count": 0, "posts_by_state": {}})
+    monkeypatch.setattr(batch_handlers, "is_batch_discovery_active", lambda batch_id: False)
+    monkeypatch.setattr(
+        batch_handlers,
+        "has_required_family_coverage",
+        lambda batch: coverage_threads.append(threading.current_thread()) or True,
+    )
+    monkeypatch.setattr(batch_handlers, "get_seeding_progress", lambda batch_id: dict(progress_state))
+    monkeypatch.setattr(
+        batch_handlers,
+        "update_seeding_progress",
+        lambda batch_id, **progress: progress_state.update(progress) or dict(progress_state),
+    )
+
+    async def _run():
+        loop_thread = threading.current_thread()
+
+        def _schedule(batch_id, reason):
+            scheduled.append((batch_id, reason, threading.current_thread() is loop_thread))
+            return True
+
+        monkeypatch.setattr(batch_handlers, "schedule_batch_discovery", _schedule)
+        response = await batch_handlers.get_batch_status("batch-coverage-thread")
+        await asyncio.sleep(0)
+        return response, loop_thread
+
+    response, loop_thread = asyncio.run(_run())
+
+    assert response.data["progress"]["stage"] == "booting"
+    assert coverage_threads and coverage_threads[0] is not loop_thread
+    assert scheduled == [("batch-coverage-thread", "coverage_recovery", True)]
+
+
 def test_get_batch_status_throttles_repeated_coverage_recovery_polling(monkeypatch):
     scheduled = []
     batch_handlers._COVERAGE_RECOVERY_LAST_SCHEDULED_AT.clear()
@@ -630,15 +689,25 @@ def test_get_batch_status_throttles_repeated_coverage_recovery_polling(monkeypat
         lambda batch_id, reason: scheduled.append((batch_id, reason)) or True,
     )
 
+    real_get_running_loop = asyncio.get_running_loop
+
     class FakeLoop:
-        def __init__(self):
+        def __init__(self, loop):
             self.now_value = 1000.0
+            self._loop = loop
 
         def time(self):
             return self.now_value
 
-    fake_loop = FakeLoop()
-    monkeypatch.setattr(batch_handlers.asyncio, "get_running_loop", lambda: fake_loop)
+        def __getattr__(self, name):
+            # run_db still needs the real loop's executor hand-off.
+            return getattr(self._loop, name)
+
+    monkeypatch.setattr(
+        batch_handlers.asyncio,
+        "get_running_loop",
+        lambda: FakeLoop(real_get_running_loop()),
+    )
 
     asyncio.run(batch_handlers.get_batch_status("batch-coverage-short"))
     asyncio.run(batch_handlers.get_batch_status("batch-coverage-short"))
@@ -1123,7 +1192,67 @@ def test_batch_detail_template_uses_slower_refresh_interval():
     repo_root = Path(__file__).resolve().parents[1]
     template = (repo_root / "templates/batches/detail.html").read_text(encoding="utf-8")
     assert 'hx-trigger="every 5s"' not in template
-    assert 'hx-trigger="every 15s"' in template
+    assert 'hx-trigger="every 15s"' not in template
+    assert 'hx-trigger="batch-progress, every 60s"' in template
+    assert 'data-progress-stream="/batches/{{ batch.id }}/progress/stream' in template
+
+
+def test_batch_detail_progress_refresh_is_throttled_on_coalesced_events():
+    from pathlib import Path
+
+    repo_root = Path(__file__).resolve().parents[1]
+    detail_js = (repo_root / "static/js/batches/detail.js").read_text(encoding="utf-8")
+    refresh_events = detail_js.split("const PROGRESS_REFRESH_EVENTS", 1)[1].split("]);", 1)[0]
+    assert "'progress.changed'" in refresh_events
+    assert "'post.progress'" not in refresh_events
+    assert "PROGRESS_REFRESH_MAX_WAIT_MS" in detail_js.split("const scheduleBatchProgressRefresh", 1)[1]
+    config_request = detail_js.split("'htmx:configRequest'", 1)[1].split("});", 1)[0]
+    assert "'batch-progress'" in config_request
+    assert "parameters.progress_event = progressRefreshEventId" in config_request
+
+
+def test_batch_detail_progress_refresh_renders_the_shared_hub_detail(monkeypatch):
+    rendered = []
+    shared_requests = []
+
+    class _Hub:
+        def latest_event_id(self, batch_id):
+            return "7"
+
+        async def shared_detail(self, batch_id, event_id, load):
+            shared_requests.append((batch_id, event_id))
+            return {"id": batch_id, "posts": []}
+
+    monkeypatch.setattr(batch_handlers, "get_batch_progress_hub", lambda: _Hub())
+    monkeypatch.setattr(batch_handlers, "_wants_html", lambda request: True)
+    monkeypatch.setattr(
+        batch_handlers,
+        "_read_batch_recovery_inputs",
+        lambda _batch_id: (_ for _ in ()).throw(AssertionError("progress refresh must not read the batch")),
+    )
+    monkeypatch.setattr(
+        batch_handlers,
+        "_render_batch_detail",
+        lambda request, payload, progress_event_id: rendered.append((payload, progress_event_id)) or "page",
+    )
+
+    response = asyncio.run(
+        batch_handlers.get_batch_endpoint(request=object(), batch_id="batch-1", progress_event="6")
+    )
+
+    assert response == "page"
+    assert shared_requests == [("batch-1", "6")]
+    assert rendered == [({"id": "batch-1", "posts": []}, "7")]
+
+
+def test_batch_list_seeding_feed_ignores_hub_state_events():
+    from pathlib import Path
+
+    repo_root = Path(__file__).resolve().parents[1]
+    template = (repo_root / "templates/batches/list.html").read_text(encoding="utf-8")
+    stream_handler = template.split("source.onmessage", 1)[1]
+    assert "`/batches/${batchId}/progress/stream`" in template
+    assert stream_handler.index("if (!event.seeding_event_id)") < stream_handler.index("pushFeedEvent(batchId, event)")
 
 
 def test_topic_run_card_uses_slower_refresh_interval():
@@ -1532,7 +1661,7 @@ def test_batch_detail_templates_compile_without_syntax_errors():
     batch_detail_template = Path("templates/batches/detail.html").read_text()
     run_card_template = Path("templates/topics/partials/run_card.html").read_text()
 
-    assert 'hx-trigger="every 15s"' in batch_detail_template
+    assert 'hx-trigger="batch-progress, every 60s"' in batch_detail_template
     assert 'hx-trigger="load, every 15s"' in run_card_template
 
 
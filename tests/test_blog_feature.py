@@ -738,39 +738,120 @@ def test_blog_image_generate_endpoint_is_registered():
     assert response.status_code != 404
 
 
-def test_blog_generate_endpoint_auto_generates_preview_image(monkeypatch):
-    draft_calls = []
-    image_calls = []
+def test_blog_generate_endpoint_returns_draft_with_preview_image(monkeypatch):
+    pipeline_calls = []
 
-    def _fake_generate_blog_draft(post_id):
-        draft_calls.append(post_id)
+    async def _fake_generate_blog_draft_with_image(post_id):
+        pipeline_calls.append(post_id)
         return {
             "name": "Titel",
             "slug": "titel",
             "body_html": "<p>Text</p>",
-            "image_prompt": "Quadratisches Coverbild",
-            "preview_image_url": None,
-        }
-
-    def _fake_generate_blog_image(post_id, *, image_prompt=None):
-        image_calls.append((post_id, image_prompt))
-        return {
-            "post_id": post_id,
-            "image_prompt": image_prompt,
-            "preview_image_url": "https://cdn.example.com/blog/titel.png",
+            "image_prompt": "Querformat-Coverbild",
+            "preview_image_url": "https://cdn.example.com/blog/titel.webp",
             "image_model": "gemini-2.5-flash-image",
         }
 
-    monkeypatch.setattr("app.features.blog.blog_runtime.generate_blog_draft", _fake_generate_blog_draft)
-    monkeypatch.setattr("app.features.blog.blog_runtime.generate_blog_image", _fake_generate_blog_image)
+    monkeypatch.setattr(
+        "app.features.blog.blog_runtime.generate_blog_draft_with_image",
+        _fake_generate_blog_draft_with_image,
+    )
 
     response = asyncio.run(blog_handlers.generate_blog_draft("post-1"))
 
     payload = response.model_dump()
-    assert payload["data"]["preview_image_url"] == "https://cdn.example.com/blog/titel.png"
+    assert payload["data"]["preview_image_url"] == "https://cdn.example.com/blog/titel.webp"
     assert payload["data"]["image_model"] == "gemini-2.5-flash-image"
-    assert draft_calls == ["post-1"]
-    assert image_calls == [("post-1", "Quadratisches Coverbild")]
+    assert pipeline_calls == ["post-1"]
+
+
+def _pipeline_post():
+    return {
+        "id": "post-1",
+        "blog_enabled": True,
+        "blog_status": "pending",
+        "blog_scheduled_at": None,
+        "seed_data": {"script_review_status": "approved"},
+        "topic_title": "Barrierefreie Arzttermine",
+    }
+
+
+def _patch_pipeline_storage(monkeypatch, update_calls, uploads):
+    class _FakeStorage:
+        def upload_image(self, **kwargs):
+            uploads.append(kwargs)
+            return {"url": f"https://cdn.example.com/blog/{kwargs['file_name']}", "storage_key": kwargs["file_name"]}
+
+    def _fake_update_blog_status(post_id, **kwargs):
+        update_calls.append((post_id, kwargs))
+        return {"id": post_id, **kwargs}
+
+    monkeypatch.setattr(blog_runtime, "_load_post_for_blog", lambda _post_id: _pipeline_post())
+    monkeypatch.setattr(
+        blog_runtime,
+        "_lookup_dossier",
+        lambda _post: {"id": "dossier-1", "normalized_payload": {"topic": "Barrierefreie Arzttermine"}},
+    )
+    monkeypatch.setattr(blog_runtime, "get_storage_client", lambda: _FakeStorage())
+    monkeypatch.setattr(blog_runtime, "update_blog_status", _fake_update_blog_status)
+
+
+def test_generate_blog_draft_with_image_runs_text_and_image_concurrently(monkeypatch):
+    import threading
+
+    update_calls = []
+    uploads = []
+    _patch_pipeline_storage(monkeypatch, update_calls, uploads)
+    # Each side waits for the other, so this only completes when both run at once.
+    both_running = threading.Barrier(2, timeout=5)
+
+    def _fake_write_blog_draft(post_id, post, dossier):
+        both_running.wait()
+        return {"name": "Titel", "slug": "titel", "body_html": "<p>Text</p>", "image_prompt": "Draft-Bildprompt"}
+
+    def _fake_render_blog_image(image_prompt, *, correlation_id):
+        assert "Barrierefreie Arzttermine" in image_prompt
+        both_running.wait()
+        return b"RIFF0000WEBP", "gemini-2.5-flash-image"
+
+    monkeypatch.setattr(blog_runtime, "_write_blog_draft", _fake_write_blog_draft)
+    monkeypatch.setattr(blog_runtime, "_render_blog_image", _fake_render_blog_image)
+
+    content = asyncio.run(blog_runtime.generate_blog_draft_with_image("post-1"))
+
+    assert content["preview_image_url"] == "https://cdn.example.com/blog/titel.webp"
+    assert content["image_model"] == "gemini-2.5-flash-image"
+    assert "Barrierefreie Arzttermine" in content["image_prompt"]
+    assert uploads[0]["content_type"] == "image/webp"
+    assert [call[1]["status"] for call in update_calls] == ["generating", "draft"]
+
+
+def test_generate_blog_draft_with_image_keeps_draft_when_image_fails(monkeypatch):
+    update_calls = []
+    uploads = []
+    _patch_pipeline_storage(monkeypatch, update_calls, uploads)
+    monkeypatch.setattr(
+        blog_runtime,
+        "_write_blog_draft",
+        lambda post_id, post, dossier: {
+            "name": "Titel",
+            "slug": "titel",
+            "body_html": "<p>Text</p>",
+            "image_prompt": "Draft-Bildprompt",
+        },
+    )
+
+    def _failing_render(image_prompt, *, correlation_id):
+        raise ThirdPartyError("Generated blog image could not be converted to WebP.")
+
+    monkeypatch.setattr(blog_runtime, "_render_blog_image", _failing_render)
+
+    content = asyncio.run(blog_runtime.generate_blog_draft_with_image("post-1"))
+
+    assert content["image_prompt"] == "Draft-Bildprompt"
+    assert not content.get("preview_image_url")
+    assert uploads == []
+    assert update_calls[-1][1]["status"] == "draft"
 
 
 def test_blog_content_update_endpoint_rejects_empty():
@@ -1086,14 +1167,14 @@ def test_generate_all_blog_drafts_fills_missing_preview_images(monkeypatch):
         ],
     )
 
-    def _fake_generate_blog_draft(post_id):
+    async def _fake_generate_blog_draft_with_image(post_id):
         generated.append(post_id)
         return {
             "name": f"Draft {post_id}",
             "slug": f"draft-{post_id}",
             "body_html": "<p>Text</p>",
             "image_prompt": f"Bild fuer {post_id}",
-            "preview_image_url": None,
+            "preview_image_url": f"https://cdn.example.com/{post_id}.webp",
         }
 
     def _fake_generate_blog_image(post_id, *, image_prompt=None):
@@ -1105,17 +1186,17 @@ def test_generate_all_blog_drafts_fills_missing_preview_images(monkeypatch):
             "image_model": "gemini-2.5-flash-image",
         }
 
-    monkeypatch.setattr("app.features.blog.blog_runtime.generate_blog_draft", _fake_generate_blog_draft)
+    monkeypatch.setattr(
+        "app.features.blog.blog_runtime.generate_blog_draft_with_image",
+        _fake_generate_blog_draft_with_image,
+    )
     monkeypatch.setattr("app.features.blog.blog_runtime.generate_blog_image", _fake_generate_blog_image)
 
     response = asyncio.run(blog_handlers.generate_all_blog_drafts("batch-1"))
 
     payload = response.model_dump()
     assert generated == ["post-1"]
-    assert imaged == [
-        ("post-1", "Bild fuer post-1"),
-        ("post-2", "Bild fuer bestehenden Draft"),
-    ]
+    assert imaged == [("post-2", "Bild fuer bestehenden Draft")]
     assert payload["data"]["results"] == [
         {"post_id": "post-1", "status": "draft", "image_generated": True},
         {"post_id": "post-2", "status": "draft", "image_generated": True},
@@ -79,6 +79,99 @@ def test_dispatch_due_blog_posts_processes_due_rows(monkeypatch):
     assert result["failed"] == 0
 
 
+def test_dispatch_due_blog_posts_publishes_with_bounded_concurrency(monkeypatch):
+    import threading
+    import time
+
+    monkeypatch.setattr(
+        blog_runtime,
+        "get_due_scheduled_blog_posts",
+        lambda limit=10: [{"id": f"post-{index}"} for index in range(5)],
+    )
+    monkeypatch.setattr(blog_runtime, "_claim_due_blog_post", lambda post_id: post_id != "post-4")
+    monkeypatch.setattr(blog_runtime, "BLOG_PUBLISH_MAX_CONCURRENCY", 2)
+    failed_updates = []
+    monkeypatch.setattr(
+        blog_runtime,
+        "update_blog_status",
+        lambda post_id, **kwargs: failed_updates.append((post_id, kwargs["status"])),
+    )
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def _fake_publish(post_id, publication_date=None):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        if post_id == "post-3":
+            raise RuntimeError("Webflow request failed: 500")
+        return {"post_id": post_id}
+
+    monkeypatch.setattr(blog_runtime, "publish_blog_post", _fake_publish)
+
+    result = asyncio.run(blog_runtime.dispatch_due_blog_posts(trigger="test"))
+
+    assert active["peak"] == 2
+    assert result["processed"] == 4
+    assert result["published"] == 3
+    assert result["failed"] == 1
+    assert failed_updates == [("post-3", "failed")]
+
+
+def _webflow_response(status_code, *, headers=None, text='{"id": "wf-item-123"}'):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = httpx.Headers(headers or {})
+    response.text = text
+    response.json.return_value = {"id": "wf-item-123"}
+    return response
+
+
+def test_webflow_request_waits_out_retry_after_on_429(monkeypatch):
+    from app.core import rate_limit
+    from app.features.blog import webflow_client
+
+    sleeps = []
+    monkeypatch.setattr(webflow_client, "_RATE_GATE", rate_limit.RateLimitCooldown())
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    responses = [
+        _webflow_response(429, headers={"Retry-After": "7"}, text="rate limited"),
+        _webflow_response(200),
+    ]
+
+    with patch.object(httpx.Client, "request", side_effect=responses) as mock_request:
+        client = WebflowClient(api_token="test-token", collection_id="col-1", site_id="site-1")
+        item_id = client.create_item({"name": "Test Blog", "slug": "test-blog"})
+
+    assert item_id == "wf-item-123"
+    assert mock_request.call_count == 2
+    assert len(sleeps) == 1 and 6.5 < sleeps[0] <= 7
+
+
+def test_webflow_request_spaces_calls_when_rate_limit_runs_low(monkeypatch):
+    from app.core import rate_limit
+    from app.features.blog import webflow_client
+
+    sleeps = []
+    monkeypatch.setattr(webflow_client, "_RATE_GATE", rate_limit.RateLimitCooldown())
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    responses = [
+        _webflow_response(200, headers={"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "1"}),
+        _webflow_response(200, headers={"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "40"}),
+    ]
+
+    with patch.object(httpx.Client, "request", side_effect=responses):
+        client = WebflowClient(api_token="test-token", collection_id="col-1", site_id="site-1")
+        client.publish_item("wf-item-1")
+        client.publish_item("wf-item-2")
+
+    assert len(sleeps) == 1 and 0.5 < sleeps[0] <= 1.0
+
+
 def test_update_blog_status_scheduled_raises_on_first_write_error_without_fallback(monkeypatch):
     class _FailingTable:
         def __init__(self):
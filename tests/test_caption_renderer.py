@@ -9,7 +9,10 @@ from app.adapters.caption_renderer import (
     CaptionRendererError,
     _fit_caption_layout,
     _fit_transcript_to_video_duration,
+    _build_overlay_filter,
+    _get_word_sprite,
     _render_caption_frame,
+    generate_ass_content,
 )
 from PIL import Image, ImageDraw
 
@@ -79,6 +82,67 @@ class TestCaptionFrameRendering:
         assert img0.tobytes() != img1.tobytes()
 
 
+    def test_word_sprite_is_cropped_and_cached_across_renders(self):
+        first = _get_word_sprite("WIEDERHOLT", video_width=1080, base_font_size=108, fill=(255, 255, 255, 255))
+        second = _get_word_sprite("WIEDERHOLT", video_width=1080, base_font_size=108, fill=(255, 255, 255, 255))
+        yellow = _get_word_sprite("WIEDERHOLT", video_width=1080, base_font_size=108, fill=(255, 215, 0, 255))
+        assert first is second
+        assert yellow is not first
+        assert first.image.size[0] < 1080
+        assert first.image.size[1] < 400
+
+    def test_word_sprite_cache_is_bounded_by_decoded_bytes(self, monkeypatch):
+        from app.adapters import caption_renderer
+
+        monkeypatch.setattr(caption_renderer, "_word_sprite_cache", caption_renderer.OrderedDict())
+        monkeypatch.setattr(caption_renderer, "_word_sprite_cache_bytes", 0)
+        one = _get_word_sprite("EINS", video_width=540, base_font_size=54, fill=(255, 255, 255, 255))
+        monkeypatch.setattr(caption_renderer, "CAPTION_SPRITE_CACHE_MAX_BYTES", one.nbytes * 2)
+
+        for word in ("ZWEI", "DREI", "VIER", "FUENF"):
+            _get_word_sprite(word, video_width=540, base_font_size=54, fill=(255, 255, 255, 255))
+
+        cached = list(caption_renderer._word_sprite_cache.values())
+        assert caption_renderer._word_sprite_cache_bytes == sum(sprite.nbytes for sprite in cached)
+        assert caption_renderer._word_sprite_cache_bytes <= one.nbytes * 2 or len(cached) == 1
+        assert ("FUENF", 540, 54, (255, 255, 255, 255)) in caption_renderer._word_sprite_cache
+        assert ("EINS", 540, 54, (255, 255, 255, 255)) not in caption_renderer._word_sprite_cache
+
+    def test_word_sprites_are_rasterized_outside_the_cache_lock(self, monkeypatch):
+        from app.adapters import caption_renderer
+
+        monkeypatch.setattr(caption_renderer, "_word_sprite_cache", caption_renderer.OrderedDict())
+        monkeypatch.setattr(caption_renderer, "_word_sprite_cache_bytes", 0)
+        real_rasterize = caption_renderer._rasterize_word_sprite
+        lock_held = []
+
+        def tracking_rasterize(*args, **kwargs):
+            lock_held.append(caption_renderer._word_sprite_lock.locked())
+            return real_rasterize(*args, **kwargs)
+
+        monkeypatch.setattr(caption_renderer, "_rasterize_word_sprite", tracking_rasterize)
+
+        _get_word_sprite("SCHNELL", video_width=540, base_font_size=54, fill=(255, 255, 255, 255))
+
+        assert lock_held == [False]
+
+    def test_overlay_filter_places_sprites_and_writes_each_once(self, tmp_path):
+        words = [Word("ja", 0.0, 0.4), Word("nein", 0.4, 0.8), Word("ja", 0.8, 1.2), Word("nein", 1.2, 1.6)]
+        inputs, filter_complex, count = _build_overlay_filter(
+            video_path="in.mp4",
+            words=words,
+            fps=30.0,
+            video_width=1080,
+            video_height=1920,
+            work_dir=str(tmp_path),
+        )
+        assert count == 4
+        assert len(inputs) == 10
+        # Same word and same colour slot reuse one sprite file.
+        assert len(list(tmp_path.iterdir())) == 2
+        assert "overlay=0:0" not in filter_complex
+
+
 class TestCaptionTiming:
     def test_fit_transcript_to_video_duration_compresses_overlong_schedule(self):
         transcript = WordLevelTranscript(
@@ -112,11 +176,12 @@ class TestCaptionTiming:
 
 
 class TestBurnCaptions:
+    @patch("app.adapters.caption_renderer._libass_available", return_value=False)
     @patch("app.adapters.caption_renderer.subprocess.run")
     @patch("app.adapters.caption_renderer._get_video_duration", return_value=8.0)
     @patch("app.adapters.caption_renderer._get_video_fps", return_value=30.0)
     @patch("app.adapters.caption_renderer._get_video_dimensions", return_value=(1080, 1920))
-    def test_burn_success(self, mock_dims, mock_fps, mock_duration, mock_run):
+    def test_burn_success(self, mock_dims, mock_fps, mock_duration, mock_run, mock_libass):
         mock_run.return_value = MagicMock(returncode=0, stderr="")
         transcript = WordLevelTranscript(words=[Word("Test", 0.0, 0.5)], full_text="Test")
         with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
@@ -135,11 +200,12 @@ class TestBurnCaptions:
             if output_path and os.path.exists(output_path):
                 os.unlink(output_path)
 
+    @patch("app.adapters.caption_renderer._libass_available", return_value=False)
     @patch("app.adapters.caption_renderer.subprocess.run")
     @patch("app.adapters.caption_renderer._get_video_duration", return_value=8.0)
     @patch("app.adapters.caption_renderer._get_video_fps", return_value=30.0)
     @patch("app.adapters.caption_renderer._get_video_dimensions", return_value=(1080, 1920))
-    def test_burn_ffmpeg_failure_raises(self, mock_dims, mock_fps, mock_duration, mock_run):
+    def test_burn_ffmpeg_failure_raises(self, mock_dims, mock_fps, mock_duration, mock_run, mock_libass):
         mock_run.return_value = MagicMock(returncode=1, stderr="codec error")
         transcript = WordLevelTranscript(words=[Word("Test", 0.0, 0.5)], full_text="Test")
         with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
@@ -151,11 +217,12 @@ class TestBurnCaptions:
         finally:
             os.unlink(input_path)
 
+    @patch("app.adapters.caption_renderer._libass_available", return_value=False)
     @patch("app.adapters.caption_renderer.subprocess.run")
     @patch("app.adapters.caption_renderer._get_video_duration", return_value=8.0)
     @patch("app.adapters.caption_renderer._get_video_fps", return_value=30.0)
     @patch("app.adapters.caption_renderer._get_video_dimensions", return_value=(1080, 1920))
-    def test_burn_uses_half_open_overlay_windows_to_avoid_boundary_overlap(self, mock_dims, mock_fps, mock_duration, mock_run):
+    def test_burn_uses_half_open_overlay_windows_to_avoid_boundary_overlap(self, mock_dims, mock_fps, mock_duration, mock_run, mock_libass):
         mock_run.return_value = MagicMock(returncode=0, stderr="")
         transcript = WordLevelTranscript(
             words=[
@@ -183,3 +250,65 @@ class TestBurnCaptions:
             os.unlink(input_path)
             if output_path and os.path.exists(output_path):
                 os.unlink(output_path)
+
+    @patch("app.adapters.caption_renderer._libass_available", return_value=True)
+    @patch("app.adapters.caption_renderer.subprocess.run")
+    @patch("app.adapters.caption_renderer._get_video_duration", return_value=8.0)
+    @patch("app.adapters.caption_renderer._get_video_fps", return_value=30.0)
+    @patch("app.adapters.caption_renderer._get_video_dimensions", return_value=(1080, 1920))
+    def test_burn_uses_single_ass_filter_when_libass_available(self, mock_dims, mock_fps, mock_duration, mock_run, mock_libass):
+        scripts = []
+
+        def _capture(cmd, **kwargs):
+            filter_complex = cmd[cmd.index("-filter_complex") + 1]
+            ass_path = filter_complex.split("filename=", 1)[1].split(":fontsdir=", 1)[0].split("[vout]", 1)[0]
+            with open(ass_path, encoding="utf-8") as handle:
+                scripts.append(handle.read())
+            return MagicMock(returncode=0, stderr="")
+
+        mock_run.side_effect = _capture
+        transcript = WordLevelTranscript(
+            words=[Word("Bleibt", 0.0, 0.5), Word("ruhig", 0.5, 0.9), Word("heute", 0.9, 1.4)],
+            full_text="Bleibt ruhig heute",
+        )
+        output_path = None
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+            f.write(b"fake_video_data")
+            input_path = f.name
+        try:
+            output_path = burn_captions(video_path=input_path, transcript=transcript, correlation_id="test_ass")
+            cmd = mock_run.call_args[0][0]
+            assert cmd.count("-i") == 1
+            filter_complex = cmd[cmd.index("-filter_complex") + 1]
+            assert filter_complex.startswith("[0:v]ass=")
+            assert "overlay" not in filter_complex
+            assert len(scripts) == 1
+            assert scripts[0].count("Dialogue:") == 3
+        finally:
+            os.unlink(input_path)
+            if output_path and os.path.exists(output_path):
+                os.unlink(output_path)
+
+
+class TestAssContent:
+    def test_events_match_overlay_style_and_windows(self):
+        transcript = WordLevelTranscript(
+            words=[Word("Bleibt", 0.0, 0.5), Word("ruhig", 0.5, 0.9), Word("{heute}", 0.9, 1.4)],
+            full_text="Bleibt ruhig heute",
+        )
+        content = generate_ass_content(transcript, video_width=1080, video_height=1920, fps=30.0)
+        events = [line for line in content.splitlines() if line.startswith("Dialogue:")]
+        assert len(events) == 3
+        assert events[0].startswith("Dialogue: 0,0:00:00.00,0:00:00.50,Caption,")
+        assert events[1].startswith("Dialogue: 0,0:00:00.50,0:00:00.90,Caption,")
+        assert "\\1c&H00FFFFFF&" in events[0]
+        assert "\\1c&H0000D7FF&" in events[1]
+        assert "\\pos(540,1440)" in events[0]
+        assert events[0].endswith("BLEIBT")
+        assert events[2].endswith("(HEUTE)")
+        assert "ScaledBorderAndShadow: yes" in content
+
+    def test_empty_transcript_has_no_events(self):
+        content = generate_ass_content(WordLevelTranscript(words=[], full_text=""))
+        assert "[Events]" in content
+        assert "Dialogue:" not in content
@@ -14,6 +14,16 @@ from app.core.video_profiles import (
 from app.adapters.deepgram_client import Word, WordLevelTranscript
 
 
+@pytest.fixture(autouse=True)
+def _speech_track(monkeypatch):
+    """Skip ffprobe/ffmpeg: every fake video has an audio track that extracts cleanly."""
+    monkeypatch.setattr(
+        "workers.caption_worker.probe_media",
+        lambda _path: MagicMock(stream=lambda codec_type: {"codec_type": codec_type}),
+    )
+    monkeypatch.setattr("workers.caption_worker._extract_audio_track", lambda **_kwargs: True)
+
+
 class TestProcessCaptionPost:
     @patch("workers.caption_worker.burn_captions")
     @patch("workers.caption_worker.get_deepgram_client")
@@ -32,8 +42,7 @@ class TestProcessCaptionPost:
         mock_table.select.return_value.eq.return_value.execute.return_value.data = []
 
         mock_storage_inst = MagicMock()
-        mock_storage_inst.download_video.return_value = b"video_bytes"
-        mock_storage_inst.upload_video.return_value = {
+        mock_storage_inst.upload_video_file.return_value = {
             "storage_key": "videos/captioned/test.mp4",
             "url": "https://cdn.example.com/videos/captioned/test.mp4",
             "size": 2048,
@@ -45,7 +54,7 @@ class TestProcessCaptionPost:
             full_text="Hallo Welt",
         )
         mock_dg_inst = MagicMock()
-        mock_dg_inst.transcribe.return_value = transcript
+        mock_dg_inst.transcribe_file.return_value = transcript
         mock_dg.return_value = mock_dg_inst
 
         # Create a real temp file so open() works on the burn output path
@@ -67,9 +76,9 @@ class TestProcessCaptionPost:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
-        mock_dg_inst.transcribe.assert_called_once()
+        mock_dg_inst.transcribe_file.assert_called_once()
         mock_burn.assert_called_once()
-        mock_storage_inst.upload_video.assert_called_once()
+        mock_storage_inst.upload_video_file.assert_called_once()
 
     @patch("workers.caption_worker.get_deepgram_client")
     @patch("workers.caption_worker.get_storage_client")
@@ -87,11 +96,10 @@ class TestProcessCaptionPost:
         mock_table.select.return_value.eq.return_value.execute.return_value.data = []
 
         mock_storage_inst = MagicMock()
-        mock_storage_inst.download_video.return_value = b"video_bytes"
         mock_storage.return_value = mock_storage_inst
 
         mock_dg_inst = MagicMock()
-        mock_dg_inst.transcribe.return_value = WordLevelTranscript(words=[], full_text="")
+        mock_dg_inst.transcribe_file.return_value = WordLevelTranscript(words=[], full_text="")
         mock_dg.return_value = mock_dg_inst
 
         post = {
@@ -108,6 +116,73 @@ class TestProcessCaptionPost:
         assert final_update["video_status"] == VIDEO_STATUS_CAPTION_COMPLETED
 
 
+    @patch("workers.caption_worker.burn_captions")
+    @patch("workers.caption_worker.get_deepgram_client")
+    @patch("workers.caption_worker.get_storage_client")
+    @patch("workers.caption_worker.get_supabase")
+    def test_pipeline_streams_files_instead_of_buffering(self, mock_sb_factory, mock_storage, mock_dg, mock_burn):
+        from workers.caption_worker import _process_caption_post
+
+        mock_sb_factory.return_value.client = MagicMock()
+        seen = {}
+
+        def fake_download(*, video_url, destination_path, correlation_id):
+            with open(destination_path, "wb") as handle:
+                handle.write(b"source_video")
+            seen["video_path"] = destination_path
+            return len(b"source_video")
+
+        mock_storage_inst = MagicMock()
+        mock_storage_inst.download_video_to_file.side_effect = fake_download
+        mock_storage_inst.upload_video_file.return_value = {"storage_key": "k", "url": "https://cdn/k", "size": 9}
+        mock_storage.return_value = mock_storage_inst
+        mock_dg_inst = MagicMock()
+        mock_dg_inst.transcribe_file.return_value = WordLevelTranscript(words=[Word("Hallo", 0.0, 0.5)], full_text="Hallo")
+        mock_dg.return_value = mock_dg_inst
+        fd, output_path = tempfile.mkstemp(suffix=".mp4")
+        os.write(fd, b"captioned")
+        os.close(fd)
+        mock_burn.return_value = output_path
+
+        _process_caption_post({"id": "post_1", "batch_id": None, "video_url": "https://cdn/v.mp4", "video_metadata": {}})
+
+        transcribe_kwargs = mock_dg_inst.transcribe_file.call_args.kwargs
+        assert transcribe_kwargs["path"].endswith("speech.m4a")
+        assert transcribe_kwargs["content_type"] == "audio/mp4"
+        assert mock_burn.call_args.kwargs["video_path"] == seen["video_path"]
+        assert mock_storage_inst.upload_video_file.call_args.kwargs["path"] == output_path
+        mock_storage_inst.download_video.assert_not_called()
+        mock_storage_inst.upload_video.assert_not_called()
+        assert not os.path.exists(output_path)
+        assert not os.path.exists(os.path.dirname(seen["video_path"]))
+
+    def test_transcription_falls_back_to_the_video_when_extraction_fails(self, monkeypatch, tmp_path):
+        from workers import caption_worker
+
+        monkeypatch.setattr(caption_worker, "_extract_audio_track", lambda **_kwargs: False)
+        deepgram = MagicMock()
+        video_path = str(tmp_path / "source.mp4")
+
+        caption_worker._transcribe_video_file(
+            deepgram, video_path=video_path, work_dir=str(tmp_path), correlation_id="c1",
+        )
+
+        deepgram.transcribe_file.assert_called_once_with(path=video_path, correlation_id="c1", content_type="video/mp4")
+
+    def test_video_without_audio_track_skips_deepgram(self, monkeypatch, tmp_path):
+        from workers import caption_worker
+
+        monkeypatch.setattr(caption_worker, "probe_media", lambda _path: MagicMock(stream=lambda _codec_type: None))
+        deepgram = MagicMock()
+
+        transcript = caption_worker._transcribe_video_file(
+            deepgram, video_path=str(tmp_path / "source.mp4"), work_dir=str(tmp_path), correlation_id="c1",
+        )
+
+        assert transcript.words == []
+        deepgram.transcribe_file.assert_not_called()
+
+
 class TestCaptionRetryLogic:
     @patch("workers.caption_worker.get_deepgram_client")
     @patch("workers.caption_worker.get_storage_client")
@@ -122,11 +197,10 @@ class TestCaptionRetryLogic:
         mock_table.update.return_value.eq.return_value.execute.return_value = MagicMock()
 
         mock_storage_inst = MagicMock()
-        mock_storage_inst.download_video.return_value = b"video_bytes"
         mock_storage.return_value = mock_storage_inst
 
         mock_dg_inst = MagicMock()
-        mock_dg_inst.transcribe.side_effect = DeepgramError("503 error", transient=True)
+        mock_dg_inst.transcribe_file.side_effect = DeepgramError("503 error", transient=True)
         mock_dg.return_value = mock_dg_inst
 
         post = {
@@ -156,11 +230,10 @@ class TestCaptionRetryLogic:
         mock_table.update.return_value.eq.return_value.execute.return_value = MagicMock()
 
         mock_storage_inst = MagicMock()
-        mock_storage_inst.download_video.return_value = b"video_bytes"
         mock_storage.return_value = mock_storage_inst
 
         mock_dg_inst = MagicMock()
-        mock_dg_inst.transcribe.side_effect = DeepgramError("503 error", transient=True)
+        mock_dg_inst.transcribe_file.side_effect = DeepgramError("503 error", transient=True)
         mock_dg.return_value = mock_dg_inst
 
         post = {
@@ -175,3 +248,245 @@ class TestCaptionRetryLogic:
         update_calls = mock_table.update.call_args_list
         final_update = update_calls[-1][0][0]
         assert final_update["video_status"] == VIDEO_STATUS_CAPTION_FAILED
+
+
+def _column_value(row, column):
+    column, _, json_key = column.partition("->>")
+    value = row.get(column)
+    return (value or {}).get(json_key) if json_key else value
+
+
+class _FakePostsTable:
+    """Just enough of the posts query builder for the poll/claim/recovery paths."""
+
+    def __init__(self, db):
+        self._db = db
+        self._filters = []
+        self._update = None
+
+    def select(self, fields):
+        self._fields = fields
+        return self
+
+    def update(self, payload):
+        self._update = payload
+        return self
+
+    def in_(self, column, values):
+        self._filters.append((column, tuple(values)))
+        return self
+
+    def eq(self, column, value):
+        self._filters.append((column, (value,)))
+        return self
+
+    def limit(self, _count):
+        return self
+
+    def execute(self):
+        with self._db["lock"]:
+            matches = [
+                row for row in self._db["rows"]
+                if all(_column_value(row, column) in values for column, values in self._filters)
+            ]
+            if self._update is not None:
+                for row in matches:
+                    row.update(self._update)
+                    row["updated_at"] = "2026-10-16T00:00:00+00:00"
+            return MagicMock(data=[dict(row) for row in matches])
+
+
+def _fake_posts_db(monkeypatch, rows):
+    import threading
+
+    db = {"rows": rows, "lock": threading.Lock()}
+    fake_sb = MagicMock()
+    fake_sb.client.table.side_effect = lambda _name: _FakePostsTable(db)
+    monkeypatch.setattr("workers.caption_worker.get_supabase", lambda: fake_sb)
+    return db
+
+
+class TestCaptionConcurrency:
+    def test_poll_claims_each_post_once_and_captions_claimed_posts_concurrently(self, monkeypatch):
+        import threading
+        from workers import caption_worker
+
+        rows = [
+            {"id": f"post_{index}", "video_status": VIDEO_STATUS_CAPTION_PENDING, "video_metadata": {}}
+            for index in range(3)
+        ]
+        _fake_posts_db(monkeypatch, rows)
+        # Another replica claimed post_2 between our select and our claim.
+        real_claim = caption_worker._claim_caption_post
+
+        def racing_claim(post):
+            if post["id"] == "post_2":
+                rows[2]["video_status"] = VIDEO_STATUS_CAPTION_PROCESSING
+            return real_claim(post)
+
+        both_running = threading.Barrier(2, timeout=5)
+        processed = []
+
+        def fake_process(post):
+            both_running.wait()
+            processed.append(post["id"])
+
+        monkeypatch.setattr(caption_worker, "_claim_caption_post", racing_claim)
+        monkeypatch.setattr(caption_worker, "_process_caption_post", fake_process)
+        monkeypatch.setattr(caption_worker, "CAPTION_MAX_CONCURRENCY", 2)
+
+        assert caption_worker.poll_caption_pending() == 3
+
+        assert sorted(processed) == ["post_0", "post_1"]
+        assert rows[0]["video_status"] == VIDEO_STATUS_CAPTION_PROCESSING
+        assert rows[0]["video_metadata"][caption_worker.CAPTION_LEASE_OWNER_KEY]
+
+    def test_running_job_renews_its_lease_until_it_finishes(self, monkeypatch):
+        import threading
+        from workers import caption_worker
+
+        rows = [{"id": "post_slow", "video_status": VIDEO_STATUS_CAPTION_PENDING, "video_metadata": {"a": 1}}]
+        _fake_posts_db(monkeypatch, rows)
+        monkeypatch.setattr(caption_worker, "CAPTION_LEASE_RENEW_SECONDS", 0.01)
+        renewed = threading.Event()
+        real_renew = caption_worker._renew_caption_lease
+        renewals = []
+
+        def tracking_renew(post):
+            renewals.append(real_renew(post))
+            renewed.set()
+            return renewals[-1]
+
+        def slow_process(post):
+            assert renewed.wait(5)
+            rows[0]["video_status"] = VIDEO_STATUS_CAPTION_COMPLETED
+
+        monkeypatch.setattr(caption_worker, "_renew_caption_lease", tracking_renew)
+        monkeypatch.setattr(caption_worker, "_process_caption_post", slow_process)
+
+        claimed = caption_worker._claim_caption_post(rows[0])
+        caption_worker._run_claimed_caption_post(claimed)
+
+        assert renewals[0] is True
+        assert rows[0]["video_metadata"]["a"] == 1
+        # Finished posts are no longer ours to extend.
+        assert real_renew(claimed) is False
+
+    def test_lease_is_not_renewed_once_another_worker_owns_the_post(self, monkeypatch):
+        from workers import caption_worker
+
+        rows = [
+            {
+                "id": "post_taken",
+                "video_status": VIDEO_STATUS_CAPTION_PROCESSING,
+                "video_metadata": {
+                    caption_worker.CAPTION_LEASE_OWNER_KEY: "other-host:2",
+                    caption_worker.CAPTION_LEASE_EXPIRES_KEY: "2999-01-01T00:00:00+00:00",
+                },
+            }
+        ]
+        _fake_posts_db(monkeypatch, rows)
+
+        assert caption_worker._renew_caption_lease({"id": "post_taken", "video_metadata": {}}) is False
+        assert rows[0]["video_metadata"][caption_worker.CAPTION_LEASE_OWNER_KEY] == "other-host:2"
+
+    def test_expired_caption_lease_is_returned_to_pending(self, monkeypatch):
+        from workers import caption_worker
+
+        rows = [
+            {
+                "id": "post_stale",
+                "video_status": VIDEO_STATUS_CAPTION_PROCESSING,
+                "updated_at": "2026-10-15T00:00:00+00:00",
+                "video_metadata": {
+                    caption_worker.CAPTION_LEASE_OWNER_KEY: "gone:1",
+                    caption_worker.CAPTION_LEASE_EXPIRES_KEY: "2026-10-15T00:15:00+00:00",
+                    "caption_retry_count": 1,
+                },
+            },
+            {
+                "id": "post_live",
+                "video_status": VIDEO_STATUS_CAPTION_PROCESSING,
+                "updated_at": "2026-10-15T00:00:00+00:00",
+                "video_metadata": {
+                    caption_worker.CAPTION_LEASE_OWNER_KEY: "alive:1",
+                    caption_worker.CAPTION_LEASE_EXPIRES_KEY: "2999-01-01T00:00:00+00:00",
+                },
+            },
+        ]
+        _fake_posts_db(monkeypatch, rows)
+
+        assert caption_worker._recover_expired_caption_leases() == 1
+
+        assert rows[0]["video_status"] == VIDEO_STATUS_CAPTION_PENDING
+        assert rows[0]["video_metadata"] == {"caption_retry_count": 1}
+        assert rows[1]["video_status"] == VIDEO_STATUS_CAPTION_PROCESSING
+
+
+class TestCaptionFailureHandling:
+    def _leased_row(self, caption_worker, *, owner=None, retry_count=0):
+        return {
+            "id": "post_broken",
+            "batch_id": None,
+            "video_url": "https://cdn.example.com/videos/original.mp4",
+            "video_status": VIDEO_STATUS_CAPTION_PROCESSING,
+            "video_metadata": {
+                "caption_retry_count": retry_count,
+                caption_worker.CAPTION_LEASE_OWNER_KEY: owner or caption_worker._caption_worker_identity(),
+                caption_worker.CAPTION_LEASE_EXPIRES_KEY: "2999-01-01T00:00:00+00:00",
+            },
+        }
+
+    def _broken_download(self, monkeypatch, caption_worker):
+        storage = MagicMock()
+        storage.download_video_to_file.side_effect = RuntimeError("object missing")
+        monkeypatch.setattr(caption_worker, "get_storage_client", lambda: storage)
+        monkeypatch.setattr(caption_worker, "get_deepgram_client", MagicMock)
+
+    def test_unexpected_error_counts_as_a_retry(self, monkeypatch):
+        from workers import caption_worker
+
+        rows = [self._leased_row(caption_worker)]
+        _fake_posts_db(monkeypatch, rows)
+        self._broken_download(monkeypatch, caption_worker)
+
+        caption_worker._process_caption_post({**rows[0], "video_metadata": {"caption_retry_count": 0}})
+
+        assert rows[0]["video_status"] == VIDEO_STATUS_CAPTION_PENDING
+        assert rows[0]["video_metadata"] == {"caption_retry_count": 1}
+
+    def test_unexpected_error_fails_the_post_after_max_retries(self, monkeypatch):
+        from workers import caption_worker
+
+        rows = [self._leased_row(caption_worker, retry_count=2)]
+        _fake_posts_db(monkeypatch, rows)
+        self._broken_download(monkeypatch, caption_worker)
+
+        caption_worker._process_caption_post({**rows[0], "video_metadata": {"caption_retry_count": 2}})
+
+        assert rows[0]["video_status"] == VIDEO_STATUS_CAPTION_FAILED
+        assert rows[0]["video_metadata"]["caption_error"] == "object missing"
+
+    def test_worker_that_lost_its_lease_does_not_overwrite_the_post(self, monkeypatch):
+        from workers import caption_worker
+
+        rows = [self._leased_row(caption_worker, owner="other-host:2")]
+        _fake_posts_db(monkeypatch, rows)
+
+        assert caption_worker._mark_caption_completed(
+            post_id="post_broken",
+            existing_metadata={},
+            caption_metadata={"caption_video_url": "https://cdn.example.com/stale.mp4"},
+            correlation_id="caption_post_broken",
+        ) is False
+        caption_worker._handle_caption_failure(
+            post_id="post_broken",
+            existing_metadata={},
+            error=RuntimeError("late failure"),
+            correlation_id="caption_post_broken",
+            transient=True,
+        )
+
+        assert rows[0]["video_status"] == VIDEO_STATUS_CAPTION_PROCESSING
+        assert rows[0]["video_metadata"][caption_worker.CAPTION_LEASE_OWNER_KEY] == "other-host:2"
+        assert "caption_video_url" not in rows[0]["video_metadata"]
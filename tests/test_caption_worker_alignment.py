@@ -33,19 +33,14 @@ def test_caption_worker_aligns_transcript_to_script():
         patch("workers.caption_worker.burn_captions") as mock_burn,
         patch("workers.caption_worker._mark_caption_completed"),
         patch("workers.caption_worker._check_batch_caption_complete"),
-        patch("builtins.open", MagicMock()),
-        patch("os.close"),
-        patch("os.unlink"),
-        patch("tempfile.mkstemp", return_value=(0, "/tmp/fake.mp4")),
+        patch("workers.caption_worker._transcribe_video_file", return_value=mock_transcript),
     ):
         mock_sb.return_value.client.table.return_value.update.return_value.eq.return_value.execute.return_value = None
-        mock_storage.return_value.download_video.return_value = b"fake-video-bytes"
-        mock_storage.return_value.upload_video.return_value = {
+        mock_storage.return_value.upload_video_file.return_value = {
             "url": "https://example.com/captioned.mp4",
             "storage_key": "test-key",
             "size": 100,
         }
-        mock_dg.return_value.transcribe.return_value = mock_transcript
         mock_burn.return_value = "/tmp/fake_output.mp4"
 
         _process_caption_post(fake_post)
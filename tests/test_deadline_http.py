@@ -0,0 +1,84 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.adapters import deadline_http
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 64 * 1024
+
+    def do_GET(self):
+        self.server.peers.add(self.client_address)
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.peers = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def transport():
+    instance = deadline_http.DeadlineHttpTransport()
+    yield instance
+    instance.close()
+
+
+def test_sequential_requests_reuse_one_pooled_connection(stub_server, transport):
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/rows"
+
+    responses = [transport.request("GET", url, timeout_seconds=2) for _ in range(5)]
+
+    assert [response.json() for response in responses] == [{"ok": True}] * 5
+    assert len(stub_server.peers) == 1
+
+
+def test_requests_from_many_threads_share_the_transport(stub_server, transport):
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/rows"
+    statuses = []
+
+    def _call():
+        statuses.append(transport.request("GET", url, timeout_seconds=2).status_code)
+
+    threads = [threading.Thread(target=_call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [200] * 8
+    assert len(stub_server.peers) <= 8
+
+
+def test_deadline_cancels_the_request_by_wall_clock(stub_server, transport):
+    url = f"http://127.0.0.1:{stub_server.server_address[1]}/slow"
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        transport.request("GET", url, timeout_seconds=0.1)
+    assert time.monotonic() - started < 0.45
+
+    # The loop keeps serving after a cancelled request.
+    fast = f"http://127.0.0.1:{stub_server.server_address[1]}/rows"
+    assert transport.request("GET", fast, timeout_seconds=2).status_code == 200
@@ -138,3 +138,25 @@ class TestDeepgramClientTranscribe:
         with pytest.raises(DeepgramError) as exc_info:
             client.transcribe(audio_bytes=b"bad", correlation_id="test_3")
         assert exc_info.value.transient is True
+
+    def test_transcribe_file_streams_the_file_body(self, tmp_path):
+        import httpx
+
+        DeepgramClient._instance = None
+        client = DeepgramClient()
+        received = {}
+
+        def handler(request):
+            received["content_type"] = request.headers["Content-Type"]
+            received["content_length"] = request.headers["Content-Length"]
+            received["body"] = request.read()
+            return httpx.Response(200, json={"results": {"channels": [{"alternatives": [{"transcript": "", "words": []}]}]}})
+
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        audio = tmp_path / "speech.m4a"
+        audio.write_bytes(b"a" * 600_000)
+
+        result = client.transcribe_file(path=str(audio), correlation_id="test_4", content_type="audio/mp4")
+
+        assert result.words == []
+        assert received == {"content_type": "audio/mp4", "content_length": "600000", "body": b"a" * 600_000}
@@ -0,0 +1,117 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import app.adapters.media_probe as media_probe
+
+
+_PAYLOAD = {
+    "streams": [
+        {"index": 0, "codec_type": "video", "width": 720, "height": 1280, "r_frame_rate": "24/1", "duration": "8.000000"},
+        {"index": 1, "codec_type": "audio", "sample_rate": "48000", "channels": 2, "duration": "7.980000"},
+    ],
+    "format": {"duration": "8.010000", "size": "1024", "format_name": "mov,mp4,m4a,3gp,3g2,mj2"},
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    media_probe.clear_media_probe_cache()
+    monkeypatch.setattr(media_probe, "MEDIA_PROBE_CACHE_DIR", "")
+    yield
+    media_probe.clear_media_probe_cache()
+
+
+@pytest.fixture
+def ffprobe_calls(monkeypatch):
+    calls = []
+
+    def _fake_run(command, **kwargs):
+        calls.append(command)
+        return SimpleNamespace(returncode=0, stdout=json.dumps(_PAYLOAD), stderr="")
+
+    monkeypatch.setattr(media_probe.subprocess, "run", _fake_run)
+    return calls
+
+
+def test_probe_media_runs_one_ffprobe_for_all_facts(tmp_path, ffprobe_calls):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"fake-mp4")
+
+    probe = media_probe.probe_media(clip)
+    again = media_probe.probe_media(str(clip))
+
+    assert again is probe
+    assert len(ffprobe_calls) == 1
+    assert (probe.width, probe.height) == (720, 1280)
+    assert probe.fps == 24.0
+    assert probe.duration == pytest.approx(8.01)
+    assert probe.stream_duration("video") == pytest.approx(8.0)
+    assert probe.stream_duration("audio") == pytest.approx(7.98)
+
+
+def test_missing_video_stream_error_names_file_and_streams(tmp_path, monkeypatch):
+    clip = tmp_path / "audio-only.mp4"
+    clip.write_bytes(b"fake-m4a")
+    payload = {"streams": [{"index": 0, "codec_type": "audio", "codec_name": "aac"}], "format": {"duration": "3.0"}}
+    monkeypatch.setattr(
+        media_probe.subprocess,
+        "run",
+        lambda command, **kwargs: SimpleNamespace(returncode=0, stdout=json.dumps(payload), stderr=""),
+    )
+
+    probe = media_probe.probe_media(clip)
+    with pytest.raises(media_probe.MediaProbeError) as exc_info:
+        probe.width
+
+    assert str(clip) in exc_info.value.stderr
+    assert "0:audio/aac" in exc_info.value.stderr
+    assert str(exc_info.value) == exc_info.value.stderr
+
+
+def test_probe_media_reprobes_after_file_changes(tmp_path, ffprobe_calls):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"first")
+    media_probe.probe_media(clip)
+    clip.write_bytes(b"second-version")
+
+    media_probe.probe_media(clip)
+
+    assert len(ffprobe_calls) == 2
+
+
+def test_probe_media_disk_store_is_content_addressed(tmp_path, monkeypatch, ffprobe_calls):
+    monkeypatch.setattr(media_probe, "MEDIA_PROBE_CACHE_DIR", str(tmp_path / "store"))
+    first = tmp_path / "a.mp4"
+    second = tmp_path / "b.mp4"
+    first.write_bytes(b"same-bytes")
+    second.write_bytes(b"same-bytes")
+
+    media_probe.probe_media(first)
+    media_probe.clear_media_probe_cache()
+    probe = media_probe.probe_media(second)
+
+    assert len(ffprobe_calls) == 1
+    assert probe.width == 720
+
+
+def test_probe_media_failure_is_not_cached(tmp_path, monkeypatch):
+    clip = tmp_path / "broken.mp4"
+    clip.write_bytes(b"junk")
+    calls = []
+
+    def _failing_run(command, **kwargs):
+        calls.append(command)
+        return SimpleNamespace(returncode=1, stdout="", stderr="moov atom not found")
+
+    monkeypatch.setattr(media_probe.subprocess, "run", _failing_run)
+
+    for _ in range(2):
+        with pytest.raises(media_probe.MediaProbeError) as exc_info:
+            media_probe.probe_media(clip)
+        assert "moov atom not found" in exc_info.value.stderr
+    assert len(calls) == 2
+    with pytest.raises(ValueError):
+        media_probe.probe_media(os.path.join(str(tmp_path), "missing.mp4"))
@@ -0,0 +1,113 @@
+"""Tests for the cross-process provider rate limiter."""
+
+import pytest
+
+from app.adapters import provider_rate_limiter as module
+from app.adapters.provider_rate_limiter import ProviderRateLimiter, parse_provider_rate_limits
+from app.core.errors import ThirdPartyError
+
+
+class _FakeRpc:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def __call__(self, function_name, payload):
+        self.calls.append((function_name, dict(payload)))
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_parse_provider_rate_limits_reads_model_and_provider_defaults():
+    budgets = parse_provider_rate_limits(
+        "vertex_gemini:gemini-2.5-pro=60, vertex_gemini:*=600,vertex_gemini:broken=fast,:x=5"
+    )
+
+    assert budgets == {
+        ("vertex_gemini", "gemini-2.5-pro"): 60.0,
+        ("vertex_gemini", "*"): 600.0,
+    }
+
+
+def test_unbudgeted_models_skip_the_database():
+    rpc = _FakeRpc()
+    limiter = ProviderRateLimiter(budgets={("vertex_gemini", "gemini-2.5-pro"): 60}, rpc=rpc)
+
+    assert limiter.acquire("vertex_gemini", "gemini-2.5-flash") == 0.0
+    limiter.report_rate_limited("vertex_gemini", "gemini-2.5-flash", retry_after_seconds=2)
+
+    assert rpc.calls == []
+
+
+def test_acquire_waits_for_the_shared_bucket_then_proceeds(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(module.random, "uniform", lambda low, _high: low)
+    rpc = _FakeRpc({"granted": False, "wait_seconds": 0.4}, {"granted": True})
+    limiter = ProviderRateLimiter(
+        budgets={("vertex_gemini", "*"): 120},
+        tenant="topic_worker",
+        burst_seconds=5,
+        rpc=rpc,
+    )
+
+    limiter.acquire("vertex_gemini", "gemini-2.5-flash", max_wait_seconds=5)
+
+    assert sleeps == [0.4]
+    function_name, payload = rpc.calls[0]
+    assert function_name == "acquire_provider_rate_limit"
+    assert payload["p_model"] == "gemini-2.5-flash"
+    assert payload["p_tenant"] == "topic_worker"
+    assert payload["p_requests_per_minute"] == 120
+    assert payload["p_burst"] == 10.0
+    assert len(rpc.calls) == 2
+
+
+def test_acquire_refuses_before_sending_when_the_wait_exceeds_the_budget(monkeypatch):
+    monkeypatch.setattr(module.time, "sleep", lambda _seconds: pytest.fail("should not sleep"))
+    rpc = _FakeRpc({"granted": False, "wait_seconds": 30, "rate_scale": 0.25})
+    limiter = ProviderRateLimiter(budgets={("vertex_gemini", "*"): 60}, rpc=rpc)
+
+    with pytest.raises(ThirdPartyError) as exc_info:
+        limiter.acquire("vertex_gemini", "gemini-2.5-pro", max_wait_seconds=2)
+
+    assert exc_info.value.details["status_code"] == 429
+    assert exc_info.value.details["blocked_before_submit"] is True
+
+
+def test_limiter_fails_open_and_skips_the_database_for_a_while():
+    rpc = _FakeRpc(RuntimeError("connection refused"))
+    limiter = ProviderRateLimiter(budgets={("vertex_gemini", "*"): 60}, fail_open_seconds=60, rpc=rpc)
+
+    assert limiter.acquire("vertex_gemini", "gemini-2.5-pro") >= 0.0
+    assert limiter.acquire("vertex_gemini", "gemini-2.5-pro") >= 0.0
+    limiter.report_rate_limited("vertex_gemini", "gemini-2.5-pro", retry_after_seconds=2)
+
+    assert len(rpc.calls) == 1
+
+
+def test_report_rate_limited_shrinks_the_shared_budget():
+    rpc = _FakeRpc({"rate_scale": 0.5, "penalty_until": "2026-10-16T12:00:03+00:00"})
+    limiter = ProviderRateLimiter(
+        budgets={("vertex_gemini", "*"): 60},
+        tenant="audit_worker",
+        min_scale=0.1,
+        rpc=rpc,
+    )
+
+    limiter.report_rate_limited("vertex_gemini", "gemini-2.5-pro", retry_after_seconds=3)
+
+    assert rpc.calls == [
+        (
+            "report_provider_rate_limited",
+            {
+                "p_provider": "vertex_gemini",
+                "p_model": "gemini-2.5-pro",
+                "p_tenant": "audit_worker",
+                "p_retry_after_seconds": 3.0,
+                "p_min_scale": 0.1,
+            },
+        )
+    ]
@@ -75,6 +75,10 @@ class _FakeTable:
         self.filters.append(("lte", key, value))
         return self
 
+    def in_(self, key, values):
+        self.filters.append(("in", key, list(values)))
+        return self
+
     def order(self, key):
         self.order_key = key
         return self
@@ -107,6 +111,8 @@ class _FakeTable:
                 return False
             if operator == "lte" and current > value:
                 return False
+            if operator == "in" and current not in value:
+                return False
         return True
 
 
@@ -577,6 +583,110 @@ def test_dispatch_due_posts_tracks_tiktok_draft_as_user_action(monkeypatch):
     assert post["publish_results"]["tiktok"]["status"] == "awaiting_user_action"
 
 
+def test_dispatch_due_posts_runs_posts_concurrently_under_network_limits(monkeypatch):
+    storage = {
+        "posts": [
+            {
+                "id": f"post-{index}",
+                "batch_id": "batch-1",
+                "video_url": "https://cdn.example.com/video.mp4",
+                "seed_data": {"script_review_status": "approved"},
+                "scheduled_at": f"2026-03-17T08:0{index}:00",
+                "publish_caption": "Shared caption",
+                "social_networks": ["facebook", "tiktok"],
+                "publish_status": "scheduled",
+                "publish_results": {},
+                "platform_ids": {},
+            }
+            for index in range(4)
+        ]
+    }
+    calls = {"load_batch": 0, "tiktok_state": 0}
+    in_flight = {"facebook": 0, "tiktok": 0}
+    peak = {"facebook": 0, "tiktok": 0, "both": 0}
+    logged = []
+
+    def _load_batch(batch_id, fields="id,state,meta_connection"):
+        calls["load_batch"] += 1
+        return {
+            "id": batch_id,
+            "state": BatchState.S7_PUBLISH_PLAN.value,
+            "meta_connection": {
+                "status": "connected",
+                "selected_page": {"id": "page-1", "access_token": "page-token"},
+            },
+        }
+
+    async def _tiktok_state():
+        calls["tiktok_state"] += 1
+        return {"status": "connected", "publish_ready": False}
+
+    async def _track(network, result):
+        in_flight[network] += 1
+        peak[network] = max(peak[network], in_flight[network])
+        peak["both"] = max(peak["both"], min(in_flight["facebook"], in_flight["tiktok"]))
+        await asyncio.sleep(0.01)
+        in_flight[network] -= 1
+        return result
+
+    async def _facebook(post, _meta_connection):
+        return await _track("facebook", f"fb-{post['id']}")
+
+    async def _tiktok_draft(post_id, *, caption=None):
+        return await _track(
+            "tiktok",
+            {
+                "id": f"job-{post_id}",
+                "status": "submitted",
+                "tiktok_publish_id": f"tt-{post_id}",
+                "response_payload_json": {"provider_status": "SEND_TO_USER_INBOX"},
+                "error_message": "",
+            },
+        )
+
+    class _Logger:
+        def info(self, event, **fields):
+            logged.append((event, fields))
+
+        def warning(self, *_args, **_kwargs):
+            return None
+
+    monkeypatch.setattr(publish_handlers, "get_supabase", lambda: _FakeSupabase(storage))
+    monkeypatch.setattr(publish_handlers, "_load_batch", _load_batch)
+    monkeypatch.setattr(publish_handlers, "_reconcile_completed_batches", lambda batch_ids: None)
+    monkeypatch.setattr(publish_handlers, "get_tiktok_publish_state", _tiktok_state)
+    monkeypatch.setattr(publish_handlers, "_publish_facebook_video", _facebook)
+    monkeypatch.setattr(publish_handlers, "upload_tiktok_draft_for_post", _tiktok_draft)
+    monkeypatch.setattr(publish_handlers, "PUBLISH_DISPATCH_MAX_CONCURRENCY", 4)
+    monkeypatch.setitem(publish_handlers.PUBLISH_NETWORK_MAX_CONCURRENCY, "facebook", 2)
+    monkeypatch.setitem(publish_handlers.PUBLISH_NETWORK_MAX_CONCURRENCY, "tiktok", 1)
+    monkeypatch.setattr(publish_handlers, "logger", _Logger())
+
+    result = asyncio.run(publish_handlers.dispatch_due_posts())
+
+    assert result["processed"] == 4
+    assert calls == {"load_batch": 1, "tiktok_state": 1}
+    assert peak["facebook"] == 2
+    assert peak["tiktok"] == 1
+    assert peak["both"] == 1
+    assert all(post["platform_ids"] == {"facebook": f"fb-{post['id']}"} for post in storage["posts"])
+    assert all(post["publish_results"]["tiktok"]["status"] == "awaiting_user_action" for post in storage["posts"])
+    dispatched = [fields for event, fields in logged if event == "meta_due_post_dispatched"]
+    assert sorted(fields["post_id"] for fields in dispatched) == [f"post-{index}" for index in range(4)]
+    assert all(fields["dispatch_lag_seconds"] >= fields["claim_lag_seconds"] > 0 for fields in dispatched)
+
+
+def test_dispatch_lag_seconds_accepts_naive_and_offset_timestamps():
+    now = datetime(2026, 3, 17, 8, 1, 30)
+
+    assert publish_handlers._dispatch_lag_seconds("2026-03-17T08:00:00", now) == 90.0
+    assert publish_handlers._dispatch_lag_seconds("2026-03-17T09:00:00+01:00", now) == 90.0
+    assert publish_handlers._dispatch_lag_seconds("2026-03-17T08:00:00Z", now) == 90.0
+    assert publish_handlers._dispatch_lag_seconds("2026-03-17T08:05:00", now) == 0.0
+    assert publish_handlers._dispatch_lag_seconds(None, now) is None
+    assert publish_handlers._dispatch_lag_seconds("soon", now) is None
+
+
 def test_tiktok_job_result_status_preserves_failed_provider_job():
     status = publish_handlers._tiktok_job_result_status(
         {
@@ -1056,6 +1166,134 @@ def test_publish_instagram_reel_falls_back_to_raw_video_when_captioned_mp4_is_no
     assert transcoded["source_url"] == "https://cdn.example.com/raw.mp4"
 
 
+def test_prepare_publish_variants_builds_only_missing_instagram_variants(monkeypatch):
+    soon = (datetime.utcnow() + timedelta(hours=2)).isoformat()
+    later = (datetime.utcnow() + timedelta(days=30)).isoformat()
+
+    def _post(post_id, **overrides):
+        row = {
+            "id": post_id,
+            "batch_id": "batch-1",
+            "video_url": f"https://cdn.example.com/{post_id}.mp4",
+            "video_status": "caption_completed",
+            "video_metadata": {},
+            "seed_data": {},
+            "social_networks": ["instagram"],
+            "scheduled_at": soon,
+            "publish_status": "scheduled",
+        }
+        row.update(overrides)
+        return row
+
+    storage = {
+        "posts": [
+            _post("needs-variant"),
+            _post("facebook-only", social_networks=["facebook"]),
+            _post("captioning", video_status="caption_processing"),
+            _post("has-variant", video_metadata={"instagram_video_url": "https://cdn.example.com/ig.mp4"}),
+            _post("far-future", scheduled_at=later),
+            _post("already-published", publish_status="published"),
+        ]
+    }
+    monkeypatch.setattr(publish_handlers, "get_supabase", lambda: _FakeSupabase(storage))
+    monkeypatch.setattr(publish_handlers, "_resolve_instagram_video_url", lambda post: post["raw_video_url"])
+    built = []
+    monkeypatch.setattr(
+        publish_handlers,
+        "_create_instagram_safe_video",
+        lambda post, source_url: built.append((post["id"], source_url)) or "https://cdn.example.com/variant.mp4",
+    )
+
+    result = asyncio.run(publish_handlers.prepare_publish_variants())
+
+    assert built == [("needs-variant", "https://cdn.example.com/needs-variant.mp4")]
+    assert result == {"candidates": 1, "prepared": 1, "failed": 0}
+
+
+def test_prepare_publish_variants_counts_failures_without_raising(monkeypatch):
+    soon = (datetime.utcnow() + timedelta(hours=1)).isoformat()
+    storage = {
+        "posts": [
+            {
+                "id": "post-1",
+                "video_url": "https://cdn.example.com/post-1.mp4",
+                "video_metadata": {},
+                "social_networks": ["instagram"],
+                "scheduled_at": soon,
+                "publish_status": "pending",
+            }
+        ]
+    }
+    monkeypatch.setattr(publish_handlers, "get_supabase", lambda: _FakeSupabase(storage))
+    monkeypatch.setattr(publish_handlers, "_resolve_instagram_video_url", lambda post: post["raw_video_url"])
+
+    def _fail(post, source_url):
+        raise ThirdPartyError("Publish variant transcode failed.")
+
+    monkeypatch.setattr(publish_handlers, "_create_instagram_safe_video", _fail)
+
+    result = asyncio.run(publish_handlers.run_publish_variant_job())
+
+    assert result == {"candidates": 1, "prepared": 0, "failed": 1}
+    metadata = storage["posts"][0]["video_metadata"]
+    assert metadata["instagram_variant_attempts"] == 1
+    assert metadata["instagram_variant_error"] == "Publish variant transcode failed."
+    # The next cycle backs off instead of transcoding the same post again.
+    assert asyncio.run(publish_handlers.run_publish_variant_job()) == {"candidates": 0, "prepared": 0, "failed": 0}
+
+
+def test_instagram_variant_retry_backs_off_and_gives_up(monkeypatch):
+    monkeypatch.setattr(publish_handlers, "PUBLISH_VARIANT_RETRY_BASE_MINUTES", 10.0)
+    monkeypatch.setattr(publish_handlers, "PUBLISH_VARIANT_MAX_ATTEMPTS", 3)
+    now = datetime(2026, 10, 16, 12, 0, 0)
+
+    def _failed(attempts, minutes_ago):
+        return {
+            "instagram_variant_attempts": attempts,
+            "instagram_variant_failed_at": (now - timedelta(minutes=minutes_ago)).isoformat(),
+        }
+
+    assert publish_handlers._instagram_variant_retry_due({}, now) is True
+    assert publish_handlers._instagram_variant_retry_due(_failed(1, 5), now) is False
+    assert publish_handlers._instagram_variant_retry_due(_failed(1, 10), now) is True
+    assert publish_handlers._instagram_variant_retry_due(_failed(2, 15), now) is False
+    assert publish_handlers._instagram_variant_retry_due(_failed(2, 20), now) is True
+    assert publish_handlers._instagram_variant_retry_due(_failed(3, 600), now) is False
+
+
+def test_create_instagram_safe_video_merges_into_current_metadata(monkeypatch):
+    storage = {
+        "posts": [
+            {
+                "id": "post-1",
+                "video_metadata": {
+                    "caption_video_url": "https://cdn.example.com/captioned.mp4",
+                    "instagram_variant_attempts": 2,
+                    "instagram_variant_failed_at": "2026-10-16T10:00:00",
+                },
+            }
+        ]
+    }
+    stale_post = {"id": "post-1", "video_metadata": {"caption_video_url": "https://cdn.example.com/captioned.mp4"}}
+    monkeypatch.setattr(publish_handlers, "get_supabase", lambda: _FakeSupabase(storage))
+
+    def _build(**kwargs):
+        # Another worker writes to the row while the transcode runs.
+        storage["posts"][0]["video_metadata"]["caption_alignment"] = {"status": "ok"}
+        return {"url": "https://cdn.example.com/ig.mp4", "storage_key": "ig.mp4", "profile": "instagram_reels"}
+
+    monkeypatch.setattr(publish_handlers, "build_video_variant", _build)
+
+    url = publish_handlers._create_instagram_safe_video(stale_post, "https://cdn.example.com/captioned.mp4")
+
+    metadata = storage["posts"][0]["video_metadata"]
+    assert url == "https://cdn.example.com/ig.mp4"
+    assert metadata["instagram_video_url"] == "https://cdn.example.com/ig.mp4"
+    assert metadata["caption_alignment"] == {"status": "ok"}
+    assert "instagram_variant_attempts" not in metadata
+    assert "instagram_variant_failed_at" not in metadata
+
+
 def test_publish_instagram_reel_uses_persisted_instagram_safe_video(monkeypatch):
     calls = []
 
@@ -4,6 +4,7 @@ import asyncio
 from copy import deepcopy
 from types import SimpleNamespace
 
+import httpx
 import pytest
 
 from app.features.publish import tiktok
@@ -204,9 +205,9 @@ def _production_settings():
     )
 
 
-async def _download_stub(video_url: str):
+async def _probe_stub(video_url: str):
     assert video_url == "https://cdn.example.com/video.mp4"
-    return (b"video-bytes", "video/mp4")
+    return (len(b"video-bytes"), "video/mp4")
 
 
 async def _init_stub(access_token: str, video_size: int):
@@ -257,9 +258,10 @@ async def _direct_init_stub(
     }
 
 
-async def _upload_stub(upload_url: str, video_bytes: bytes, content_type: str, chunk_size: int, total_chunk_count: int):
+async def _upload_stub(upload_url: str, video_url: str, content_type: str, video_size: int, chunk_size: int, total_chunk_count: int):
     assert upload_url in {"https://upload.example.com", "https://upload.example.com/direct"}
-    assert video_bytes == b"video-bytes"
+    assert video_url == "https://cdn.example.com/video.mp4"
+    assert video_size == len(b"video-bytes")
     assert content_type == "video/mp4"
     assert chunk_size == len(b"video-bytes")
     assert total_chunk_count == 1
@@ -386,8 +388,8 @@ def test_upload_tiktok_draft_persists_job_and_post_result(monkeypatch):
     monkeypatch.setattr(tiktok, "get_supabase", lambda: _FakeSupabase(storage))
     monkeypatch.setattr(tiktok, "_initialize_inbox_video_pull_from_url", _init_url_stub)
     monkeypatch.setattr(tiktok, "_poll_publish_status", lambda access_token, publish_id, *, post_mode: asyncio.sleep(0, result={"status": "SEND_TO_USER_INBOX"}))
-    monkeypatch.setattr(tiktok, "_download_video_bytes", _unexpected_upload_call)
-    monkeypatch.setattr(tiktok, "_upload_video_chunks", _unexpected_upload_call)
+    monkeypatch.setattr(tiktok, "_probe_video_source", _unexpected_upload_call)
+    monkeypatch.setattr(tiktok, "_stream_video_chunks", _unexpected_upload_call)
 
     response = asyncio.run(
         tiktok.upload_tiktok_draft(TikTokUploadDraftRequest(post_id="post-1", caption="TikTok caption"))
@@ -503,8 +505,8 @@ def test_upload_tiktok_draft_allows_s8_complete_after_meta_publish(monkeypatch):
     monkeypatch.setattr(tiktok, "get_supabase", lambda: _FakeSupabase(storage))
     monkeypatch.setattr(tiktok, "_initialize_inbox_video_pull_from_url", _init_url_stub)
     monkeypatch.setattr(tiktok, "_poll_publish_status", lambda access_token, publish_id, *, post_mode: asyncio.sleep(0, result={"status": "SEND_TO_USER_INBOX"}))
-    monkeypatch.setattr(tiktok, "_download_video_bytes", _unexpected_upload_call)
-    monkeypatch.setattr(tiktok, "_upload_video_chunks", _unexpected_upload_call)
+    monkeypatch.setattr(tiktok, "_probe_video_source", _unexpected_upload_call)
+    monkeypatch.setattr(tiktok, "_stream_video_chunks", _unexpected_upload_call)
 
     response = asyncio.run(
         tiktok.upload_tiktok_draft(TikTokUploadDraftRequest(post_id="post-1", caption="TikTok caption"))
@@ -540,7 +542,7 @@ def test_publish_tiktok_direct_persists_published_post_result(monkeypatch):
 
     monkeypatch.setattr(tiktok, "get_settings", _production_settings)
     monkeypatch.setattr(tiktok, "get_supabase", lambda: _FakeSupabase(storage))
-    monkeypatch.setattr(tiktok, "_download_video_bytes", _download_stub)
+    monkeypatch.setattr(tiktok, "_probe_video_source", _probe_stub)
     monkeypatch.setattr(tiktok, "_initialize_direct_post", _direct_init_stub)
     monkeypatch.setattr(
         tiktok,
@@ -564,7 +566,7 @@ def test_publish_tiktok_direct_persists_published_post_result(monkeypatch):
             result={"status": "PUBLISH_COMPLETE", "publicaly_available_post_id": ["tt-post-1"]},
         ),
     )
-    monkeypatch.setattr(tiktok, "_upload_video_chunks", _upload_stub)
+    monkeypatch.setattr(tiktok, "_stream_video_chunks", _upload_stub)
 
     response = asyncio.run(
         tiktok.publish_tiktok_direct(
@@ -590,6 +592,91 @@ def test_publish_tiktok_direct_persists_published_post_result(monkeypatch):
     assert storage["posts"][0]["platform_ids"]["tiktok"] == "tt-post-1"
 
 
+def _mock_async_client(monkeypatch, handler):
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        tiktok.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+
+def test_stream_video_chunks_uses_ranged_reads_and_prefetches_next_chunk(monkeypatch):
+    video = bytes(range(23))
+    events = []
+    uploaded = {}
+
+    async def handler(request):
+        if request.method == "GET":
+            start, end = (int(part) for part in request.headers["range"].removeprefix("bytes=").split("-"))
+            events.append(f"get {start}-{end}")
+            return httpx.Response(206, content=video[start:end + 1])
+        content_range = request.headers["content-range"]
+        events.append(f"put-start {content_range}")
+        await asyncio.sleep(0.01)
+        uploaded[content_range] = request.content
+        events.append(f"put-end {content_range}")
+        return httpx.Response(201)
+
+    _mock_async_client(monkeypatch, handler)
+
+    # 23 bytes in 10-byte chunks: the short remainder rides on the final chunk.
+    asyncio.run(
+        tiktok._stream_video_chunks("https://upload.example.com", "https://cdn.example.com/video.mp4", "video/mp4", 23, 10, 2)
+    )
+
+    assert uploaded == {"bytes 0-9/23": video[:10], "bytes 10-22/23": video[10:]}
+    assert events.index("get 10-22") < events.index("put-end bytes 0-9/23")
+
+
+def test_stream_video_chunks_rejects_origin_ignoring_ranges(monkeypatch):
+    async def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, content=b"x" * 23)
+        return httpx.Response(201)
+
+    _mock_async_client(monkeypatch, handler)
+
+    with pytest.raises(ThirdPartyError, match="range download"):
+        asyncio.run(
+            tiktok._stream_video_chunks("https://upload.example.com", "https://cdn.example.com/video.mp4", "video/mp4", 23, 10, 2)
+        )
+
+
+def test_probe_video_source_falls_back_to_one_byte_range(monkeypatch):
+    async def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        assert request.headers["range"] == "bytes=0-0"
+        return httpx.Response(
+            206,
+            content=b"x",
+            headers={"content-range": "bytes 0-0/23", "content-type": "video/mp4; codecs=avc1"},
+        )
+
+    _mock_async_client(monkeypatch, handler)
+
+    assert asyncio.run(tiktok._probe_video_source("https://cdn.example.com/video.mp4")) == (23, "video/mp4")
+
+
+def test_probe_video_source_does_not_download_body_when_range_is_ignored(monkeypatch):
+    body_reads = []
+
+    async def _body():
+        body_reads.append("chunk")
+        yield b"x" * 23
+
+    async def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, content=_body(), headers={"content-length": "23", "content-type": "video/mp4"})
+
+    _mock_async_client(monkeypatch, handler)
+
+    assert asyncio.run(tiktok._probe_video_source("https://cdn.example.com/video.mp4")) == (23, "video/mp4")
+    assert body_reads == []
+
+
 def test_publish_tiktok_direct_allows_s8_complete_after_meta_publish(monkeypatch):
     storage = {
         "posts": [
@@ -621,7 +708,7 @@ def test_publish_tiktok_direct_allows_s8_complete_after_meta_publish(monkeypatch
 
     monkeypatch.setattr(tiktok, "get_settings", _production_settings)
     monkeypatch.setattr(tiktok, "get_supabase", lambda: _FakeSupabase(storage))
-    monkeypatch.setattr(tiktok, "_download_video_bytes", _download_stub)
+    monkeypatch.setattr(tiktok, "_probe_video_source", _probe_stub)
     monkeypatch.setattr(tiktok, "_initialize_direct_post", _direct_init_stub)
     monkeypatch.setattr(
         tiktok,
@@ -645,7 +732,7 @@ def test_publish_tiktok_direct_allows_s8_complete_after_meta_publish(monkeypatch
             result={"status": "PUBLISH_COMPLETE", "publicaly_available_post_id": ["tt-post-1"]},
         ),
     )
-    monkeypatch.setattr(tiktok, "_upload_video_chunks", _upload_stub)
+    monkeypatch.setattr(tiktok, "_stream_video_chunks", _upload_stub)
 
     response = asyncio.run(
         tiktok.publish_tiktok_direct(
@@ -707,7 +794,7 @@ def test_publish_tiktok_direct_surfaces_private_account_restriction(monkeypatch)
 
     monkeypatch.setattr(tiktok, "get_settings", _production_settings)
     monkeypatch.setattr(tiktok, "get_supabase", lambda: _FakeSupabase(storage))
-    monkeypatch.setattr(tiktok, "_download_video_bytes", _download_stub)
+    monkeypatch.setattr(tiktok, "_probe_video_source", _probe_stub)
     monkeypatch.setattr(tiktok, "_initialize_direct_post", _restricted_init)
     monkeypatch.setattr(
         tiktok,
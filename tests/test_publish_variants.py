@@ -0,0 +1,127 @@
+"""Tests for content-addressed pre-publish video variants."""
+
+from hashlib import sha256
+
+import pytest
+
+from app.features.publish import variants
+
+
+class _FakeStorage:
+    def __init__(self, stored=None):
+        self.stored = dict(stored or {})
+        self.lookups = []
+        self.uploads = []
+
+    def video_variant_key(self, *, source_sha256, profile):
+        return f"videos/variants/{profile}/{source_sha256}.mp4"
+
+    def find_video_variant(self, *, source_sha256, profile):
+        self.lookups.append(source_sha256)
+        key = self.video_variant_key(source_sha256=source_sha256, profile=profile)
+        if key not in self.stored:
+            return None
+        return {"storage_key": key, "url": f"https://cdn.example.com/{key}", "size": self.stored[key]}
+
+    def upload_video_file(self, *, path, file_name, correlation_id, content_type, object_key):
+        with open(path, "rb") as handle:
+            payload = handle.read()
+        self.uploads.append(object_key)
+        self.stored[object_key] = len(payload)
+        return {"storage_key": object_key, "url": f"https://cdn.example.com/{object_key}", "size": len(payload)}
+
+
+@pytest.fixture
+def transcodes(monkeypatch):
+    calls = []
+
+    def _fake_transcode(source_path, output_path, profile, *, correlation_id):
+        calls.append((source_path, profile))
+        with open(output_path, "wb") as handle:
+            handle.write(b"variant")
+
+    monkeypatch.setattr(variants, "_transcode", _fake_transcode)
+    return calls
+
+
+def test_known_digest_reuses_stored_variant_without_download(monkeypatch, transcodes):
+    digest = "a" * 64
+    key = f"videos/variants/{variants.INSTAGRAM_REELS_PROFILE}/{digest}.mp4"
+    storage = _FakeStorage({key: 7})
+    monkeypatch.setattr(variants, "get_storage_client", lambda: storage)
+    monkeypatch.setattr(
+        variants, "_download_source", lambda *_args: (_ for _ in ()).throw(AssertionError("should not download"))
+    )
+
+    variant = variants.build_video_variant(
+        source_url="https://cdn.example.com/captioned.mp4",
+        profile=variants.INSTAGRAM_REELS_PROFILE,
+        correlation_id="c1",
+        source_sha256=digest,
+    )
+
+    assert variant["reused"] is True
+    assert variant["storage_key"] == key
+    assert variant["source_sha256"] == digest
+    assert transcodes == []
+    assert storage.uploads == []
+
+
+def test_local_source_is_hashed_transcoded_and_stored_under_its_digest(monkeypatch, tmp_path, transcodes):
+    source = tmp_path / "captioned.mp4"
+    source.write_bytes(b"captioned-video")
+    digest = sha256(b"captioned-video").hexdigest()
+    storage = _FakeStorage()
+    monkeypatch.setattr(variants, "get_storage_client", lambda: storage)
+
+    variant = variants.build_video_variant(
+        source_url="https://cdn.example.com/captioned.mp4",
+        profile=variants.INSTAGRAM_REELS_PROFILE,
+        correlation_id="c1",
+        source_path=str(source),
+    )
+
+    assert variant["reused"] is False
+    assert variant["source_sha256"] == digest
+    assert storage.lookups == [digest]
+    assert storage.uploads == [f"videos/variants/{variants.INSTAGRAM_REELS_PROFILE}/{digest}.mp4"]
+    assert transcodes == [(str(source), variants.INSTAGRAM_REELS_PROFILE)]
+    assert variants.instagram_variant_metadata(variant) == {
+        "instagram_video_url": variant["url"],
+        "instagram_video_storage_key": storage.uploads[0],
+        "instagram_video_profile": variants.INSTAGRAM_REELS_PROFILE,
+        "instagram_video_source_sha256": digest,
+    }
+
+
+def test_downloaded_source_with_stored_variant_skips_transcode(monkeypatch, transcodes):
+    digest = sha256(b"raw-video").hexdigest()
+    key = f"videos/variants/{variants.INSTAGRAM_REELS_PROFILE}/{digest}.mp4"
+    storage = _FakeStorage({key: 7})
+    monkeypatch.setattr(variants, "get_storage_client", lambda: storage)
+
+    def _fake_download(source_url, destination_path):
+        with open(destination_path, "wb") as handle:
+            handle.write(b"raw-video")
+        return digest
+
+    monkeypatch.setattr(variants, "_download_source", _fake_download)
+
+    variant = variants.build_video_variant(
+        source_url="https://cdn.example.com/raw.mp4",
+        profile=variants.INSTAGRAM_REELS_PROFILE,
+        correlation_id="c1",
+    )
+
+    assert variant["reused"] is True
+    assert variant["storage_key"] == key
+    assert transcodes == []
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        variants.build_video_variant(
+            source_url="https://cdn.example.com/raw.mp4",
+            profile="tiktok-unknown",
+            correlation_id="c1",
+        )
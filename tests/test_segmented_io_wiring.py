@@ -5,7 +5,13 @@ construction in handlers and the poller's poll → record → stitch / fail / wa
 external IO (Veo/Vertex clients, Supabase, the stitcher, the completion store) is faked.
 """
 
+import os
+import time
+from contextlib import contextmanager
 from dataclasses import replace
+from pathlib import Path
+
+import pytest
 
 import app.core.video_profiles as vp_profiles
 import app.features.videos.handlers as h
@@ -251,6 +257,12 @@ class _FakeVeoClient:
         self.downloaded.append(video_uri)
         return f"bytes::{video_uri}".encode()
 
+    def download_video_to_file(self, *, video_uri, destination_path, correlation_id):
+        self.downloaded.append(video_uri)
+        payload = f"bytes::{video_uri}".encode()
+        Path(destination_path).write_bytes(payload)
+        return len(payload)
+
 
 def _segmented_post(ops):
     return {
@@ -273,6 +285,11 @@ def _ops(states):
     ]
 
 
+@pytest.fixture(autouse=True)
+def _isolated_segment_staging(monkeypatch, tmp_path):
+    monkeypatch.setattr(vp, "SEGMENT_STAGING_ROOT", str(tmp_path / "segment-stage"))
+
+
 def _patch_common(monkeypatch, fake_sb):
     monkeypatch.setattr(vp, "get_supabase", lambda: fake_sb)
     monkeypatch.setattr(vp, "_veo_available", True)
@@ -288,21 +305,31 @@ def test_handle_segmented_video_stitches_when_all_complete(monkeypatch):
     stitched = {}
     def _fake_stitch(**kwargs):
         stitched.update(kwargs)
-        return b"FINAL", {"output_duration_seconds": 16.0}
-    monkeypatch.setattr(vp, "stitch_segments", _fake_stitch)
+        stitched["segment_bytes"] = [Path(path).read_bytes() for path in kwargs["segment_paths"]]
+        Path(kwargs["output_path"]).write_bytes(b"FINAL")
+        return {"output_duration_seconds": 16.0}
+    monkeypatch.setattr(vp, "stitch_segments_to_file", _fake_stitch)
 
     stored = {}
     def _fake_store(**kwargs):
         stored.update(kwargs)
+        stored["video_bytes"] = Path(kwargs["video_path"]).read_bytes()
     monkeypatch.setattr(vp, "_store_completed_video", _fake_store)
 
     post = _segmented_post(_ops(["submitted", "submitted"]))
     vp._handle_segmented_video(post, "corr")
 
-    # Both segments downloaded in index order, stitched bytes handed to the completion store.
-    assert fake_veo.downloaded == ["gs://seg/0.mp4", "gs://seg/1.mp4"]
+    # Each segment streamed to disk once; the stitcher reads the staged files in index order.
+    assert sorted(fake_veo.downloaded) == ["gs://seg/0.mp4", "gs://seg/1.mp4"]
+    assert stitched["segment_bytes"] == [
+        b"bytes::gs://seg/0.mp4",
+        b"bytes::gs://seg/1.mp4",
+    ]
+    assert not Path(vp._segment_staging_dir("post-1")).exists()  # staging cleared after store
     assert stitched["trim_windows"] is None
-    assert stored["video_source"] == b"FINAL"
+    # The stitched clip is uploaded from the staging dir, never loaded into memory.
+    assert stored["video_bytes"] == b"FINAL"
+    assert "video_source" not in stored
     assert stored["provider_metadata"]["segmented"] is True
     # We never persist a "stitching" status (the posts CHECK constraint forbids it); the post stays
     # processing until the completion store flips it to caption_pending.
@@ -332,8 +359,9 @@ def test_handle_segmented_video_uses_actual_transcript_windows_for_stitching(mon
     stitched = {}
     def _fake_stitch(**kwargs):
         stitched.update(kwargs)
-        return b"FINAL", {"output_duration_seconds": 5.0}
-    monkeypatch.setattr(vp, "stitch_segments", _fake_stitch)
+        Path(kwargs["output_path"]).write_bytes(b"FINAL")
+        return {"output_duration_seconds": 5.0}
+    monkeypatch.setattr(vp, "stitch_segments_to_file", _fake_stitch)
     monkeypatch.setattr(vp, "_store_completed_video", lambda **_kwargs: None)
 
     post = _segmented_post(_ops(["submitted", "submitted"]))
@@ -355,7 +383,7 @@ def test_handle_segmented_video_waits_when_partial(monkeypatch):
     _patch_common(monkeypatch, fake_sb)
     fake_veo = _FakeVeoClient({"op-0": (True, "gs://seg/0.mp4", False), "op-1": (False, None, False)})
     monkeypatch.setattr(vp, "get_veo_client", lambda: fake_veo)
-    monkeypatch.setattr(vp, "stitch_segments", lambda **kw: (_ for _ in ()).throw(AssertionError("must not stitch")))
+    monkeypatch.setattr(vp, "stitch_segments_to_file", lambda **kw: (_ for _ in ()).throw(AssertionError("must not stitch")))
     marked = {}
     monkeypatch.setattr(vp, "_mark_processing", lambda pid, cid, op: marked.update({"post": pid}))
 
@@ -363,6 +391,71 @@ def test_handle_segmented_video_waits_when_partial(monkeypatch):
     vp._handle_segmented_video(post, "corr")
 
     assert marked.get("post") == "post-1"  # stayed processing, no stitch
+    # The finished segment is already staged on disk for the eventual stitch.
+    assert fake_veo.downloaded == ["gs://seg/0.mp4"]
+    assert Path(vp._staged_segment_path("post-1", "gs://seg/0.mp4")).is_file()
+
+
+def test_handle_segmented_video_stitch_reuses_prefetched_segments(monkeypatch):
+    fake_sb = _FakeSupabase()
+    _patch_common(monkeypatch, fake_sb)
+    fake_veo = _FakeVeoClient({"op-0": (True, "gs://seg/0.mp4", False), "op-1": (False, None, False)})
+    monkeypatch.setattr(vp, "get_veo_client", lambda: fake_veo)
+    monkeypatch.setattr(vp, "_mark_processing", lambda *a, **kw: None)
+    post = _segmented_post(_ops(["submitted", "submitted"]))
+    vp._handle_segmented_video(post, "corr")
+
+    fake_veo._statuses["op-1"] = (True, "gs://seg/1.mp4", False)
+    monkeypatch.setattr(vp, "stitch_segments_to_file", lambda **kw: Path(kw["output_path"]).write_bytes(b"FINAL") and {})
+    monkeypatch.setattr(vp, "_store_completed_video", lambda **kw: None)
+    vp._handle_segmented_video(post, "corr")
+
+    # Segment 0 was staged on the earlier poll and is not downloaded again.
+    assert fake_veo.downloaded == ["gs://seg/0.mp4", "gs://seg/1.mp4"]
+
+
+
+def test_prefetch_downloads_hold_a_heavy_work_slot(monkeypatch):
+    fake_veo = _FakeVeoClient({})
+    monkeypatch.setattr(vp, "get_veo_client", lambda: fake_veo)
+    slots = []
+
+    @contextmanager
+    def _fake_slot(post_id, correlation_id):
+        slots.append(post_id)
+        yield
+
+    def _fake_stage(provider, post_id, uris, correlation_id):
+        assert slots == [post_id]
+        return []
+
+    monkeypatch.setattr(vp, "_heavy_work_slot", _fake_slot)
+    monkeypatch.setattr(vp, "_stage_segments", _fake_stage)
+
+    vp._prefetch_completed_segments("veo_3_1", "post-1", ["gs://seg/0.mp4"], "corr")
+
+    assert slots == ["post-1"]
+
+
+def test_sweep_removes_stale_staging_dirs_of_posts_no_longer_pollable(monkeypatch):
+    monkeypatch.setattr(vp, "SEGMENT_STAGING_STALE_SECONDS", 600)
+    root = Path(vp.SEGMENT_STAGING_ROOT)
+    for post_id in ("active", "left-old", "left-recent"):
+        (root / post_id).mkdir(parents=True)
+        (root / post_id / "segment_x.mp4").write_bytes(b"seg")
+    now = time.time()
+    old = now - 3600
+    os.utime(root / "active", (old, old))
+    os.utime(root / "left-old", (old, old))
+
+    removed = vp._sweep_stale_segment_staging({"active"}, now=now)
+
+    assert removed == 1
+    assert sorted(path.name for path in root.iterdir()) == ["active", "left-recent"]
+
+
+def test_sweep_tolerates_missing_staging_root():
+    assert vp._sweep_stale_segment_staging(set()) == 0
 
 
 def test_handle_segmented_video_fails_when_any_segment_fails(monkeypatch):
@@ -370,7 +463,7 @@ def test_handle_segmented_video_fails_when_any_segment_fails(monkeypatch):
     _patch_common(monkeypatch, fake_sb)
     fake_veo = _FakeVeoClient({"op-0": (True, "gs://seg/0.mp4", False), "op-1": (False, None, True)})
     monkeypatch.setattr(vp, "get_veo_client", lambda: fake_veo)
-    monkeypatch.setattr(vp, "stitch_segments", lambda **kw: (_ for _ in ()).throw(AssertionError("must not stitch")))
+    monkeypatch.setattr(vp, "stitch_segments_to_file", lambda **kw: (_ for _ in ()).throw(AssertionError("must not stitch")))
     released = {}
     monkeypatch.setattr(vp, "release_quota", lambda **kw: released.update(kw))
 
@@ -418,10 +511,10 @@ def test_handle_segmented_video_submits_i2v_when_anchor_completes(monkeypatch):
     monkeypatch.setattr(vp, "_download_segment_bytes", lambda *a, **k: b"ANCHOR_BYTES")
     monkeypatch.setattr(vp, "record_prompt_audit", lambda **kw: None)
     monkeypatch.setattr(
-        vp, "stitch_segments", lambda **kw: (_ for _ in ()).throw(AssertionError("must not stitch yet"))
+        vp, "stitch_segments_to_file", lambda **kw: (_ for _ in ()).throw(AssertionError("must not stitch yet"))
     )
     marked = {}
-    monkeypatch.setattr(vp, "_mark_processing", lambda pid, cid, op: marked.update({"post": pid}))
+    monkeypatch.setattr(vp, "_mark_processing", lambda pid, cid, op, **kw: marked.update({"post": pid, **kw}))
 
     captured = {}
     def _fake_submit(*, post_id, metadata, anchor_video_bytes, correlation_id, persist_op):
@@ -441,6 +534,7 @@ def test_handle_segmented_video_submits_i2v_when_anchor_completes(monkeypatch):
     assert final_meta["i2v_lock"]["state"] == sp.I2V_STATE_SUBMITTED  # fan-out marked done
     assert any(o["index"] == 1 and o["operation_id"] == "i2v-op-1" for o in final_meta["veo_segment_ops"])
     assert marked.get("post") == "post-1"  # still processing, not stitched
+    assert marked.get("operation_submitted") is True  # i2v ops restart the poll schedule
 
 
 def test_handle_segmented_video_stitches_after_i2v_segments_complete(monkeypatch):
@@ -452,9 +546,14 @@ def test_handle_segmented_video_stitches_after_i2v_segments_complete(monkeypatch
     monkeypatch.setattr(
         vp, "submit_locked_segments", lambda **kw: (_ for _ in ()).throw(AssertionError("already submitted"))
     )
-    monkeypatch.setattr(vp, "stitch_segments", lambda **kw: (b"FINAL", {"output_duration_seconds": 16.0}))
+    def _fake_stitch(**kwargs):
+        Path(kwargs["output_path"]).write_bytes(b"FINAL")
+        return {"output_duration_seconds": 16.0}
+    monkeypatch.setattr(vp, "stitch_segments_to_file", _fake_stitch)
     stored = {}
-    monkeypatch.setattr(vp, "_store_completed_video", lambda **kw: stored.update(kw))
+    monkeypatch.setattr(
+        vp, "_store_completed_video", lambda **kw: stored.update(kw, video_bytes=Path(kw["video_path"]).read_bytes())
+    )
 
     ops = [
         {"index": 0, "operation_id": "op-0", "status": "completed", "video_uri": "gs://seg/0.mp4", "kind": sp.SEGMENT_KIND_ANCHOR},
@@ -462,5 +561,5 @@ def test_handle_segmented_video_stitches_after_i2v_segments_complete(monkeypatch
     ]
     vp._handle_segmented_video(_i2v_post(lock_state=sp.I2V_STATE_SUBMITTED, ops=ops), "corr")
 
-    assert fake_veo.downloaded == ["gs://seg/0.mp4", "gs://seg/1.mp4"]  # both segments stitched in order
-    assert stored.get("video_source") == b"FINAL"
+    assert sorted(fake_veo.downloaded) == ["gs://seg/0.mp4", "gs://seg/1.mp4"]  # both segments staged
+    assert stored.get("video_bytes") == b"FINAL"
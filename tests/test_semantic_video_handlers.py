@@ -69,17 +69,19 @@ def test_scene_image_progress_rpc_cancels_by_absolute_wall_clock(monkeypatch):
 
     from app.features.semantic_videos import queries
 
-    class SlowClient:
-        async def __aenter__(self):
-            return self
+    from app.adapters import deadline_http
 
-        async def __aexit__(self, *_args):
-            return None
+    class SlowClient:
+        is_closed = False
 
-        async def post(self, *_args, **_kwargs):
+        async def request(self, *_args, **_kwargs):
             await asyncio.sleep(1)
 
-    monkeypatch.setattr(queries.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+        async def aclose(self):
+            return None
+
+    monkeypatch.setattr(deadline_http.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+    monkeypatch.setattr(deadline_http, "_transport", deadline_http.DeadlineHttpTransport())
     started = time.monotonic()
     with pytest.raises(StateTransitionError, match="absolute deadline"):
         queries._AbsoluteDeadlineRpc(
@@ -98,17 +100,19 @@ def test_scene_image_control_rpcs_share_the_absolute_wall_clock_boundary(
 
     from app.features.semantic_videos import queries
 
-    class SlowClient:
-        async def __aenter__(self):
-            return self
+    from app.adapters import deadline_http
 
-        async def __aexit__(self, *_args):
-            return None
+    class SlowClient:
+        is_closed = False
 
-        async def post(self, *_args, **_kwargs):
+        async def request(self, *_args, **_kwargs):
             await asyncio.sleep(1)
 
-    monkeypatch.setattr(queries.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+        async def aclose(self):
+            return None
+
+    monkeypatch.setattr(deadline_http.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+    monkeypatch.setattr(deadline_http, "_transport", deadline_http.DeadlineHttpTransport())
     calls = (
         lambda: queries.authorize_scene_image_provider_attempt(
             job_id="job-1",
@@ -158,17 +162,19 @@ def test_scene_image_reconciliation_read_has_an_absolute_wall_clock_boundary(
 
     from app.features.semantic_videos import queries
 
-    class SlowClient:
-        async def __aenter__(self):
-            return self
+    from app.adapters import deadline_http
 
-        async def __aexit__(self, *_args):
-            return None
+    class SlowClient:
+        is_closed = False
 
-        async def get(self, *_args, **_kwargs):
+        async def request(self, *_args, **_kwargs):
             await asyncio.sleep(1)
 
-    monkeypatch.setattr(queries.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+        async def aclose(self):
+            return None
+
+    monkeypatch.setattr(deadline_http.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+    monkeypatch.setattr(deadline_http, "_transport", deadline_http.DeadlineHttpTransport())
     started = time.monotonic()
     with pytest.raises(StateTransitionError, match="job read"):
         queries.get_scene_image_job("post-1", timeout_seconds=0.02)
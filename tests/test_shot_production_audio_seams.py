@@ -4,6 +4,7 @@ import json
 import pytest
 
 from app.core.errors import ValidationError
+import app.features.shot_production.audio_seams as audio_seams
 from app.features.shot_production.audio_seams import (
     ACOUSTIC_ANALYZER_VERSION,
     AcousticSeamPlan,
@@ -15,6 +16,8 @@ from app.features.shot_production.audio_seams import (
     _extend_delivery_windows,
     acoustic_analysis_cache_key,
     analyze_audio_frames,
+    decode_frame_metrics,
+    encode_frame_metrics,
     parse_frame_metrics,
     plan_acoustic_seams,
 )
@@ -193,6 +196,88 @@ def test_analyze_audio_frames_rejects_failed_ffprobe(tmp_path):
         analyze_audio_frames(media_path, run_fn=lambda *_args, **_kwargs: Result())
 
 
+def test_frame_metrics_cache_encoding_round_trips():
+    frames = (
+        AudioFrameMetrics(0.0, -120.0, -90.5, 0.0, 0.0, 0.0),
+        AudioFrameMetrics(0.016, -45.1, -32.0, 0.116, 3760.0, 0.61),
+    )
+
+    blob = encode_frame_metrics(frames)
+
+    assert len(blob) == 8 + 2 * 6 * 8
+    assert decode_frame_metrics(blob) == frames
+    with pytest.raises(ValidationError):
+        decode_frame_metrics(blob[:-1])
+
+
+def test_ffprobe_version_is_not_cached_across_injected_runners(monkeypatch):
+    monkeypatch.setattr(audio_seams, "_ffprobe_version_value", None)
+
+    def runner_for(version):
+        def run(command, **kwargs):
+            return type("Result", (), {"returncode": 0, "stdout": f"ffprobe version {version}\n", "stderr": ""})()
+
+        return run
+
+    assert audio_seams._ffprobe_version(runner_for("6.0")) == "ffprobe version 6.0"
+    assert audio_seams._ffprobe_version(runner_for("7.1")) == "ffprobe version 7.1"
+    assert audio_seams._ffprobe_version_value is None
+
+
+def test_analyze_audio_frames_reuses_cached_metrics(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_seams, "_ffprobe_version_value", None)
+    media_path = tmp_path / "take.mp4"
+    media_path.write_bytes(b"video")
+    copy_path = tmp_path / "take-copy.mp4"
+    copy_path.write_bytes(b"video")
+    analysis_calls = []
+
+    class Result:
+        def __init__(self, stdout):
+            self.returncode = 0
+            self.stdout = stdout
+            self.stderr = ""
+
+    def fake_run(command, **kwargs):
+        if command == ["ffprobe", "-version"]:
+            return Result("ffprobe version 7.1 Copyright (c) 2007-2024\nbuilt with gcc")
+        analysis_calls.append(command)
+        return Result(json.dumps({"frames": [_frame("0.0"), _frame("0.016")]}))
+
+    cache_dir = tmp_path / "acoustic-analysis"
+    first = analyze_audio_frames(media_path, run_fn=fake_run, cache_dir=cache_dir)
+    second = analyze_audio_frames(copy_path, run_fn=fake_run, cache_dir=cache_dir)
+
+    assert second == first
+    assert len(analysis_calls) == 1
+    assert len(list(cache_dir.rglob("*.afm"))) == 1
+
+    media_path.write_bytes(b"different video")
+    analyze_audio_frames(media_path, run_fn=fake_run, cache_dir=cache_dir)
+    assert len(analysis_calls) == 2
+
+
+def test_frame_window_queries_match_linear_scan():
+    take = _evidence(0, duration=2.0, first_word=0.5, final_word=1.5)
+    columns = audio_seams._frame_columns(take)
+    shuffled = TakeAudioEvidence(
+        take_index=0,
+        provider_duration_seconds=take.provider_duration_seconds,
+        first_word_start_seconds=take.first_word_start_seconds,
+        final_word_end_seconds=take.final_word_end_seconds,
+        frames=tuple(reversed(take.frames)),
+    )
+
+    assert columns.ordered
+    assert not audio_seams._frame_columns(shuffled).ordered
+    for start, end in ((0.0, 0.032), (0.5, 0.5), (0.48, 0.52), (1.49, 2.5), (-1.0, 0.0)):
+        expected = audio_seams._frames_between(take, start, end)
+        assert audio_seams._frames_between(take, start, end, columns=columns) == expected
+        assert audio_seams._frames_between(
+            shuffled, start, end, columns=audio_seams._frame_columns(shuffled)
+        ) == tuple(reversed(expected))
+
+
 def _evidence(
     index,
     *,
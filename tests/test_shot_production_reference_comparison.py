@@ -55,6 +55,41 @@ def test_edit_metrics_reject_invalid_duration_or_cut_timeline(duration, cuts):
         derive_edit_metrics(duration, cuts)
 
 
+
+def test_probe_edit_metrics_takes_duration_from_shared_media_probe(tmp_path, monkeypatch):
+    from app.adapters.media_probe import MediaProbe
+    from app.features.shot_production import reference_comparison
+
+    media_path = tmp_path / "candidate.mp4"
+    media_path.write_bytes(b"video")
+    probed = []
+
+    def fake_probe_media(path):
+        probed.append(path)
+        return MediaProbe(payload={"format": {"duration": "10.0"}})
+
+    class Result:
+        returncode = 0
+        stdout = json.dumps({"frames": [{"tags": {"lavfi.scd.time": "4.0", "lavfi.scd.score": "9.5"}}]})
+
+    commands = []
+
+    def fake_run(command, **_kwargs):
+        commands.append(command)
+        return Result()
+
+    monkeypatch.setattr(reference_comparison, "probe_media", fake_probe_media)
+
+    metrics = reference_comparison.probe_edit_metrics(media_path, run_fn=fake_run)
+
+    assert probed == [media_path]
+    assert len(commands) == 1
+    assert "lavfi" in commands[0]
+    assert metrics["duration_seconds"] == 10.0
+    assert metrics["cut_timestamps_seconds"] == [4.0]
+    assert metrics["scene_scores"] == [9.5]
+
+
 def _write_valid_candidate_manifest(path, candidate_path):
     candidate_bytes = candidate_path.read_bytes()
     candidate_sha256 = sha256(candidate_bytes).hexdigest()
@@ -1467,7 +1467,10 @@ def test_compose_orders_takes_uses_trim_windows_and_captions_once(tmp_path):
         probe_fn=lambda _path: _valid_final_probe(),
     )
 
-    assert stitch_calls[0]["segment_videos"] == [b"clip-0", b"clip-1"]
+    assert [Path(path).read_bytes() for path in stitch_calls[0]["segment_paths"]] == [
+        b"clip-0",
+        b"clip-1",
+    ]
     assert stitch_calls[0]["trim_windows"] == [take["trim_window"] for take in payload["takes"]]
     assert stitch_calls[0]["target_duration_seconds"] == 16.0
     assert len(caption_calls) == 1
@@ -1798,7 +1801,7 @@ def test_compose_acoustic_mode_plans_crossfades_and_requires_acoustic_gate(tmp_p
         "punch_in_center",
     ]
     assert stitch_calls[0]["target_duration_seconds"] == 16.0
-    assert stitch_calls[0]["segment_videos"][1] == b"room-tone-bridged"
+    assert Path(stitch_calls[0]["segment_paths"][1]).read_bytes() == b"room-tone-bridged"
     saved = _read(manifest_path)
     assert saved["acoustic_seam_qa"]["passed"] is True
     assert len(saved["acoustic_seam_qa"]["clips"]) == 1
@@ -3017,6 +3020,68 @@ def test_upload_resume_reconciles_committed_put_after_lost_response_without_seco
     assert _read(manifest_path)["upload_verification"]["passed"] is True
 
 
+def test_upload_streams_the_captioned_file_when_storage_supports_it(tmp_path):
+    from app.features.shot_production.runner import upload_final
+
+    class FileStorage:
+        def __init__(self):
+            self.file_uploads = []
+
+        def prepare_video_upload(self, **kwargs):
+            return {
+                "storage_provider": "fake_r2",
+                "storage_key": "videos/content-addressed-final.mp4",
+                "url": "https://cdn.example.test/videos/content-addressed-final.mp4",
+                "file_path": "videos/content-addressed-final.mp4",
+                "size": kwargs["expected_size"],
+                "sha256": kwargs["expected_sha256"],
+                "file_type": "video/mp4",
+            }
+
+        def upload_video(self, **_kwargs):
+            raise AssertionError("captioned file should not be read into memory")
+
+        def upload_video_file(self, **kwargs):
+            self.file_uploads.append(kwargs)
+            content = Path(kwargs["path"]).read_bytes()
+            return {
+                "storage_key": kwargs["object_key"],
+                "url": "https://cdn.example.test/videos/content-addressed-final.mp4",
+                "size": len(content),
+                "sha256": sha256(content).hexdigest(),
+            }
+
+        def verify_video_upload(self, **kwargs):
+            return {
+                "passed": bool(self.file_uploads),
+                "failure_reasons": [] if self.file_uploads else ["not_found"],
+                "storage_key": kwargs["storage_key"],
+            }
+
+    manifest_path = _manifest_with_raw_takes(tmp_path)
+    payload = _read(manifest_path)
+    captioned = manifest_path.parent / "final-captioned.mp4"
+    captioned.write_bytes(b"captioned-video")
+    payload["caption"] = {
+        "captioned_path": str(captioned),
+        "sha256": sha256(captioned.read_bytes()).hexdigest(),
+        "bytes": captioned.stat().st_size,
+    }
+    payload["seam_qa"] = {"passed": True}
+    payload["media_qa"] = {"passed": True}
+    payload["voice_qa"] = {"passed": True}
+    manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    storage = FileStorage()
+
+    upload_final(manifest_path, storage)
+
+    assert len(storage.file_uploads) == 1
+    assert storage.file_uploads[0]["path"] == str(captioned)
+    assert storage.file_uploads[0]["expected_sha256"] == payload["caption"]["sha256"]
+    assert storage.file_uploads[0]["object_key"] == "videos/content-addressed-final.mp4"
+    assert _read(manifest_path)["status"] == "uploaded"
+
+
 def test_invalidate_composition_preserves_passed_takes_and_archives_delivery(tmp_path):
     from app.features.shot_production.runner import invalidate_composition
 
@@ -82,3 +82,165 @@ class TestStorageDownload:
                 correlation_id="missing-object-test",
                 timeout_seconds=0.1,
             )
+
+    def test_download_video_to_file_streams_to_disk(self, tmp_path):
+        import httpx
+
+        StorageClient._instance = None
+        with patch.object(StorageClient, "__init__", lambda self: None):
+            client = StorageClient()
+        payload = b"x" * (3 * 1024 * 1024 + 17)
+        client._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=payload))
+        )
+        destination = tmp_path / "source.mp4"
+
+        size = client.download_video_to_file(
+            video_url="https://cdn.example.com/videos/test.mp4",
+            destination_path=str(destination),
+            correlation_id="test_stream",
+        )
+
+        assert size == len(payload)
+        assert destination.read_bytes() == payload
+
+
+class TestStorageFileUpload:
+    @staticmethod
+    def _client():
+        StorageClient._instance = None
+        with patch.object(StorageClient, "__init__", lambda self: None):
+            client = StorageClient()
+        client.bucket_name = "bucket"
+        client.public_base_url = "https://cdn.example.com"
+        client.object_prefix = "videos"
+        client.client = MagicMock()
+        uploaded = {}
+
+        def upload_fileobj(fileobj, bucket, key, ExtraArgs=None, Config=None):
+            # s3transfer only reads non-seekable streams front to back, in part-sized reads.
+            assert not hasattr(fileobj, "seek")
+            uploaded[key] = b"".join(iter(lambda: fileobj.read(4), b""))
+
+        client.client.upload_fileobj.side_effect = upload_fileobj
+        return client, uploaded
+
+    def test_upload_video_file_matches_upload_video_result(self, tmp_path):
+        from hashlib import sha256
+
+        client, uploaded = self._client()
+        video = tmp_path / "captioned.mp4"
+        video.write_bytes(b"captioned-video")
+
+        result = client.upload_video_file(path=str(video), file_name="captioned.mp4", correlation_id="c1")
+
+        expected_sha256 = sha256(b"captioned-video").hexdigest()
+        assert uploaded[result["storage_key"]] == b"captioned-video"
+        assert result["size"] == len(b"captioned-video")
+        assert result["sha256"] == expected_sha256
+        assert result["url"] == f"https://cdn.example.com/{result['storage_key']}"
+        assert set(result) == {
+            "storage_provider", "storage_key", "url", "thumbnail_url", "file_path", "size", "sha256", "file_type",
+        }
+        args, kwargs = client.client.upload_fileobj.call_args
+        assert args[1:3] == ("bucket", result["storage_key"])
+        assert kwargs["ExtraArgs"]["ContentType"] == "video/mp4"
+        assert "Metadata" not in kwargs["ExtraArgs"]
+        assert kwargs["Config"].max_in_memory_upload_chunks >= 1
+        copy_kwargs = client.client.copy_object.call_args.kwargs
+        assert copy_kwargs["CopySource"] == {"Bucket": "bucket", "Key": result["storage_key"]}
+        assert copy_kwargs["MetadataDirective"] == "REPLACE"
+        assert copy_kwargs["Metadata"] == {"sha256": expected_sha256}
+        assert copy_kwargs["ContentType"] == "video/mp4"
+        client.client.put_object.assert_not_called()
+
+    def test_upload_video_file_sets_known_digest_up_front(self):
+        import io
+        from hashlib import sha256
+
+        client, _ = self._client()
+        expected_sha256 = sha256(b"final-video").hexdigest()
+
+        result = client.upload_video_file(
+            fileobj=io.BytesIO(b"final-video"),
+            file_name="final.mp4",
+            object_key="videos/final.mp4",
+            expected_sha256=expected_sha256.upper(),
+        )
+
+        assert result["storage_key"] == "videos/final.mp4"
+        assert result["size"] == len(b"final-video")
+        assert result["sha256"] == expected_sha256
+        extra_args = client.client.upload_fileobj.call_args.kwargs["ExtraArgs"]
+        assert extra_args["Metadata"] == {"sha256": expected_sha256}
+        client.client.copy_object.assert_not_called()
+
+    def test_upload_video_file_removes_object_when_digest_mismatches(self):
+        import io
+
+        client, _ = self._client()
+
+        with pytest.raises(ValueError, match="SHA-256"):
+            client.upload_video_file(
+                fileobj=io.BytesIO(b"changed-video"),
+                file_name="final.mp4",
+                object_key="videos/final.mp4",
+                expected_sha256="a" * 64,
+            )
+
+        client.client.delete_object.assert_called_once_with(Bucket="bucket", Key="videos/final.mp4")
+        client.client.copy_object.assert_not_called()
+
+    def test_upload_video_file_requires_exactly_one_source(self, tmp_path):
+        import io
+
+        client, _ = self._client()
+
+        with pytest.raises(ValueError):
+            client.upload_video_file(file_name="final.mp4")
+        with pytest.raises(ValueError):
+            client.upload_video_file(
+                path=str(tmp_path / "final.mp4"),
+                fileobj=io.BytesIO(b"x"),
+                file_name="final.mp4",
+            )
+        client.client.upload_fileobj.assert_not_called()
+
+
+
+class TestStorageVideoVariants:
+    def test_video_variant_key_is_content_addressed_per_profile(self):
+        client, _ = TestStorageFileUpload._client()
+
+        key = client.video_variant_key(source_sha256="AB" * 32, profile="instagram-reels-v1")
+
+        assert key == f"videos/variants/instagram-reels-v1/{'ab' * 32}.mp4"
+        with pytest.raises(ValueError):
+            client.video_variant_key(source_sha256="not-a-digest", profile="instagram-reels-v1")
+
+    def test_find_video_variant_returns_upload_shaped_result(self):
+        client, _ = TestStorageFileUpload._client()
+        client.client.head_object.return_value = {
+            "ContentLength": 42,
+            "ContentType": "video/mp4",
+            "Metadata": {"sha256": "c" * 64},
+        }
+
+        result = client.find_video_variant(source_sha256="a" * 64, profile="instagram-reels-v1")
+
+        expected_key = f"videos/variants/instagram-reels-v1/{'a' * 64}.mp4"
+        client.client.head_object.assert_called_once_with(Bucket="bucket", Key=expected_key)
+        assert result["storage_key"] == expected_key
+        assert result["url"] == f"https://cdn.example.com/{expected_key}"
+        assert result["size"] == 42
+        assert result["sha256"] == "c" * 64
+
+    def test_find_video_variant_returns_none_for_missing_object(self):
+        from app.adapters import storage_client as module
+
+        client, _ = TestStorageFileUpload._client()
+        client.client.head_object.side_effect = module.ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+        )
+
+        assert client.find_video_variant(source_sha256="a" * 64, profile="instagram-reels-v1") is None
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from types import SimpleNamespace
 
 import httpx
@@ -148,3 +151,37 @@ def test_scene_image_detail_reads_reconnect_the_shared_client(
 
     assert result == row
     assert reconnects == [failed_client]
+
+
+def test_run_db_runs_off_the_event_loop_thread():
+    async def main():
+        loop_thread = threading.current_thread().name
+        worker_thread = await supabase_client.run_db(lambda: threading.current_thread().name)
+        return loop_thread, worker_thread
+
+    loop_thread, worker_thread = asyncio.run(main())
+
+    assert worker_thread != loop_thread
+    assert worker_thread.startswith("supabase-db")
+
+
+def test_run_db_keeps_loop_responsive_and_propagates_errors():
+    async def main():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        await supabase_client.run_db(time.sleep, 0.2)
+        ticking.cancel()
+        with pytest.raises(ValueError, match="bad filter"):
+            await supabase_client.run_db(
+                lambda **kwargs: (_ for _ in ()).throw(ValueError(kwargs["message"])),
+                message="bad filter",
+            )
+        return ticks
+
+    assert len(asyncio.run(main())) >= 5
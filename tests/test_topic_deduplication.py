@@ -0,0 +1,108 @@
+"""Tests for the inverted-index topic similarity search."""
+
+import random
+
+from app.features.topics import deduplication
+from app.features.topics.deduplication import (
+    TopicSimilarityIndex,
+    calculate_topic_similarity,
+    deduplicate_topics,
+    is_duplicate_topic,
+)
+
+_WORDS = [
+    "rollstuhl", "rampe", "bus", "bahn", "pflegegrad", "antrag", "wohnung", "aufzug",
+    "recht", "kasse", "hilfe", "barriere", "arzt", "termin", "stufe", "zugang",
+]
+
+
+def _random_topic(rng, index):
+    def phrase(low, high):
+        return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(low, high)))
+
+    return {"id": f"t{index}", "title": phrase(2, 5), "rotation": phrase(3, 8), "cta": phrase(0, 3)}
+
+
+def _linear_is_duplicate(title, rotation, cta, existing, threshold):
+    max_similarity = 0.0
+    matched = None
+    for row in existing:
+        similarity = calculate_topic_similarity(title, rotation, cta, row["title"], row["rotation"], row["cta"])
+        if similarity > max_similarity:
+            max_similarity = similarity
+            matched = row["id"]
+        if similarity >= threshold:
+            return True, matched, similarity
+    return False, matched, max_similarity
+
+
+def test_index_matches_the_linear_jaccard_scan_exactly():
+    rng = random.Random(7)
+    existing = [_random_topic(rng, index) for index in range(200)]
+    index = TopicSimilarityIndex(existing)
+
+    for probe in range(40):
+        query = _random_topic(rng, f"q{probe}")
+        for threshold in (0.2, 0.35, 0.7):
+            expected = _linear_is_duplicate(query["title"], query["rotation"], query["cta"], existing, threshold)
+            actual = is_duplicate_topic(query["title"], query["rotation"], query["cta"], index, threshold)
+            if expected[0]:
+                assert actual == expected
+            else:
+                assert actual[0] is False and actual[2] <= expected[2] < threshold
+            best_topic, best_score = index.best_match(query["title"], query["rotation"], query["cta"])
+            assert best_score == max(
+                calculate_topic_similarity(query["title"], query["rotation"], query["cta"], row["title"], row["rotation"], row["cta"])
+                for row in existing
+            )
+
+
+def test_deduplicate_topics_checks_new_topics_against_each_other_without_touching_a_shared_index():
+    existing = [{"id": "t1", "title": "Rampe am Bahnhof", "rotation": "Die Rampe fehlt", "cta": "Teilen"}]
+    index = TopicSimilarityIndex(existing)
+    new_topics = [
+        {"title": "Aufzug kaputt", "rotation": "Der Aufzug steht still", "cta": "Melden"},
+        {"title": "Aufzug kaputt", "rotation": "Der Aufzug steht still", "cta": "Melden"},
+        {"title": "Rampe am Bahnhof", "rotation": "Die Rampe fehlt", "cta": "Teilen"},
+    ]
+
+    unique = deduplicate_topics(new_topics, index, threshold=0.7)
+
+    assert unique == [new_topics[0]]
+    assert len(index) == 1
+    assert deduplicate_topics(new_topics, existing, threshold=0.7) == unique
+
+
+def test_rows_missing_fields_are_skipped_like_before():
+    index = TopicSimilarityIndex([{"id": "t1", "title": "Rampe"}])
+
+    assert len(index) == 0
+    assert is_duplicate_topic("Rampe", "Rampe", "Rampe", index) == (False, None, 0.0)
+
+
+def test_registry_index_is_cached_and_updated_incrementally(monkeypatch):
+    deduplication.reset_registry_similarity_index()
+    loads = []
+
+    def load_topics():
+        loads.append(1)
+        return [{"id": "t1", "title": "Rampe am Bahnhof", "rotation": "Rampe fehlt", "cta": "Teilen"}]
+
+    first = deduplication.get_registry_similarity_index(load_topics)
+    deduplication.record_registry_topic(
+        {"id": "t2", "title": "Aufzug im Rathaus", "rotation": "Aufzug kaputt", "cta": "Melden"}
+    )
+    deduplication.record_registry_topic(
+        {"id": "t1", "title": "Stufe am Arzt", "rotation": "Stufe ohne Rampe", "cta": "Teilen"}
+    )
+    second = deduplication.get_registry_similarity_index(load_topics)
+
+    assert second is first
+    assert loads == [1]
+    assert second.best_match("Aufzug Rathaus", "Aufzug", "")[0]["id"] == "t2"
+    assert second.best_match("Bahnhof", "Bahnhof", "Bahnhof") == (None, 0.0)
+
+    monkeypatch.setattr(deduplication, "TOPIC_SIMILARITY_INDEX_TTL_SECONDS", 0)
+    deduplication.get_registry_similarity_index(load_topics)
+    assert loads == [1, 1]
+    deduplication.reset_registry_similarity_index()
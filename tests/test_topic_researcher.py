@@ -116,6 +116,48 @@ def test_run_discovery_cycle():
     assert update_kwargs[1]["status"] == "completed"
 
 
+def test_run_discovery_cycle_researches_seeds_concurrently():
+    """Seeds run side by side; the cron row still gets a heartbeat per finished seed."""
+    import threading
+    from workers.topic_researcher import run_discovery_cycle
+
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_research(seed_topic, post_type, tiers):
+        # Only passes when both seeds are in flight at the same time.
+        both_started.wait()
+        if seed_topic == "Topic B":
+            return None
+        return [{"id": "t-a", "title": seed_topic}]
+
+    with patch("workers.topic_researcher.select_seeds") as mock_select, \
+         patch("workers.topic_researcher.create_cron_run") as mock_create, \
+         patch("workers.topic_researcher.update_cron_run") as mock_update, \
+         patch("workers.topic_researcher._research_single_topic", side_effect=fake_research), \
+         patch("workers.topic_researcher.RESEARCH_MAX_CONCURRENCY", 2), \
+         patch("workers.topic_researcher.count_selectable_topic_families", return_value=0):
+
+        mock_select.return_value = (["Topic A", "Topic B"], "yaml_bank")
+        mock_create.return_value = {"id": "run-1", "status": "running"}
+        mock_update.return_value = {"id": "run-1", "status": "completed"}
+
+        run_discovery_cycle(audit_after_discovery=False)
+
+    heartbeat_statuses = [call[1]["status"] for call in mock_update.call_args_list[:-1]]
+    assert heartbeat_statuses and set(heartbeat_statuses) == {"running"}
+    final = mock_update.call_args[1]
+    assert final["status"] == "completed"
+    assert final["topics_completed"] == 1
+    assert final["topics_failed"] == 1
+    assert final["topic_ids"] == ["t-a"]
+    assert final["details"] == {
+        "per_topic": [
+            {"seed": "Topic A", "status": "completed", "rows": 1},
+            {"seed": "Topic B", "status": "failed"},
+        ]
+    }
+
+
 def test_run_discovery_cycle_no_seeds():
     """When no seeds available, creates run with 0 topics."""
     from workers.topic_researcher import run_discovery_cycle
@@ -1026,7 +1026,7 @@ def test_list_topic_suggestions_prefers_low_use_count_and_older_last_used(monkey
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     result = topic_queries.list_topic_suggestions(target_length_tier=8, limit=3, post_type="value")
 
@@ -1049,7 +1049,7 @@ def test_list_topic_suggestions_deduplicates_same_topic_family_title(monkeypatch
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     result = topic_queries.list_topic_suggestions(target_length_tier=8, limit=5, post_type="value")
 
@@ -1074,7 +1074,7 @@ def test_list_topic_suggestions_only_returns_active_pass_audited_families(monkey
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     result = topic_queries.list_topic_suggestions(target_length_tier=8, limit=10, post_type="value")
 
@@ -1091,7 +1091,7 @@ def test_list_topic_suggestions_does_not_fall_back_to_source_less_value_rows(mon
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: [])
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     result = topic_queries.list_topic_suggestions(target_length_tier=8, limit=10, post_type="value")
 
@@ -1120,7 +1120,11 @@ def test_list_topic_suggestions_skips_inaccessible_value_source_urls(monkeypatch
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: "good.example" in url)
+    monkeypatch.setattr(
+        topic_queries,
+        "_check_value_source_urls",
+        lambda urls: {url: "good.example" in url for url in urls},
+    )
 
     result = topic_queries.list_topic_suggestions(target_length_tier=8, limit=10, post_type="value")
 
@@ -1185,7 +1189,7 @@ def test_list_topic_suggestions_skips_chopped_value_rows_from_metadata_fragments
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     result = topic_queries.list_topic_suggestions(target_length_tier=8, limit=10, post_type="value")
 
@@ -1206,7 +1210,7 @@ def test_list_topic_suggestions_includes_used_scripts_but_prefers_unused(monkeyp
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     result = topic_queries.list_topic_suggestions(target_length_tier=8, limit=10, post_type="value")
 
@@ -1242,7 +1246,7 @@ def test_list_topic_suggestions_keeps_duration_specific_script_over_registry_stu
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     result = topic_queries.list_topic_suggestions(target_length_tier=32, limit=10, post_type="value")
 
@@ -1268,6 +1272,55 @@ def test_count_selectable_topic_families_uses_full_limit(monkeypatch):
     assert captured["limit"] == 10_000
 
 
+@patch("app.features.topics.queries.get_supabase")
+def test_topic_script_count_maps_are_one_cached_rpc_invalidated_by_writes(mock_get_sb):
+    from app.features.topics import queries as topic_queries
+
+    mock_sb = _mock_supabase()
+    mock_sb.client.rpc.return_value.execute.return_value = MagicMock(
+        data={"topic-1": [3, 1], "topic-2": [2, 0]}
+    )
+    mock_get_sb.return_value = mock_sb
+    topic_queries.invalidate_topic_script_counts()
+    try:
+        totals, used = topic_queries.get_topic_script_count_maps()
+        assert totals == {"topic-1": 3, "topic-2": 2}
+        assert used == {"topic-1": 1}
+        topic_queries.get_topic_script_count_maps()
+        assert mock_sb.client.rpc.call_count == 1
+        mock_sb.client.rpc.assert_called_with("get_topic_script_counts", {})
+
+        mock_sb.client.table.execute.return_value = MagicMock(data=[{"id": "script-1", "use_count": 0}])
+        topic_queries.mark_topic_script_used(script_id="script-1")
+        topic_queries.get_topic_script_count_maps()
+        assert mock_sb.client.rpc.call_count == 2
+    finally:
+        topic_queries.invalidate_topic_script_counts()
+
+
+@patch("app.features.topics.queries.get_supabase")
+def test_topic_script_count_maps_fall_back_to_narrow_scan(mock_get_sb):
+    from app.features.topics import queries as topic_queries
+
+    mock_sb = _mock_supabase()
+    mock_sb.client.rpc.side_effect = RuntimeError("function get_topic_script_counts does not exist")
+    mock_sb.client.table.range.return_value = mock_sb.client.table
+    mock_sb.client.table.execute.return_value = MagicMock(
+        data=[
+            {"topic_registry_id": "topic-1", "use_count": 2},
+            {"topic_registry_id": "topic-1", "use_count": 0},
+            {"topic_registry_id": "topic-2", "use_count": None},
+        ]
+    )
+    mock_get_sb.return_value = mock_sb
+    topic_queries.invalidate_topic_script_counts()
+    try:
+        assert topic_queries.get_topic_script_count_maps() == ({"topic-1": 2, "topic-2": 1}, {"topic-1": 1})
+        mock_sb.client.table.select.assert_called_with("topic_registry_id, use_count")
+    finally:
+        topic_queries.invalidate_topic_script_counts()
+
+
 def test_duration_neutral_topic_selection_accepts_audited_underlength_script(monkeypatch):
     from app.features.topics import queries as topic_queries
 
@@ -1298,7 +1351,7 @@ def test_duration_neutral_topic_selection_accepts_audited_underlength_script(mon
 
     monkeypatch.setattr(topic_queries, "get_all_topics_from_registry", lambda: registry_rows)
     monkeypatch.setattr(topic_queries, "_fetch_topic_script_rows", lambda **kwargs: script_rows)
-    monkeypatch.setattr(topic_queries, "_is_value_source_url_accessible", lambda _url: True)
+    monkeypatch.setattr(topic_queries, "_check_value_source_urls", lambda urls: {url: True for url in urls})
 
     strict = topic_queries.list_topic_suggestions(
         target_length_tier=32,
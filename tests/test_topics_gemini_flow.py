@@ -522,7 +522,7 @@ def test_topics_feature_uses_gemini_methods(monkeypatch):
     fake_llm = FakeTopicLLM()
 
     monkeypatch.setattr(topic_agents, "get_llm_client", lambda: fake_llm)
-    monkeypatch.setattr(topic_agents, "_validate_url_accessible", lambda url, timeout=5.0: True)
+    monkeypatch.setattr(topic_agents, "validate_sources_accessible", lambda item: None)
 
     items = topic_agents.generate_topics_research_agent(post_type="value", count=9)
     scripts = topic_agents.generate_dialog_scripts(topic="Pflegegrad 2025 prüfen", scripts_required=1)
@@ -587,7 +587,7 @@ def test_generate_topic_script_candidate_uses_duration_profile_import(monkeypatc
     )
 
     monkeypatch.setattr(topic_agents, "get_llm_client", lambda: FakeLaneLLM())
-    monkeypatch.setattr(topic_agents, "_validate_url_accessible", lambda url, timeout=5.0: True)
+    monkeypatch.setattr(topic_agents, "validate_sources_accessible", lambda item: None)
 
     item = topic_agents.generate_topic_script_candidate(
         post_type="value",
@@ -746,21 +746,28 @@ def test_get_random_topic_returns_least_coverage(monkeypatch):
         {"id": "t2", "title": "Topic B", "post_type": "value", "rotation": "r", "cta": "c"},
         {"id": "t3", "title": "Topic C", "post_type": "lifestyle", "rotation": "r", "cta": "c"},
     ]
-    script_counts = {"t1": 5, "t2": 0, "t3": 2}
+    script_counts = {"t1": 5, "t3": 2}
+    count_calls = []
 
     monkeypatch.setattr(
         topic_hub, "get_all_topics_from_registry", lambda: fake_topics
     )
     monkeypatch.setattr(
         topic_hub,
-        "get_topic_scripts_for_registry",
-        lambda topic_id, target_length_tier=None: [{}] * script_counts.get(topic_id, 0),
+        "_fetch_topic_script_count_maps",
+        lambda: count_calls.append(1) or (script_counts, {}),
     )
 
+    def fail_per_topic_fetch(topic_id, target_length_tier=None):
+        raise AssertionError("topic selection must not fetch scripts per topic")
+
+    monkeypatch.setattr(topic_hub, "get_topic_scripts_for_registry", fail_per_topic_fetch)
+
     result = topic_hub.get_random_topic()
     assert result is not None
     assert result["id"] == "t2"
     assert result["script_count"] == 0
+    assert len(count_calls) == 1
 
 
 def test_pick_topic_bank_topics_prefers_unseen_and_least_used(monkeypatch):
@@ -837,15 +844,12 @@ def test_fuzzy_match_topic_finds_similar(monkeypatch):
         {"id": "t1", "title": "Hyaluronic Acid Benefits", "post_type": "value", "rotation": "Benefits of hyaluronic acid", "cta": "Try it"},
     ]
     monkeypatch.setattr(topic_hub, "get_all_topics_from_registry", lambda: fake_topics)
-    monkeypatch.setattr(
-        topic_hub,
-        "get_topic_scripts_for_registry",
-        lambda topic_id, target_length_tier=None: [],
-    )
+    monkeypatch.setattr(topic_hub, "_fetch_topic_script_count_maps", lambda: ({"t1": 3}, {}))
 
     result = topic_hub.fuzzy_match_topic("Hyaluronic Acid")
     assert result is not None
     assert result["id"] == "t1"
+    assert result["script_count"] == 3
 
 
 def test_fuzzy_match_topic_returns_none_for_novel_topic(monkeypatch):
@@ -856,11 +860,7 @@ def test_fuzzy_match_topic_returns_none_for_novel_topic(monkeypatch):
         {"id": "t1", "title": "Hyaluronic Acid Benefits", "post_type": "value", "rotation": "Benefits of hyaluronic acid", "cta": "Try it"},
     ]
     monkeypatch.setattr(topic_hub, "get_all_topics_from_registry", lambda: fake_topics)
-    monkeypatch.setattr(
-        topic_hub,
-        "get_topic_scripts_for_registry",
-        lambda topic_id, target_length_tier=None: [],
-    )
+    monkeypatch.setattr(topic_hub, "_fetch_topic_script_count_maps", lambda: ({}, {}))
 
     result = topic_hub.fuzzy_match_topic("Morning Skincare Routine Tips")
     assert result is None
@@ -1352,6 +1352,45 @@ def test_shared_warmup_falls_back_to_synthesized_dossier(monkeypatch):
     assert summary["lanes_persisted"] == 1
 
 
+def test_shared_warmup_rate_limit_backoff_pauses_every_seed(monkeypatch):
+    from app.core.rate_limit import RateLimitCooldown
+    from app.features.topics import bank_warmup
+
+    sleeps = []
+    monkeypatch.setattr(bank_warmup.time, "sleep", lambda seconds: sleeps.append(seconds))
+    monkeypatch.setattr(bank_warmup, "_RATE_LIMIT_COOLDOWN", RateLimitCooldown())
+
+    assert not bank_warmup.is_rate_limit_error(RuntimeError("Failed to generate topic script 429"))
+    assert bank_warmup.is_rate_limit_error(ThirdPartyError("quota", {"status_code": 429}))
+
+    attempts = []
+
+    def rate_limited_once():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ThirdPartyError("Gemini quota exhausted", {"status_code": 429})
+        return "ok"
+
+    assert bank_warmup._call_with_retry(
+        "generate_topic_script_candidate",
+        seed_topic="Seed A",
+        lane_title=None,
+        callback=rate_limited_once,
+    ) == "ok"
+    assert len(attempts) == 2
+    assert sleeps and 0 < sleeps[-1] <= 1
+
+    # Another seed starting inside the cooldown waits before its first call.
+    sleeps.clear()
+    assert bank_warmup._call_with_retry(
+        "generate_topic_research_dossier",
+        seed_topic="Seed B",
+        lane_title=None,
+        callback=lambda: "ok",
+    ) == "ok"
+    assert sleeps and 0 < sleeps[0] <= 1
+
+
 def test_shared_warmup_filters_near_duplicate_lane_candidates(monkeypatch):
     from app.features.topics import bank_warmup
     from app.features.topics import hub as topic_hub
@@ -0,0 +1,102 @@
+import threading
+import time
+
+import httpx
+
+from app.adapters.url_reachability import UrlReachabilityService
+
+
+def _service(handler, **kwargs):
+    return UrlReachabilityService(transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_check_many_probes_each_url_once_and_serves_repeats_from_cache():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, str(request.url)))
+        return httpx.Response(404 if "gone" in str(request.url) else 200)
+
+    service = _service(handler)
+    urls = ["https://a.example/page", "https://a.example/page/", "https://b.example/gone"]
+
+    first = service.check_many(urls)
+    second = service.check_many(urls)
+
+    assert first == second == {
+        "https://a.example/page": True,
+        "https://a.example/page/": True,
+        "https://b.example/gone": False,
+    }
+    assert sorted(calls) == [("HEAD", "https://a.example/page"), ("HEAD", "https://b.example/gone")]
+    service.close()
+
+
+def test_head_rejection_falls_back_to_get_and_invalid_urls_skip_the_network():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(405 if request.method == "HEAD" else 200)
+
+    service = _service(handler)
+
+    assert service.check_many(["https://blocks-head.example/x", "ftp://files.example/x", ""]) == {
+        "https://blocks-head.example/x": True,
+        "ftp://files.example/x": False,
+        "": False,
+    }
+    assert calls == ["HEAD", "GET"]
+    service.close()
+
+
+def test_probes_run_in_parallel_but_respect_the_per_host_limit():
+    lock = threading.Lock()
+    active = {}
+    peak = {}
+
+    def handler(request):
+        host = request.url.host
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.05)
+        with lock:
+            active[host] -= 1
+        return httpx.Response(200)
+
+    service = _service(handler, max_workers=8, per_host_limit=2)
+    urls = [f"https://slow.example/{index}" for index in range(6)] + [
+        f"https://other.example/{index}" for index in range(2)
+    ]
+
+    started = time.monotonic()
+    results = service.check_many(urls)
+    elapsed = time.monotonic() - started
+
+    assert all(results.values())
+    assert peak["slow.example"] == 2
+    assert peak["other.example"] == 2
+    assert elapsed < 0.05 * len(urls)
+    service.close()
+
+
+def test_failures_expire_sooner_and_the_cache_evicts_least_recently_used():
+    status = {"code": 503}
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(status["code"])
+
+    service = _service(handler, ttl_seconds=60, failure_ttl_seconds=0.01, max_entries=2)
+
+    assert service.check("https://flaky.example/") is False
+    time.sleep(0.02)
+    status["code"] = 200
+    assert service.check("https://flaky.example/") is True
+
+    service.check_many(["https://one.example/", "https://two.example/"])
+    service.check("https://flaky.example/")
+    assert calls.count("https://flaky.example/") == 3
+    service.close()
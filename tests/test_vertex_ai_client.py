@@ -593,6 +593,43 @@ def test_vertex_gemini_generate_content_allows_retry_owner_to_disable_nested_ret
     assert exc_info.value.details["attempts"] == 1
 
 
+def test_vertex_gemini_generate_content_shares_429_with_the_cross_process_limiter(monkeypatch):
+    responses = [
+        _gemini_response(
+            429,
+            body='{"error":{"status":"RESOURCE_EXHAUSTED"}}',
+            retry_after="3",
+        ),
+        _gemini_response(200, json_body={"ok": True}),
+    ]
+    gemini_module, client, _mock_http = _gemini_post_client(monkeypatch, responses)
+    monkeypatch.setattr(gemini_module.time, "sleep", lambda _seconds: None)
+    events = []
+
+    class FakeLimiter:
+        def acquire(self, provider, model, *, max_wait_seconds=None):
+            events.append(("acquire", provider, model, max_wait_seconds))
+            return 0.0
+
+        def report_rate_limited(self, provider, model, *, retry_after_seconds):
+            events.append(("report", provider, model, retry_after_seconds))
+
+    monkeypatch.setattr(gemini_module, "get_provider_rate_limiter", lambda: FakeLimiter())
+
+    client._post_generate_content(
+        model="gemini-2.5-flash",
+        location="global",
+        payload={"contents": []},
+        log_event="test_vertex_gemini",
+    )
+
+    assert events == [
+        ("acquire", "vertex_gemini", "gemini-2.5-flash", None),
+        ("report", "vertex_gemini", "gemini-2.5-flash", 3.0),
+        ("acquire", "vertex_gemini", "gemini-2.5-flash", None),
+    ]
+
+
 def test_deadline_timeouts_allocate_one_total_budget_across_http_phases():
     from app.adapters.llm_client import _gemini_total_budget_timeout
     from app.adapters.vertex_gemini_client import (
@@ -688,17 +725,19 @@ def test_gemini_api_deadline_cancels_a_trickling_request_by_wall_clock(
     import httpx
     from app.adapters import llm_client as module
 
-    class SlowClient:
-        async def __aenter__(self):
-            return self
+    from app.adapters import deadline_http
 
-        async def __aexit__(self, *_args):
-            return None
+    class SlowClient:
+        is_closed = False
 
-        async def post(self, *_args, **_kwargs):
+        async def request(self, *_args, **_kwargs):
             await asyncio.sleep(1)
 
-    monkeypatch.setattr(module.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+        async def aclose(self):
+            return None
+
+    monkeypatch.setattr(deadline_http.httpx, "AsyncClient", lambda **_kwargs: SlowClient())
+    monkeypatch.setattr(deadline_http, "_transport", deadline_http.DeadlineHttpTransport())
     started = time.monotonic()
     with pytest.raises(httpx.TimeoutException, match="absolute deadline"):
         module._gemini_api_post_with_deadline(
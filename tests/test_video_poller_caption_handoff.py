@@ -24,7 +24,7 @@ class TestPollerCaptionHandoff:
         from workers.video_poller import _store_completed_video
 
         mock_storage_instance = MagicMock()
-        mock_storage_instance.upload_video.return_value = {
+        mock_storage_instance.upload_video_file.return_value = {
             "storage_provider": "cloudflare_r2",
             "storage_key": "test/key.mp4",
             "url": "https://cdn.example.com/test/key.mp4",
@@ -94,7 +94,7 @@ class TestPollerCaptionHandoff:
         from workers.video_poller import _store_completed_video
 
         mock_storage_instance = MagicMock()
-        mock_storage_instance.upload_video.return_value = {
+        mock_storage_instance.upload_video_file.return_value = {
             "storage_provider": "cloudflare_r2",
             "storage_key": "test/key.mp4",
             "url": "https://cdn.example.com/test/key.mp4",
@@ -183,7 +183,7 @@ class TestPollerCaptionHandoff:
         from workers.video_poller import _store_completed_video
 
         mock_storage_instance = MagicMock()
-        mock_storage_instance.upload_video.return_value = {
+        mock_storage_instance.upload_video_file.return_value = {
             "storage_provider": "cloudflare_r2",
             "storage_key": "test/key.mp4",
             "url": "https://cdn.example.com/test/key.mp4",
@@ -231,7 +231,7 @@ class TestPollerCaptionHandoff:
         from workers.video_poller import _store_completed_video
 
         mock_storage_instance = MagicMock()
-        mock_storage_instance.upload_video.return_value = {
+        mock_storage_instance.upload_video_file.return_value = {
             "storage_provider": "cloudflare_r2",
             "storage_key": "test/key.mp4",
             "url": "https://cdn.example.com/test/key.mp4",
@@ -1,6 +1,7 @@
 """Tests for Veo extension chaining in the video poller."""
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta, timezone
+import hashlib
 import pytest
 import httpx
 
@@ -105,6 +106,210 @@ def test_poll_pending_videos_skips_idle_reconcile_until_due(monkeypatch):
     video_poller.poll_pending_videos()
 
 
+def _spy_poll_cycle_metrics(monkeypatch):
+    from workers import video_poller
+
+    logged = []
+    real_log = video_poller._log_poll_cycle_metrics
+
+    def _spy(**kwargs):
+        logged.append(real_log(**kwargs))
+        return logged[-1]
+
+    monkeypatch.setattr(video_poller, "_log_poll_cycle_metrics", _spy)
+    return logged
+
+
+def test_poll_pending_videos_processes_posts_in_bounded_pool(monkeypatch):
+    """One slow post must not serialize the cycle; in-flight work stays bounded."""
+    import threading
+    import time as real_time
+    from workers import video_poller
+
+    posts = [{"id": f"post-{index}"} for index in range(6)] + [{"id": "post-0"}]
+
+    class FakeTable:
+        def select(self, *a, **kw):
+            return self
+
+        def in_(self, *a, **kw):
+            return self
+
+        def execute(self):
+            return MagicMock(data=posts)
+
+    class FakeSupabase:
+        client = MagicMock()
+
+    fake_sb = FakeSupabase()
+    fake_sb.client.table = lambda name: FakeTable()
+    monkeypatch.setattr(video_poller, "get_supabase", lambda: fake_sb)
+    monkeypatch.setattr(video_poller, "_maybe_reconcile_batches_ready_for_qa", lambda active_post_count: None)
+    monkeypatch.setattr(video_poller, "VIDEO_POLLER_STATUS_CONCURRENCY", 3)
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "seen": []}
+
+    def fake_process(post):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            state["seen"].append(post["id"])
+        real_time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+
+    monkeypatch.setattr(video_poller, "process_video_operation", fake_process)
+    logged = _spy_poll_cycle_metrics(monkeypatch)
+
+    assert video_poller.poll_pending_videos() is True
+
+    assert sorted(state["seen"]) == [f"post-{index}" for index in range(6)]
+    assert 1 < state["peak"] <= 3
+    metrics = logged[-1]
+    assert metrics["queue_depth"] == 6
+    assert metrics["processed"] == 6
+    assert metrics["status_concurrency"] == 3
+    assert metrics["post_latency_max_seconds"] >= 0.05
+
+
+def test_heavy_work_slot_is_bounded_and_reentrant(monkeypatch):
+    import threading
+    import time as real_time
+    from workers import video_poller
+
+    monkeypatch.setattr(video_poller, "_HEAVY_WORK_GATE", threading.BoundedSemaphore(1))
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def heavy(post_id):
+        with video_poller._heavy_work_slot(post_id, f"poll_{post_id}"):
+            # Nested sections (stitch -> store) must not deadlock on the same slot.
+            with video_poller._heavy_work_slot(post_id, f"poll_{post_id}"):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                real_time.sleep(0.02)
+                with lock:
+                    state["active"] -= 1
+
+    threads = [threading.Thread(target=heavy, args=(f"post-{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert state["peak"] == 1
+
+
+def test_poll_pending_videos_fails_cycle_after_all_slots_finish(monkeypatch):
+    from workers import video_poller
+
+    class FakeTable:
+        def select(self, *a, **kw):
+            return self
+
+        def in_(self, *a, **kw):
+            return self
+
+        def execute(self):
+            return MagicMock(data=[{"id": "post-1"}, {"id": "post-2"}])
+
+    class FakeSupabase:
+        client = MagicMock()
+
+    fake_sb = FakeSupabase()
+    fake_sb.client.table = lambda name: FakeTable()
+    monkeypatch.setattr(video_poller, "get_supabase", lambda: fake_sb)
+    monkeypatch.setattr(video_poller, "VIDEO_POLLER_STATUS_CONCURRENCY", 2)
+    processed = []
+
+    def fake_process(post):
+        processed.append(post["id"])
+        if post["id"] == "post-1":
+            raise RuntimeError("lease claim failed")
+
+    monkeypatch.setattr(video_poller, "process_video_operation", fake_process)
+
+    assert video_poller.poll_pending_videos() is False
+    assert sorted(processed) == ["post-1", "post-2"]
+
+
+def test_poll_pending_videos_only_processes_due_operations(monkeypatch):
+    """Operations that cannot be done yet must not cost a lease write or a provider call."""
+    from workers import video_poller
+
+    now = datetime(2026, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+    posts = [
+        # Submitted 5s ago: far below the typical render time.
+        {"id": "fresh", "updated_at": "2026-05-01T11:59:55Z", "video_metadata": {"video_pipeline_route": "short"}},
+        # Submitted 5 minutes ago without a schedule yet (legacy in-flight row).
+        {"id": "legacy", "updated_at": "2026-05-01T11:55:00Z", "video_metadata": {}},
+        # Backed off by a previous check.
+        {"id": "backed_off", "video_metadata": {"video_poll_attempt": 3, "video_poll_next_at": "2026-05-01T12:00:20Z"}},
+        {"id": "due", "video_metadata": {"video_poll_attempt": 2, "video_poll_next_at": "2026-05-01T11:59:59Z"}},
+        # Due by schedule but deferred by an extension rate-limit retry.
+        {
+            "id": "deferred",
+            "video_metadata": {
+                "video_poll_next_at": "2026-05-01T11:59:00Z",
+                "veo_extension_retry_after": "2026-05-01T12:01:00Z",
+            },
+        },
+    ]
+
+    class FakeTable:
+        def select(self, *a, **kw):
+            return self
+
+        def in_(self, *a, **kw):
+            return self
+
+        def execute(self):
+            return MagicMock(data=posts)
+
+    class FakeSupabase:
+        client = MagicMock()
+
+    fake_sb = FakeSupabase()
+    fake_sb.client.table = lambda name: FakeTable()
+    monkeypatch.setattr(video_poller, "get_supabase", lambda: fake_sb)
+    monkeypatch.setattr(video_poller, "_utc_now", lambda: now)
+    monkeypatch.setattr(video_poller, "_maybe_reconcile_batches_ready_for_qa", lambda active_post_count: None)
+    processed = []
+    monkeypatch.setattr(video_poller, "process_video_operation", lambda post: processed.append(post["id"]))
+    logged = _spy_poll_cycle_metrics(monkeypatch)
+
+    assert video_poller.poll_pending_videos() is True
+
+    assert sorted(processed) == ["due", "legacy"]
+    assert logged[-1]["not_due"] == 3
+
+
+def test_schedule_next_video_poll_backs_off_and_resets_on_submit():
+    from workers import video_poller
+
+    now = datetime(2026, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+    metadata = {"video_pipeline_route": "veo_segmented"}
+
+    submitted = video_poller._schedule_next_video_poll(metadata, now=now, operation_submitted=True)
+    assert submitted["video_poll_attempt"] == 0
+    assert submitted["video_poll_next_at"] == "2026-05-01T12:01:00Z"
+
+    delays = []
+    current = submitted
+    for _ in range(4):
+        current = video_poller._schedule_next_video_poll(current, now=now)
+        due_at = video_poller._parse_utc_timestamp(current["video_poll_next_at"])
+        delays.append(int((due_at - now).total_seconds()))
+    assert delays == [10, 20, 30, 30]
+    assert current["video_poll_attempt"] == 4
+
+    cleared = video_poller._clear_terminal_polling_metadata(current)
+    assert "video_poll_next_at" not in cleared
+    assert "video_poll_attempt" not in cleared
+
+
 def test_claim_video_poll_lease_uses_updated_at_compare_and_set(monkeypatch):
     from workers.video_poller import _claim_video_poll_lease
 
@@ -1076,34 +1281,41 @@ def test_store_completed_video_applies_crop_postprocess():
     """Final storage must upload the post-processed portrait bytes when crop metadata is present."""
     from workers.video_poller import _store_completed_video
 
+    uploaded = {}
+
+    def _upload_video_file(**kwargs):
+        with open(kwargs["path"], "rb") as file_obj:
+            uploaded["bytes"] = file_obj.read()
+        return {
+            "storage_provider": "cloudflare_r2",
+            "storage_key": "videos/post.mp4",
+            "url": "https://cdn.example.com/post.mp4",
+            "thumbnail_url": None,
+            "file_path": "videos/post.mp4",
+            "size": 12,
+        }
+
+    def _postprocess(*, video_path, output_path, **_kwargs):
+        with open(video_path, "rb") as file_obj:
+            assert file_obj.read() == b"raw-video"
+        with open(output_path, "wb") as file_obj:
+            file_obj.write(b"cropped-video")
+        return output_path, {
+            "postprocess_crop_applied": True,
+            "postprocess_crop_output_size": "720x1280",
+        }
+
     mock_storage = MagicMock()
-    mock_storage.upload_video.return_value = {
-        "storage_provider": "cloudflare_r2",
-        "storage_key": "videos/post.mp4",
-        "url": "https://cdn.example.com/post.mp4",
-        "thumbnail_url": None,
-        "file_path": "videos/post.mp4",
-        "size": 12,
-    }
+    mock_storage.upload_video_file.side_effect = _upload_video_file
     mock_supabase = MagicMock()
     mock_supabase.client.table.return_value.update.return_value.eq.return_value.execute.return_value = MagicMock()
 
     with patch("workers.video_poller.get_storage_client", return_value=mock_storage), \
          patch("workers.video_poller.get_supabase", return_value=mock_supabase), \
          patch(
-             "workers.video_poller._maybe_postprocess_video_bytes",
-             return_value=(
-                 b"cropped-video",
-                 {
-                     "postprocess_crop_applied": True,
-                     "postprocess_crop_output_size": "720x1280",
-                 },
-             ),
-         ) as mock_postprocess, \
-         patch(
-             "workers.video_poller._trim_tail",
-             return_value=(b"cropped-video", {}),
-         ):
+             "workers.video_poller._maybe_postprocess_video",
+             side_effect=_postprocess,
+         ) as mock_postprocess:
         _store_completed_video(
             post_id="post-crop",
             provider="veo_3_1",
@@ -1117,11 +1329,13 @@ def test_store_completed_video_applies_crop_postprocess():
         )
 
     mock_postprocess.assert_called_once()
-    mock_storage.upload_video.assert_called_once_with(
-        video_bytes=b"cropped-video",
-        file_name="post_post-crop.mp4",
-        correlation_id="corr-store",
-    )
+    mock_storage.upload_video_file.assert_called_once()
+    upload_kwargs = mock_storage.upload_video_file.call_args.kwargs
+    assert uploaded["bytes"] == b"cropped-video"
+    assert upload_kwargs["expected_sha256"] == hashlib.sha256(b"cropped-video").hexdigest()
+    assert "fileobj" not in upload_kwargs
+    assert upload_kwargs["file_name"] == "post_post-crop.mp4"
+    assert upload_kwargs["correlation_id"] == "corr-store"
     update_payload = mock_supabase.client.table.return_value.update.call_args[0][0]
     assert update_payload["video_metadata"]["postprocess_crop_applied"] is True
     assert update_payload["video_metadata"]["postprocess_crop_output_size"] == "720x1280"
@@ -10,7 +10,7 @@ import subprocess
 
 import pytest
 
-from app.adapters.video_stitcher import _probe_duration, extract_anchor_frame, stitch_segments
+from app.adapters.video_stitcher import _probe_duration, extract_anchor_frame, stitch_segments, stitch_segments_to_file
 
 pytestmark = pytest.mark.skipif(
     shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
@@ -59,13 +59,8 @@ def test_stitch_two_segments_preserves_audio_at_cut(tmp_path):
     _make_clip(clip_a, seconds=2, color="red")
     _make_clip(clip_b, seconds=3, color="blue")
 
-    with open(clip_a, "rb") as fh:
-        bytes_a = fh.read()
-    with open(clip_b, "rb") as fh:
-        bytes_b = fh.read()
-
     final_bytes, meta = stitch_segments(
-        segment_videos=[bytes_a, bytes_b],
+        segment_paths=[clip_a, clip_b],
         post_id="post_test",
         correlation_id="corr_test",
     )
@@ -91,13 +86,8 @@ def test_stitch_trims_segments_to_spoken_windows(tmp_path):
     _make_clip(clip_a, seconds=4, color="red")
     _make_clip(clip_b, seconds=4, color="blue")
 
-    with open(clip_a, "rb") as fh:
-        bytes_a = fh.read()
-    with open(clip_b, "rb") as fh:
-        bytes_b = fh.read()
-
     final_bytes, meta = stitch_segments(
-        segment_videos=[bytes_a, bytes_b],
+        segment_paths=[clip_a, clip_b],
         post_id="post_test",
         correlation_id="corr_test",
         trim_windows=[
@@ -125,13 +115,12 @@ def test_stitch_retimes_transcript_windowed_operator_review_to_exact_target(
     clip_b = str(tmp_path / "b.mp4")
     _make_clip(clip_a, seconds=8, color="red")
     _make_clip(clip_b, seconds=8, color="blue")
-    segment_videos = []
+    segment_paths = []
     for path in (clip_a, clip_b):
-        with open(path, "rb") as handle:
-            segment_videos.append(handle.read())
+        segment_paths.append(path)
 
     final_bytes, meta = stitch_segments(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         post_id="operator-review",
         correlation_id="operator-review",
         trim_windows=[
@@ -156,13 +145,8 @@ def test_stitch_acoustic_plan_hard_cuts_video_and_crossfades_audio(tmp_path):
     _make_clip(clip_a, seconds=2, color="red", frequency=440, sample_rate=44100)
     _make_clip(clip_b, seconds=2, color="blue", frequency=660, sample_rate=48000)
 
-    with open(clip_a, "rb") as fh:
-        bytes_a = fh.read()
-    with open(clip_b, "rb") as fh:
-        bytes_b = fh.read()
-
     final_bytes, meta = stitch_segments(
-        segment_videos=[bytes_a, bytes_b],
+        segment_paths=[clip_a, clip_b],
         post_id="post_test",
         correlation_id="corr_test",
         acoustic_plan={
@@ -209,14 +193,9 @@ def test_stitch_acoustic_plan_rejects_out_of_contract_overlap(tmp_path):
     _make_clip(clip_a, seconds=2, color="red")
     _make_clip(clip_b, seconds=2, color="blue")
 
-    with open(clip_a, "rb") as fh:
-        bytes_a = fh.read()
-    with open(clip_b, "rb") as fh:
-        bytes_b = fh.read()
-
     with pytest.raises(ValueError, match="overlap"):
         stitch_segments(
-            segment_videos=[bytes_a, bytes_b],
+            segment_paths=[clip_a, clip_b],
             post_id="post_test",
             correlation_id="corr_test",
             acoustic_plan={
@@ -237,13 +216,8 @@ def test_stitch_accepts_dataclass_serialized_tuple_plan(tmp_path):
     _make_clip(clip_a, seconds=2, color="red")
     _make_clip(clip_b, seconds=2, color="blue")
 
-    with open(clip_a, "rb") as fh:
-        bytes_a = fh.read()
-    with open(clip_b, "rb") as fh:
-        bytes_b = fh.read()
-
     final_bytes, meta = stitch_segments(
-        segment_videos=[bytes_a, bytes_b],
+        segment_paths=[clip_a, clip_b],
         post_id="post_test",
         correlation_id="corr_test",
         acoustic_plan={
@@ -269,13 +243,12 @@ def test_stitch_acoustic_plan_caps_accumulated_frame_rounding(tmp_path):
         path = str(tmp_path / f"take-{index}.mp4")
         _make_clip(path, seconds=seconds, color=color, width=90, height=160)
         paths.append(path)
-    segment_videos = []
+    segment_paths = []
     for path in paths:
-        with open(path, "rb") as fh:
-            segment_videos.append(fh.read())
+        segment_paths.append(path)
 
     final_bytes, meta = stitch_segments(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         post_id="post_test",
         correlation_id="corr_test",
         acoustic_plan={
@@ -307,13 +280,12 @@ def test_stitch_acoustic_plan_allows_only_one_frame_of_exact_16_rounding(tmp_pat
         path = str(tmp_path / f"exact-16-take-{index}.mp4")
         _make_clip(path, seconds=8, color=color, width=90, height=160)
         paths.append(path)
-    segment_videos = []
+    segment_paths = []
     for path in paths:
-        with open(path, "rb") as fh:
-            segment_videos.append(fh.read())
+        segment_paths.append(path)
 
     final_bytes, meta = stitch_segments(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         post_id="post_exact_16",
         correlation_id="corr_exact_16",
         target_duration_seconds=16.0,
@@ -357,17 +329,16 @@ def test_stitch_acoustic_plan_allows_only_one_frame_of_exact_16_rounding(tmp_pat
 
 
 def test_stitch_uses_bounded_av_retime_for_live_exact_16_shortfall(tmp_path):
-    segment_videos = []
+    segment_paths = []
     for index, color in enumerate(("red", "blue")):
         path = str(tmp_path / f"retime-take-{index}.mp4")
         _make_clip(path, seconds=8, color=color, width=90, height=160)
-        with open(path, "rb") as fh:
-            segment_videos.append(fh.read())
+        segment_paths.append(path)
 
     content_duration = 15.22
     retime_ratio = 16.0 / content_duration
     final_bytes, meta = stitch_segments(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         post_id="post_retime_16",
         correlation_id="corr_retime_16",
         target_duration_seconds=16.0,
@@ -415,18 +386,17 @@ def test_stitch_uses_bounded_av_retime_for_live_exact_16_shortfall(tmp_path):
 
 
 def test_stitch_retimes_exact_16_delivery_with_one_frame_encoder_rounding(tmp_path):
-    segment_videos = []
+    segment_paths = []
     for index, color in enumerate(("red", "blue")):
         path = str(tmp_path / f"retime-rounding-take-{index}.mp4")
         _make_clip(path, seconds=8, color=color, width=90, height=160)
-        with open(path, "rb") as fh:
-            segment_videos.append(fh.read())
+        segment_paths.append(path)
 
     content_duration = 14.51
     frame_duration = 1.0 / 24.0
     retime_ratio = (16.0 - frame_duration) / content_duration
     final_bytes, meta = stitch_segments(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         post_id="post_retime_rounding_16",
         correlation_id="corr_retime_rounding_16",
         target_duration_seconds=16.0,
@@ -471,16 +441,15 @@ def test_stitch_retimes_exact_16_delivery_with_one_frame_encoder_rounding(tmp_pa
 
 
 def test_stitch_rejects_exact_16_delivery_that_needs_a_frozen_multi_second_outro(tmp_path):
-    segment_videos = []
+    segment_paths = []
     for index, color in enumerate(("red", "blue")):
         path = str(tmp_path / f"short-take-{index}.mp4")
         _make_clip(path, seconds=8, color=color, width=90, height=160)
-        with open(path, "rb") as fh:
-            segment_videos.append(fh.read())
+        segment_paths.append(path)
 
     with pytest.raises(ValueError, match="more than one frame of synthetic padding"):
         stitch_segments(
-            segment_videos=segment_videos,
+            segment_paths=segment_paths,
             post_id="post_short_16",
             correlation_id="corr_short_16",
             target_duration_seconds=16.0,
@@ -511,15 +480,14 @@ def test_stitch_rejects_exact_16_delivery_that_needs_a_frozen_multi_second_outro
 
 
 def test_stitch_trims_subframe_overshoot_to_exact_16_seconds(tmp_path):
-    segment_videos = []
+    segment_paths = []
     for index, color in enumerate(("red", "blue")):
         path = str(tmp_path / f"long-take-{index}.mp4")
         _make_clip(path, seconds=9, color=color, width=90, height=160)
-        with open(path, "rb") as fh:
-            segment_videos.append(fh.read())
+        segment_paths.append(path)
 
     final_bytes, meta = stitch_segments(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         post_id="post_trim_16",
         correlation_id="corr_trim_16",
         target_duration_seconds=16.0,
@@ -566,15 +534,8 @@ def test_stitch_preserves_full_framing_for_character_consistency_segments(tmp_pa
     _make_clip(clip_b, seconds=3, color="blue")
     _make_clip(clip_c, seconds=3, color="green")
 
-    with open(clip_a, "rb") as fh:
-        bytes_a = fh.read()
-    with open(clip_b, "rb") as fh:
-        bytes_b = fh.read()
-    with open(clip_c, "rb") as fh:
-        bytes_c = fh.read()
-
     final_bytes, meta = stitch_segments(
-        segment_videos=[bytes_a, bytes_b, bytes_c],
+        segment_paths=[clip_a, clip_b, clip_c],
         post_id="post_test",
         correlation_id="corr_test",
     )
@@ -598,13 +559,12 @@ def test_stitch_applies_semantic_jump_cut_reframe_only_when_opted_in(tmp_path):
     clip_b = str(tmp_path / "semantic-b.mp4")
     _make_clip(clip_a, seconds=3, color="red")
     _make_clip(clip_b, seconds=3, color="blue")
-    segment_videos = []
+    segment_paths = []
     for path in (clip_a, clip_b):
-        with open(path, "rb") as handle:
-            segment_videos.append(handle.read())
+        segment_paths.append(path)
 
     _bytes, metadata = stitch_segments(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         post_id="semantic-reframe",
         correlation_id="semantic-reframe",
         acoustic_plan={
@@ -645,13 +605,8 @@ def test_stitch_normalizes_mismatched_resolution(tmp_path):
     _make_clip(clip_a, seconds=2, color="green", width=360, height=640)
     _make_clip(clip_b, seconds=2, color="black", width=362, height=640)  # off-by-two width
 
-    with open(clip_a, "rb") as fh:
-        bytes_a = fh.read()
-    with open(clip_b, "rb") as fh:
-        bytes_b = fh.read()
-
     final_bytes, meta = stitch_segments(
-        segment_videos=[bytes_a, bytes_b],
+        segment_paths=[clip_a, clip_b],
         post_id="post_test",
         correlation_id="corr_test",
     )
@@ -662,9 +617,11 @@ def test_stitch_normalizes_mismatched_resolution(tmp_path):
     assert 3.9 <= duration <= 4.1, duration
 
 
-def test_single_segment_passthrough():
+def test_single_segment_passthrough(tmp_path):
+    clip = tmp_path / "single.mp4"
+    clip.write_bytes(b"FAKE_MP4_BYTES")
     final_bytes, meta = stitch_segments(
-        segment_videos=[b"FAKE_MP4_BYTES"],
+        segment_paths=[str(clip)],
         post_id="post_test",
         correlation_id="corr_test",
     )
@@ -673,6 +630,24 @@ def test_single_segment_passthrough():
     assert meta["stitch_segment_count"] == 1
 
 
+def test_stitch_to_file_writes_output_path(tmp_path):
+    clip_a = str(tmp_path / "a.mp4")
+    clip_b = str(tmp_path / "b.mp4")
+    _make_clip(clip_a, seconds=2, color="red")
+    _make_clip(clip_b, seconds=2, color="blue")
+    out_path = str(tmp_path / "stitched.mp4")
+
+    meta = stitch_segments_to_file(
+        segment_paths=[clip_a, clip_b],
+        output_path=out_path,
+        post_id="post_test",
+        correlation_id="corr_test",
+    )
+
+    assert meta["stitch_applied"] is True
+    assert 3.9 <= _probe_duration(out_path) <= 4.1
+
+
 def test_single_semantic_take_excludes_terminal_drift_and_retimes_to_exact_8s(
     tmp_path,
 ):
@@ -682,7 +657,7 @@ def test_single_semantic_take_excludes_terminal_drift_and_retimes_to_exact_8s(
         source_bytes = fh.read()
 
     final_bytes, meta = stitch_segments(
-        segment_videos=[source_bytes],
+        segment_paths=[clip],
         post_id="single-semantic",
         correlation_id="single-semantic",
         target_duration_seconds=8.0,
@@ -704,7 +679,7 @@ def test_single_semantic_take_excludes_terminal_drift_and_retimes_to_exact_8s(
 
 def test_empty_input_raises():
     with pytest.raises(ValueError):
-        stitch_segments(segment_videos=[], post_id="p", correlation_id="c")
+        stitch_segments(segment_paths=[], post_id="p", correlation_id="c")
 
 
 def test_extract_anchor_frame_returns_jpeg(tmp_path):
@@ -50,21 +50,17 @@ class TestTrimTail:
             src = os.path.join(td, "input.mp4")
             _generate_test_video(8.0, src)
 
-            with open(src, "rb") as f:
-                original_bytes = f.read()
-
-            trimmed_bytes, metadata = _trim_tail(
-                video_bytes=original_bytes,
+            out = os.path.join(td, "output.mp4")
+            trimmed_path, metadata = _trim_tail(
+                video_path=src,
+                output_path=out,
                 trim_ms=200,
                 post_id="test-001",
                 correlation_id="corr-001",
             )
 
-            out = os.path.join(td, "output.mp4")
-            with open(out, "wb") as f:
-                f.write(trimmed_bytes)
-
-            duration_ms = _get_duration_ms(out)
+            assert trimmed_path == out
+            duration_ms = _get_duration_ms(trimmed_path)
             # Should be ~7800ms, allow 50ms tolerance for codec framing
             assert 7700 < duration_ms < 7850, f"Expected ~7800ms, got {duration_ms}ms"
 
@@ -76,11 +72,9 @@ class TestTrimTail:
             src = os.path.join(td, "input.mp4")
             _generate_test_video(4.0, src)
 
-            with open(src, "rb") as f:
-                original_bytes = f.read()
-
             _, metadata = _trim_tail(
-                video_bytes=original_bytes,
+                video_path=src,
+                output_path=os.path.join(td, "output.mp4"),
                 trim_ms=200,
                 post_id="test-002",
                 correlation_id="corr-002",
@@ -91,24 +85,22 @@ class TestTrimTail:
             assert "trim_final_duration_ms" in metadata
 
     def test_trim_skipped_when_video_too_short(self):
-        """If the video is shorter than trim amount, return original bytes unchanged."""
+        """If the video is shorter than trim amount, return the original path unchanged."""
         from workers.video_poller import _trim_tail
 
         with tempfile.TemporaryDirectory() as td:
             src = os.path.join(td, "input.mp4")
             _generate_test_video(0.15, src)  # 150ms — shorter than 200ms trim
 
-            with open(src, "rb") as f:
-                original_bytes = f.read()
-
-            result_bytes, metadata = _trim_tail(
-                video_bytes=original_bytes,
+            result_path, metadata = _trim_tail(
+                video_path=src,
+                output_path=os.path.join(td, "output.mp4"),
                 trim_ms=200,
                 post_id="test-003",
                 correlation_id="corr-003",
             )
 
-            assert result_bytes == original_bytes
+            assert result_path == src
             assert metadata.get("trim_tail_skipped") is True
 
     def test_trim_zero_ms_returns_original(self):
@@ -119,15 +111,13 @@ class TestTrimTail:
             src = os.path.join(td, "input.mp4")
             _generate_test_video(4.0, src)
 
-            with open(src, "rb") as f:
-                original_bytes = f.read()
-
-            result_bytes, metadata = _trim_tail(
-                video_bytes=original_bytes,
+            result_path, metadata = _trim_tail(
+                video_path=src,
+                output_path=os.path.join(td, "output.mp4"),
                 trim_ms=0,
                 post_id="test-004",
                 correlation_id="corr-004",
             )
 
-            assert result_bytes == original_bytes
+            assert result_path == src
             assert metadata == {}
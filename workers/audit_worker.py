@@ -5,43 +5,84 @@ from __future__ import annotations
 import os
 import sys
 import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from app.core.logging import configure_logging, get_logger
 from app.adapters.llm_client import get_llm_client
 from app.features.topics.audit import audit_batch
-from app.features.topics.queries import get_unaudited_scripts, update_script_quality
+from app.features.topics.queries import apply_script_audit_results, get_unaudited_scripts
 
 configure_logging()
 logger = get_logger(__name__)
 
 AUDIT_INTERVAL_SECONDS = int(os.getenv("TOPIC_AUDIT_INTERVAL_SECONDS", "60"))
-MAX_SCRIPTS_PER_RUN = 50
+MAX_SCRIPTS_PER_RUN = int(os.getenv("TOPIC_AUDIT_MAX_SCRIPTS_PER_RUN", "50"))
+# Concurrent Gemini audit calls per cycle; 1 restores the old one-by-one behaviour.
+AUDIT_MAX_IN_FLIGHT = max(int(os.getenv("TOPIC_AUDIT_MAX_IN_FLIGHT", "4")), 1)
+# Scripts packed into one Gemini request; 1 sends every script on its own.
+AUDIT_PACK_SIZE = max(int(os.getenv("TOPIC_AUDIT_PACK_SIZE", "8")), 1)
+
+
+def _queue_lag_seconds(rows: List[Dict[str, Any]], now: datetime) -> Optional[float]:
+    """Age of the oldest pending script picked up this cycle."""
+    created = []
+    for row in rows:
+        raw = str(row.get("created_at") or "").strip()
+        if not raw:
+            continue
+        try:
+            parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        created.append(parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc))
+    if not created:
+        return None
+    return round(max((now - min(created)).total_seconds(), 0.0), 1)
 
 
 def run_audit_cycle() -> None:
     """Run one audit cycle: fetch unaudited scripts, evaluate, write results."""
+    started = time.monotonic()
     rows = get_unaudited_scripts(limit=MAX_SCRIPTS_PER_RUN)
     if not rows:
         logger.info("audit_cycle_no_pending_scripts")
         return
 
-    logger.info("audit_cycle_starting", pending_count=len(rows))
+    queue_lag_seconds = _queue_lag_seconds(rows, datetime.now(timezone.utc))
+    logger.info(
+        "audit_cycle_starting",
+        pending_count=len(rows),
+        max_in_flight=AUDIT_MAX_IN_FLIGHT,
+        pack_size=AUDIT_PACK_SIZE,
+        queue_lag_seconds=queue_lag_seconds,
+    )
     llm = get_llm_client()
-    results = audit_batch(rows, llm=llm)
-
-    for result in results:
-        update_script_quality(
-            script_id=result.script_id,
-            quality_score=result.total_score,
-            quality_notes=result.quality_notes,
-            audit_status=result.status,
-        )
+    results = audit_batch(
+        rows,
+        llm=llm,
+        max_in_flight=AUDIT_MAX_IN_FLIGHT,
+        pack_size=AUDIT_PACK_SIZE,
+    )
+
+    written = apply_script_audit_results(
+        [
+            {
+                "script_id": result.script_id,
+                "quality_score": result.total_score,
+                "quality_notes": result.quality_notes,
+                "audit_status": result.status,
+            }
+            for result in results
+        ]
+    )
 
     pass_count = sum(1 for r in results if r.status == "pass")
     repair_count = sum(1 for r in results if r.status == "needs_repair")
     reject_count = sum(1 for r in results if r.status == "reject")
+    elapsed_seconds = max(time.monotonic() - started, 1e-6)
 
     logger.info(
         "audit_cycle_complete",
@@ -49,6 +90,12 @@ def run_audit_cycle() -> None:
         passed=pass_count,
         needs_repair=repair_count,
         rejected=reject_count,
+        deferred=len(rows) - len(results),
+        written=written,
+        elapsed_seconds=round(elapsed_seconds, 2),
+        scripts_per_minute=round(len(results) * 60.0 / elapsed_seconds, 1),
+        queue_lag_seconds=queue_lag_seconds,
+        backlog_full=len(rows) >= MAX_SCRIPTS_PER_RUN,
     )
 
 
@@ -57,6 +104,8 @@ def main() -> None:
         "audit_worker_started",
         interval_hours=AUDIT_INTERVAL_SECONDS / 3600,
         max_scripts=MAX_SCRIPTS_PER_RUN,
+        max_in_flight=AUDIT_MAX_IN_FLIGHT,
+        pack_size=AUDIT_PACK_SIZE,
     )
 
     while True:
@@ -3,23 +3,30 @@
 from __future__ import annotations
 
 import os
+import shutil
+import socket
+import subprocess
 import sys
 import tempfile
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
 
 # Keep script execution import-safe (python workers/caption_worker.py).
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.adapters.deepgram_client import DeepgramError, get_deepgram_client
+from app.adapters.deepgram_client import DeepgramClient, DeepgramError, WordLevelTranscript, get_deepgram_client
 from app.adapters.caption_renderer import burn_captions, CaptionRendererError
 from app.adapters.caption_aligner import align_transcript_to_script
+from app.adapters.media_probe import MediaProbeError, probe_media
 from app.adapters.storage_client import get_storage_client
 from app.adapters.supabase_client import get_supabase
 from app.core.config import get_settings
 from app.core.logging import configure_logging, get_logger
 from app.features.batches.state_machine import reconcile_batch_video_pipeline_state
+from app.features.publish.variants import INSTAGRAM_VARIANT_METADATA_KEYS
 from app.core.video_profiles import (
     VIDEO_STATUS_CAPTION_PENDING,
     VIDEO_STATUS_CAPTION_PROCESSING,
@@ -36,13 +43,182 @@ CAPTION_ERROR_BACKOFF_SECONDS = int(os.getenv("CAPTION_ERROR_BACKOFF_SECONDS", "
 MAX_CAPTION_RETRIES = 3
 CAPTION_BATCH_LIMIT = 5
 CAPTION_POLL_SELECT_FIELDS = "id,batch_id,video_url,video_metadata,seed_data"
+# Posts captioned at once by this worker; 1 restores the old one-by-one loop.
+CAPTION_MAX_CONCURRENCY = max(int(os.getenv("CAPTION_MAX_CONCURRENCY", "4")), 1)
+
+
+def _available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Burn-in encodes running at once across this worker's posts; the rest of a job
+# is network-bound and can overlap freely.
+CAPTION_MAX_CONCURRENT_ENCODES = max(int(os.getenv("CAPTION_MAX_CONCURRENT_ENCODES", str(_available_cores()))), 1)
+_ENCODE_SLOTS = threading.BoundedSemaphore(CAPTION_MAX_CONCURRENT_ENCODES)
+# A claimed post whose lease lapses (worker crashed mid-job) goes back to pending.
+CAPTION_LEASE_SECONDS = max(int(os.getenv("CAPTION_LEASE_SECONDS", "900")), 60)
+CAPTION_LEASE_OWNER_KEY = "caption_lease_owner"
+CAPTION_LEASE_EXPIRES_KEY = "caption_lease_expires_at"
+# A running job pushes its lease out this often, so slow downloads or a long wait
+# for an encode slot never let it lapse while the worker is still alive.
+CAPTION_LEASE_RENEW_SECONDS = max(CAPTION_LEASE_SECONDS // 3, 20)
+# Deepgram only needs the speech: a mono 16 kHz AAC track is a few hundred KB
+# where the MP4 it came from is tens of MB.
+CAPTION_AUDIO_EXTRACT_TIMEOUT_SECONDS = 120
 
 
 def _caption_worker_sleep_seconds(rows_seen_count: int) -> int:
     return CAPTION_IDLE_BACKOFF_SECONDS if rows_seen_count == 0 else POLL_INTERVAL_SECONDS
 
 
+def _caption_worker_identity() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _parse_utc_timestamp(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _without_caption_lease(metadata: dict[str, Any]) -> dict[str, Any]:
+    cleaned = dict(metadata)
+    cleaned.pop(CAPTION_LEASE_OWNER_KEY, None)
+    cleaned.pop(CAPTION_LEASE_EXPIRES_KEY, None)
+    return cleaned
+
+
+def _leased_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
+    return {
+        **metadata,
+        CAPTION_LEASE_OWNER_KEY: _caption_worker_identity(),
+        CAPTION_LEASE_EXPIRES_KEY: (
+            datetime.now(timezone.utc) + timedelta(seconds=CAPTION_LEASE_SECONDS)
+        ).isoformat(),
+    }
+
+
+def _claim_caption_post(post: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Move one pending post to caption_processing under this worker's lease.
+
+    The update only matches while the row is still pending, so when several
+    replicas see the same post exactly one of them gets it back.
+    """
+    post_id = post["id"]
+    metadata = _without_caption_lease(post.get("video_metadata") or {})
+    response = (
+        get_supabase().client.table("posts")
+        .update({
+            "video_status": VIDEO_STATUS_CAPTION_PROCESSING,
+            "video_metadata": _leased_metadata(metadata),
+        })
+        .eq("id", post_id)
+        .eq("video_status", VIDEO_STATUS_CAPTION_PENDING)
+        .execute()
+    )
+    if not response.data:
+        logger.info("caption_claim_conflict", post_id=post_id)
+        return None
+    return {**post, "video_metadata": metadata}
+
+
+def _recover_expired_caption_leases() -> int:
+    """Return posts stuck in caption_processing past their lease to the queue."""
+    supabase = get_supabase().client
+    response = (
+        supabase.table("posts")
+        .select("id,updated_at,video_metadata")
+        .in_("video_status", [VIDEO_STATUS_CAPTION_PROCESSING])
+        .execute()
+    )
+    now = datetime.now(timezone.utc)
+    recovered = 0
+    for row in response.data or []:
+        metadata = row.get("video_metadata") or {}
+        expires_at = _parse_utc_timestamp(metadata.get(CAPTION_LEASE_EXPIRES_KEY))
+        if expires_at is None:
+            # Rows claimed before leases existed: fall back to their last write.
+            updated_at = _parse_utc_timestamp(row.get("updated_at"))
+            expires_at = updated_at + timedelta(seconds=CAPTION_LEASE_SECONDS) if updated_at else None
+        if expires_at is None or expires_at > now or not row.get("updated_at"):
+            continue
+        reset = (
+            supabase.table("posts")
+            .update({
+                "video_status": VIDEO_STATUS_CAPTION_PENDING,
+                "video_metadata": _without_caption_lease(metadata),
+            })
+            .eq("id", row["id"])
+            .eq("updated_at", row["updated_at"])
+            .execute()
+        )
+        if reset.data:
+            recovered += 1
+            logger.warning(
+                "caption_lease_expired_requeued",
+                post_id=row["id"],
+                lease_owner=metadata.get(CAPTION_LEASE_OWNER_KEY),
+            )
+    return recovered
+
+
+def _renew_caption_lease(post: dict[str, Any]) -> bool:
+    """Extend this worker's lease on a post it is still processing.
+
+    Matches only while the row is caption_processing under our lease, so a job that
+    already finished, or whose lease was recovered by another replica, is left alone.
+    """
+    response = (
+        get_supabase().client.table("posts")
+        .update({"video_metadata": _leased_metadata(post.get("video_metadata") or {})})
+        .eq("id", post["id"])
+        .eq("video_status", VIDEO_STATUS_CAPTION_PROCESSING)
+        .eq(f"video_metadata->>{CAPTION_LEASE_OWNER_KEY}", _caption_worker_identity())
+        .execute()
+    )
+    return bool(response.data)
+
+
+def _keep_caption_lease(post: dict[str, Any], done: threading.Event) -> None:
+    while not done.wait(CAPTION_LEASE_RENEW_SECONDS):
+        try:
+            if not _renew_caption_lease(post):
+                logger.warning("caption_lease_lost", post_id=post.get("id"))
+                return
+        except Exception:
+            logger.exception("caption_lease_renew_failed", post_id=post.get("id"))
+
+
+def _run_claimed_caption_post(post: dict[str, Any]) -> None:
+    done = threading.Event()
+    renewer = threading.Thread(
+        target=_keep_caption_lease,
+        args=(post, done),
+        name=f"caption-lease-{post.get('id')}",
+        daemon=True,
+    )
+    renewer.start()
+    try:
+        _process_caption_post(post)
+    except Exception:
+        logger.exception("caption_post_error", post_id=post.get("id"))
+    finally:
+        done.set()
+        renewer.join()
+
+
 def poll_caption_pending() -> int:
+    try:
+        _recover_expired_caption_leases()
+    except Exception:
+        logger.exception("caption_lease_recovery_failed")
     supabase = get_supabase().client
     statuses = list(get_caption_pollable_statuses())
     result = (
@@ -55,15 +231,74 @@ def poll_caption_pending() -> int:
     posts = result.data or []
     if not posts:
         return 0
-    logger.info("caption_poll_found", count=len(posts))
-    rows_seen_count = 0
-    for post in posts:
-        rows_seen_count += 1
-        try:
-            _process_caption_post(post)
-        except Exception:
-            logger.exception("caption_post_error", post_id=post.get("id"))
-    return rows_seen_count
+    claimed = [claimed_post for claimed_post in map(_claim_caption_post, posts) if claimed_post is not None]
+    logger.info(
+        "caption_poll_found",
+        count=len(posts),
+        claimed=len(claimed),
+        max_concurrency=CAPTION_MAX_CONCURRENCY,
+    )
+    if claimed:
+        with ThreadPoolExecutor(
+            max_workers=min(CAPTION_MAX_CONCURRENCY, len(claimed)),
+            thread_name_prefix="caption",
+        ) as executor:
+            list(executor.map(_run_claimed_caption_post, claimed))
+    return len(posts)
+
+
+def _extract_audio_track(*, video_path: str, audio_path: str, correlation_id: str) -> bool:
+    result = subprocess.run(
+        [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-i", video_path,
+            "-vn", "-ac", "1", "-ar", "16000",
+            "-c:a", "aac", "-b:a", "64k",
+            audio_path,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=CAPTION_AUDIO_EXTRACT_TIMEOUT_SECONDS,
+    )
+    if result.returncode != 0 or not os.path.isfile(audio_path) or os.path.getsize(audio_path) == 0:
+        logger.warning(
+            "caption_audio_extract_failed",
+            correlation_id=correlation_id,
+            returncode=result.returncode,
+            stderr=result.stderr[-400:],
+        )
+        return False
+    return True
+
+
+def _transcribe_video_file(
+    deepgram: DeepgramClient,
+    *,
+    video_path: str,
+    work_dir: str,
+    correlation_id: str,
+) -> WordLevelTranscript:
+    """Transcribe a downloaded video by sending Deepgram only its audio track.
+
+    Falls back to streaming the whole file when extraction fails, so an odd
+    container never costs a caption.
+    """
+    try:
+        if probe_media(video_path).stream("audio") is None:
+            logger.warning("caption_video_has_no_audio", correlation_id=correlation_id)
+            return WordLevelTranscript(words=[], full_text="")
+    except MediaProbeError as exc:
+        logger.warning("caption_audio_probe_failed", correlation_id=correlation_id, error=str(exc))
+
+    audio_path = os.path.join(work_dir, "speech.m4a")
+    try:
+        extracted = _extract_audio_track(video_path=video_path, audio_path=audio_path, correlation_id=correlation_id)
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.warning("caption_audio_extract_failed", correlation_id=correlation_id, error=str(exc))
+        extracted = False
+    if extracted:
+        return deepgram.transcribe_file(path=audio_path, correlation_id=correlation_id, content_type="audio/mp4")
+    return deepgram.transcribe_file(path=video_path, correlation_id=correlation_id, content_type="video/mp4")
 
 
 def _process_caption_post(post: dict[str, Any]) -> None:
@@ -73,22 +308,24 @@ def _process_caption_post(post: dict[str, Any]) -> None:
     video_url = post.get("video_url", "")
     existing_metadata = post.get("video_metadata") or {}
 
-    supabase = get_supabase().client
     storage = get_storage_client()
     deepgram = get_deepgram_client()
 
-    supabase.table("posts").update({
-        "video_status": VIDEO_STATUS_CAPTION_PROCESSING,
-    }).eq("id", post_id).execute()
-
-    video_tmp_path = None
+    # Every stage works from files in here, so memory stays flat whatever the video size.
+    work_dir = tempfile.mkdtemp(prefix="caption_job_")
     output_path = None
+    completed = False
 
     try:
         logger.info("caption_download_start", correlation_id=correlation_id)
-        video_bytes = storage.download_video(video_url=video_url, correlation_id=correlation_id)
+        video_path = os.path.join(work_dir, "source.mp4")
+        storage.download_video_to_file(
+            video_url=video_url, destination_path=video_path, correlation_id=correlation_id,
+        )
 
-        transcript = deepgram.transcribe(audio_bytes=video_bytes, correlation_id=correlation_id)
+        transcript = _transcribe_video_file(
+            deepgram, video_path=video_path, work_dir=work_dir, correlation_id=correlation_id,
+        )
 
         # Align Deepgram transcription to the known script to fix misspellings
         seed_data = post.get("seed_data") or {}
@@ -107,45 +344,46 @@ def _process_caption_post(post: dict[str, Any]) -> None:
 
         if not transcript.words:
             logger.warning("caption_empty_transcript", correlation_id=correlation_id, post_id=post_id)
-            _mark_caption_completed(
+            completed = _mark_caption_completed(
                 post_id=post_id, existing_metadata=existing_metadata,
                 caption_metadata={}, correlation_id=correlation_id,
             )
-            _check_batch_caption_complete(batch_id, correlation_id)
+            if completed:
+                _check_batch_caption_complete(batch_id, correlation_id)
             return
 
-        video_fd, video_tmp_path = tempfile.mkstemp(suffix=".mp4")
-        os.close(video_fd)
-        with open(video_tmp_path, "wb") as f:
-            f.write(video_bytes)
-
-        output_path = burn_captions(
-            video_path=video_tmp_path, transcript=transcript, correlation_id=correlation_id,
-        )
-
-        with open(output_path, "rb") as f:
-            captioned_bytes = f.read()
+        with _ENCODE_SLOTS:
+            output_path = burn_captions(
+                video_path=video_path, transcript=transcript, correlation_id=correlation_id,
+            )
 
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         file_name = f"captioned_{timestamp}_{post_id}.mp4"
 
-        upload_result = storage.upload_video(
-            video_bytes=captioned_bytes, file_name=file_name, correlation_id=correlation_id,
+        upload_result = storage.upload_video_file(
+            path=output_path, file_name=file_name, correlation_id=correlation_id,
         )
 
         caption_metadata = {
             "caption_video_url": upload_result["url"],
             "caption_video_key": upload_result["storage_key"],
             "caption_video_size": upload_result.get("size"),
+            "caption_video_sha256": upload_result.get("sha256"),
             "captioned_at": datetime.now(timezone.utc).isoformat(),
             "caption_word_count": len(transcript.words),
         }
+        # A variant made from the previous video no longer matches the captioned one; the
+        # publish scheduler's variant stage rebuilds it once the post is completed.
+        existing_metadata = {
+            key: value for key, value in existing_metadata.items() if key not in INSTAGRAM_VARIANT_METADATA_KEYS
+        }
 
-        _mark_caption_completed(
+        completed = _mark_caption_completed(
             post_id=post_id, existing_metadata=existing_metadata,
             caption_metadata=caption_metadata, correlation_id=correlation_id,
         )
-        _check_batch_caption_complete(batch_id, correlation_id)
+        if completed:
+            _check_batch_caption_complete(batch_id, correlation_id)
 
     except (DeepgramError, CaptionRendererError) as exc:
         _handle_caption_failure(
@@ -153,37 +391,69 @@ def _process_caption_post(post: dict[str, Any]) -> None:
             error=exc, correlation_id=correlation_id,
         )
 
+    except Exception as exc:
+        if completed:
+            # The caption is stored; only the batch reconcile failed.
+            raise
+        # Storage, probe and upload failures count against the retry budget too, so a
+        # broken source ends in caption_failed instead of cycling through lease recovery.
+        logger.exception("caption_unexpected_error", correlation_id=correlation_id, post_id=post_id)
+        _handle_caption_failure(
+            post_id=post_id, existing_metadata=existing_metadata,
+            error=exc, correlation_id=correlation_id, transient=True,
+        )
+
     finally:
-        for path in (video_tmp_path, output_path):
-            if path and os.path.exists(path):
-                try:
-                    os.unlink(path)
-                except OSError:
-                    pass
+        if output_path and os.path.exists(output_path):
+            try:
+                os.unlink(output_path)
+            except OSError:
+                pass
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _update_leased_caption_post(post_id, payload) -> bool:
+    """Write a caption outcome only while this worker still holds the post's lease.
+
+    A worker whose lease lapsed and was recovered by another replica must not
+    overwrite what that replica does with the post.
+    """
+    response = (
+        get_supabase().client.table("posts")
+        .update(payload)
+        .eq("id", post_id)
+        .eq(f"video_metadata->>{CAPTION_LEASE_OWNER_KEY}", _caption_worker_identity())
+        .execute()
+    )
+    if not response.data:
+        logger.warning("caption_lease_lost", post_id=post_id)
+        return False
+    return True
 
 
-def _mark_caption_completed(*, post_id, existing_metadata, caption_metadata, correlation_id):
-    supabase = get_supabase().client
+def _mark_caption_completed(*, post_id, existing_metadata, caption_metadata, correlation_id) -> bool:
     merged = {**existing_metadata, **caption_metadata}
-    supabase.table("posts").update({
+    if not _update_leased_caption_post(post_id, {
         "video_status": VIDEO_STATUS_CAPTION_COMPLETED,
         "video_metadata": merged,
-    }).eq("id", post_id).execute()
+    }):
+        return False
     logger.info("caption_completed", correlation_id=correlation_id, post_id=post_id)
+    return True
 
 
-def _handle_caption_failure(*, post_id, existing_metadata, error, correlation_id):
-    supabase = get_supabase().client
+def _handle_caption_failure(*, post_id, existing_metadata, error, correlation_id, transient=None):
     retry_count = existing_metadata.get("caption_retry_count", 0) + 1
-    transient = getattr(error, "transient", False)
+    if transient is None:
+        transient = getattr(error, "transient", False)
 
     if transient and retry_count < MAX_CAPTION_RETRIES:
         merged = {**existing_metadata, "caption_retry_count": retry_count}
-        supabase.table("posts").update({
+        if _update_leased_caption_post(post_id, {
             "video_status": VIDEO_STATUS_CAPTION_PENDING,
             "video_metadata": merged,
-        }).eq("id", post_id).execute()
-        logger.warning("caption_retry_scheduled", correlation_id=correlation_id, retry_count=retry_count, error=str(error))
+        }):
+            logger.warning("caption_retry_scheduled", correlation_id=correlation_id, retry_count=retry_count, error=str(error))
     else:
         merged = {
             **existing_metadata,
@@ -191,11 +461,11 @@ def _handle_caption_failure(*, post_id, existing_metadata, error, correlation_id
             "caption_error": str(error),
             "caption_failed_at": datetime.now(timezone.utc).isoformat(),
         }
-        supabase.table("posts").update({
+        if _update_leased_caption_post(post_id, {
             "video_status": VIDEO_STATUS_CAPTION_FAILED,
             "video_metadata": merged,
-        }).eq("id", post_id).execute()
-        logger.error("caption_failed_permanently", correlation_id=correlation_id, retry_count=retry_count, error=str(error))
+        }):
+            logger.error("caption_failed_permanently", correlation_id=correlation_id, retry_count=retry_count, error=str(error))
 
 
 def _check_batch_caption_complete(batch_id, correlation_id):
@@ -17,7 +17,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from app.core.config import get_settings
 from app.core.logging import configure_logging, get_logger
 from app.features.blog.handlers import run_scheduled_blog_publish_job
-from app.features.publish.handlers import run_scheduled_publish_job
+from app.features.publish.handlers import run_publish_variant_job, run_scheduled_publish_job
 
 configure_logging()
 logger = get_logger(__name__)
@@ -48,6 +48,13 @@ async def run_cycle() -> tuple[dict[str, Any], dict[str, Any]]:
     return social_result, blog_result
 
 
+async def run_variant_loop() -> None:
+    """Prepare publish variants on their own cadence so a long transcode never delays dispatch."""
+    while True:
+        await run_publish_variant_job()
+        await asyncio.sleep(POLL_SECONDS)
+
+
 async def main() -> None:
     settings = get_settings()
     logger.info(
@@ -55,9 +62,13 @@ async def main() -> None:
         environment=settings.environment,
         poll_seconds=POLL_SECONDS,
     )
-    while True:
-        await run_cycle()
-        await asyncio.sleep(POLL_SECONDS)
+    variant_loop = asyncio.create_task(run_variant_loop())
+    try:
+        while True:
+            await run_cycle()
+            await asyncio.sleep(POLL_SECONDS)
+    finally:
+        variant_loop.cancel()
 
 
 if __name__ == "__main__":
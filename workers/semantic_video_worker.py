@@ -1161,7 +1161,7 @@ class ProductionStageRunner:
             }
         )
         stitched_bytes, stitch_metadata = stitch_segments(
-            segment_videos=[raw_bytes],
+            segment_paths=[str(raw_path)],
             post_id=str(run["id"]),
             correlation_id=f"semantic_ugc_{run['id']}_advisory_stitch",
             trim_windows=None,
@@ -8,9 +8,10 @@ deployment orchestration and audit timing.
 import time
 import sys
 import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from dateutil.parser import isoparse
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -41,6 +42,10 @@ NICHE = os.environ.get("CRON_RESEARCH_NICHE", "Schwerbehinderung, Treppenlifte,
 CRON_STALE_AFTER_SECONDS = 15 * 60
 CRON_CHILD_WINDOW_GRACE_SECONDS = 60
 MIN_ACTIVE_FAMILY_COVERAGE = int(os.environ.get("TOPIC_MIN_ACTIVE_FAMILY_COVERAGE", "5"))
+# Seeds researched at once; 1 restores the old one-by-one cycle.
+RESEARCH_MAX_CONCURRENCY = max(int(os.getenv("TOPIC_RESEARCH_MAX_CONCURRENCY", str(MAX_TOPICS_PER_RUN))), 1)
+# Keeps the wrapper's updated_at fresh while long seeds are still running.
+CRON_HEARTBEAT_INTERVAL_SECONDS = 5 * 60
 
 def _get_last_run_timestamp() -> float:
     """Get timestamp of last completed cron run from DB. Returns 0.0 if none."""
@@ -260,6 +265,86 @@ def _research_single_topic(
         return None
 
 
+def _summarize_seed_outcomes(
+    seeds: List[str],
+    outcomes: Dict[int, Dict[str, Any]],
+    *,
+    include_running: bool = False,
+) -> Tuple[int, int, List[str], List[Dict[str, Any]]]:
+    """(completed, failed, topic_ids, details) in seed order."""
+    topics_completed = 0
+    topics_failed = 0
+    topic_ids: List[str] = []
+    details: List[Dict[str, Any]] = []
+    for index, seed in enumerate(seeds):
+        outcome = outcomes.get(index)
+        if outcome is None:
+            if include_running:
+                details.append({"seed": seed, "status": "running"})
+            continue
+        if outcome["status"] == "completed":
+            topics_completed += 1
+            for row in outcome["rows"]:
+                topic_id = str(row.get("id") or "").strip()
+                if topic_id:
+                    topic_ids.append(topic_id)
+            details.append({"seed": seed, "status": "completed", "rows": len(outcome["rows"])})
+        else:
+            topics_failed += 1
+            details.append({"seed": seed, "status": "failed"})
+    return topics_completed, topics_failed, topic_ids, details
+
+
+def _research_seeds(
+    *,
+    run_id: str,
+    seeds: List[str],
+    outcomes: Dict[int, Dict[str, Any]],
+) -> None:
+    """Research seeds concurrently, heartbeating the cron row as each one finishes.
+
+    ``outcomes`` is filled in place (seed index -> detail with ``rows``) so a
+    caller handling an escaped error still sees every seed that finished.
+    """
+
+    def heartbeat() -> None:
+        completed, failed, topic_ids, details = _summarize_seed_outcomes(seeds, outcomes, include_running=True)
+        _heartbeat_cron_run(
+            run_id=run_id,
+            topics_completed=completed,
+            topics_failed=failed,
+            topic_ids=topic_ids,
+            details=details,
+        )
+
+    def research(seed: str) -> Optional[List[Dict[str, Any]]]:
+        logger.info("topic_research_topic_started", seed_topic=seed)
+        return _research_single_topic(
+            seed_topic=seed,
+            post_type=POST_TYPE,
+            tiers=TARGET_TIERS,
+        )
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(RESEARCH_MAX_CONCURRENCY, max(len(seeds), 1)),
+        thread_name_prefix="topic-research",
+    )
+    try:
+        pending: Dict[Future, int] = {executor.submit(research, seed): index for index, seed in enumerate(seeds)}
+        while pending:
+            done, _ = wait(pending, timeout=CRON_HEARTBEAT_INTERVAL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                topic_rows = _normalize_stored_rows(future.result())
+                if topic_rows:
+                    outcomes[index] = {"status": "completed", "rows": topic_rows}
+                else:
+                    outcomes[index] = {"status": "failed", "rows": []}
+            heartbeat()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def run_discovery_cycle(*, audit_after_discovery: bool = True):
     """Execute one full discovery cycle: select seeds, research them, track in DB."""
     run_id: Optional[str] = None
@@ -268,6 +353,7 @@ def run_discovery_cycle(*, audit_after_discovery: bool = True):
     topic_ids: List[str] = []
     details: List[Dict[str, Any]] = []
     seeds: List[str] = []
+    outcomes: Dict[int, Dict[str, Any]] = {}
     active_coverage_before = count_selectable_topic_families(post_type=POST_TYPE, target_length_tier=8)
     logger.info(
         "topic_research_coverage_snapshot",
@@ -293,32 +379,16 @@ def run_discovery_cycle(*, audit_after_discovery: bool = True):
         )
         run_id = run_record["id"]
 
-        for seed in seeds:
-            logger.info("topic_research_topic_started", seed_topic=seed)
-            result = _research_single_topic(
-                seed_topic=seed,
-                post_type=POST_TYPE,
-                tiers=TARGET_TIERS,
-            )
-            topic_rows = _normalize_stored_rows(result)
-            if topic_rows:
-                topics_completed += 1
-                for row in topic_rows:
-                    topic_id = str(row.get("id") or "").strip()
-                    if topic_id:
-                        topic_ids.append(topic_id)
-                details.append({"seed": seed, "status": "completed", "rows": len(topic_rows)})
-            else:
-                topics_failed += 1
-                details.append({"seed": seed, "status": "failed"})
-
-            _heartbeat_cron_run(
-                run_id=run_id,
-                topics_completed=topics_completed,
-                topics_failed=topics_failed,
-                topic_ids=topic_ids,
-                details=details,
-            )
+        research_started = time.monotonic()
+        _research_seeds(run_id=run_id, seeds=seeds, outcomes=outcomes)
+        topics_completed, topics_failed, topic_ids, details = _summarize_seed_outcomes(seeds, outcomes)
+        logger.info(
+            "topic_research_seeds_finished",
+            run_id=run_id,
+            seed_count=len(seeds),
+            max_concurrency=RESEARCH_MAX_CONCURRENCY,
+            elapsed_seconds=round(time.monotonic() - research_started, 1),
+        )
 
         final_status = "completed" if topics_failed < len(seeds) else "failed"
         error_msg = None
@@ -356,6 +426,8 @@ def run_discovery_cycle(*, audit_after_discovery: bool = True):
         )
     except Exception as exc:
         logger.exception("topic_research_cron_failed", error=str(exc), run_id=run_id)
+        if outcomes:
+            topics_completed, topics_failed, topic_ids, details = _summarize_seed_outcomes(seeds, outcomes)
         if run_id is not None:
             try:
                 update_cron_run(
@@ -376,6 +448,7 @@ if __name__ == "__main__":
         "topic_researcher_started",
         interval_hours=RESEARCH_INTERVAL_SECONDS / 3600,
         max_topics=MAX_TOPICS_PER_RUN,
+        max_concurrency=RESEARCH_MAX_CONCURRENCY,
         tiers=TARGET_TIERS,
     )
 
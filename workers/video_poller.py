@@ -9,13 +9,18 @@ import time
 import sys
 import os
 import json
+import hashlib
+import shutil
 import socket
 import subprocess
 import tempfile
+import threading
 import atexit
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from urllib.parse import quote, urlparse
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterator, List, Dict, Any, Optional, Union
 import httpx
 import google.auth
 from google.auth.transport.requests import Request
@@ -48,11 +53,15 @@ from app.core.video_profiles import (
     VIDEO_STATUS_COMPLETED,
     VIDEO_STATUS_FAILED,
     VIDEO_STATUS_STITCHING,
+    VIDEO_POLL_ATTEMPT_KEY,
+    VIDEO_POLL_NEXT_AT_KEY,
+    compute_next_video_poll_at,
     get_processing_video_status,
     get_submitted_video_status,
     TRIM_TAIL_MS,
 )
-from app.adapters.video_stitcher import stitch_segments
+from app.adapters.media_probe import MediaProbeError, probe_media
+from app.adapters.video_stitcher import stitch_segments_to_file
 from app.adapters.deepgram_client import DeepgramError, get_deepgram_client
 from app.features.videos.segmented_pipeline import (
     SEGMENT_STATUS_COMPLETED,
@@ -135,7 +144,19 @@ VEO_EXTENSION_INPUT_NOT_READY_MESSAGE = (
     "Input video must be a video that was generated by VEO that has been processed."
 )
 VIDEO_POLLER_LOCK_PATH = os.path.join(tempfile.gettempdir(), "aiugc-video-poller.lock")
+# Posts in one cycle are processed by a bounded pool. Status checks are cheap network calls, while
+# download/stitch/trim/store work is CPU, disk and memory heavy, so it gets its own smaller gate.
+VIDEO_POLLER_STATUS_CONCURRENCY = max(1, int(os.getenv("VIDEO_POLLER_STATUS_CONCURRENCY", "8")))
+VIDEO_POLLER_HEAVY_CONCURRENCY = max(1, int(os.getenv("VIDEO_POLLER_HEAVY_CONCURRENCY", "2")))
+# Segmented routes stream each completed segment to a per-post staging directory as soon as its op
+# finishes, so the stitch finds every input already on disk when the last segment lands. Staging
+# dirs of posts that left the pollable set without a stitch are swept once they are this old.
+SEGMENT_STAGING_ROOT = os.path.join(tempfile.gettempdir(), "aiugc-segment-stage")
+SEGMENT_DOWNLOAD_CONCURRENCY = max(1, int(os.getenv("VIDEO_POLLER_SEGMENT_DOWNLOAD_CONCURRENCY", "4")))
+SEGMENT_STAGING_STALE_SECONDS = max(0, int(os.getenv("VIDEO_POLLER_SEGMENT_STAGING_STALE_SECONDS", "3600")))
 _VIDEO_POLLER_LOCK_HANDLE = None
+_HEAVY_WORK_GATE = threading.BoundedSemaphore(VIDEO_POLLER_HEAVY_CONCURRENCY)
+_heavy_work_state = threading.local()
 _last_idle_reconcile_at = 0.0
 
 
@@ -358,6 +379,8 @@ def _clear_terminal_polling_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]
         "veo_extension_last_retryable_error",
         "veo_extension_rate_limit_retry_count",
         "veo_extension_input_retry_count",
+        VIDEO_POLL_NEXT_AT_KEY,
+        VIDEO_POLL_ATTEMPT_KEY,
         "trim_tail_ms",
         "trim_original_duration_ms",
         "trim_final_duration_ms",
@@ -403,6 +426,59 @@ def _release_post_quota_reservation(
     )
 
 
+def _video_poll_due_at(post: Dict[str, Any]) -> Optional[datetime]:
+    """When the post's current operation is next worth a provider status check.
+
+    Posts scheduled by an earlier check carry ``video_poll_next_at``. Freshly submitted posts do not,
+    so their first check is derived from the route's typical render time after the submit write
+    (``updated_at``). Extension retry deferrals push the due time out further.
+    """
+    metadata = post.get("video_metadata") or {}
+    due_at = _parse_utc_timestamp(metadata.get(VIDEO_POLL_NEXT_AT_KEY))
+    if due_at is None and metadata.get(VIDEO_POLL_ATTEMPT_KEY) is None:
+        submitted_at = _parse_utc_timestamp(post.get("updated_at"))
+        if submitted_at is not None:
+            due_at = compute_next_video_poll_at(
+                metadata.get("video_pipeline_route"),
+                anchor=submitted_at,
+                attempt=0,
+            )
+    retry_after = _parse_utc_timestamp(metadata.get("veo_extension_retry_after"))
+    if retry_after is not None and (due_at is None or retry_after > due_at):
+        due_at = retry_after
+    return due_at
+
+
+def _post_is_due_for_poll(post: Dict[str, Any], *, now: Optional[datetime] = None) -> bool:
+    due_at = _video_poll_due_at(post)
+    return due_at is None or due_at <= (now or _utc_now())
+
+
+def _schedule_next_video_poll(
+    metadata: Dict[str, Any],
+    *,
+    now: Optional[datetime] = None,
+    operation_submitted: bool = False,
+) -> Dict[str, Any]:
+    """Return metadata with the next due time for its operation.
+
+    ``operation_submitted`` restarts the schedule for a newly accepted provider operation; otherwise
+    a status check just found the operation still rendering and the backoff grows.
+    """
+    current = now or _utc_now()
+    attempt = 0 if operation_submitted else int(metadata.get(VIDEO_POLL_ATTEMPT_KEY) or 0) + 1
+    next_poll_at = compute_next_video_poll_at(
+        metadata.get("video_pipeline_route"),
+        anchor=current,
+        attempt=attempt,
+    )
+    return {
+        **metadata,
+        VIDEO_POLL_ATTEMPT_KEY: attempt,
+        VIDEO_POLL_NEXT_AT_KEY: _utc_now_iso(next_poll_at),
+    }
+
+
 def _claim_video_poll_lease(post: Dict[str, Any], correlation_id: str) -> Optional[Dict[str, Any]]:
     post_id = post["id"]
     poller_identity = _poller_identity()
@@ -609,99 +685,73 @@ def _even(value: int) -> int:
 
 
 def _probe_video_dimensions(video_path: str) -> tuple[int, int]:
-    command = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "v:0",
-        "-show_entries",
-        "stream=width,height",
-        "-of",
-        "json",
-        video_path,
-    ]
-    result = subprocess.run(command, capture_output=True, text=True, timeout=30)
-    if result.returncode != 0:
-        raise ValueError(f"ffprobe failed: {result.stderr[-200:]}")
-    data = json.loads(result.stdout)
-    stream = (data.get("streams") or [{}])[0]
-    width = int(stream["width"])
-    height = int(stream["height"])
-    return width, height
+    try:
+        probe = probe_media(video_path)
+        return probe.width, probe.height
+    except MediaProbeError as exc:
+        raise ValueError(f"ffprobe failed: {exc.stderr[-200:]}") from exc
 
 
 def _probe_video_duration(video_path: str) -> float:
     """Return video duration in seconds as a float."""
-    command = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "default=noprint_wrappers=1:nokey=1",
-        video_path,
-    ]
-    result = subprocess.run(command, capture_output=True, text=True, timeout=30)
-    if result.returncode != 0:
-        raise ValueError(f"ffprobe duration failed: {result.stderr[-200:]}")
-    return float(result.stdout.strip())
+    try:
+        duration = probe_media(video_path).duration
+    except MediaProbeError as exc:
+        raise ValueError(f"ffprobe duration failed: {exc.stderr[-200:]}") from exc
+    if duration is None:
+        raise ValueError("ffprobe duration failed: no container duration")
+    return duration
 
 
 def _trim_tail(
     *,
-    video_bytes: bytes,
+    video_path: str,
+    output_path: str,
     trim_ms: int,
     post_id: str,
     correlation_id: str,
-) -> tuple[bytes, Dict[str, Any]]:
-    """Trim the last `trim_ms` milliseconds from a video using ffmpeg stream copy."""
+) -> tuple[str, Dict[str, Any]]:
+    """Trim the last `trim_ms` milliseconds from a video using ffmpeg stream copy.
+
+    Returns the path holding the result: ``output_path`` once trimmed, ``video_path``
+    when there was nothing to trim.
+    """
     if trim_ms <= 0:
-        return video_bytes, {}
+        return video_path, {}
 
-    with tempfile.TemporaryDirectory(prefix="video_trim_") as temp_dir:
-        input_path = os.path.join(temp_dir, "input.mp4")
-        output_path = os.path.join(temp_dir, "output.mp4")
-        with open(input_path, "wb") as file_obj:
-            file_obj.write(video_bytes)
+    original_duration = _probe_video_duration(video_path)
+    trim_seconds = trim_ms / 1000.0
 
-        original_duration = _probe_video_duration(input_path)
-        trim_seconds = trim_ms / 1000.0
+    if original_duration <= trim_seconds:
+        logger.warning(
+            "trim_tail_skipped_too_short",
+            post_id=post_id,
+            correlation_id=correlation_id,
+            original_duration=original_duration,
+            trim_ms=trim_ms,
+        )
+        return video_path, {"trim_tail_skipped": True}
 
-        if original_duration <= trim_seconds:
-            logger.warning(
-                "trim_tail_skipped_too_short",
-                post_id=post_id,
-                correlation_id=correlation_id,
-                original_duration=original_duration,
-                trim_ms=trim_ms,
-            )
-            return video_bytes, {"trim_tail_skipped": True}
-
-        target_duration = original_duration - trim_seconds
-
-        command = [
-            "ffmpeg",
-            "-y",
-            "-i",
-            input_path,
-            "-t",
-            f"{target_duration:.3f}",
-            "-c",
-            "copy",
-            "-movflags",
-            "+faststart",
-            output_path,
-        ]
-        result = subprocess.run(command, capture_output=True, text=True, timeout=60)
-        if result.returncode != 0:
-            raise ValueError(f"ffmpeg trim failed: {result.stderr[-300:]}")
+    target_duration = original_duration - trim_seconds
 
-        final_duration = _probe_video_duration(output_path)
+    command = [
+        "ffmpeg",
+        "-y",
+        "-i",
+        video_path,
+        "-t",
+        f"{target_duration:.3f}",
+        "-c",
+        "copy",
+        "-movflags",
+        "+faststart",
+        output_path,
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, timeout=60)
+    if result.returncode != 0:
+        raise ValueError(f"ffmpeg trim failed: {result.stderr[-300:]}")
 
-        with open(output_path, "rb") as file_obj:
-            trimmed_bytes = file_obj.read()
+    final_duration = _probe_video_duration(output_path)
 
     logger.info(
         "trim_tail_applied",
@@ -712,23 +762,25 @@ def _trim_tail(
         trim_ms=trim_ms,
     )
 
-    return trimmed_bytes, {
+    return output_path, {
         "trim_tail_ms": trim_ms,
         "trim_original_duration_ms": round(original_duration * 1000),
         "trim_final_duration_ms": round(final_duration * 1000),
     }
 
 
-def _maybe_postprocess_video_bytes(
+def _maybe_postprocess_video(
     *,
     post_id: str,
-    video_bytes: bytes,
+    video_path: str,
+    output_path: str,
     existing_metadata: Dict[str, Any],
     correlation_id: str,
-) -> tuple[bytes, Dict[str, Any]]:
+) -> tuple[str, Dict[str, Any]]:
+    """Apply the post's crop postprocess into ``output_path``; return the path to upload."""
     target_aspect_ratio = str(existing_metadata.get("postprocess_crop_aspect_ratio") or "").strip()
     if not target_aspect_ratio:
-        return video_bytes, {}
+        return video_path, {}
 
     requested_size = str(existing_metadata.get("requested_size") or "").strip()
     if not requested_size:
@@ -737,65 +789,56 @@ def _maybe_postprocess_video_bytes(
     target_aspect_width, target_aspect_height = _parse_aspect_ratio(target_aspect_ratio)
     target_width, target_height = _parse_size(requested_size)
 
-    with tempfile.TemporaryDirectory(prefix="video_postprocess_") as temp_dir:
-        input_path = os.path.join(temp_dir, "input.mp4")
-        output_path = os.path.join(temp_dir, "output.mp4")
-        with open(input_path, "wb") as file_obj:
-            file_obj.write(video_bytes)
-
-        source_width, source_height = _probe_video_dimensions(input_path)
-        source_ratio = source_width / source_height
-        target_ratio = target_aspect_width / target_aspect_height
-
-        if abs(source_ratio - target_ratio) < 0.001:
-            crop_width = source_width
-            crop_height = source_height
-            crop_x = 0
-            crop_y = 0
-        elif source_ratio > target_ratio:
-            crop_height = source_height
-            crop_width = _even(int(source_height * target_ratio))
-            crop_x = max((source_width - crop_width) // 2, 0)
-            crop_y = 0
-        else:
-            crop_width = source_width
-            crop_height = _even(int(source_width / target_ratio))
-            crop_x = 0
-            crop_y = max((source_height - crop_height) // 2, 0)
-
-        filter_graph = (
-            f"crop={crop_width}:{crop_height}:{crop_x}:{crop_y},"
-            f"scale={target_width}:{target_height}"
-        )
-        command = [
-            "ffmpeg",
-            "-y",
-            "-i",
-            input_path,
-            "-vf",
-            filter_graph,
-            "-map",
-            "0:v:0",
-            "-map",
-            "0:a?",
-            "-c:v",
-            "libx264",
-            "-preset",
-            "fast",
-            "-crf",
-            "18",
-            "-c:a",
-            "copy",
-            "-movflags",
-            "+faststart",
-            output_path,
-        ]
-        result = subprocess.run(command, capture_output=True, text=True, timeout=180)
-        if result.returncode != 0:
-            raise ValueError(f"ffmpeg postprocess failed: {result.stderr[-300:]}")
-
-        with open(output_path, "rb") as file_obj:
-            processed_bytes = file_obj.read()
+    source_width, source_height = _probe_video_dimensions(video_path)
+    source_ratio = source_width / source_height
+    target_ratio = target_aspect_width / target_aspect_height
+
+    if abs(source_ratio - target_ratio) < 0.001:
+        crop_width = source_width
+        crop_height = source_height
+        crop_x = 0
+        crop_y = 0
+    elif source_ratio > target_ratio:
+        crop_height = source_height
+        crop_width = _even(int(source_height * target_ratio))
+        crop_x = max((source_width - crop_width) // 2, 0)
+        crop_y = 0
+    else:
+        crop_width = source_width
+        crop_height = _even(int(source_width / target_ratio))
+        crop_x = 0
+        crop_y = max((source_height - crop_height) // 2, 0)
+
+    filter_graph = (
+        f"crop={crop_width}:{crop_height}:{crop_x}:{crop_y},"
+        f"scale={target_width}:{target_height}"
+    )
+    command = [
+        "ffmpeg",
+        "-y",
+        "-i",
+        video_path,
+        "-vf",
+        filter_graph,
+        "-map",
+        "0:v:0",
+        "-map",
+        "0:a?",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "fast",
+        "-crf",
+        "18",
+        "-c:a",
+        "copy",
+        "-movflags",
+        "+faststart",
+        output_path,
+    ]
+    result = subprocess.run(command, capture_output=True, text=True, timeout=180)
+    if result.returncode != 0:
+        raise ValueError(f"ffmpeg postprocess failed: {result.stderr[-300:]}")
 
     logger.info(
         "video_postprocess_crop_applied",
@@ -806,7 +849,7 @@ def _maybe_postprocess_video_bytes(
         output_size=f"{target_width}x{target_height}",
         filter_graph=filter_graph,
     )
-    return processed_bytes, {
+    return output_path, {
         "postprocess_crop_applied": True,
         "postprocess_crop_source_size": f"{source_width}x{source_height}",
         "postprocess_crop_output_size": f"{target_width}x{target_height}",
@@ -814,9 +857,130 @@ def _maybe_postprocess_video_bytes(
     }
 
 
+@contextmanager
+def _heavy_work_slot(post_id: str, correlation_id: str) -> Iterator[None]:
+    """Bound concurrent download/stitch/store work across poll slots.
+
+    Re-entrant per thread so nested heavy sections (stitch -> store) hold a single slot.
+    """
+    depth = getattr(_heavy_work_state, "depth", 0)
+    if depth:
+        _heavy_work_state.depth = depth + 1
+        try:
+            yield
+        finally:
+            _heavy_work_state.depth -= 1
+        return
+
+    wait_started = time.monotonic()
+    _HEAVY_WORK_GATE.acquire()
+    wait_seconds = time.monotonic() - wait_started
+    if wait_seconds >= 1.0:
+        logger.info(
+            "video_poll_heavy_slot_waited",
+            post_id=post_id,
+            correlation_id=correlation_id,
+            wait_seconds=round(wait_seconds, 3),
+            heavy_concurrency=VIDEO_POLLER_HEAVY_CONCURRENCY,
+        )
+    _heavy_work_state.depth = 1
+    try:
+        yield
+    finally:
+        _heavy_work_state.depth = 0
+        _HEAVY_WORK_GATE.release()
+
+
+def _timed_process_video_operation(post: Dict[str, Any]) -> float:
+    """Run one post through the poll path and return its wall-clock latency in seconds."""
+    started = time.monotonic()
+    try:
+        process_video_operation(post)
+    finally:
+        latency_seconds = time.monotonic() - started
+        logger.debug(
+            "video_poll_post_processed",
+            post_id=post.get("id"),
+            latency_seconds=round(latency_seconds, 3),
+        )
+    return latency_seconds
+
+
+def _unique_posts_by_id(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Never hand the same post to two slots in one cycle; the lease fences across cycles."""
+    seen: set[str] = set()
+    unique: List[Dict[str, Any]] = []
+    for post in posts:
+        post_id = post.get("id")
+        if post_id in seen:
+            continue
+        seen.add(post_id)
+        unique.append(post)
+    return unique
+
+
+def _process_video_operations(posts: List[Dict[str, Any]]) -> List[float]:
+    """Process a cycle's posts in a bounded pool and return per-post latencies.
+
+    The first unexpected error is re-raised after every slot has finished so a
+    failed cycle still backs off exactly like the sequential loop did.
+    """
+    if not posts:
+        return []
+    if VIDEO_POLLER_STATUS_CONCURRENCY == 1 or len(posts) == 1:
+        return [_timed_process_video_operation(post) for post in posts]
+
+    latencies: List[float] = []
+    first_error: Optional[BaseException] = None
+    with ThreadPoolExecutor(
+        max_workers=min(VIDEO_POLLER_STATUS_CONCURRENCY, len(posts)),
+        thread_name_prefix="video-poll",
+    ) as executor:
+        futures = [executor.submit(_timed_process_video_operation, post) for post in posts]
+        for future in futures:
+            try:
+                latencies.append(future.result())
+            except Exception as exc:  # noqa: BLE001
+                if first_error is None:
+                    first_error = exc
+    if first_error is not None:
+        raise first_error
+    return latencies
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _log_poll_cycle_metrics(
+    *,
+    queue_depth: int,
+    latencies: List[float],
+    cycle_seconds: float,
+    not_due: int = 0,
+) -> Dict[str, Any]:
+    metrics = {
+        "queue_depth": queue_depth,
+        "not_due": not_due,
+        "processed": len(latencies),
+        "cycle_seconds": round(cycle_seconds, 3),
+        "post_latency_p50_seconds": round(_percentile(latencies, 0.5), 3),
+        "post_latency_p95_seconds": round(_percentile(latencies, 0.95), 3),
+        "post_latency_max_seconds": round(max(latencies, default=0.0), 3),
+        "status_concurrency": VIDEO_POLLER_STATUS_CONCURRENCY,
+        "heavy_concurrency": VIDEO_POLLER_HEAVY_CONCURRENCY,
+    }
+    logger.info("video_poll_cycle_completed", **metrics)
+    return metrics
+
+
 def poll_pending_videos() -> bool:
     """
-    Poll all posts with submitted/processing video status.
+    Poll posts with submitted/processing video status whose operation is due for a status check.
     Per Constitution § VIII: Test end-to-end in real environment.
     """
     try:
@@ -827,12 +991,21 @@ def poll_pending_videos() -> bool:
             "video_status", list(get_pollable_video_statuses())
         ).execute()
         
-        posts = response.data
-        logger.info("polling_videos", count=len(posts))
-        
-        for post in posts:
-            process_video_operation(post)
+        posts = _unique_posts_by_id(response.data or [])
+        now = _utc_now()
+        due_posts = [post for post in posts if _post_is_due_for_poll(post, now=now)]
+        logger.info("polling_videos", count=len(due_posts), in_flight=len(posts))
+
+        cycle_started = time.monotonic()
+        latencies = _process_video_operations(due_posts)
+        _log_poll_cycle_metrics(
+            queue_depth=len(due_posts),
+            latencies=latencies,
+            cycle_seconds=time.monotonic() - cycle_started,
+            not_due=len(posts) - len(due_posts),
+        )
 
+        _sweep_stale_segment_staging({str(post.get("id")) for post in posts})
         _maybe_reconcile_batches_ready_for_qa(active_post_count=len(posts))
         return True
     
@@ -951,6 +1124,7 @@ def process_video_operation(post: Dict[str, Any]):
 
             should_defer = isinstance(e, httpx.HTTPStatusError) and e.response.status_code in {429, 500, 502, 503, 504}
             if should_defer:
+                retry_metadata = _schedule_next_video_poll(retry_metadata)
                 try:
                     supabase = get_supabase().client
                     supabase.table("posts").update({
@@ -1170,6 +1344,7 @@ def _retry_rai_filtered_video(post: Dict[str, Any], correlation_id: str, rai_rea
         "rai_last_retry_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "operation_ids": operation_ids,
     })
+    metadata = _schedule_next_video_poll(metadata, operation_submitted=True)
     if quota_consume_error:
         metadata["quota_consume_error"] = quota_consume_error
     # Clear failure fields so the post re-enters the polling loop
@@ -1226,6 +1401,128 @@ def _download_segment_bytes(provider: str, video_uri: str, correlation_id: str)
     return _decode_vertex_video_uri(video_uri)
 
 
+def _download_segment_to_file(
+    provider: str, video_uri: str, destination_path: str, correlation_id: str
+) -> None:
+    """Stream one segment to disk without holding the whole clip in memory."""
+    if provider == "veo_3_1":
+        get_veo_client().download_video_to_file(
+            video_uri=video_uri,
+            destination_path=destination_path,
+            correlation_id=correlation_id,
+        )
+        return
+    if video_uri.startswith("gs://"):
+        url, headers = _vertex_gcs_media_request(video_uri)
+        with httpx.stream("GET", url, headers=headers, follow_redirects=True, timeout=120.0) as response:
+            response.raise_for_status()
+            with open(destination_path, "wb") as file_obj:
+                for chunk in response.iter_bytes():
+                    file_obj.write(chunk)
+        return
+    with open(destination_path, "wb") as file_obj:
+        file_obj.write(_decode_vertex_video_uri(video_uri))
+
+
+def _segment_staging_dir(post_id: str) -> str:
+    return os.path.join(SEGMENT_STAGING_ROOT, str(post_id))
+
+
+def _staged_segment_path(post_id: str, video_uri: str) -> str:
+    # Keyed by URI so a regenerated segment never reuses a stale staged file.
+    digest = hashlib.sha256(video_uri.encode("utf-8")).hexdigest()[:24]
+    return os.path.join(_segment_staging_dir(post_id), f"segment_{digest}.mp4")
+
+
+def _stage_segment(provider: str, post_id: str, video_uri: str, correlation_id: str) -> str:
+    staged_path = _staged_segment_path(post_id, video_uri)
+    if os.path.isfile(staged_path) and os.path.getsize(staged_path) > 0:
+        return staged_path
+    os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+    partial_path = f"{staged_path}.part"
+    try:
+        _download_segment_to_file(provider, video_uri, partial_path, correlation_id)
+        os.replace(partial_path, staged_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return staged_path
+
+
+def _stage_segments(
+    provider: str, post_id: str, uris: List[str], correlation_id: str
+) -> List[str]:
+    """Download not-yet-staged segments concurrently; return staged paths in ``uris`` order."""
+    if not uris:
+        return []
+    if len(uris) == 1 or SEGMENT_DOWNLOAD_CONCURRENCY == 1:
+        return [
+            _stage_segment(provider, post_id, uri, f"{correlation_id}_seg{index}")
+            for index, uri in enumerate(uris)
+        ]
+    with ThreadPoolExecutor(
+        max_workers=min(SEGMENT_DOWNLOAD_CONCURRENCY, len(uris)),
+        thread_name_prefix="video-segment-stage",
+    ) as executor:
+        futures = [
+            executor.submit(_stage_segment, provider, post_id, uri, f"{correlation_id}_seg{index}")
+            for index, uri in enumerate(uris)
+        ]
+        return [future.result() for future in futures]
+
+
+def _prefetch_completed_segments(
+    provider: str, post_id: str, uris: List[str], correlation_id: str
+) -> None:
+    """Stage segments as their ops complete; a failure here is retried by the stitch.
+
+    Downloads hold a heavy work slot so prefetch from every status slot cannot exceed the
+    download/stitch/store bound.
+    """
+    try:
+        with _heavy_work_slot(post_id, correlation_id):
+            _stage_segments(provider, post_id, uris, correlation_id)
+    except Exception as exc:  # noqa: BLE001 - the stitch re-stages anything missing.
+        logger.warning(
+            "segmented_video_prefetch_failed",
+            post_id=post_id,
+            correlation_id=correlation_id,
+            error=str(exc),
+        )
+
+
+def _clear_segment_staging(post_id: str) -> None:
+    shutil.rmtree(_segment_staging_dir(post_id), ignore_errors=True)
+
+
+def _sweep_stale_segment_staging(active_post_ids: set[str], *, now: Optional[float] = None) -> int:
+    """Remove staging dirs of posts that are no longer pollable.
+
+    A post can leave the pipeline without reaching the stitch (cancelled, reset, RAI retry, or a
+    worker restart mid-download), so its staged segments would otherwise stay on disk forever.
+    Dirs touched within ``SEGMENT_STAGING_STALE_SECONDS`` are kept for posts that only just left.
+    """
+    try:
+        entries = list(os.scandir(SEGMENT_STAGING_ROOT))
+    except OSError:
+        return 0
+    cutoff = (time.time() if now is None else now) - SEGMENT_STAGING_STALE_SECONDS
+    removed = 0
+    for entry in entries:
+        if entry.name in active_post_ids:
+            continue
+        try:
+            if not entry.is_dir(follow_symlinks=False) or entry.stat().st_mtime > cutoff:
+                continue
+        except OSError:
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+        removed += 1
+    if removed:
+        logger.info("segment_staging_swept", removed=removed)
+    return removed
+
+
 def _persist_segment_metadata(post_id: str, metadata: Dict[str, Any], correlation_id: str) -> None:
     supabase = get_supabase().client
     supabase.table("posts").update(
@@ -1256,6 +1553,7 @@ def _fail_segmented_post(post: Dict[str, Any], metadata: Dict[str, Any], correla
     supabase.table("posts").update(
         {"video_status": VIDEO_STATUS_FAILED, "video_metadata": failure_metadata}
     ).eq("id", post_id).execute()
+    _clear_segment_staging(post_id)
     logger.error(
         "segmented_video_failed",
         post_id=post_id,
@@ -1309,13 +1607,13 @@ def _fallback_segment_trim_windows(
 
 def _resolve_segment_trim_windows(
     *,
-    segment_videos: List[bytes],
+    segment_paths: List[str],
     metadata: Dict[str, Any],
     correlation_id: str,
 ) -> Optional[List[Dict[str, Any]]]:
     fallback_windows = _fallback_segment_trim_windows(
         metadata=metadata,
-        segment_count=len(segment_videos),
+        segment_count=len(segment_paths),
     )
     if not fallback_windows:
         return None
@@ -1334,9 +1632,11 @@ def _resolve_segment_trim_windows(
         return fallback_windows
 
     resolved: List[Dict[str, Any]] = []
-    for index, video_bytes in enumerate(segment_videos):
+    for index, segment_path in enumerate(segment_paths):
         fallback = fallback_windows[index] if fallback_windows and index < len(fallback_windows) else None
         try:
+            with open(segment_path, "rb") as file_obj:
+                video_bytes = file_obj.read()
             transcript = deepgram.transcribe(
                 audio_bytes=video_bytes,
                 correlation_id=f"{correlation_id}_seg{index}_trim",
@@ -1409,14 +1709,17 @@ def _stitch_and_store_segments(
         correlation_id=correlation_id,
         segment_count=len(uris),
     )
-    segment_videos = [_download_segment_bytes(provider, uri, correlation_id) for uri in uris]
+    segment_paths = _stage_segments(provider, post_id, uris, correlation_id)
     trim_windows = _resolve_segment_trim_windows(
-        segment_videos=segment_videos,
+        segment_paths=segment_paths,
         metadata=metadata,
         correlation_id=correlation_id,
     )
-    final_bytes, stitch_meta = stitch_segments(
-        segment_videos=segment_videos,
+    # The stitched clip stays next to its segments and is uploaded from there.
+    final_path = os.path.join(_segment_staging_dir(post_id), "stitched.mp4")
+    stitch_meta = stitch_segments_to_file(
+        segment_paths=segment_paths,
+        output_path=final_path,
         post_id=post_id,
         correlation_id=correlation_id,
         trim_windows=trim_windows,
@@ -1425,7 +1728,7 @@ def _stitch_and_store_segments(
         "segmented_video_stitch_complete",
         post_id=post_id,
         correlation_id=correlation_id,
-        output_bytes=len(final_bytes),
+        output_bytes=os.path.getsize(final_path),
     )
     merged_metadata = {**metadata, **{f"stitch_{key}": value for key, value in stitch_meta.items()}}
     if trim_windows:
@@ -1433,11 +1736,12 @@ def _stitch_and_store_segments(
     _store_completed_video(
         post_id=post_id,
         provider=provider,
-        video_source=final_bytes,
+        video_path=final_path,
         correlation_id=correlation_id,
         provider_metadata={"segmented": True, **stitch_meta},
         existing_metadata=merged_metadata,
     )
+    _clear_segment_staging(post_id)
 
 
 def _handle_segmented_video(post: Dict[str, Any], correlation_id: str) -> None:
@@ -1463,6 +1767,7 @@ def _handle_segmented_video(post: Dict[str, Any], correlation_id: str) -> None:
         return
 
     changed = False
+    newly_completed_uris: List[str] = []
     for op in ops:
         if op.get("status") in (SEGMENT_STATUS_COMPLETED, SEGMENT_STATUS_FAILED):
             continue
@@ -1479,6 +1784,7 @@ def _handle_segmented_video(post: Dict[str, Any], correlation_id: str) -> None:
             metadata["veo_segment_ops"] = record_segment_result(
                 metadata, operation_id=op_id, status=SEGMENT_STATUS_COMPLETED, video_uri=seg_uri
             )
+            newly_completed_uris.append(seg_uri)
             changed = True
 
     if changed:
@@ -1488,6 +1794,9 @@ def _handle_segmented_video(post: Dict[str, Any], correlation_id: str) -> None:
         _fail_segmented_post(post, metadata, correlation_id)
         return
 
+    if newly_completed_uris:
+        _prefetch_completed_segments(provider, post_id, newly_completed_uris, correlation_id)
+
     # Identity-lock route: once the anchor (seg 0) completes, submit the remaining segments as
     # image-to-video locked to its frame. Posts without an i2v_lock fall straight through (legacy
     # all-at-once fan-out), so this is a no-op for them.
@@ -1512,7 +1821,8 @@ def _handle_segmented_video(post: Dict[str, Any], correlation_id: str) -> None:
         )
         return
 
-    _stitch_and_store_segments(post, metadata, provider, correlation_id)
+    with _heavy_work_slot(post_id, correlation_id):
+        _stitch_and_store_segments(post, metadata, provider, correlation_id)
 
 
 def _maybe_submit_i2v_segments(
@@ -1587,7 +1897,12 @@ def _maybe_submit_i2v_segments(
 
     metadata = mark_i2v_submitted(metadata)
     _persist_segment_metadata(post_id, metadata, correlation_id)
-    _mark_processing(post_id, correlation_id, post.get("video_operation_id") or anchor_uri)
+    _mark_processing(
+        post_id,
+        correlation_id,
+        post.get("video_operation_id") or anchor_uri,
+        operation_submitted=True,
+    )
 
 
 def _handle_veo_video(post: Dict[str, Any], operation_id: str, correlation_id: str) -> None:
@@ -1634,57 +1949,58 @@ def _handle_veo_video(post: Dict[str, Any], operation_id: str, correlation_id: s
             )
             return
 
-        video_uri = video_data["video_uri"]
+        with _heavy_work_slot(post_id, correlation_id):
+            video_uri = video_data["video_uri"]
 
-        settings = get_settings()
-        requires_local_postprocess = bool(metadata.get("postprocess_crop_aspect_ratio"))
+            settings = get_settings()
+            requires_local_postprocess = bool(metadata.get("postprocess_crop_aspect_ratio"))
 
-        if settings.use_url_based_upload and not requires_local_postprocess:
-            try:
-                logger.info(
-                    "attempting_url_based_upload",
-                    post_id=post_id,
-                    correlation_id=correlation_id,
-                    video_uri_preview=video_uri[:100]
-                )
+            if settings.use_url_based_upload and not requires_local_postprocess:
+                try:
+                    logger.info(
+                        "attempting_url_based_upload",
+                        post_id=post_id,
+                        correlation_id=correlation_id,
+                        video_uri_preview=video_uri[:100]
+                    )
 
-                download_url = veo_client.get_video_download_url(
-                    video_uri=video_uri,
-                    correlation_id=correlation_id
-                )
+                    download_url = veo_client.get_video_download_url(
+                        video_uri=video_uri,
+                        correlation_id=correlation_id
+                    )
 
-                _store_completed_video(
-                    post_id=post_id,
-                    provider="veo_3_1",
-                    video_source=download_url,
-                    correlation_id=correlation_id,
-                    provider_metadata=video_data,
-                    existing_metadata=post.get("video_metadata") or {}
-                )
+                    _store_completed_video(
+                        post_id=post_id,
+                        provider="veo_3_1",
+                        video_source=download_url,
+                        correlation_id=correlation_id,
+                        provider_metadata=video_data,
+                        existing_metadata=post.get("video_metadata") or {}
+                    )
 
-                return
+                    return
 
-            except Exception as url_upload_error:
-                logger.warning(
-                    "url_upload_failed_using_bytes_fallback",
-                    post_id=post_id,
-                    correlation_id=correlation_id,
-                    error=str(url_upload_error)
-                )
+                except Exception as url_upload_error:
+                    logger.warning(
+                        "url_upload_failed_using_bytes_fallback",
+                        post_id=post_id,
+                        correlation_id=correlation_id,
+                        error=str(url_upload_error)
+                    )
 
-        video_bytes = veo_client.download_video(
-            video_uri=video_uri,
-            correlation_id=correlation_id
-        )
+            video_bytes = veo_client.download_video(
+                video_uri=video_uri,
+                correlation_id=correlation_id
+            )
 
-        _store_completed_video(
-            post_id=post_id,
-            provider="veo_3_1",
-            video_source=video_bytes,
-            correlation_id=correlation_id,
-            provider_metadata=video_data,
-            existing_metadata=post.get("video_metadata") or {}
-        )
+            _store_completed_video(
+                post_id=post_id,
+                provider="veo_3_1",
+                video_source=video_bytes,
+                correlation_id=correlation_id,
+                provider_metadata=video_data,
+                existing_metadata=post.get("video_metadata") or {}
+            )
     else:
         _mark_processing(post_id, correlation_id, operation_id)
 
@@ -1747,15 +2063,16 @@ def _handle_vertex_ai_video(post: Dict[str, Any], operation_id: str, correlation
                 raise
             return
 
-        video_source = _decode_vertex_video_uri(video_uri)
-        _store_completed_video(
-            post_id=post_id,
-            provider=provider,
-            video_source=video_source,
-            correlation_id=correlation_id,
-            provider_metadata=status_result,
-            existing_metadata=metadata,
-        )
+        with _heavy_work_slot(post_id, correlation_id):
+            video_source = _decode_vertex_video_uri(video_uri)
+            _store_completed_video(
+                post_id=post_id,
+                provider=provider,
+                video_source=video_source,
+                correlation_id=correlation_id,
+                provider_metadata=status_result,
+                existing_metadata=metadata,
+            )
     elif done and not video_uri:
         raise FlowForgeException(
             code=ErrorCode.THIRD_PARTY_FAIL,
@@ -1770,7 +2087,9 @@ def _handle_vertex_ai_video(post: Dict[str, Any], operation_id: str, correlation
     else:
         new_status = "processing"
         supabase = get_supabase().client
-        metadata = _clear_transient_polling_errors(post.get("video_metadata") or {})
+        metadata = _schedule_next_video_poll(
+            _clear_transient_polling_errors(post.get("video_metadata") or {})
+        )
         supabase.table("posts").update({
             "video_status": new_status,
             "video_metadata": {
@@ -1788,19 +2107,10 @@ def _decode_vertex_video_uri(video_uri: str) -> bytes:
         import base64
         return base64.b64decode(b64_data)
     if video_uri.startswith("gs://"):
-        _ensure_google_adc_env()
-        bucket_and_object = video_uri[5:]
-        bucket, _, object_name = bucket_and_object.partition("/")
-        if not bucket or not object_name:
-            raise ValueError(f"Invalid Vertex GCS URI: {video_uri}")
-        credentials, _ = google.auth.default(scopes=["https://www.googleapis.com/auth/devstorage.read_only"])
-        if credentials.expired or not credentials.token:
-            credentials.refresh(Request())
-        object_path = quote(object_name, safe="")
-        url = f"https://storage.googleapis.com/storage/v1/b/{bucket}/o/{object_path}?alt=media"
+        url, headers = _vertex_gcs_media_request(video_uri)
         response = httpx.get(
             url,
-            headers={"Authorization": f"Bearer {credentials.token}"},
+            headers=headers,
             follow_redirects=True,
             timeout=120.0,
         )
@@ -1809,6 +2119,21 @@ def _decode_vertex_video_uri(video_uri: str) -> bytes:
     return video_uri
 
 
+def _vertex_gcs_media_request(video_uri: str) -> tuple[str, Dict[str, str]]:
+    """Resolve a gs:// URI to an authenticated GCS JSON-API media download request."""
+    _ensure_google_adc_env()
+    bucket_and_object = video_uri[5:]
+    bucket, _, object_name = bucket_and_object.partition("/")
+    if not bucket or not object_name:
+        raise ValueError(f"Invalid Vertex GCS URI: {video_uri}")
+    credentials, _ = google.auth.default(scopes=["https://www.googleapis.com/auth/devstorage.read_only"])
+    if credentials.expired or not credentials.token:
+        credentials.refresh(Request())
+    object_path = quote(object_name, safe="")
+    url = f"https://storage.googleapis.com/storage/v1/b/{bucket}/o/{object_path}?alt=media"
+    return url, {"Authorization": f"Bearer {credentials.token}"}
+
+
 
 def _stage_vertex_video_bytes_to_gcs(
     *,
@@ -1861,68 +2186,92 @@ def _stage_vertex_video_bytes_to_gcs(
     return f"gs://{bucket}/{normalized_object_name}"
 
 
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_obj:
+        for chunk in iter(lambda: file_obj.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def _store_completed_video(
     *,
     post_id: str,
     provider: str,
-    video_source: Union[bytes, str],
     correlation_id: str,
     provider_metadata: Dict[str, Any],
     existing_metadata: Dict[str, Any],
+    video_source: Union[bytes, str, None] = None,
+    video_path: Optional[str] = None,
 ) -> None:
+    """Upload a finished clip and hand the post to the caption stage.
+
+    ``video_source`` is downloaded bytes or a URL the storage client fetches itself;
+    ``video_path`` is a clip already on disk (the segmented stitch output). Local clips
+    go through crop and tail trim as files and are uploaded from the last one written,
+    so nothing past the initial download is held in memory.
+    """
     storage_client = get_storage_client()
-    processed_source = video_source
     postprocess_metadata: Dict[str, Any] = {}
 
-    if isinstance(video_source, bytes):
-        processed_source, postprocess_metadata = _maybe_postprocess_video_bytes(
-            post_id=post_id,
-            video_bytes=video_source,
-            existing_metadata=existing_metadata,
-            correlation_id=correlation_id,
-        )
+    with tempfile.TemporaryDirectory(prefix="video_store_") as work_dir:
+        local_path = video_path
+        if isinstance(video_source, bytes):
+            local_path = os.path.join(work_dir, "source.mp4")
+            with open(local_path, "wb") as file_obj:
+                file_obj.write(video_source)
 
-    if isinstance(processed_source, bytes) and TRIM_TAIL_MS > 0:
-        try:
-            processed_source, trim_metadata = _trim_tail(
-                video_bytes=processed_source,
-                trim_ms=TRIM_TAIL_MS,
+        if local_path is not None:
+            local_path, postprocess_metadata = _maybe_postprocess_video(
                 post_id=post_id,
+                video_path=local_path,
+                output_path=os.path.join(work_dir, "cropped.mp4"),
+                existing_metadata=existing_metadata,
                 correlation_id=correlation_id,
             )
-            postprocess_metadata.update(trim_metadata)
-        except Exception:
-            logger.exception(
-                "trim_tail_failed_using_original",
-                post_id=post_id,
+            if TRIM_TAIL_MS > 0:
+                try:
+                    local_path, trim_metadata = _trim_tail(
+                        video_path=local_path,
+                        output_path=os.path.join(work_dir, "trimmed.mp4"),
+                        trim_ms=TRIM_TAIL_MS,
+                        post_id=post_id,
+                        correlation_id=correlation_id,
+                    )
+                    postprocess_metadata.update(trim_metadata)
+                except Exception:
+                    logger.exception(
+                        "trim_tail_failed_using_original",
+                        post_id=post_id,
+                        correlation_id=correlation_id,
+                    )
+        elif isinstance(video_source, str) and video_source.startswith(("gs://", "data:")):
+            local_path = os.path.join(work_dir, "source.mp4")
+            with open(local_path, "wb") as file_obj:
+                file_obj.write(_decode_vertex_video_uri(video_source))
+
+        upload_method = "url" if local_path is None else "bytes"
+        upload_start = time.monotonic()
+
+        if local_path is None:
+            upload_result = storage_client.upload_video_from_url(
+                video_url=video_source,
+                file_name=f"post_{post_id}.mp4",
+                correlation_id=correlation_id
+            )
+            size_bytes = upload_result.get("size")
+        else:
+            # The digest is known up front, so R2 gets it at upload time instead of via a
+            # metadata copy.
+            size_bytes = os.path.getsize(local_path)
+            upload_result = storage_client.upload_video_file(
+                path=local_path,
+                file_name=f"post_{post_id}.mp4",
                 correlation_id=correlation_id,
+                expected_sha256=_file_sha256(local_path),
             )
 
-    if isinstance(processed_source, str) and processed_source.startswith(("gs://", "data:")):
-        processed_source = _decode_vertex_video_uri(processed_source)
-
-    upload_method = "url" if isinstance(processed_source, str) else "bytes"
-    upload_start = time.monotonic()
-
-    if upload_method == "url":
-        upload_result = storage_client.upload_video_from_url(
-            video_url=processed_source,
-            file_name=f"post_{post_id}.mp4",
-            correlation_id=correlation_id
-        )
-    else:
-        upload_result = storage_client.upload_video(
-            video_bytes=processed_source,
-            file_name=f"post_{post_id}.mp4",
-            correlation_id=correlation_id
-        )
-
-    upload_duration = time.monotonic() - upload_start
-
-    if isinstance(processed_source, bytes):
-        size_bytes = len(processed_source)
-    else:
-        size_bytes = upload_result.get("size")
+        upload_duration = time.monotonic() - upload_start
 
     logger.info(
         "video_upload_performance",
@@ -2025,10 +2374,19 @@ def _store_completed_video(
     )
 
 
-def _mark_processing(post_id: str, correlation_id: str, operation_id: str) -> None:
+def _mark_processing(
+    post_id: str,
+    correlation_id: str,
+    operation_id: str,
+    *,
+    operation_submitted: bool = False,
+) -> None:
     supabase = get_supabase().client
     post_response = supabase.table("posts").select("video_metadata").eq("id", post_id).single().execute()
-    existing_metadata = _clear_transient_polling_errors((post_response.data or {}).get("video_metadata") or {})
+    existing_metadata = _schedule_next_video_poll(
+        _clear_transient_polling_errors((post_response.data or {}).get("video_metadata") or {}),
+        operation_submitted=operation_submitted,
+    )
     supabase.table("posts").update({
         "video_status": "processing",
         "video_metadata": {
@@ -2327,6 +2685,9 @@ def _submit_extension_hop(
         "last_polled_by": poller_identity,
         "last_polled_at": _utc_now_iso(lease_refreshed_at),
     })
+    metadata.update(
+        _schedule_next_video_poll(metadata, now=lease_refreshed_at, operation_submitted=True)
+    )
     if requested_model:
         metadata["requested_model"] = requested_model
     provider_model = result.get("provider_model")